@@ -7,6 +7,7 @@ Usage:
     python -m agent [-c CONFIG] [-v]
 """
 
+from .channel import AgentChannel
 from .collectors import (
     get_all_services_status,
     get_cpu_info,
@@ -23,11 +24,14 @@ from .config import (
     load_config,
     load_config_from_env,
 )
-from .heartbeat import send_heartbeat
+from .events import StateWatcher, send_events
+from .heartbeat import send_heartbeat, send_heartbeat_batch
 
 __all__ = [
+    "AgentChannel",
     "AgentConfig",
     "DEFAULT_HEARTBEAT_INTERVAL",
+    "StateWatcher",
     "get_all_services_status",
     "get_cpu_info",
     "get_mac_address",
@@ -38,5 +42,7 @@ __all__ = [
     "get_service_status",
     "load_config",
     "load_config_from_env",
+    "send_events",
     "send_heartbeat",
+    "send_heartbeat_batch",
 ]
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import signal
 import sys
 import time
 from pathlib import Path
@@ -22,6 +23,7 @@ from pathlib import Path
 if __name__ == "__main__" and __package__ is None:
     # Running as standalone script - add parent dir to path for imports
     sys.path.insert(0, str(Path(__file__).parent))
+    from channel import AgentChannel, is_channel_available
     from collectors import (
         get_all_services_status,
         get_cpu_info,
@@ -34,9 +36,18 @@ if __name__ == "__main__" and __package__ is None:
         get_package_updates,
     )
     from config import load_config
-    from heartbeat import HeartbeatResult, send_heartbeat
+    from events import StateWatcher, send_shutdown_event
+    from heartbeat import (
+        MAX_BATCH_SAMPLES,
+        HeartbeatResult,
+        build_heartbeat_payload,
+        build_sample_payload,
+        send_heartbeat,
+        send_heartbeat_batch,
+    )
 else:
     # Running as module
+    from .channel import AgentChannel, is_channel_available
     from .collectors import (
         get_all_services_status,
         get_cpu_info,
@@ -49,10 +60,38 @@ else:
         get_package_updates,
     )
     from .config import load_config
-    from .heartbeat import HeartbeatResult, send_heartbeat
+    from .events import StateWatcher, send_shutdown_event
+    from .heartbeat import (
+        MAX_BATCH_SAMPLES,
+        HeartbeatResult,
+        build_heartbeat_payload,
+        build_sample_payload,
+        send_heartbeat,
+        send_heartbeat_batch,
+    )
 
 logger = logging.getLogger(__name__)
 
+# Samples kept for backfill while the hub is unreachable (one slot is left
+# for the full heartbeat that closes each batch)
+MAX_BUFFERED_SAMPLES = MAX_BATCH_SAMPLES - 1
+
+
+def _handle_sigterm(signum: int, frame: object) -> None:
+    """Treat SIGTERM (systemctl stop, host shutdown) like Ctrl+C."""
+    raise KeyboardInterrupt
+
+
+def _shutdown(watcher: StateWatcher | None, channel: AgentChannel | None) -> int:
+    """Stop event push and tell the hub the agent is going away."""
+    logger.info("Shutting down...")
+    if watcher:
+        watcher.stop()
+        send_shutdown_event(watcher.config, channel)
+    if channel:
+        channel.stop()
+    return 0
+
 
 def main() -> int:
     """Main entry point for the agent.
@@ -129,64 +168,146 @@ Examples:
         cpu_info.get("cpu_cores") or 0,
     )
 
+    # Optional persistent channel: heartbeats, events and hub commands over one
+    # WebSocket, with HTTP as the fallback whenever it is down
+    channel: AgentChannel | None = None
+    if config.channel_enabled:
+        if not config.uses_per_agent_auth():
+            logger.warning("Hub channel requires api_token; using HTTP only")
+        elif not is_channel_available():
+            logger.warning("Hub channel requires the 'websockets' package; using HTTP only")
+        else:
+            channel = AgentChannel(config, Path(args.config))
+            channel.start()
+
+    # Push service/filesystem state changes between heartbeats
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    watcher: StateWatcher | None = None
+    if config.events_enabled:
+        watcher = StateWatcher(config, channel)
+        watcher.start()
+
+    sample_interval = config.effective_sample_interval()
+    if sample_interval < config.heartbeat_interval:
+        logger.info(
+            "High-frequency sampling every %ds, delivered in batches every %ds",
+            sample_interval,
+            config.heartbeat_interval,
+        )
+
+    # Metrics samples awaiting delivery: high-frequency samples between
+    # heartbeats, plus backfill for heartbeats that failed to send
+    pending_samples: list[dict] = []
+    # Cleared if the hub predates /agents/heartbeat/batch
+    batching = True
+    next_heartbeat = time.monotonic()
+
     # Main loop - metrics collection only
     while True:
         try:
-            # Collect metrics
-            logger.debug("Collecting metrics...")
-            metrics = get_metrics()
-            mac_address = get_mac_address()
-            packages = get_package_update_list()
-            filesystems = get_filesystem_metrics()
-            network_interfaces = get_network_interfaces()
-
-            # Derive counts from detailed package list to ensure consistency
-            # (apt-get -s upgrade can miss packages that need dist-upgrade)
-            package_updates: dict[str, int | None] | None = None
-            if packages:
-                package_updates = {
-                    "updates_available": len(packages),
-                    "security_updates": sum(1 for p in packages if p.get("is_security")),
-                }
+            if time.monotonic() < next_heartbeat:
+                # Intermediate high-frequency sample (metrics only)
+                logger.debug("Collecting metrics sample...")
+                pending_samples.append(build_sample_payload(config, get_metrics()))
             else:
-                package_updates = get_package_updates()
-
-            # Collect service status if configured (US0018)
-            services = None
-            if config.monitored_services:
-                logger.debug("Collecting status for %d services...", len(config.monitored_services))
-                services = get_all_services_status(config.monitored_services)
-
-            # Send heartbeat (metrics only - no command results)
-            result: HeartbeatResult = send_heartbeat(
-                config,
-                metrics,
-                os_info,
-                mac_address,
-                package_updates,
-                services,
-                cpu_info=cpu_info,
-                packages=packages if packages else None,
-                filesystems=filesystems if filesystems else None,
-                network_interfaces=network_interfaces if network_interfaces else None,
-            )
-
-            if not result.success:
-                logger.warning("Heartbeat failed")
+                next_heartbeat = time.monotonic() + config.heartbeat_interval
+
+                # Collect metrics
+                logger.debug("Collecting metrics...")
+                metrics = get_metrics()
+                mac_address = get_mac_address()
+                packages = get_package_update_list()
+                filesystems = get_filesystem_metrics()
+                network_interfaces = get_network_interfaces()
+
+                # Derive counts from detailed package list to ensure consistency
+                # (apt-get -s upgrade can miss packages that need dist-upgrade)
+                package_updates: dict[str, int | None] | None = None
+                if packages:
+                    package_updates = {
+                        "updates_available": len(packages),
+                        "security_updates": sum(1 for p in packages if p.get("is_security")),
+                    }
+                else:
+                    package_updates = get_package_updates()
+
+                # Collect service status if configured (US0018)
+                services = None
+                if config.monitored_services:
+                    logger.debug(
+                        "Collecting status for %d services...", len(config.monitored_services)
+                    )
+                    services = get_all_services_status(config.monitored_services)
+
+                payload = build_heartbeat_payload(
+                    config,
+                    metrics,
+                    os_info,
+                    package_updates,
+                    services,
+                    cpu_info=cpu_info,
+                    packages=packages if packages else None,
+                    filesystems=filesystems if filesystems else None,
+                    network_interfaces=network_interfaces if network_interfaces else None,
+                )
+
+                result: HeartbeatResult | None = None
+                if pending_samples and batching:
+                    # Deliver buffered samples with this heartbeat in one request
+                    result = send_heartbeat_batch(config, [*pending_samples, payload])
+                    if not result.batch_supported:
+                        # Older hub: send single heartbeats from now on
+                        logger.warning("Falling back to single heartbeats")
+                        batching = False
+                        sample_interval = config.heartbeat_interval
+                        pending_samples.clear()
+                        result = None
+                if result is None and channel and channel.connected:
+                    # None means no ack over the channel - fall back to HTTP below
+                    result = channel.send_heartbeat(payload)
+                if result is None:
+                    # Send heartbeat (metrics only - no command results)
+                    result = send_heartbeat(
+                        config,
+                        metrics,
+                        os_info,
+                        mac_address,
+                        package_updates,
+                        services,
+                        cpu_info=cpu_info,
+                        packages=packages if packages else None,
+                        filesystems=filesystems if filesystems else None,
+                        network_interfaces=network_interfaces if network_interfaces else None,
+                    )
+
+                if result.success:
+                    pending_samples.clear()
+                else:
+                    logger.warning("Heartbeat failed")
+                    if batching:
+                        # Keep the metrics for backfill once the hub is reachable
+                        pending_samples.append(build_sample_payload(config, metrics))
+
+            # Bound memory use during long outages (oldest samples dropped)
+            if len(pending_samples) > MAX_BUFFERED_SAMPLES:
+                del pending_samples[:-MAX_BUFFERED_SAMPLES]
 
         except KeyboardInterrupt:
-            logger.info("Shutting down...")
-            return 0
+            return _shutdown(watcher, channel)
         except Exception as e:
             logger.exception("Unexpected error in main loop: %s", e)
 
-        # Wait for next interval
-        logger.debug("Sleeping for %d seconds...", config.heartbeat_interval)
+        # Wait for next sample
+        logger.debug("Sleeping for %d seconds...", sample_interval)
         try:
-            time.sleep(config.heartbeat_interval)
+            if channel is None:
+                time.sleep(sample_interval)
+            elif channel.wait_connected(sample_interval):
+                # Heartbeat on every (re)connect so the hub sees the agent is
+                # alive, whichever hub worker the channel landed on
+                next_heartbeat = time.monotonic()
         except KeyboardInterrupt:
-            logger.info("Shutting down...")
-            return 0
+            return _shutdown(watcher, channel)
 
     return 0
 
@@ -0,0 +1,305 @@
+"""Persistent WebSocket channel from the agent to the hub.
+
+Optional alternative to HTTP polling. When enabled, the agent keeps one
+WebSocket open to the hub (authenticated with its per-agent token) and
+sends heartbeats and events over it. The hub uses the same connection to
+send commands back:
+
+- sync_config: replace monitored_services (applied in place, no restart)
+- restart_service: systemctl restart <service_name> (readwrite mode only)
+- collect_metrics: return current metrics immediately
+
+Heartbeats and events fall back to HTTP whenever the channel is down, so
+enabling it never makes delivery less reliable. Requires the optional
+``websockets`` package.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import subprocess
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+try:
+    from websockets.exceptions import WebSocketException
+    from websockets.sync.client import connect
+except ImportError:  # pragma: no cover - optional dependency
+    connect = None
+    WebSocketException = Exception
+
+# Support both running as module and standalone script
+try:
+    from .collectors import get_metrics
+    from .config import AgentConfig, persist_monitored_services
+    from .heartbeat import HeartbeatResult, _build_headers
+except ImportError:
+    from collectors import get_metrics
+    from config import AgentConfig, persist_monitored_services
+    from heartbeat import HeartbeatResult, _build_headers
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the hub to acknowledge a heartbeat or events frame
+ACK_TIMEOUT = 10.0
+# Reconnect backoff bounds in seconds
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 60.0
+# Timeout for hub-initiated service restarts
+RESTART_TIMEOUT = 120
+
+# systemd unit names (letters, digits, ":-_.\\@")
+_SERVICE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9:_.@\\-]+$")
+
+
+def is_channel_available() -> bool:
+    """Check whether the optional websockets dependency is installed."""
+    return connect is not None
+
+
+class AgentChannel:
+    """Background WebSocket connection to the hub with automatic reconnect."""
+
+    def __init__(self, config: AgentConfig, config_path: Path | None = None) -> None:
+        """Initialise the channel.
+
+        Args:
+            config: Agent configuration (monitored_services is updated in place
+                by sync_config commands).
+            config_path: Config file to persist synced settings to, if any.
+        """
+        self.config = config
+        self.config_path = config_path
+        self._ws: Any = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._waiters: dict[str, tuple[threading.Event, dict[str, Any]]] = {}
+        self._waiters_lock = threading.Lock()
+        self._opened = threading.Event()
+
+    @property
+    def url(self) -> str:
+        """WebSocket URL of the hub channel endpoint."""
+        base = self.config.hub_url.rstrip("/")
+        if base.startswith("https://"):
+            base = "wss://" + base[len("https://") :]
+        elif base.startswith("http://"):
+            base = "ws://" + base[len("http://") :]
+        return f"{base}/api/v1/agents/channel"
+
+    @property
+    def connected(self) -> bool:
+        """Whether the channel is currently open."""
+        return self._ws is not None
+
+    def wait_connected(self, timeout: float) -> bool:
+        """Wait for the channel to open, for up to timeout seconds.
+
+        Returns:
+            True if a connection opened since the previous call.
+        """
+        if not self._opened.wait(timeout):
+            return False
+        self._opened.clear()
+        return True
+
+    def start(self) -> None:
+        """Connect in a daemon thread, reconnecting with backoff until stopped."""
+        self._thread = threading.Thread(target=self._run, name="hub-channel", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Close the channel and stop reconnecting."""
+        self._stop.set()
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except (WebSocketException, OSError):
+                pass
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        delay = RECONNECT_MIN_DELAY
+        while not self._stop.is_set():
+            try:
+                with connect(
+                    self.url,
+                    additional_headers=_build_headers(self.config),
+                    open_timeout=10,
+                ) as ws:
+                    self._ws = ws
+                    self._opened.set()
+                    logger.info("Hub channel connected: %s", self.url)
+                    delay = RECONNECT_MIN_DELAY
+                    for message in ws:
+                        self._dispatch(message)
+            except (WebSocketException, OSError, TimeoutError) as e:
+                logger.debug("Hub channel error: %s", e)
+            finally:
+                if self._ws is not None:
+                    logger.warning("Hub channel disconnected")
+                self._ws = None
+                self._fail_waiters()
+
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def _dispatch(self, message: str | bytes) -> None:
+        try:
+            frame = json.loads(message)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed frame from hub")
+            return
+
+        frame_type = frame.get("type")
+        if frame_type in ("ack", "error"):
+            with self._waiters_lock:
+                waiter = self._waiters.get(str(frame.get("id")))
+            if waiter:
+                event, slot = waiter
+                slot["frame"] = frame
+                event.set()
+            elif frame_type == "error":
+                logger.warning("Hub channel error: %s", frame.get("message"))
+        elif frame_type == "command":
+            # Run commands off the receive thread so acks are not held up
+            threading.Thread(
+                target=self._run_command, args=(frame,), name="hub-command", daemon=True
+            ).start()
+
+    def _fail_waiters(self) -> None:
+        with self._waiters_lock:
+            for event, _slot in self._waiters.values():
+                event.set()
+
+    def _send(self, frame: dict[str, Any]) -> bool:
+        ws = self._ws
+        if ws is None:
+            return False
+        try:
+            ws.send(json.dumps(frame))
+            return True
+        except (WebSocketException, OSError) as e:
+            logger.debug("Hub channel send failed: %s", e)
+            return False
+
+    def request(self, frame_type: str, payload: dict[str, Any]) -> dict[str, Any] | None:
+        """Send a heartbeat or events frame and wait for the hub's ack.
+
+        Args:
+            frame_type: "heartbeat" or "events".
+            payload: Body matching the equivalent HTTP endpoint.
+
+        Returns:
+            The ack payload, or None if the channel is down, the hub rejected
+            the frame, or no ack arrived within ACK_TIMEOUT.
+        """
+        frame_id = uuid.uuid4().hex
+        event = threading.Event()
+        slot: dict[str, Any] = {}
+        with self._waiters_lock:
+            self._waiters[frame_id] = (event, slot)
+        try:
+            if not self._send({"type": frame_type, "id": frame_id, "payload": payload}):
+                return None
+            event.wait(ACK_TIMEOUT)
+        finally:
+            with self._waiters_lock:
+                self._waiters.pop(frame_id, None)
+
+        frame = slot.get("frame")
+        if frame is None:
+            return None
+        if frame.get("type") == "error":
+            logger.warning("Hub rejected %s: %s", frame_type, frame.get("message"))
+            return None
+        return frame.get("payload") or {}
+
+    def send_heartbeat(self, payload: dict[str, Any]) -> HeartbeatResult | None:
+        """Send a full heartbeat over the channel.
+
+        Returns:
+            HeartbeatResult, or None if the caller should fall back to HTTP.
+        """
+        data = self.request("heartbeat", payload)
+        if data is None:
+            return None
+        if data.get("server_registered"):
+            logger.info("Server auto-registered with hub")
+        return HeartbeatResult(success=True, server_registered=data.get("server_registered", False))
+
+    def send_events(self, payload: dict[str, Any]) -> bool:
+        """Send an events payload over the channel.
+
+        Returns:
+            True if the hub acknowledged the events.
+        """
+        return self.request("events", payload) is not None
+
+    def _run_command(self, frame: dict[str, Any]) -> None:
+        command = frame.get("command")
+        params = frame.get("params") or {}
+        try:
+            success, result, error = self._execute(command, params)
+        except Exception as e:
+            logger.exception("Hub command %s failed", command)
+            success, result, error = False, {}, str(e)
+        self._send(
+            {
+                "type": "command_result",
+                "id": frame.get("id"),
+                "success": success,
+                "result": result,
+                "error": error,
+            }
+        )
+
+    def _execute(
+        self, command: str | None, params: dict[str, Any]
+    ) -> tuple[bool, dict[str, Any], str | None]:
+        """Run a hub command.
+
+        Returns:
+            Tuple of (success, result, error).
+        """
+        if command == "collect_metrics":
+            return True, {"metrics": get_metrics()}, None
+
+        if command == "sync_config":
+            services = params.get("monitored_services")
+            if not isinstance(services, list):
+                return False, {}, "monitored_services must be a list"
+            self.config.monitored_services = [str(s) for s in services]
+            persisted = bool(
+                self.config_path and persist_monitored_services(self.config_path, services)
+            )
+            logger.info("Hub synced %d monitored services", len(services))
+            return True, {"monitored_services": services, "persisted": persisted}, None
+
+        if command == "restart_service":
+            if not self.config.can_execute_commands():
+                return False, {}, "Agent is not permitted to execute commands (readonly mode)"
+            service_name = str(params.get("service_name", ""))
+            if not _SERVICE_NAME_PATTERN.match(service_name):
+                return False, {}, f"Invalid service name: {service_name!r}"
+            logger.info("Restarting %s on hub request", service_name)
+            proc = subprocess.run(
+                ["systemctl", "restart", service_name],
+                capture_output=True,
+                text=True,
+                timeout=RESTART_TIMEOUT,
+            )
+            return (
+                proc.returncode == 0,
+                {"exit_code": proc.returncode, "stdout": proc.stdout, "stderr": proc.stderr},
+                None,
+            )
+
+        return False, {}, f"Unknown command: {command}"
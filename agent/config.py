@@ -21,6 +21,8 @@ logger = logging.getLogger(__name__)
 # Constants
 DEFAULT_HEARTBEAT_INTERVAL = 60
 DEFAULT_COMMAND_TIMEOUT = 30
+DEFAULT_EVENT_POLL_INTERVAL = 5
+DEFAULT_FILESYSTEM_EVENT_PERCENT = 90.0
 
 # Agent operating modes (BG0017)
 AGENT_MODE_READONLY = "readonly"
@@ -46,6 +48,9 @@ class AgentConfig:
     api_key: str | None = None  # Legacy shared API key
     api_token: str | None = None  # Per-agent token (preferred)
     heartbeat_interval: int = DEFAULT_HEARTBEAT_INTERVAL
+    # High-frequency sampling: collect metrics every sample_interval seconds and
+    # deliver them in one batch per heartbeat_interval (None = one sample per heartbeat)
+    sample_interval: int | None = None
     monitored_services: list[str] | None = None
     # Agent operating mode (BG0017): "readonly" or "readwrite"
     # - readonly: Metrics collection only, no command execution
@@ -55,6 +60,12 @@ class AgentConfig:
     command_execution_enabled: bool = False
     use_sudo: bool = False
     command_timeout: int = DEFAULT_COMMAND_TIMEOUT
+    # Event push: report service/filesystem state changes and shutdown immediately
+    events_enabled: bool = True
+    event_poll_interval: int = DEFAULT_EVENT_POLL_INTERVAL
+    filesystem_event_percent: float = DEFAULT_FILESYSTEM_EVENT_PERCENT
+    # Persistent WebSocket channel to the hub (requires api_token and websockets)
+    channel_enabled: bool = False
 
     def has_valid_auth(self) -> bool:
         """Check if this agent has valid authentication configured.
@@ -84,6 +95,17 @@ class AgentConfig:
         """
         return self.mode == AGENT_MODE_READWRITE and self.command_execution_enabled
 
+    def effective_sample_interval(self) -> int:
+        """Get the metrics sampling interval in seconds.
+
+        Returns:
+            sample_interval if it is set and shorter than heartbeat_interval,
+            otherwise heartbeat_interval (one sample per heartbeat).
+        """
+        if self.sample_interval and 0 < self.sample_interval < self.heartbeat_interval:
+            return self.sample_interval
+        return self.heartbeat_interval
+
 
 def _generate_guid() -> str:
     """Generate a new UUID v4 GUID for this agent.
@@ -141,6 +163,36 @@ def _persist_guid_to_config(config_path: Path, guid: str) -> None:
         )
 
 
+def persist_monitored_services(config_path: Path, services: list[str]) -> bool:
+    """Persist the monitored_services list to the config file.
+
+    Used when the hub pushes a config sync over the agent channel. If the
+    file cannot be written, logs a warning; the in-memory list still applies
+    until the agent restarts.
+
+    Args:
+        config_path: Path to the YAML configuration file.
+        services: Service names to monitor.
+
+    Returns:
+        True if the file was updated.
+    """
+    try:
+        with open(config_path) as f:
+            data = yaml.safe_load(f) or {}
+
+        data["monitored_services"] = list(services)
+
+        with open(config_path, "w") as f:
+            yaml.dump(data, f, default_flow_style=False)
+
+        logger.info("Persisted %d monitored services to %s", len(services), config_path)
+        return True
+    except OSError as e:
+        logger.warning("Could not persist monitored_services to %s: %s", config_path, e)
+        return False
+
+
 def load_config_from_env() -> AgentConfig | None:
     """Load configuration from environment variables.
 
@@ -151,11 +203,16 @@ def load_config_from_env() -> AgentConfig | None:
         HOMELAB_AGENT_API_KEY: Legacy shared API key (for backward compatibility)
         HOMELAB_AGENT_SERVER_GUID: Permanent agent GUID (auto-generated if not set)
         HOMELAB_AGENT_HEARTBEAT_INTERVAL: Heartbeat interval in seconds
+        HOMELAB_AGENT_SAMPLE_INTERVAL: Metrics sampling interval in seconds (high-frequency mode)
         HOMELAB_AGENT_MONITORED_SERVICES: Comma-separated list of services to monitor
         HOMELAB_AGENT_MODE: Operating mode ("readonly" or "readwrite", default: readonly)
         HOMELAB_AGENT_COMMAND_EXECUTION: Enable command execution (true/false)
         HOMELAB_AGENT_USE_SUDO: Use sudo for commands (true/false)
         HOMELAB_AGENT_COMMAND_TIMEOUT: Command timeout in seconds
+        HOMELAB_AGENT_EVENTS_ENABLED: Push state-change events (true/false, default: true)
+        HOMELAB_AGENT_EVENT_POLL_INTERVAL: State-change poll interval in seconds
+        HOMELAB_AGENT_FILESYSTEM_EVENT_PERCENT: Filesystem usage percent that triggers an event
+        HOMELAB_AGENT_CHANNEL_ENABLED: Use the persistent hub channel (true/false, default: false)
 
     Returns:
         AgentConfig if required env vars are set, None otherwise.
@@ -184,6 +241,9 @@ def load_config_from_env() -> AgentConfig | None:
         os.environ.get("HOMELAB_AGENT_HEARTBEAT_INTERVAL", DEFAULT_HEARTBEAT_INTERVAL)
     )
 
+    sample_interval_str = os.environ.get("HOMELAB_AGENT_SAMPLE_INTERVAL")
+    sample_interval = int(sample_interval_str) if sample_interval_str else None
+
     # Parse comma-separated services list
     services_str = os.environ.get("HOMELAB_AGENT_MONITORED_SERVICES", "")
     monitored_services = [s.strip() for s in services_str.split(",") if s.strip()] or None
@@ -201,6 +261,17 @@ def load_config_from_env() -> AgentConfig | None:
     use_sudo = os.environ.get("HOMELAB_AGENT_USE_SUDO", "false").lower() == "true"
     command_timeout = int(os.environ.get("HOMELAB_AGENT_COMMAND_TIMEOUT", DEFAULT_COMMAND_TIMEOUT))
 
+    # Event push settings
+    events_enabled = os.environ.get("HOMELAB_AGENT_EVENTS_ENABLED", "true").lower() == "true"
+    event_poll_interval = int(
+        os.environ.get("HOMELAB_AGENT_EVENT_POLL_INTERVAL", DEFAULT_EVENT_POLL_INTERVAL)
+    )
+    filesystem_event_percent = float(
+        os.environ.get("HOMELAB_AGENT_FILESYSTEM_EVENT_PERCENT", DEFAULT_FILESYSTEM_EVENT_PERCENT)
+    )
+
+    channel_enabled = os.environ.get("HOMELAB_AGENT_CHANNEL_ENABLED", "false").lower() == "true"
+
     auth_method = "per_agent" if api_token else "legacy"
     logger.info(
         "Loaded configuration from environment variables (mode=%s, auth=%s)", mode, auth_method
@@ -212,11 +283,16 @@ def load_config_from_env() -> AgentConfig | None:
         api_token=api_token,
         api_key=api_key,
         heartbeat_interval=heartbeat_interval,
+        sample_interval=sample_interval,
         monitored_services=monitored_services,
         mode=mode,
         command_execution_enabled=command_execution_enabled,
         use_sudo=use_sudo,
         command_timeout=command_timeout,
+        events_enabled=events_enabled,
+        event_poll_interval=event_poll_interval,
+        filesystem_event_percent=filesystem_event_percent,
+        channel_enabled=channel_enabled,
     )
 
 
@@ -277,6 +353,16 @@ def load_config(
         if not isinstance(command_config, dict):
             command_config = {}
 
+        # Event push settings
+        events_config = data.get("events", {})
+        if not isinstance(events_config, dict):
+            events_config = {}
+
+        # Persistent hub channel settings
+        channel_config = data.get("channel", {})
+        if not isinstance(channel_config, dict):
+            channel_config = {}
+
         # Extract auth credentials
         api_token = data.get("api_token")
         api_key = data.get("api_key")
@@ -292,11 +378,20 @@ def load_config(
             api_token=str(api_token) if api_token else None,
             api_key=str(api_key) if api_key else None,
             heartbeat_interval=int(data.get("heartbeat_interval", DEFAULT_HEARTBEAT_INTERVAL)),
+            sample_interval=int(data["sample_interval"]) if data.get("sample_interval") else None,
             monitored_services=data.get("monitored_services"),
             mode=mode,
             command_execution_enabled=bool(command_config.get("enabled", False)),
             use_sudo=bool(command_config.get("use_sudo", False)),
             command_timeout=int(command_config.get("timeout_seconds", DEFAULT_COMMAND_TIMEOUT)),
+            events_enabled=bool(events_config.get("enabled", True)),
+            event_poll_interval=int(
+                events_config.get("poll_interval", DEFAULT_EVENT_POLL_INTERVAL)
+            ),
+            filesystem_event_percent=float(
+                events_config.get("filesystem_percent", DEFAULT_FILESYSTEM_EVENT_PERCENT)
+            ),
+            channel_enabled=bool(channel_config.get("enabled", False)),
         )
 
     # Fall back to environment variables
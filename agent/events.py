@@ -0,0 +1,251 @@
+"""State-change event push for the HomelabCmd monitoring agent.
+
+Watches monitored services and filesystems between heartbeats and pushes a
+small event to the hub as soon as something changes, so service failures
+and full disks are alerted on within seconds instead of on the next
+heartbeat. A shutdown event is sent when the agent stops.
+
+Service state is read with a single ``systemctl show`` call per poll for all
+monitored units, which is cheap enough to run every few seconds without a
+D-Bus client dependency.
+"""
+
+from __future__ import annotations
+
+import logging
+import socket
+import subprocess
+import threading
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+# Support both running as module and standalone script
+try:
+    from .collectors import (
+        _ACTIVE_STATE_MAP,
+        get_filesystem_metrics,
+        get_service_status,
+        is_running_in_container,
+    )
+    from .config import AgentConfig
+    from .heartbeat import _build_headers
+except ImportError:
+    from collectors import (
+        _ACTIVE_STATE_MAP,
+        get_filesystem_metrics,
+        get_service_status,
+        is_running_in_container,
+    )
+    from config import AgentConfig
+    from heartbeat import _build_headers
+
+if TYPE_CHECKING:
+    from .channel import AgentChannel
+
+logger = logging.getLogger(__name__)
+
+# Events are best-effort: one short attempt, the next heartbeat catches up
+EVENT_REQUEST_TIMEOUT = 5.0
+
+
+def _event(event_type: str, **payload: Any) -> dict[str, Any]:
+    """Build an event dictionary timestamped now."""
+    return {"event_type": event_type, "timestamp": datetime.now(UTC).isoformat(), **payload}
+
+
+def send_events(
+    config: AgentConfig,
+    events: list[dict[str, Any]],
+    channel: AgentChannel | None = None,
+) -> bool:
+    """Push state-change events to the hub.
+
+    Uses the persistent channel when it is connected, otherwise HTTP.
+
+    Args:
+        config: Agent configuration.
+        events: Event dictionaries matching the hub AgentEvent schema.
+        channel: Optional hub channel.
+
+    Returns:
+        True if the hub accepted the events, False otherwise.
+    """
+    if not events:
+        return True
+
+    payload = {
+        "server_guid": config.server_guid,
+        "server_id": config.server_id,
+        "events": events,
+    }
+    if channel is not None and channel.connected and channel.send_events(payload):
+        logger.debug("Pushed %d event(s) over hub channel", len(events))
+        return True
+
+    url = f"{config.hub_url}/api/v1/agents/events"
+
+    try:
+        with httpx.Client(timeout=EVENT_REQUEST_TIMEOUT) as client:
+            response = client.post(url, json=payload, headers=_build_headers(config))
+        if response.status_code == 200:
+            logger.debug("Pushed %d event(s) to hub", len(events))
+            return True
+        logger.warning("Event push failed: HTTP %d", response.status_code)
+    except httpx.HTTPError as e:
+        logger.warning("Event push failed: %s", e)
+    return False
+
+
+def get_service_active_states(services: list[str]) -> dict[str, str]:
+    """Get the mapped status of several systemd services in one call.
+
+    Args:
+        services: Systemd service names.
+
+    Returns:
+        Mapping of service name to status (running/stopped/failed/unknown).
+        Empty if systemd is not available.
+    """
+    if not services or is_running_in_container():
+        return {}
+
+    try:
+        proc = subprocess.run(
+            ["systemctl", "show", *services, "--property=ActiveState"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.debug("Could not query service states: %s", e)
+        return {}
+
+    # systemctl prints one ActiveState=... block per unit, in argument order
+    states = [
+        line.split("=", 1)[1]
+        for line in proc.stdout.splitlines()
+        if line.startswith("ActiveState=")
+    ]
+    if len(states) != len(services):
+        return {}
+
+    return {
+        name: _ACTIVE_STATE_MAP.get(state, "unknown")
+        for name, state in zip(services, states, strict=True)
+    }
+
+
+def is_system_shutting_down() -> bool:
+    """Check whether the host itself is shutting down (vs only the agent stopping)."""
+    try:
+        proc = subprocess.run(
+            ["systemctl", "is-system-running"],
+            capture_output=True,
+            text=True,
+            timeout=2,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+    return proc.stdout.strip() == "stopping"
+
+
+class StateWatcher:
+    """Background watcher that pushes events when watched state changes.
+
+    Polls service ActiveState and filesystem usage every
+    ``config.event_poll_interval`` seconds. The first poll only records a
+    baseline; events are sent for subsequent changes.
+    """
+
+    def __init__(self, config: AgentConfig, channel: AgentChannel | None = None) -> None:
+        """Initialise the watcher.
+
+        Args:
+            config: Agent configuration.
+            channel: Optional hub channel to push events over.
+        """
+        self.config = config
+        self.channel = channel
+        self._service_states: dict[str, str] = {}
+        self._filesystems_over: dict[str, bool] = {}
+        self._baseline_taken = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start polling in a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name="state-watcher", daemon=True)
+        self._thread.start()
+        logger.info(
+            "Event push enabled (poll every %ds, filesystem threshold %.0f%%)",
+            self.config.event_poll_interval,
+            self.config.filesystem_event_percent,
+        )
+
+    def stop(self) -> None:
+        """Stop polling."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.config.event_poll_interval + 1)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                events = self.poll()
+                if events:
+                    send_events(self.config, events, self.channel)
+            except Exception as e:
+                logger.warning("State watcher error: %s", e)
+            self._stop.wait(self.config.event_poll_interval)
+
+    def poll(self) -> list[dict[str, Any]]:
+        """Check watched state once and return events for any changes.
+
+        Returns:
+            Event dictionaries for changes since the previous poll.
+        """
+        events: list[dict[str, Any]] = []
+
+        services = self.config.monitored_services or []
+        for name, status in get_service_active_states(services).items():
+            previous = self._service_states.get(name)
+            self._service_states[name] = status
+            if self._baseline_taken and previous is not None and previous != status:
+                logger.info("Service %s changed %s -> %s", name, previous, status)
+                events.append(_event("service_state", service=get_service_status(name)))
+
+        threshold = self.config.filesystem_event_percent
+        for fs in get_filesystem_metrics():
+            mount_point = fs["mount_point"]
+            is_over = fs["percent"] >= threshold
+            was_over = self._filesystems_over.get(mount_point)
+            self._filesystems_over[mount_point] = is_over
+            if self._baseline_taken and was_over is not None and was_over != is_over:
+                logger.info(
+                    "Filesystem %s %s %.0f%% (now %.1f%%)",
+                    mount_point,
+                    "crossed" if is_over else "dropped below",
+                    threshold,
+                    fs["percent"],
+                )
+                events.append(_event("filesystem_threshold", filesystem=fs))
+
+        self._baseline_taken = True
+        return events
+
+
+def send_shutdown_event(config: AgentConfig, channel: AgentChannel | None = None) -> bool:
+    """Tell the hub the agent is stopping.
+
+    Args:
+        config: Agent configuration.
+        channel: Optional hub channel (sent over it so the hub expects the disconnect).
+
+    Returns:
+        True if the hub accepted the event.
+    """
+    reason = "system_shutdown" if is_system_shutting_down() else "agent_stop"
+    logger.info("Sending shutdown event to hub (%s, host %s)", reason, socket.gethostname())
+    return send_events(config, [_event("shutdown", shutdown_reason=reason)], channel)
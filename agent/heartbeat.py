@@ -56,6 +56,8 @@ def get_agent_version() -> str:
 RETRY_COUNT = 3
 RETRY_DELAY_SECONDS = 5
 REQUEST_TIMEOUT = 30.0
+MAX_BATCH_SAMPLES = 1000  # Hub limit for /agents/heartbeat/batch
+BATCH_UNSUPPORTED_STATUSES = (404, 405)  # Hubs older than /agents/heartbeat/batch
 
 
 @dataclass
@@ -64,43 +66,40 @@ class HeartbeatResult:
 
     success: bool
     server_registered: bool
+    batch_supported: bool = True
 
 
-def send_heartbeat(
+class EndpointNotSupportedError(Exception):
+    """The hub does not have the endpoint (it predates it)."""
+
+
+def build_heartbeat_payload(
     config: AgentConfig,
     metrics: dict[str, Any],
-    os_info: dict[str, str | None],
-    mac_address: str | None,  # noqa: ARG001 - collected for future use
+    os_info: dict[str, str | None] | None,
     package_updates: dict[str, int | None] | None,
     services: list[dict[str, Any]] | None = None,
     cpu_info: dict[str, Any] | None = None,
     packages: list[dict[str, Any]] | None = None,
     filesystems: list[dict[str, Any]] | None = None,
     network_interfaces: list[dict[str, Any]] | None = None,
-) -> HeartbeatResult:
-    """Send heartbeat to hub API with retry logic.
+) -> dict[str, Any]:
+    """Build a full heartbeat payload timestamped now.
 
     Args:
         config: Agent configuration.
         metrics: Collected system metrics.
         os_info: Operating system information.
-        mac_address: Primary interface MAC address (for future schema extension).
         package_updates: Package update counts (updates_available, security_updates).
-        services: List of service status dictionaries (name, status, pid, memory_mb, cpu_percent).
+        services: List of service status dictionaries.
         cpu_info: CPU model and core count for power profile detection.
         packages: Detailed package update list (US0051).
         filesystems: Per-filesystem disk metrics (US0178).
         network_interfaces: Per-interface network metrics (US0179).
 
     Returns:
-        HeartbeatResult with success status.
-
-    Note:
-        US0152: Command execution has been removed. The hub now uses SSH
-        for synchronous command execution instead of the async channel.
+        Heartbeat payload dictionary matching the hub HeartbeatRequest schema.
     """
-    url = f"{config.hub_url}/api/v1/agents/heartbeat"
-
     payload: dict[str, Any] = {
         "server_guid": config.server_guid,  # Permanent identity (US0070)
         "server_id": config.server_id,
@@ -134,7 +133,33 @@ def send_heartbeat(
     if network_interfaces:
         payload["network_interfaces"] = network_interfaces
 
-    # Build authentication headers (per-agent token preferred, fall back to legacy key)
+    return payload
+
+
+def build_sample_payload(config: AgentConfig, metrics: dict[str, Any]) -> dict[str, Any]:
+    """Build a lightweight metrics-only sample for batch submission.
+
+    Used for high-frequency sampling and backfill, where only the time
+    series matters and server metadata is carried by the latest full sample.
+
+    Args:
+        config: Agent configuration.
+        metrics: Collected system metrics.
+
+    Returns:
+        Minimal heartbeat payload dictionary.
+    """
+    return {
+        "server_guid": config.server_guid,
+        "server_id": config.server_id,
+        "hostname": socket.gethostname(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "metrics": metrics,
+    }
+
+
+def _build_headers(config: AgentConfig) -> dict[str, str]:
+    """Build authentication headers (per-agent token preferred, fall back to legacy key)."""
     headers: dict[str, str] = {
         "Content-Type": "application/json",
     }
@@ -145,7 +170,148 @@ def send_heartbeat(
     elif config.api_key:
         # Legacy shared API key authentication
         headers["X-API-Key"] = config.api_key
+    return headers
+
+
+def send_heartbeat(
+    config: AgentConfig,
+    metrics: dict[str, Any],
+    os_info: dict[str, str | None],
+    mac_address: str | None,  # noqa: ARG001 - collected for future use
+    package_updates: dict[str, int | None] | None,
+    services: list[dict[str, Any]] | None = None,
+    cpu_info: dict[str, Any] | None = None,
+    packages: list[dict[str, Any]] | None = None,
+    filesystems: list[dict[str, Any]] | None = None,
+    network_interfaces: list[dict[str, Any]] | None = None,
+) -> HeartbeatResult:
+    """Send heartbeat to hub API with retry logic.
+
+    Args:
+        config: Agent configuration.
+        metrics: Collected system metrics.
+        os_info: Operating system information.
+        mac_address: Primary interface MAC address (for future schema extension).
+        package_updates: Package update counts (updates_available, security_updates).
+        services: List of service status dictionaries (name, status, pid, memory_mb, cpu_percent).
+        cpu_info: CPU model and core count for power profile detection.
+        packages: Detailed package update list (US0051).
+        filesystems: Per-filesystem disk metrics (US0178).
+        network_interfaces: Per-interface network metrics (US0179).
+
+    Returns:
+        HeartbeatResult with success status.
+
+    Note:
+        US0152: Command execution has been removed. The hub now uses SSH
+        for synchronous command execution instead of the async channel.
+    """
+    url = f"{config.hub_url}/api/v1/agents/heartbeat"
+    payload = build_heartbeat_payload(
+        config,
+        metrics,
+        os_info,
+        package_updates,
+        services,
+        cpu_info=cpu_info,
+        packages=packages,
+        filesystems=filesystems,
+        network_interfaces=network_interfaces,
+    )
+    headers = _build_headers(config)
+
+    data = _post_with_retry(config, url, payload, headers)
+    if data is None:
+        return HeartbeatResult(
+            success=False,
+            server_registered=False,
+        )
 
+    if data.get("server_registered"):
+        logger.info("Server auto-registered with hub")
+    logger.debug("Heartbeat sent successfully")
+
+    return HeartbeatResult(
+        success=True,
+        server_registered=data.get("server_registered", False),
+    )
+
+
+def send_heartbeat_batch(
+    config: AgentConfig,
+    samples: list[dict[str, Any]],
+) -> HeartbeatResult:
+    """Send several heartbeat samples to the hub in one request.
+
+    The hub stores every sample as history and evaluates alerts only on the
+    newest one, so the last sample should be a full heartbeat payload.
+
+    Args:
+        config: Agent configuration.
+        samples: Heartbeat payloads, oldest first (max MAX_BATCH_SAMPLES).
+
+    Returns:
+        HeartbeatResult with success status.
+    """
+    url = f"{config.hub_url}/api/v1/agents/heartbeat/batch"
+    payload = {"heartbeats": samples[-MAX_BATCH_SAMPLES:]}
+
+    try:
+        data = _post_with_retry(
+            config,
+            url,
+            payload,
+            _build_headers(config),
+            unsupported_statuses=BATCH_UNSUPPORTED_STATUSES,
+        )
+    except EndpointNotSupportedError:
+        logger.warning("Hub does not support batched heartbeats")
+        return HeartbeatResult(
+            success=False,
+            server_registered=False,
+            batch_supported=False,
+        )
+    if data is None:
+        return HeartbeatResult(
+            success=False,
+            server_registered=False,
+        )
+
+    server_registered = any(s.get("server_registered") for s in data.get("servers", []))
+    if server_registered:
+        logger.info("Server auto-registered with hub")
+    logger.debug("Batch heartbeat sent successfully (%d samples)", data.get("accepted", 0))
+
+    return HeartbeatResult(
+        success=True,
+        server_registered=server_registered,
+    )
+
+
+def _post_with_retry(
+    config: AgentConfig,
+    url: str,
+    payload: dict[str, Any],
+    headers: dict[str, str],
+    unsupported_statuses: tuple[int, ...] = (),
+) -> dict[str, Any] | None:
+    """POST a payload to the hub, retrying transient failures.
+
+    Args:
+        config: Agent configuration (used for auth error messages).
+        url: Hub endpoint URL.
+        payload: JSON payload.
+        headers: Request headers including authentication.
+        unsupported_statuses: HTTP statuses meaning the hub lacks the
+            endpoint; these are not retried.
+
+    Returns:
+        Decoded JSON response on HTTP 200, None on failure.
+
+    Raises:
+        EndpointNotSupportedError: If the hub answers with one of
+            unsupported_statuses.
+    """
     last_error: Exception | None = None
 
     for attempt in range(1, RETRY_COUNT + 1):
@@ -154,22 +320,13 @@ def send_heartbeat(
                 response = client.post(url, json=payload, headers=headers)
 
                 if response.status_code == 200:
-                    data = response.json()
-                    if data.get("server_registered"):
-                        logger.info("Server auto-registered with hub")
-                    logger.debug("Heartbeat sent successfully")
-
-                    return HeartbeatResult(
-                        success=True,
-                        server_registered=data.get("server_registered", False),
-                    )
+                    return response.json()
                 elif response.status_code == 401:
                     auth_method = "api_token" if config.api_token else "api_key"
                     logger.error("Authentication failed - check %s in configuration", auth_method)
-                    return HeartbeatResult(
-                        success=False,
-                        server_registered=False,
-                    )
+                    return None
+                elif response.status_code in unsupported_statuses:
+                    raise EndpointNotSupportedError(f"HTTP {response.status_code} from {url}")
                 else:
                     logger.warning(
                         "Heartbeat failed (attempt %d/%d): HTTP %d",
@@ -195,6 +352,8 @@ def send_heartbeat(
                 e,
             )
             last_error = e
+        except EndpointNotSupportedError:
+            raise
         except Exception as e:
             logger.warning(
                 "Heartbeat error (attempt %d/%d): %s",
@@ -213,7 +372,4 @@ def send_heartbeat(
         RETRY_COUNT,
         last_error,
     )
-    return HeartbeatResult(
-        success=False,
-        server_registered=False,
-    )
+    return None
@@ -228,8 +228,10 @@ if [[ "$SCRIPT_DIR" != "$AGENT_DIR" ]]; then
     echo "Copying agent package..."
     cp "$SCRIPT_DIR/__init__.py" "$AGENT_DIR/"
     cp "$SCRIPT_DIR/__main__.py" "$AGENT_DIR/"
+    cp "$SCRIPT_DIR/channel.py" "$AGENT_DIR/"
     cp "$SCRIPT_DIR/config.py" "$AGENT_DIR/"
     cp "$SCRIPT_DIR/collectors.py" "$AGENT_DIR/"
+    cp "$SCRIPT_DIR/events.py" "$AGENT_DIR/"
     cp "$SCRIPT_DIR/heartbeat.py" "$AGENT_DIR/"
     # Copy executor.py if it exists (for readwrite mode)
     if [[ -f "$SCRIPT_DIR/executor.py" ]]; then
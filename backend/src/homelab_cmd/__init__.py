@@ -1,3 +1,8 @@
 """HomelabCmd: Self-hosted homelab monitoring and management platform."""
 
+import time
+
 __version__ = "1.0.0"
+
+# When the package started loading, the reference for startup timings
+STARTED_AT = time.perf_counter()
@@ -0,0 +1,83 @@
+"""Conditional GET for polled read endpoints.
+
+The dashboard polls list endpoints that usually have not changed since the
+last poll. Endpoints declare the models they read; their ETag is derived
+from those tables' change versions (see db/versions.py), the request URL
+and the hub version. A request whose If-None-Match matches is answered with
+304 Not Modified after a single small query, before the endpoint runs.
+
+Usage:
+    @router.get("", dependencies=[Depends(conditional_get(Server, Metrics))])
+"""
+
+import hashlib
+from collections.abc import Awaitable, Callable
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from homelab_cmd import __version__
+from homelab_cmd.api.deps import verify_api_key
+from homelab_cmd.db.base import Base
+from homelab_cmd.db.session import get_async_session
+from homelab_cmd.db.versions import get_table_versions
+
+# Browsers may keep responses but must revalidate them before each use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(request: Request, versions: dict[str, int]) -> str:
+    """Build a weak ETag for a response.
+
+    Weak because compression changes the bytes but not the content.
+
+    Args:
+        request: The request being answered.
+        versions: Versions of the tables the response is built from.
+
+    Returns:
+        Quoted weak entity tag.
+    """
+    query = sorted(request.query_params.multi_items())
+    state = "|".join(
+        [__version__, request.url.path, repr(query)]
+        + [f"{table}={version}" for table, version in sorted(versions.items())]
+    )
+    return f'W/"{hashlib.sha256(state.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def conditional_get(*models: type[Base]) -> Callable[..., Awaitable[None]]:
+    """Dependency adding ETag support to a read endpoint.
+
+    Args:
+        *models: Models whose tables the endpoint reads.
+
+    Returns:
+        Dependency that sets ETag and Cache-Control on the response, or
+        raises a 304 when the client's copy is current.
+    """
+    tables = sorted({table.name for model in models for table in model.__mapper__.tables})
+
+    async def check_etag(
+        request: Request,
+        response: Response,
+        session: AsyncSession = Depends(get_async_session),
+        _: str = Depends(verify_api_key),
+    ) -> None:
+        etag = make_etag(request, await get_table_versions(session, tables))
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    return check_etag
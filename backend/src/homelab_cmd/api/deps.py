@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Annotated
 
 from fastapi import Depends, Header, HTTPException, Security
-from fastapi.security import APIKeyHeader
+from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from homelab_cmd.config import get_settings
@@ -15,6 +15,9 @@ from homelab_cmd.services.token_service import TokenService
 # API key header scheme (legacy authentication)
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# Bearer scheme for scrapers that cannot send custom headers (Prometheus)
+bearer_scheme = HTTPBearer(auto_error=False)
+
 
 @dataclass
 class AuthInfo:
@@ -65,6 +68,24 @@ async def verify_api_key(api_key: str | None = Security(api_key_header)) -> str:
     return api_key
 
 
+async def verify_scrape_auth(
+    api_key: str | None = Security(api_key_header),
+    bearer: HTTPAuthorizationCredentials | None = Security(bearer_scheme),
+) -> str:
+    """Verify the API key from X-API-Key or an Authorization: Bearer header.
+
+    Prometheus supports bearer tokens natively but not arbitrary headers,
+    so scrape endpoints accept the API key either way.
+
+    Returns:
+        The validated API key
+
+    Raises:
+        HTTPException: 401 if the API key is missing or invalid
+    """
+    return await verify_api_key(api_key or (bearer.credentials if bearer else None))
+
+
 async def verify_agent_auth(
     api_key: str | None = Security(api_key_header),
     agent_token: Annotated[str | None, Header(alias="X-Agent-Token")] = None,
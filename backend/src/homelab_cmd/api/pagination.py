@@ -0,0 +1,183 @@
+"""Keyset pagination and cached totals for newest-first list endpoints.
+
+Alert, action and scan lists are ordered newest first. Paged with OFFSET,
+SQLite steps over every skipped row, so deep pages into a long history get
+slower and slower. Each page also returns next_cursor, an opaque token for
+the (created_at, id) of its last row. Passing it back as cursor continues
+after that row with an index range scan, which costs the same on every
+page. OFFSET is still accepted for existing clients.
+
+Totals are counted once per table change (see db/versions.py) and reused
+until the table is next written.
+
+Usage:
+    filters = {"status": status, "server_id": server_id}
+    query = page_query(select(Alert).where(*filter_criteria(Alert, filters)), Alert, ...)
+    rows, next_cursor = split_page((await session.execute(query)).scalars().all(), limit)
+    total = await count_rows(session, Alert, filters)
+"""
+
+import base64
+import binascii
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from typing import Any, TypeVar
+
+from fastapi import HTTPException
+from sqlalchemy import ColumnElement, Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from homelab_cmd.db.base import Base
+from homelab_cmd.db.models.coordination import CacheGeneration
+from homelab_cmd.db.versions import version_name
+
+T = TypeVar("T")
+
+# Most cached totals kept before the cache is emptied
+COUNT_CACHE_SIZE = 512
+
+# (table, filters) -> (table version stamp, total)
+_count_cache: dict[tuple[str, tuple[tuple[str, Any], ...]], tuple[tuple[int, datetime], int]] = {}
+
+
+def _invalid_cursor(message: str) -> HTTPException:
+    return HTTPException(status_code=400, detail={"code": "INVALID_CURSOR", "message": message})
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Build the cursor for the row a page ends on.
+
+    Args:
+        created_at: The row's creation time.
+        row_id: The row's primary key.
+
+    Returns:
+        Opaque URL-safe token.
+    """
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(UTC).replace(tzinfo=None)
+    token = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(token).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Read a cursor built by encode_cursor.
+
+    Args:
+        cursor: Token from a previous page's next_cursor.
+
+    Returns:
+        Creation time (naive UTC) and primary key of the last row seen.
+
+    Raises:
+        HTTPException: 400 INVALID_CURSOR if the token is malformed.
+    """
+    try:
+        token = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = token.split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise _invalid_cursor("Malformed pagination cursor") from None
+
+
+def filter_criteria(model: type[Base], filters: dict[str, Any]) -> list[ColumnElement[bool]]:
+    """Equality criteria for the filters that were given.
+
+    Args:
+        model: Model being listed.
+        filters: Column name to required value; None or an empty value
+            (e.g. ``?status=``) means no filter.
+
+    Returns:
+        WHERE criteria.
+    """
+    return [getattr(model, column) == value for column, value in filters.items() if value]
+
+
+def page_query(
+    query: Select, model: type[Base], limit: int, cursor: str | None = None, offset: int = 0
+) -> Select:
+    """Order a list query newest first and select one page of it.
+
+    One row more than the page is selected so split_page can tell whether
+    another page follows.
+
+    Args:
+        query: Filtered query over model.
+        model: Model with created_at and integer id columns.
+        limit: Page size.
+        cursor: next_cursor of the previous page, if continuing.
+        offset: Rows to skip; cannot be combined with cursor.
+
+    Returns:
+        Query for the page.
+
+    Raises:
+        HTTPException: 400 INVALID_CURSOR for a malformed cursor, or one
+            combined with an offset.
+    """
+    created_at, row_id = model.created_at, model.id
+    if cursor is not None:
+        if offset:
+            raise _invalid_cursor("cursor cannot be combined with offset")
+        query = query.where(tuple_(created_at, row_id) < tuple_(*decode_cursor(cursor)))
+    return query.order_by(created_at.desc(), row_id.desc()).offset(offset).limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence[T], limit: int, entity: Callable[[T], Any] = lambda row: row
+) -> tuple[list[T], str | None]:
+    """Trim the look-ahead row from a page and build its next_cursor.
+
+    Args:
+        rows: Rows selected by page_query.
+        limit: Page size.
+        entity: Gets the model instance from a row, for rows that select
+            more than the model.
+
+    Returns:
+        The page's rows, and the cursor for the next page (None on the last).
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit:
+        return page, None
+    last = entity(page[-1])
+    return page, encode_cursor(last.created_at, last.id)
+
+
+async def count_rows(session: AsyncSession, model: type[Base], filters: dict[str, Any]) -> int:
+    """Count matching rows, reusing the count until the table changes.
+
+    Args:
+        session: Database session.
+        model: Model being listed.
+        filters: Filters as passed to filter_criteria.
+
+    Returns:
+        Number of rows matching the filters.
+    """
+    table = model.__tablename__
+    key = (table, tuple(sorted((k, v) for k, v in filters.items() if v)))
+    # The bump time tells a recreated database apart from the one counted
+    stamp = (
+        await session.execute(
+            select(CacheGeneration.generation, CacheGeneration.updated_at).where(
+                CacheGeneration.name == version_name(table)
+            )
+        )
+    ).first()
+    cached = _count_cache.get(key)
+    if stamp is not None and cached is not None and cached[0] == tuple(stamp):
+        return cached[1]
+
+    total = (
+        await session.execute(
+            select(func.count()).select_from(model).where(*filter_criteria(model, filters))
+        )
+    ).scalar_one()
+    # Tables never written since versions were introduced have no stamp
+    if stamp is not None:
+        if len(_count_cache) >= COUNT_CACHE_SIZE:
+            _count_cache.clear()
+        _count_cache[key] = (tuple(stamp), total)
+    return total
@@ -14,6 +14,13 @@ AUTH_RESPONSES: dict = {
     }
 }
 
+# Conditional GET responses (304)
+NOT_MODIFIED_RESPONSE: dict = {
+    304: {
+        "description": "Not modified since the ETag given in If-None-Match",
+    }
+}
+
 # Resource not found responses (404)
 NOT_FOUND_RESPONSE: dict = {
     404: {
@@ -5,12 +5,14 @@ from collections.abc import Callable
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from homelab_cmd.api.deps import verify_api_key
+from homelab_cmd.api.pagination import count_rows, filter_criteria, page_query, split_page
 from homelab_cmd.api.responses import (
     AUTH_RESPONSES,
+    BAD_REQUEST_RESPONSE,
     CONFLICT_RESPONSE,
     FORBIDDEN_RESPONSE,
     NOT_FOUND_RESPONSE,
@@ -26,7 +28,14 @@ from homelab_cmd.config import get_settings
 from homelab_cmd.db.models.remediation import ActionStatus, RemediationAction
 from homelab_cmd.db.models.server import Server
 from homelab_cmd.db.session import get_async_session
+from homelab_cmd.services.agent_channel import (
+    AgentChannelError,
+    AgentChannelTimeoutError,
+    ChannelCommand,
+    get_agent_channel_manager,
+)
 from homelab_cmd.services.credential_service import CredentialService
+from homelab_cmd.services.event_bus import EventTopic, publish
 from homelab_cmd.services.host_key_service import HostKeyService
 from homelab_cmd.services.ssh_executor import SSHPooledExecutor
 
@@ -97,12 +106,27 @@ async def _build_security_upgrade_command(server_id: str, session: AsyncSession)
     return f"{DEBIAN_FRONTEND} apt-get install {APT_OPTIONS} -o APT::Sandbox::User=root {' '.join(security_pkgs)}"
 
 
+def _publish_action(action: RemediationAction) -> None:
+    """Publish an action status change on the live update bus."""
+    publish(
+        EventTopic.ACTION,
+        {
+            "action_id": action.id,
+            "server_id": action.server_id,
+            "action_type": action.action_type,
+            "status": action.status,
+            "exit_code": action.exit_code,
+        },
+    )
+
+
 async def _execute_action_via_ssh(action_id: int) -> None:
     """Execute an approved action via SSH in the background.
 
     This function runs in the background after an action is approved.
     It connects to the server via SSH, executes the command, and updates
-    the action status with the result.
+    the action status with the result. Service restarts for agents with a
+    persistent channel are sent over the channel instead.
 
     Args:
         action_id: The ID of the action to execute.
@@ -134,12 +158,64 @@ async def _execute_action_via_ssh(action_id: int) -> None:
             action.exit_code = -1
             action.stderr = f"Server {action.server_id} not found"
             await session.commit()
+            _publish_action(action)
             return
 
         # Mark as executing
         action.status = ActionStatus.EXECUTING.value
         action.executed_at = datetime.now(UTC)
         await session.commit()
+        _publish_action(action)
+
+        # Service restarts go over the agent channel when one is open (no SSH
+        # handshake). Only readwrite agents run commands; others refuse them.
+        manager = get_agent_channel_manager()
+        if (
+            action.action_type == ActionType.RESTART_SERVICE.value
+            and action.service_name
+            and server.agent_mode == "readwrite"
+            and manager.is_connected(server.id)
+        ):
+            try:
+                channel_result = await manager.send_command(
+                    server.id,
+                    ChannelCommand.RESTART_SERVICE,
+                    {"service_name": action.service_name},
+                    timeout=120,
+                )
+                exit_code = int(channel_result.result.get("exit_code", -1))
+                action.status = (
+                    ActionStatus.COMPLETED.value
+                    if channel_result.success and exit_code == 0
+                    else ActionStatus.FAILED.value
+                )
+                action.completed_at = datetime.now(UTC)
+                action.exit_code = exit_code
+                stdout = channel_result.result.get("stdout")
+                stderr = channel_result.result.get("stderr") or channel_result.error
+                action.stdout = stdout[:10000] if stdout else None
+                action.stderr = stderr[:10000] if stderr else None
+                await session.commit()
+                _publish_action(action)
+                logger.info(
+                    "Action %d completed via agent channel with exit code %d",
+                    action_id,
+                    exit_code,
+                )
+                return
+            except AgentChannelTimeoutError as e:
+                # The agent may already have restarted the service; running it
+                # again over SSH could restart it twice
+                logger.warning("Action %d outcome unknown: %s", action_id, e)
+                action.status = ActionStatus.FAILED.value
+                action.completed_at = datetime.now(UTC)
+                action.exit_code = -1
+                action.stderr = f"Outcome unknown: {e}"
+                await session.commit()
+                _publish_action(action)
+                return
+            except AgentChannelError as e:
+                logger.warning("Agent channel failed for action %d, using SSH: %s", action_id, e)
 
         # Create SSH executor
         settings = get_settings()
@@ -184,6 +260,7 @@ async def _execute_action_via_ssh(action_id: int) -> None:
             action.stderr = str(e)
 
         await session.commit()
+        _publish_action(action)
 
 
 @router.get(
@@ -191,7 +268,7 @@ async def _execute_action_via_ssh(action_id: int) -> None:
     response_model=ActionListResponse,
     operation_id="list_actions",
     summary="List remediation actions with optional filtering",
-    responses={**AUTH_RESPONSES},
+    responses={**AUTH_RESPONSES, **BAD_REQUEST_RESPONSE},
 )
 async def list_actions(
     status: str | None = Query(None, description="Filter by status"),
@@ -199,46 +276,31 @@ async def list_actions(
     action_type: str | None = Query(None, description="Filter by action type"),
     limit: int = Query(50, ge=1, le=100, description="Maximum results to return"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(
+        None, description="next_cursor from the previous page (instead of offset)"
+    ),
     session: AsyncSession = Depends(get_async_session),
     _: str = Depends(verify_api_key),
 ) -> ActionListResponse:
     """List remediation actions with optional filtering and pagination.
 
-    Returns actions sorted by creation date (newest first).
+    Returns actions sorted by creation date (newest first). Pass a page's
+    next_cursor as cursor to fetch the page after it.
     """
-    # Build base query
-    query = select(RemediationAction)
-
-    # Apply filters
-    if status:
-        query = query.where(RemediationAction.status == status)
-    if server_id:
-        query = query.where(RemediationAction.server_id == server_id)
-    if action_type:
-        query = query.where(RemediationAction.action_type == action_type)
-
-    # Get total count before pagination
-    count_query = select(func.count()).select_from(RemediationAction)
-    if status:
-        count_query = count_query.where(RemediationAction.status == status)
-    if server_id:
-        count_query = count_query.where(RemediationAction.server_id == server_id)
-    if action_type:
-        count_query = count_query.where(RemediationAction.action_type == action_type)
-
-    count_result = await session.execute(count_query)
-    total = count_result.scalar() or 0
-
-    # Apply pagination and ordering
-    query = query.order_by(RemediationAction.created_at.desc()).offset(offset).limit(limit)
-    result = await session.execute(query)
-    actions = result.scalars().all()
+    filters = {"status": status, "server_id": server_id, "action_type": action_type}
+
+    query = select(RemediationAction).where(*filter_criteria(RemediationAction, filters))
+    result = await session.execute(page_query(query, RemediationAction, limit, cursor, offset))
+    actions, next_cursor = split_page(result.scalars().all(), limit)
+
+    total = await count_rows(session, RemediationAction, filters)
 
     return ActionListResponse(
         actions=[ActionResponse.model_validate(a) for a in actions],
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -418,6 +480,7 @@ async def create_action(
     session.add(action)
     await session.commit()
     await session.refresh(action)
+    _publish_action(action)
 
     # Trigger execution in background for auto-approved actions
     if action.status == ActionStatus.APPROVED.value:
@@ -471,6 +534,7 @@ async def approve_action(
     action.approved_by = "dashboard"
 
     await session.commit()
+    _publish_action(action)
 
     # Trigger execution in background
     background_tasks.add_task(_execute_action_via_ssh, action.id)
@@ -525,6 +589,7 @@ async def reject_action(
     action.rejection_reason = request.reason
 
     await session.flush()
+    _publish_action(action)
     return ActionResponse.model_validate(action)
 
 
@@ -575,4 +640,5 @@ async def cancel_action(
     action.stderr = "Action cancelled by user"
 
     await session.flush()
+    _publish_action(action)
     return ActionResponse.model_validate(action)
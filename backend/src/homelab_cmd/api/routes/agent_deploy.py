@@ -6,28 +6,45 @@ Provides endpoints for:
 - Upgrading existing agents
 - Removing agents (mark inactive or delete)
 - Re-activating inactive servers
+- Fleet rollouts upgrading many servers in canary-first waves
 
 EP0007: Agent Management
 """
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from homelab_cmd.api.deps import verify_api_key
-from homelab_cmd.api.responses import AUTH_RESPONSES
+from homelab_cmd.api.responses import (
+    AUTH_RESPONSES,
+    BAD_REQUEST_RESPONSE,
+    CONFLICT_RESPONSE,
+    NOT_FOUND_RESPONSE,
+)
 from homelab_cmd.api.schemas.agent_deploy import (
     AgentInstallRequest,
     AgentInstallResponse,
     AgentRemoveRequest,
     AgentRemoveResponse,
+    AgentRolloutHostResult,
+    AgentRolloutListResponse,
+    AgentRolloutRequest,
+    AgentRolloutResponse,
     AgentUpgradeResponse,
     AgentVersionResponse,
     ServerActivateResponse,
 )
+from homelab_cmd.db.models.agent_rollout import AgentRollout
 from homelab_cmd.db.session import get_async_session
 from homelab_cmd.services.agent_deploy import get_agent_version, get_deployment_service
+from homelab_cmd.services.agent_rollout import (
+    RolloutConflictError,
+    RolloutError,
+    get_rollout_service,
+)
 
 router = APIRouter(prefix="/agents", tags=["Agent Deployment"])
 logger = logging.getLogger(__name__)
@@ -207,3 +224,200 @@ async def activate_server(
         message=result.message,
         error=result.error,
     )
+
+
+# Fleet rollouts
+
+
+def _rollout_response(rollout: AgentRollout) -> AgentRolloutResponse:
+    """Convert a rollout record to its API response."""
+    return AgentRolloutResponse(
+        id=rollout.id,
+        target_version=rollout.target_version,
+        status=rollout.status,
+        canary_size=rollout.canary_size,
+        wave_size=rollout.wave_size,
+        heartbeat_timeout_seconds=rollout.heartbeat_timeout_seconds,
+        waves_completed=rollout.waves_completed,
+        waves_total=rollout.waves_total,
+        hosts_total=len(rollout.server_ids),
+        hosts_succeeded=rollout.hosts_succeeded,
+        hosts_failed=rollout.hosts_failed,
+        hosts=[AgentRolloutHostResult(**host) for host in rollout.results or []],
+        error=rollout.error,
+        triggered_by=rollout.triggered_by,
+        created_at=rollout.created_at,
+        started_at=rollout.started_at,
+        completed_at=rollout.completed_at,
+    )
+
+
+async def _get_rollout_or_404(session: AsyncSession, rollout_id: int) -> AgentRollout:
+    rollout = await session.get(AgentRollout, rollout_id)
+    if rollout is None:
+        raise HTTPException(status_code=404, detail=f"Rollout {rollout_id} not found")
+    return rollout
+
+
+async def run_rollout_background(rollout_id: int) -> None:
+    """Run a rollout's waves in the background.
+
+    Args:
+        rollout_id: ID of the pending rollout to run.
+    """
+    await get_rollout_service().execute_rollout(rollout_id)
+
+
+@router.post(
+    "/rollouts",
+    response_model=AgentRolloutResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    operation_id="create_agent_rollout",
+    summary="Start a fleet agent rollout",
+    responses={
+        **AUTH_RESPONSES,
+        **BAD_REQUEST_RESPONSE,
+        409: {"description": "Another rollout is already active"},
+    },
+)
+async def create_rollout(
+    request: AgentRolloutRequest,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> AgentRolloutResponse:
+    """Upgrade the agent on many servers in waves.
+
+    The first wave is a canary of canary_size servers; later waves upgrade
+    wave_size servers concurrently. After each wave the rollout waits for the
+    upgraded servers to heartbeat with the new agent version and pauses if
+    any upgrade fails or a heartbeat does not arrive in time.
+
+    Poll GET /agents/rollouts/{rollout_id} (or subscribe to rollout_progress
+    events) for per-server results.
+    """
+    try:
+        rollout = await get_rollout_service().create_rollout(
+            session,
+            server_ids=request.server_ids,
+            canary_size=request.canary_size,
+            wave_size=request.wave_size,
+            heartbeat_timeout_seconds=request.heartbeat_timeout_seconds,
+        )
+    except RolloutConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    except RolloutError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    # The background run opens its own session, so the rollout must be visible to it
+    await session.commit()
+    background_tasks.add_task(run_rollout_background, rollout.id)
+    return _rollout_response(rollout)
+
+
+@router.get(
+    "/rollouts",
+    response_model=AgentRolloutListResponse,
+    operation_id="list_agent_rollouts",
+    summary="List fleet agent rollouts",
+    responses={**AUTH_RESPONSES},
+)
+async def list_rollouts(
+    limit: int = Query(20, ge=1, le=100, description="Maximum rollouts to return"),
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> AgentRolloutListResponse:
+    """List recent fleet agent rollouts, newest first."""
+    result = await session.execute(
+        select(AgentRollout).order_by(AgentRollout.id.desc()).limit(limit)
+    )
+    rollouts = [_rollout_response(rollout) for rollout in result.scalars().all()]
+    return AgentRolloutListResponse(rollouts=rollouts, total=len(rollouts))
+
+
+@router.get(
+    "/rollouts/{rollout_id}",
+    response_model=AgentRolloutResponse,
+    operation_id="get_agent_rollout",
+    summary="Get fleet agent rollout progress",
+    responses={**AUTH_RESPONSES, **NOT_FOUND_RESPONSE},
+)
+async def get_rollout(
+    rollout_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> AgentRolloutResponse:
+    """Get a rollout's status and per-server results."""
+    return _rollout_response(await _get_rollout_or_404(session, rollout_id))
+
+
+@router.post(
+    "/rollouts/{rollout_id}/pause",
+    response_model=AgentRolloutResponse,
+    operation_id="pause_agent_rollout",
+    summary="Pause a fleet agent rollout",
+    responses={**AUTH_RESPONSES, **NOT_FOUND_RESPONSE, **CONFLICT_RESPONSE},
+)
+async def pause_rollout(
+    rollout_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> AgentRolloutResponse:
+    """Pause a rollout once its current wave finishes."""
+    rollout = await _get_rollout_or_404(session, rollout_id)
+    try:
+        await get_rollout_service().pause_rollout(session, rollout)
+    except RolloutError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    return _rollout_response(rollout)
+
+
+@router.post(
+    "/rollouts/{rollout_id}/unpause",
+    response_model=AgentRolloutResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    operation_id="unpause_agent_rollout",
+    summary="Continue a paused fleet agent rollout",
+    responses={**AUTH_RESPONSES, **NOT_FOUND_RESPONSE, **CONFLICT_RESPONSE},
+)
+async def unpause_rollout(
+    rollout_id: int,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> AgentRolloutResponse:
+    """Continue a paused rollout with its next wave.
+
+    Servers that failed in earlier waves are not retried; upgrade them
+    individually once the cause is fixed.
+    """
+    rollout = await _get_rollout_or_404(session, rollout_id)
+    try:
+        await get_rollout_service().unpause_rollout(session, rollout)
+    except RolloutError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+
+    await session.commit()
+    background_tasks.add_task(run_rollout_background, rollout.id)
+    return _rollout_response(rollout)
+
+
+@router.post(
+    "/rollouts/{rollout_id}/cancel",
+    response_model=AgentRolloutResponse,
+    operation_id="cancel_agent_rollout",
+    summary="Cancel a fleet agent rollout",
+    responses={**AUTH_RESPONSES, **NOT_FOUND_RESPONSE, **CONFLICT_RESPONSE},
+)
+async def cancel_rollout(
+    rollout_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> AgentRolloutResponse:
+    """Cancel a rollout; servers already upgraded keep the new agent."""
+    rollout = await _get_rollout_or_404(session, rollout_id)
+    try:
+        await get_rollout_service().cancel_rollout(session, rollout)
+    except RolloutError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    return _rollout_response(rollout)
@@ -7,14 +7,16 @@ Provides endpoints for:
 - Claiming tokens and receiving agent credentials
 - Managing agent tokens (rotate, revoke)
 - Getting the install script
+- Downloading the agent files
 
 Secure Agent Architecture: Pull-based installation with per-agent tokens.
 """
 
+import asyncio
 import json
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -34,6 +36,7 @@ from homelab_cmd.api.schemas.agent_register import (
 from homelab_cmd.config import get_settings
 from homelab_cmd.db.models.registration_token import AgentMode as DbAgentMode
 from homelab_cmd.db.session import get_async_session
+from homelab_cmd.services.agent_deploy import get_agent_archive
 from homelab_cmd.services.token_service import TokenService
 
 router = APIRouter(prefix="/agents/register", tags=["Agent Registration"])
@@ -250,6 +253,39 @@ async def get_install_script(
     return PlainTextResponse(content=script, media_type="text/x-shellscript")
 
 
+@router.get(
+    "/download",
+    response_class=Response,
+    operation_id="get_agent_download",
+    summary="Download the agent files",
+    responses={
+        200: {"content": {"application/gzip": {}}, "description": "Agent archive"},
+        304: {"description": "Archive matches If-None-Match"},
+        404: {"description": "Agent files not available on this hub"},
+    },
+)
+async def get_agent_download(request: Request) -> Response:
+    """Download the agent files used by the install script.
+
+    Serves the cached, prebuilt archive for the current agent version with
+    an ETag, so repeat downloads can be answered with 304 Not Modified.
+    """
+    try:
+        archive = await asyncio.to_thread(get_agent_archive)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    headers = {"ETag": archive.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if archive.etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match == "*":
+        return Response(status_code=304, headers=headers)
+
+    headers["Content-Disposition"] = (
+        f'attachment; filename="homelab-agent-{archive.version}.tar.gz"'
+    )
+    return Response(content=archive.download, media_type="application/gzip", headers=headers)
+
+
 # --- Agent Token Management Endpoints ---
 
 
@@ -514,7 +550,7 @@ python3 -c "import psutil, httpx, yaml" 2>/dev/null || {{
 
 # Download agent files from hub
 echo "Downloading agent files..."
-curl -sSL "$HUB_URL/api/v1/agents/download" -o /tmp/homelab-agent.tar.gz 2>/dev/null || {{
+curl -fsSL "$HUB_URL/api/v1/agents/register/download" -o /tmp/homelab-agent.tar.gz 2>/dev/null || {{
     echo "Warning: Could not download agent from hub, attempting alternative method..."
     # Fallback: try to copy from local path if available
     if [[ -f "/opt/homelab-agent/agent.py" ]]; then
@@ -526,7 +562,7 @@ curl -sSL "$HUB_URL/api/v1/agents/download" -o /tmp/homelab-agent.tar.gz 2>/dev/
 }}
 
 if [[ -f /tmp/homelab-agent.tar.gz ]]; then
-    tar -xzf /tmp/homelab-agent.tar.gz -C "$INSTALL_DIR"
+    tar -xzf /tmp/homelab-agent.tar.gz -C /
     rm /tmp/homelab-agent.tar.gz
 fi
 
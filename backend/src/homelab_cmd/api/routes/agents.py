@@ -1,35 +1,73 @@
 """Agent communication API endpoints."""
 
+import asyncio
+import json
 import logging
 from datetime import UTC, datetime
+from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from homelab_cmd.api.deps import AuthInfo, verify_agent_auth
-from homelab_cmd.api.responses import AUTH_RESPONSES, FORBIDDEN_RESPONSE
+from homelab_cmd.api.deps import AuthInfo, verify_agent_auth, verify_api_key
+from homelab_cmd.api.responses import AUTH_RESPONSES, FORBIDDEN_RESPONSE, NOT_FOUND_RESPONSE
 from homelab_cmd.api.routes.config import (
     DEFAULT_NOTIFICATIONS,
     DEFAULT_THRESHOLDS,
     get_config_value,
 )
+from homelab_cmd.api.schemas.agent_channel import (
+    AgentChannelInfo,
+    AgentChannelListResponse,
+    LiveMetricsResponse,
+)
+from homelab_cmd.api.schemas.agent_event import (
+    AgentEventsRequest,
+    AgentEventsResponse,
+    AgentEventType,
+    ShutdownReason,
+)
 from homelab_cmd.api.schemas.config import NotificationsConfig, ThresholdsConfig
 from homelab_cmd.api.schemas.heartbeat import (
+    HeartbeatBatchRequest,
+    HeartbeatBatchResponse,
+    HeartbeatBatchServerResult,
     HeartbeatRequest,
     HeartbeatResponse,
+    MetricsPayload,
     PendingCommand,
+    ServiceStatusPayload,
 )
 from homelab_cmd.db.models.metrics import FilesystemMetrics, Metrics, NetworkInterfaceMetrics
 from homelab_cmd.db.models.server import Server, ServerStatus
-from homelab_cmd.db.models.service import ServiceStatus
-from homelab_cmd.db.session import get_async_session
-from homelab_cmd.services.alerting import AlertingService
+from homelab_cmd.db.models.service import CurrentServiceStatus, ServiceStatus
+from homelab_cmd.db.session import get_async_session, get_session_factory
+from homelab_cmd.services import telemetry
+from homelab_cmd.services.agent_channel import (
+    AgentChannelError,
+    AgentConnection,
+    ChannelCommand,
+    get_agent_channel_manager,
+    handle_channel_lost,
+)
+from homelab_cmd.services.alerting import AlertEvent, AlertingService
+from homelab_cmd.services.event_bus import EventTopic, publish
 from homelab_cmd.services.notifier import get_notifier
+from homelab_cmd.services.token_service import TokenService
 
 router = APIRouter(prefix="/agents", tags=["Agents"])
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for an agent to answer an on-demand metrics pull
+LIVE_METRICS_TIMEOUT = 10.0
+
+# Offline checks for dropped channels still in flight (per worker)
+_channel_lost_tasks: set[asyncio.Task] = set()
+
 # US0152: Async command channel removed (EP0013)
 # Commands are now executed via synchronous SSH (US0151, US0153)
 # The following functions were removed:
@@ -62,9 +100,6 @@ async def receive_heartbeat(
     Also stores metrics, updates server status to online, and auto-registers
     unknown servers. Processes command results and returns pending commands.
     """
-    now = datetime.now(UTC)
-    server_registered = False
-
     # US0152: Deprecation warning for v1.0 agents sending command_results
     # The async command channel is deprecated - use synchronous SSH execution (EP0013)
     if heartbeat.command_results:
@@ -77,6 +112,769 @@ async def receive_heartbeat(
     # command_results are now ignored - no longer processing them
     results_acknowledged: list[int] = []
 
+    client_host = request.client.host if request.client else None
+    server_registered = await _process_heartbeat(heartbeat, client_host, session, "rest")
+
+    logger.debug("Heartbeat received from %s", heartbeat.server_id)
+
+    # US0152: pending_commands is deprecated - always return empty array
+    # Commands are now executed via synchronous SSH (EP0013: US0151, US0153)
+    # The pending_commands field is kept for backward compatibility with v1.0 agents
+    pending_commands: list[PendingCommand] = []
+
+    # Return response with empty pending_commands (backward compatible)
+    return HeartbeatResponse(
+        status="ok",
+        server_registered=server_registered,
+        pending_commands=pending_commands,
+        results_acknowledged=results_acknowledged,
+    )
+
+
+@router.post(
+    "/heartbeat/batch",
+    response_model=HeartbeatBatchResponse,
+    operation_id="create_heartbeat_batch",
+    summary="Receive batched heartbeat samples",
+    responses={**AUTH_RESPONSES, **FORBIDDEN_RESPONSE},
+)
+async def receive_heartbeat_batch(
+    batch: HeartbeatBatchRequest,
+    request: Request,
+    session: AsyncSession = Depends(get_async_session),
+    auth: AuthInfo = Depends(verify_agent_auth),
+) -> HeartbeatBatchResponse:
+    """Receive many timestamped heartbeat samples in one request.
+
+    Used by agents for backfill after a connectivity gap and for
+    high-frequency sampling, and by relays forwarding for several agents.
+
+    Samples are grouped per server and ordered by timestamp. The most recent
+    sample for each server goes through the normal heartbeat path (server
+    state, packages, alert evaluation). Older samples are history only and
+    are bulk-inserted in a single executemany per table.
+
+    Agents authenticating with a per-agent token may only submit samples
+    for their own server GUID.
+    """
+    if auth.method == "per_agent":
+        foreign = sorted(
+            {hb.server_id for hb in batch.heartbeats if hb.server_guid != auth.server_guid}
+        )
+        if foreign:
+            raise HTTPException(
+                status_code=403,
+                detail={
+                    "code": "FORBIDDEN",
+                    "message": "Agent token may only submit samples for its own server: "
+                    + ", ".join(foreign),
+                },
+            )
+
+    samples_by_server: dict[str, list[HeartbeatRequest]] = {}
+    for hb in batch.heartbeats:
+        samples_by_server.setdefault(hb.server_id, []).append(hb)
+
+    client_host = request.client.host if request.client else None
+    results: list[HeartbeatBatchServerResult] = []
+    for server_id, samples in samples_by_server.items():
+        samples.sort(key=lambda hb: hb.timestamp)
+        latest = samples[-1]
+
+        server_registered = await _process_heartbeat(latest, client_host, session, "batch")
+        await _store_heartbeat_history(session, samples[:-1])
+        telemetry.HEARTBEATS.inc(len(samples) - 1, endpoint="batch")
+
+        results.append(
+            HeartbeatBatchServerResult(
+                server_id=server_id,
+                samples_accepted=len(samples),
+                server_registered=server_registered,
+            )
+        )
+
+    logger.debug(
+        "Batch heartbeat received: %d sample(s) for %d server(s)",
+        len(batch.heartbeats),
+        len(results),
+    )
+
+    return HeartbeatBatchResponse(
+        status="ok",
+        accepted=len(batch.heartbeats),
+        servers=results,
+    )
+
+
+@router.post(
+    "/events",
+    response_model=AgentEventsResponse,
+    operation_id="create_agent_events",
+    summary="Receive state-change events from agent",
+    responses={**AUTH_RESPONSES, **FORBIDDEN_RESPONSE, **NOT_FOUND_RESPONSE},
+)
+async def receive_agent_events(
+    payload: AgentEventsRequest,
+    session: AsyncSession = Depends(get_async_session),
+    auth: AuthInfo = Depends(verify_agent_auth),
+) -> AgentEventsResponse:
+    """Receive immediate state-change events pushed by an agent.
+
+    Agents push events between heartbeats when a watched service changes
+    ActiveState, a filesystem crosses the usage threshold, or the agent is
+    shutting down. Events go straight through the alerting path, so
+    detection takes seconds rather than a heartbeat interval (or the
+    offline threshold for shutdowns).
+
+    - service_state: recorded as service status and evaluated against
+      expected services
+    - filesystem_threshold: updates the filesystem snapshot; root filesystem
+      usage is evaluated against the disk thresholds
+    - shutdown (system_shutdown): server is marked offline and an offline
+      alert raised immediately. agent_stop is only logged and does not
+      refresh last_seen, so stale-server detection still applies from the
+      last heartbeat if heartbeats do not resume.
+
+    The server must already be registered via heartbeat.
+    """
+    if auth.method == "per_agent" and payload.server_guid != auth.server_guid:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "code": "FORBIDDEN",
+                "message": "Agent token may only submit events for its own server",
+            },
+        )
+
+    return await _process_agent_events(payload, session)
+
+
+async def _process_agent_events(
+    payload: AgentEventsRequest,
+    session: AsyncSession,
+) -> AgentEventsResponse:
+    """Apply pushed state-change events to server state and alerting.
+
+    Args:
+        payload: Validated event push.
+        session: Database session.
+
+    Returns:
+        Summary of processed events and alerts raised.
+
+    Raises:
+        HTTPException: 404 for unknown servers, 403 for inactive servers.
+    """
+    server: Server | None = None
+    if payload.server_guid:
+        result = await session.execute(select(Server).where(Server.guid == payload.server_guid))
+        server = result.scalar_one_or_none()
+    if server is None:
+        server = await session.get(Server, payload.server_id)
+    if server is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": "NOT_FOUND", "message": f"Server '{payload.server_id}' not found"},
+        )
+    if server.is_inactive:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "code": "FORBIDDEN",
+                "message": f"Server '{server.id}' is inactive (agent removed). Uninstall the agent.",
+            },
+        )
+
+    notifications_data = await get_config_value(session, "notifications")
+    notifications = (
+        NotificationsConfig(**notifications_data) if notifications_data else DEFAULT_NOTIFICATIONS
+    )
+    alerting_service = AlertingService(session)
+    server_name = server.display_name or server.hostname
+    events: list[AlertEvent] = []
+
+    # Latest reported state per service, evaluated once after all events are stored
+    latest_services: dict[str, ServiceStatusPayload] = {}
+    service_rows: list[dict[str, Any]] = []
+    shutdown_reason: ShutdownReason | None = None
+
+    for event in sorted(payload.events, key=lambda e: e.timestamp):
+        if event.event_type == AgentEventType.SERVICE_STATE and event.service:
+            svc = event.service
+            row = _service_status_row(server.id, svc, event.timestamp)
+            session.add(ServiceStatus(**row))
+            service_rows.append(row)
+            latest_services[svc.name] = svc
+
+        elif event.event_type == AgentEventType.FILESYSTEM_THRESHOLD and event.filesystem:
+            fs = event.filesystem
+            session.add(
+                FilesystemMetrics(
+                    server_id=server.id,
+                    timestamp=event.timestamp,
+                    **fs.model_dump(),
+                )
+            )
+            # Replace this mount in the latest snapshot (new list so the JSON column is dirtied)
+            snapshot = [
+                entry
+                for entry in (server.filesystems or [])
+                if entry.get("mount_point") != fs.mount_point
+            ]
+            server.filesystems = [*snapshot, fs.model_dump()]
+
+            if fs.mount_point == "/":
+                thresholds_data = await get_config_value(session, "thresholds")
+                thresholds = (
+                    ThresholdsConfig(**thresholds_data) if thresholds_data else DEFAULT_THRESHOLDS
+                )
+                events.extend(
+                    await alerting_service.evaluate_heartbeat(
+                        server_id=server.id,
+                        server_name=server_name,
+                        cpu_percent=None,
+                        memory_percent=None,
+                        disk_percent=fs.percent,
+                        thresholds=thresholds,
+                        notifications=notifications,
+                    )
+                )
+
+        elif event.event_type == AgentEventType.SHUTDOWN:
+            logger.info(
+                "Server %s agent shutting down (%s)",
+                server.id,
+                event.shutdown_reason.value if event.shutdown_reason else "unknown",
+            )
+            shutdown_reason = event.shutdown_reason or ShutdownReason.AGENT_STOP
+
+    await session.flush()
+    await _store_current_service_status(session, service_rows)
+
+    if latest_services:
+        events.extend(
+            await alerting_service.evaluate_services(
+                server_id=server.id,
+                server_name=server_name,
+                services=list(latest_services.values()),
+                notifications=notifications,
+            )
+        )
+
+    if shutdown_reason == ShutdownReason.SYSTEM_SHUTDOWN:
+        # Host is going down: mark offline now instead of waiting for stale detection
+        if server.status != ServerStatus.OFFLINE.value:
+            publish(
+                EventTopic.SERVER_STATUS,
+                {
+                    "server_id": server.id,
+                    "status": ServerStatus.OFFLINE.value,
+                    "previous_status": server.status,
+                },
+            )
+        server.status = ServerStatus.OFFLINE.value
+        # Skip offline alerts for workstations (EP0009: US0089)
+        if server.machine_type != "workstation":
+            offline_event = await alerting_service.trigger_offline_alert(
+                server_id=server.id,
+                server_name=server_name,
+                cooldowns=notifications.cooldowns,
+            )
+            if offline_event:
+                events.append(offline_event)
+    elif shutdown_reason is None:
+        server.status = ServerStatus.ONLINE.value
+        server.last_seen = datetime.now(UTC)
+    # Only the agent is stopping: leave status and last_seen as they were, so
+    # stale detection takes over from the last heartbeat if it never returns
+
+    if events and notifications.slack_webhook_url:
+        notifier = get_notifier(notifications.slack_webhook_url)
+        for alert_event in events:
+            await notifier.send_alert(alert_event, notifications)
+
+    logger.debug("Received %d event(s) from %s", len(payload.events), server.id)
+
+    return AgentEventsResponse(
+        status="ok",
+        processed=len(payload.events),
+        alerts_triggered=len(events),
+    )
+
+
+@router.get(
+    "/channels",
+    response_model=AgentChannelListResponse,
+    operation_id="list_agent_channels",
+    summary="List agents connected over the persistent channel",
+    responses={**AUTH_RESPONSES},
+)
+async def list_agent_channels(
+    _: str = Depends(verify_api_key),
+) -> AgentChannelListResponse:
+    """List agents that currently hold a persistent channel to the hub.
+
+    Commands for these servers are delivered over the channel instead of SSH.
+    """
+    channels = [
+        AgentChannelInfo(server_id=conn.server_id, connected_at=conn.connected_at)
+        for conn in get_agent_channel_manager().connections()
+    ]
+    channels.sort(key=lambda c: c.server_id)
+    return AgentChannelListResponse(channels=channels, total=len(channels))
+
+
+@router.get(
+    "/{server_id}/metrics/live",
+    response_model=LiveMetricsResponse,
+    operation_id="get_agent_live_metrics",
+    summary="Pull current metrics from an agent over its channel",
+    responses={
+        **AUTH_RESPONSES,
+        **NOT_FOUND_RESPONSE,
+        503: {"description": "Agent channel not connected or agent did not respond"},
+    },
+)
+async def get_agent_live_metrics(
+    server_id: str,
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> LiveMetricsResponse:
+    """Ask a connected agent for its metrics right now.
+
+    Avoids waiting for the next heartbeat. Only available for agents with
+    a persistent channel open.
+    """
+    server = await session.get(Server, server_id)
+    if not server:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": "NOT_FOUND", "message": f"Server '{server_id}' not found"},
+        )
+
+    try:
+        result = await get_agent_channel_manager().send_command(
+            server_id, ChannelCommand.COLLECT_METRICS, timeout=LIVE_METRICS_TIMEOUT
+        )
+    except AgentChannelError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={"code": "AGENT_CHANNEL_UNAVAILABLE", "message": str(e)},
+        ) from e
+
+    if not result.success:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "AGENT_CHANNEL_UNAVAILABLE",
+                "message": result.error or "Agent failed to collect metrics",
+            },
+        )
+
+    return LiveMetricsResponse(
+        server_id=server_id,
+        collected_at=datetime.now(UTC),
+        metrics=MetricsPayload.model_validate(result.result.get("metrics") or {}),
+    )
+
+
+@router.websocket("/channel")
+async def agent_channel(websocket: WebSocket) -> None:
+    """Persistent agent channel carrying heartbeats, events and hub commands.
+
+    Optional alternative to HTTP polling for agents with a per-agent token.
+    The agent authenticates with the X-Agent-Token and X-Server-GUID headers.
+    Heartbeat and event frames are processed exactly as the HTTP endpoints
+    and acknowledged on the same connection; the hub pushes command frames
+    back (see services.agent_channel for the frame format).
+
+    Opening the channel refreshes the server's last_seen and marks it online.
+    If the connection drops without a shutdown event, the server is marked
+    offline after a short grace period unless the agent reconnects.
+
+    Close codes: 4401 invalid credentials, 4403 inactive server, 4404 no
+    server registered for the GUID.
+    """
+    agent_token = (websocket.headers.get("X-Agent-Token") or "").strip()
+    server_guid = (websocket.headers.get("X-Server-GUID") or "").strip()
+    await websocket.accept()
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        is_valid = False
+        if agent_token and server_guid:
+            is_valid, _ = await TokenService(session).validate_agent_token(
+                plaintext_token=agent_token,
+                server_guid=server_guid,
+            )
+        if not is_valid:
+            await websocket.close(code=4401, reason="Invalid agent token or server GUID")
+            return
+
+        result = await session.execute(select(Server).where(Server.guid == server_guid))
+        server = result.scalar_one_or_none()
+        if server is None:
+            await websocket.close(code=4404, reason="No server registered for this GUID")
+            return
+        if server.is_inactive:
+            await websocket.close(code=4403, reason="Server is inactive (agent removed)")
+            return
+
+        server_id = server.id
+        # The agent is alive: an offline check for a channel it dropped on
+        # another worker must not mark it offline before its next heartbeat
+        server.last_seen = datetime.now(UTC)
+        if server.status != ServerStatus.ONLINE.value:
+            publish(
+                EventTopic.SERVER_STATUS,
+                {
+                    "server_id": server_id,
+                    "status": ServerStatus.ONLINE.value,
+                    "previous_status": server.status,
+                },
+            )
+            server.status = ServerStatus.ONLINE.value
+        # Commit last_seen and the last_used_at update
+        await session.commit()
+
+    manager = get_agent_channel_manager()
+    connection = AgentConnection(server_id, server_guid, websocket)
+    previous = manager.register(connection)
+    if previous:
+        # Agent reconnected before the old socket noticed it was gone
+        try:
+            await previous.websocket.close(code=1000, reason="Replaced by new connection")
+        except RuntimeError:
+            pass
+
+    client_host = websocket.client.host if websocket.client else None
+    try:
+        while True:
+            text = await websocket.receive_text()
+            try:
+                frame = json.loads(text)
+            except json.JSONDecodeError:
+                await connection.send_json(
+                    {"type": "error", "code": "INVALID_FRAME", "message": "Frame is not JSON"}
+                )
+                continue
+            reply = await _handle_channel_frame(connection, frame, client_host)
+            if reply is not None:
+                await connection.send_json(reply)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if manager.unregister(connection) and not connection.clean_shutdown:
+            task = asyncio.create_task(handle_channel_lost(server_id))
+            _channel_lost_tasks.add(task)
+            task.add_done_callback(_channel_lost_done)
+
+
+def _channel_lost_done(task: asyncio.Task) -> None:
+    """Forget a finished offline check, logging it if it failed."""
+    _channel_lost_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Offline check for dropped channel failed", exc_info=task.exception())
+
+
+async def _handle_channel_frame(
+    connection: AgentConnection,
+    frame: dict[str, Any],
+    client_host: str | None,
+) -> dict[str, Any] | None:
+    """Process one agent frame and build the reply.
+
+    Args:
+        connection: Connection the frame arrived on.
+        frame: Decoded JSON frame.
+        client_host: Agent's IP address.
+
+    Returns:
+        Reply frame (ack or error), or None if no reply is needed.
+    """
+    frame_type = frame.get("type")
+    frame_id = frame.get("id")
+
+    if frame_type == "command_result":
+        connection.resolve(frame)
+        return None
+
+    if frame_type not in ("heartbeat", "events"):
+        return {
+            "type": "error",
+            "id": frame_id,
+            "code": "INVALID_FRAME",
+            "message": f"Unknown frame type: {frame_type}",
+        }
+
+    session_factory = get_session_factory()
+    try:
+        async with session_factory() as session:
+            response: HeartbeatResponse | AgentEventsResponse
+            if frame_type == "heartbeat":
+                heartbeat = HeartbeatRequest.model_validate(frame.get("payload") or {})
+                _check_channel_guid(connection, heartbeat.server_guid)
+                server_registered = await _process_heartbeat(
+                    heartbeat, client_host, session, "channel"
+                )
+                response = HeartbeatResponse(status="ok", server_registered=server_registered)
+            else:
+                payload = AgentEventsRequest.model_validate(frame.get("payload") or {})
+                _check_channel_guid(connection, payload.server_guid)
+                response = await _process_agent_events(payload, session)
+                if any(e.event_type == AgentEventType.SHUTDOWN for e in payload.events):
+                    # Agent announced its stop; the disconnect that follows is expected
+                    connection.clean_shutdown = True
+            await session.commit()
+    except ValidationError as e:
+        return {
+            "type": "error",
+            "id": frame_id,
+            "code": "VALIDATION_ERROR",
+            "message": str(e),
+        }
+    except HTTPException as e:
+        detail = e.detail if isinstance(e.detail, dict) else {"message": str(e.detail)}
+        return {
+            "type": "error",
+            "id": frame_id,
+            "code": detail.get("code", "ERROR"),
+            "message": detail.get("message", ""),
+        }
+
+    return {"type": "ack", "id": frame_id, "payload": response.model_dump(mode="json")}
+
+
+def _check_channel_guid(connection: AgentConnection, server_guid: str | None) -> None:
+    """Reject frames for a server other than the one the channel authenticated as."""
+    if server_guid != connection.server_guid:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "code": "FORBIDDEN",
+                "message": "Agent channel may only carry data for its own server",
+            },
+        )
+
+
+def _service_status_row(
+    server_id: str, svc: ServiceStatusPayload, timestamp: datetime
+) -> dict[str, Any]:
+    """Build service status column values from a reported service."""
+    return {
+        "server_id": server_id,
+        "service_name": svc.name,
+        "status": svc.status,
+        "status_reason": svc.status_reason,
+        "pid": svc.pid,
+        "memory_mb": svc.memory_mb,
+        "cpu_percent": svc.cpu_percent,
+        "timestamp": timestamp,
+    }
+
+
+async def _store_current_service_status(
+    session: AsyncSession,
+    rows: list[dict[str, Any]],
+) -> None:
+    """Record the latest status of each reported service.
+
+    Upserts service_current_status in one statement. A row only replaces
+    the stored status if it is at least as new, so backfilled or replayed
+    samples cannot roll a service's state back.
+
+    Args:
+        session: Database session.
+        rows: Service status column values, as stored in service_status.
+    """
+    latest: dict[tuple[str, str], dict[str, Any]] = {}
+    for row in rows:
+        key = (row["server_id"], row["service_name"])
+        if key not in latest or row["timestamp"] >= latest[key]["timestamp"]:
+            latest[key] = row
+    if not latest:
+        return
+
+    stmt = sqlite_insert(CurrentServiceStatus).values(list(latest.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["server_id", "service_name"],
+        set_={
+            column: stmt.excluded[column]
+            for column in (
+                "status",
+                "status_reason",
+                "pid",
+                "memory_mb",
+                "cpu_percent",
+                "timestamp",
+            )
+        },
+        where=stmt.excluded.timestamp >= CurrentServiceStatus.timestamp,
+    )
+    await session.execute(stmt)
+
+
+async def backfill_current_service_status(session: AsyncSession) -> int:
+    """Fill service_current_status for services with history but no row.
+
+    Databases created with create_all rather than upgraded through the
+    migration start with an empty table. Each missing service gets its
+    newest service_status row; services that already have a row are left
+    alone, so this is a no-op once the table is complete.
+
+    Args:
+        session: Database session (not committed).
+
+    Returns:
+        Number of rows added.
+    """
+    newer = aliased(ServiceStatus)
+    newest_id = (
+        select(newer.id)
+        .where(newer.server_id == ServiceStatus.server_id)
+        .where(newer.service_name == ServiceStatus.service_name)
+        .order_by(newer.timestamp.desc(), newer.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    has_current = (
+        select(CurrentServiceStatus.server_id)
+        .where(CurrentServiceStatus.server_id == ServiceStatus.server_id)
+        .where(CurrentServiceStatus.service_name == ServiceStatus.service_name)
+        .exists()
+    )
+    columns = [
+        "server_id",
+        "service_name",
+        "status",
+        "status_reason",
+        "pid",
+        "memory_mb",
+        "cpu_percent",
+        "timestamp",
+    ]
+    stmt = (
+        sqlite_insert(CurrentServiceStatus)
+        .from_select(
+            columns,
+            select(*(getattr(ServiceStatus, column) for column in columns))
+            .where(~has_current)
+            .where(ServiceStatus.id == newest_id),
+        )
+        .on_conflict_do_nothing()
+    )
+    result = await session.execute(stmt)
+    return result.rowcount
+
+
+async def _store_heartbeat_history(
+    session: AsyncSession,
+    samples: list[HeartbeatRequest],
+) -> None:
+    """Bulk-insert historical rows for heartbeat samples.
+
+    Only time-series data is stored; server state is left to the latest
+    sample. Each table receives a single executemany INSERT.
+
+    Args:
+        session: Database session.
+        samples: Heartbeat samples to record as history.
+    """
+    metrics_rows = [
+        {"server_id": hb.server_id, "timestamp": hb.timestamp, **hb.metrics.model_dump()}
+        for hb in samples
+        if hb.metrics
+    ]
+    service_rows = [
+        _service_status_row(hb.server_id, svc, hb.timestamp)
+        for hb in samples
+        for svc in hb.services or []
+    ]
+    filesystem_rows = [
+        {"server_id": hb.server_id, "timestamp": hb.timestamp, **fs.model_dump()}
+        for hb in samples
+        for fs in hb.filesystems or []
+    ]
+    interface_rows = [
+        {
+            "server_id": hb.server_id,
+            "timestamp": hb.timestamp,
+            "interface_name": iface.name,
+            "rx_bytes": iface.rx_bytes,
+            "tx_bytes": iface.tx_bytes,
+            "rx_packets": iface.rx_packets,
+            "tx_packets": iface.tx_packets,
+            "is_up": iface.is_up,
+        }
+        for hb in samples
+        for iface in hb.network_interfaces or []
+    ]
+
+    if metrics_rows:
+        await session.execute(insert(Metrics), metrics_rows)
+    if service_rows:
+        await session.execute(insert(ServiceStatus), service_rows)
+        # Usually older than the latest sample's state, but a service may
+        # only appear in older samples
+        await _store_current_service_status(session, service_rows)
+    if filesystem_rows:
+        await session.execute(insert(FilesystemMetrics), filesystem_rows)
+    if interface_rows:
+        await session.execute(insert(NetworkInterfaceMetrics), interface_rows)
+
+
+async def _process_heartbeat(
+    heartbeat: HeartbeatRequest,
+    client_host: str | None,
+    session: AsyncSession,
+    endpoint: str,
+) -> bool:
+    """Apply a heartbeat and record it in this worker's telemetry.
+
+    Args:
+        heartbeat: Validated heartbeat payload.
+        client_host: Agent's IP address as seen by the hub, if known.
+        session: Database session.
+        endpoint: How the heartbeat arrived (rest, batch or channel).
+
+    Returns:
+        True if the server was auto-registered by this heartbeat.
+    """
+    with telemetry.HEARTBEAT_DURATION.time(endpoint=endpoint):
+        server_registered = await _apply_heartbeat(heartbeat, client_host, session)
+    telemetry.HEARTBEATS.inc(endpoint=endpoint)
+
+    metrics = heartbeat.metrics
+    telemetry.get_fleet_gauges().record_heartbeat(
+        heartbeat.server_id,
+        heartbeat.hostname,
+        {f: getattr(metrics, f) for f, _, _ in telemetry.SERVER_GAUGES} if metrics else None,
+        {svc.name: svc.status for svc in heartbeat.services or []},
+    )
+    return server_registered
+
+
+async def _apply_heartbeat(
+    heartbeat: HeartbeatRequest,
+    client_host: str | None,
+    session: AsyncSession,
+) -> bool:
+    """Apply a single heartbeat to server state, history and alerting.
+
+    Args:
+        heartbeat: Validated heartbeat payload.
+        client_host: Agent's IP address as seen by the hub, if known.
+        session: Database session.
+
+    Returns:
+        True if the server was auto-registered by this heartbeat.
+
+    Raises:
+        HTTPException: 409 on GUID conflicts, 403 for inactive servers.
+    """
+    now = datetime.now(UTC)
+    server_registered = False
+
     # 2. Server matching logic (US0070)
     server: Server | None = None
 
@@ -166,14 +964,24 @@ async def receive_heartbeat(
         )
 
     # Update server status and last_seen (AC2)
+    previous_status = None if server_registered else server.status
     server.status = ServerStatus.ONLINE.value
     server.last_seen = now
+    if previous_status != ServerStatus.ONLINE.value:
+        publish(
+            EventTopic.SERVER_STATUS,
+            {
+                "server_id": server.id,
+                "status": ServerStatus.ONLINE.value,
+                "previous_status": previous_status,
+            },
+        )
 
     # Update volatile fields on EVERY heartbeat (US0070 - AC5)
     # These can change with DHCP/network changes but GUID stays the same
     server.hostname = heartbeat.hostname
-    if request.client:
-        server.ip_address = str(request.client.host)
+    if client_host:
+        server.ip_address = client_host
 
     # Update OS info if provided (AC4)
     if heartbeat.os_info:
@@ -234,21 +1042,26 @@ async def receive_heartbeat(
             uptime_seconds=heartbeat.metrics.uptime_seconds,
         )
         session.add(metrics)
+        publish(
+            EventTopic.METRICS,
+            {
+                "server_id": server.id,
+                "timestamp": heartbeat.timestamp.isoformat(),
+                "cpu_percent": heartbeat.metrics.cpu_percent,
+                "memory_percent": heartbeat.metrics.memory_percent,
+                "disk_percent": heartbeat.metrics.disk_percent,
+                "load_1m": heartbeat.metrics.load_1m,
+            },
+        )
 
     # Store service status if provided (US0018 - AC5)
     if heartbeat.services:
-        for svc in heartbeat.services:
-            service_status = ServiceStatus(
-                server_id=heartbeat.server_id,
-                service_name=svc.name,
-                status=svc.status,
-                status_reason=svc.status_reason,
-                pid=svc.pid,
-                memory_mb=svc.memory_mb,
-                cpu_percent=svc.cpu_percent,
-                timestamp=heartbeat.timestamp,
-            )
-            session.add(service_status)
+        service_rows = [
+            _service_status_row(heartbeat.server_id, svc, heartbeat.timestamp)
+            for svc in heartbeat.services
+        ]
+        session.add_all(ServiceStatus(**row) for row in service_rows)
+        await _store_current_service_status(session, service_rows)
 
     # Store per-filesystem metrics if provided (US0178)
     if heartbeat.filesystems:
@@ -384,17 +1197,4 @@ async def receive_heartbeat(
             for event in events:
                 await notifier.send_alert(event, notifications)
 
-    logger.debug("Heartbeat received from %s", heartbeat.server_id)
-
-    # US0152: pending_commands is deprecated - always return empty array
-    # Commands are now executed via synchronous SSH (EP0013: US0151, US0153)
-    # The pending_commands field is kept for backward compatibility with v1.0 agents
-    pending_commands: list[PendingCommand] = []
-
-    # Return response with empty pending_commands (backward compatible)
-    return HeartbeatResponse(
-        status="ok",
-        server_registered=server_registered,
-        pending_commands=pending_commands,
-        results_acknowledged=results_acknowledged,
-    )
+    return server_registered
@@ -1,15 +1,21 @@
 """Alert API endpoints for listing, viewing, acknowledging, and resolving alerts."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import desc, func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from homelab_cmd.api.conditional import conditional_get
 from homelab_cmd.api.deps import verify_api_key
-from homelab_cmd.api.responses import AUTH_RESPONSES, BAD_REQUEST_RESPONSE, NOT_FOUND_RESPONSE
-from homelab_cmd.api.routes.config import get_config_value
+from homelab_cmd.api.pagination import count_rows, filter_criteria, page_query, split_page
+from homelab_cmd.api.responses import (
+    AUTH_RESPONSES,
+    BAD_REQUEST_RESPONSE,
+    NOT_FOUND_RESPONSE,
+    NOT_MODIFIED_RESPONSE,
+)
 from homelab_cmd.api.schemas.alerts import (
     AlertAcknowledgeResponse,
     AlertListResponse,
@@ -18,14 +24,18 @@ from homelab_cmd.api.schemas.alerts import (
     PendingBreachListResponse,
     PendingBreachResponse,
 )
-from homelab_cmd.api.schemas.config import ThresholdsConfig
 from homelab_cmd.db.models.alert import Alert, AlertStatus
 from homelab_cmd.db.models.alert_state import AlertState
-from homelab_cmd.db.models.service import ServiceStatus
+from homelab_cmd.db.models.server import Server
+from homelab_cmd.db.models.service import CurrentServiceStatus
 from homelab_cmd.db.session import get_async_session
+from homelab_cmd.services.alerting import publish_alert_transition
 
 router = APIRouter(prefix="/alerts", tags=["Alerts"])
 
+# Name shown for a server: its display name if set, else its hostname
+_SERVER_NAME = func.coalesce(func.nullif(Server.display_name, ""), Server.hostname)
+
 
 def _extract_service_name(alert: Alert) -> str | None:
     """Extract service name from a service alert title.
@@ -46,14 +56,24 @@ def _extract_service_name(alert: Alert) -> str | None:
     return None
 
 
+def _server_name(server: Server | None) -> str | None:
+    """Name to show for an alert's server."""
+    return server.display_name or server.hostname if server else None
+
+
 def _to_response(
-    alert: Alert, can_acknowledge: bool = True, can_resolve: bool = True
+    alert: Alert,
+    server_name: str | None,
+    can_acknowledge: bool = True,
+    can_resolve: bool = True,
 ) -> AlertResponse:
     """Convert Alert model to AlertResponse schema.
 
     Args:
-        alert: Alert ORM model instance (with server relationship loaded)
+        alert: Alert ORM model instance
+        server_name: Display name of the alert's server
         can_acknowledge: Whether the alert can be acknowledged
+        can_resolve: Whether the alert can be resolved
 
     Returns:
         AlertResponse schema with server_name populated
@@ -61,7 +81,7 @@ def _to_response(
     return AlertResponse(
         id=alert.id,
         server_id=alert.server_id,
-        server_name=alert.server.display_name or alert.server.hostname if alert.server else None,
+        server_name=server_name,
         alert_type=alert.alert_type,
         severity=alert.severity,
         status=alert.status,
@@ -82,6 +102,9 @@ def _to_response(
 async def _is_service_still_down(alert: Alert, session: AsyncSession) -> bool:
     """Check if a service alert's service is still down.
 
+    Reads the current status table, as _down_services does for list pages,
+    so an alert gets the same answer wherever it is shown.
+
     Args:
         alert: Alert ORM model instance
         session: Database session
@@ -89,60 +112,93 @@ async def _is_service_still_down(alert: Alert, session: AsyncSession) -> bool:
     Returns:
         True if service is still down, False otherwise
     """
-    if alert.alert_type != "service":
+    service_name = _extract_service_name(alert)
+    if service_name is None:
         return False
 
-    title_parts = alert.title.split()
-    if len(title_parts) >= 2 and title_parts[0] == "Service":
-        service_name = title_parts[1]
-
-        result = await session.execute(
-            select(ServiceStatus)
-            .where(ServiceStatus.server_id == alert.server_id)
-            .where(ServiceStatus.service_name == service_name)
-            .order_by(desc(ServiceStatus.timestamp))
-            .limit(1)
-        )
-        latest_status = result.scalar_one_or_none()
-
-        if latest_status and latest_status.status in ("stopped", "failed"):
-            return True
+    current = await session.get(CurrentServiceStatus, (alert.server_id, service_name))
+    return current is not None and current.status in ("stopped", "failed")
 
-    return False
 
+async def _check_can_acknowledge(
+    alert: Alert, session: AsyncSession, service_down: bool | None = None
+) -> bool:
+    """Check if an alert can be acknowledged.
 
-async def _check_can_acknowledge(alert: Alert, session: AsyncSession) -> bool:
-    """Check if an alert can be acknowledged."""
+    service_down may be passed when already known, to skip the lookup.
+    """
     # Already acknowledged or resolved - cannot acknowledge
     if alert.status != AlertStatus.OPEN.value:
         return False
 
     # Service still down - cannot acknowledge
-    if await _is_service_still_down(alert, session):
+    if service_down is None:
+        service_down = await _is_service_still_down(alert, session)
+    if service_down:
         return False
 
     return True
 
 
-async def _check_can_resolve(alert: Alert, session: AsyncSession) -> bool:
-    """Check if an alert can be resolved."""
+async def _check_can_resolve(
+    alert: Alert, session: AsyncSession, service_down: bool | None = None
+) -> bool:
+    """Check if an alert can be resolved.
+
+    service_down may be passed when already known, to skip the lookup.
+    """
     # Already resolved - technically can (idempotent), but hide button
     if alert.status == AlertStatus.RESOLVED.value:
         return False
 
     # Service still down - cannot resolve
-    if await _is_service_still_down(alert, session):
+    if service_down is None:
+        service_down = await _is_service_still_down(alert, session)
+    if service_down:
         return False
 
     return True
 
 
+async def _down_services(alerts: list[Alert], session: AsyncSession) -> set[tuple[str, str]]:
+    """Find which of the alerts' services are still down, in one query.
+
+    Reads the current status table rather than the status history, so a
+    page of service alerts needs a single primary key lookup.
+
+    Args:
+        alerts: Alerts on a list page.
+        session: Database session
+
+    Returns:
+        (server_id, service_name) of each service that is stopped or failed.
+    """
+    services = {
+        (alert.server_id, name)
+        for alert in alerts
+        if alert.status != AlertStatus.RESOLVED.value
+        and (name := _extract_service_name(alert)) is not None
+    }
+    if not services:
+        return set()
+
+    result = await session.execute(
+        select(CurrentServiceStatus.server_id, CurrentServiceStatus.service_name)
+        .where(
+            tuple_(CurrentServiceStatus.server_id, CurrentServiceStatus.service_name).in_(services)
+        )
+        .where(CurrentServiceStatus.status.in_(("stopped", "failed")))
+    )
+    return {(server_id, service_name) for server_id, service_name in result.all()}
+
+
 @router.get(
     "",
     response_model=AlertListResponse,
     operation_id="list_alerts",
     summary="List alerts with optional filtering",
-    responses={**AUTH_RESPONSES},
+    responses={**AUTH_RESPONSES, **BAD_REQUEST_RESPONSE, **NOT_MODIFIED_RESPONSE},
+    dependencies=[Depends(conditional_get(Alert, Server, CurrentServiceStatus))],
 )
 async def list_alerts(
     status: str | None = Query(None, description="Filter by status (open, acknowledged, resolved)"),
@@ -152,53 +208,46 @@ async def list_alerts(
     server_id: str | None = Query(None, description="Filter by server ID"),
     limit: int = Query(50, ge=1, le=100, description="Maximum results to return"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(
+        None, description="next_cursor from the previous page (instead of offset)"
+    ),
     session: AsyncSession = Depends(get_async_session),
     _: str = Depends(verify_api_key),
 ) -> AlertListResponse:
     """List alerts with optional filtering and pagination.
 
-    Returns alerts sorted by creation date (newest first).
+    Returns alerts sorted by creation date (newest first). Pass a page's
+    next_cursor as cursor to fetch the page after it; unlike offset, this
+    costs the same however deep into the history the page is.
     """
-    # Build base query with eager loading of server relationship
-    query = select(Alert).options(joinedload(Alert.server))
-
-    # Apply filters
-    if status:
-        query = query.where(Alert.status == status)
-    if severity:
-        query = query.where(Alert.severity == severity)
-    if server_id:
-        query = query.where(Alert.server_id == server_id)
-
-    # Get total count before pagination
-    count_query = select(func.count()).select_from(Alert)
-    if status:
-        count_query = count_query.where(Alert.status == status)
-    if severity:
-        count_query = count_query.where(Alert.severity == severity)
-    if server_id:
-        count_query = count_query.where(Alert.server_id == server_id)
-
-    count_result = await session.execute(count_query)
-    total = count_result.scalar() or 0
-
-    # Apply pagination and ordering
-    query = query.order_by(Alert.created_at.desc()).offset(offset).limit(limit)
-    result = await session.execute(query)
-    alerts = result.scalars().unique().all()
+    filters = {"status": status, "severity": severity, "server_id": server_id}
+
+    # Only the server's names are needed, not the whole server row
+    query = (
+        select(Alert, _SERVER_NAME)
+        .outerjoin(Server, Alert.server_id == Server.id)
+        .where(*filter_criteria(Alert, filters))
+    )
+    result = await session.execute(page_query(query, Alert, limit, cursor, offset))
+    rows, next_cursor = split_page(result.all(), limit, entity=lambda row: row[0])
+
+    total = await count_rows(session, Alert, filters)
 
     # Build responses with can_acknowledge and can_resolve status
+    down = await _down_services([alert for alert, _name in rows], session)
     alert_responses = []
-    for a in alerts:
-        can_ack = await _check_can_acknowledge(a, session)
-        can_res = await _check_can_resolve(a, session)
-        alert_responses.append(_to_response(a, can_acknowledge=can_ack, can_resolve=can_res))
+    for a, name in rows:
+        service_down = (a.server_id, _extract_service_name(a)) in down
+        can_ack = await _check_can_acknowledge(a, session, service_down)
+        can_res = await _check_can_resolve(a, session, service_down)
+        alert_responses.append(_to_response(a, name, can_acknowledge=can_ack, can_resolve=can_res))
 
     return AlertListResponse(
         alerts=alert_responses,
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -210,87 +259,72 @@ async def list_alerts(
     responses={**AUTH_RESPONSES},
 )
 async def list_pending_breaches(
+    server_id: str | None = Query(None, description="Filter by server ID"),
+    metric_type: str | None = Query(None, description="Filter by metric (cpu, memory, disk)"),
+    within: int | None = Query(
+        None, ge=0, description="Only breaches that fire within this many seconds"
+    ),
+    limit: int | None = Query(None, ge=1, le=1000, description="Maximum results to return"),
     session: AsyncSession = Depends(get_async_session),
     _: str = Depends(verify_api_key),
 ) -> PendingBreachListResponse:
     """List pending breaches (conditions breached but duration not yet met).
 
     Returns breaches where a threshold has been exceeded but the sustained
-    duration requirement has not yet been met. Includes time until the alert
-    would fire if the condition persists.
+    duration requirement has not yet been met, soonest to fire first.
+    Includes time until the alert would fire if the condition persists;
+    with within and limit, this answers "which servers are about to alert?"
+    across the fleet.
+
+    Pending breaches are maintained by the alerting service as heartbeats
+    are evaluated, so this reads them from an index rather than deriving
+    them from threshold settings.
     """
     now = datetime.now(UTC)
 
-    # Get threshold configuration
-    thresholds_data = await get_config_value(session, "thresholds")
-    thresholds = ThresholdsConfig(**thresholds_data) if thresholds_data else ThresholdsConfig()
-
-    # Query AlertState for pending breaches:
-    # - first_breach_at is set (breach in progress)
-    # - current_severity is null (alert hasn't fired yet)
-    result = await session.execute(
-        select(AlertState)
-        .options(joinedload(AlertState.server))
-        .where(AlertState.first_breach_at.isnot(None))
-        .where(AlertState.current_severity.is_(None))
+    criteria = [AlertState.fires_at.isnot(None)]
+    criteria += filter_criteria(AlertState, {"server_id": server_id, "metric_type": metric_type})
+    if within is not None:
+        criteria.append(AlertState.fires_at <= now + timedelta(seconds=within))
+
+    query = (
+        select(AlertState, _SERVER_NAME)
+        .outerjoin(Server, AlertState.server_id == Server.id)
+        .where(*criteria)
+        .order_by(AlertState.fires_at, AlertState.id)
+        .limit(limit)
     )
-    pending_states = result.scalars().unique().all()
+    rows = (await session.execute(query)).all()
+    total = len(rows)
+    if limit is not None and total == limit:
+        total = (
+            await session.execute(select(func.count()).select_from(AlertState).where(*criteria))
+        ).scalar_one()
 
     pending_responses: list[PendingBreachResponse] = []
-    for state in pending_states:
-        # Get threshold config for this metric type
-        metric_type = state.metric_type
-        if metric_type == "cpu":
-            threshold_config = thresholds.cpu
-        elif metric_type == "memory":
-            threshold_config = thresholds.memory
-        elif metric_type == "disk":
-            threshold_config = thresholds.disk
-        else:
-            # Skip unknown metric types (e.g., offline)
-            continue
-
-        # Calculate timing
-        first_breach = state.first_breach_at
-        if first_breach and first_breach.tzinfo is None:
-            first_breach = first_breach.replace(tzinfo=UTC)
-
-        elapsed_seconds = int((now - first_breach).total_seconds()) if first_breach else 0
-        sustained_seconds = threshold_config.sustained_seconds
-        time_until_alert = max(0, sustained_seconds - elapsed_seconds)
-
-        # Determine severity and threshold based on current value
-        current_value = state.current_value or 0
-        if current_value >= threshold_config.critical_percent:
-            severity = "critical"
-            threshold_value = threshold_config.critical_percent
-        else:
-            severity = "high"
-            threshold_value = threshold_config.high_percent
-
-        # Get server name
-        server_name = None
-        if state.server:
-            server_name = state.server.display_name or state.server.hostname
+    for state, server_name in rows:
+        # Handle timezone-naive datetimes from SQLite
+        first_breach = state.first_breach_at.replace(tzinfo=UTC)
+        fires_at = state.fires_at.replace(tzinfo=UTC)
 
         pending_responses.append(
             PendingBreachResponse(
                 server_id=state.server_id,
                 server_name=server_name,
-                metric_type=metric_type,
+                metric_type=state.metric_type,
                 current_value=state.current_value,
-                threshold_value=threshold_value,
-                severity=severity,
+                threshold_value=state.pending_threshold,
+                severity=state.pending_severity,
                 first_breach_at=first_breach,
-                sustained_seconds=sustained_seconds,
-                elapsed_seconds=elapsed_seconds,
-                time_until_alert=time_until_alert,
+                sustained_seconds=int((fires_at - first_breach).total_seconds()),
+                elapsed_seconds=int((now - first_breach).total_seconds()),
+                time_until_alert=max(0, int((fires_at - now).total_seconds())),
             )
         )
 
     return PendingBreachListResponse(
         pending=pending_responses,
-        total=len(pending_responses),
+        total=total,
     )
 
 
@@ -320,7 +354,9 @@ async def get_alert(
 
     can_ack = await _check_can_acknowledge(alert, session)
     can_res = await _check_can_resolve(alert, session)
-    return _to_response(alert, can_acknowledge=can_ack, can_resolve=can_res)
+    return _to_response(
+        alert, _server_name(alert.server), can_acknowledge=can_ack, can_resolve=can_res
+    )
 
 
 @router.post(
@@ -366,34 +402,22 @@ async def acknowledge_alert(
         )
 
     # For service alerts, check if service is still down
-    if alert.alert_type == "service":
-        # Extract service name from title (format: "Service {name} is {status}")
-        title_parts = alert.title.split()
-        if len(title_parts) >= 2 and title_parts[0] == "Service":
-            service_name = title_parts[1]
-
-            # Get latest service status
-            result = await session.execute(
-                select(ServiceStatus)
-                .where(ServiceStatus.server_id == alert.server_id)
-                .where(ServiceStatus.service_name == service_name)
-                .order_by(desc(ServiceStatus.timestamp))
-                .limit(1)
+    service_name = _extract_service_name(alert)
+    if service_name is not None:
+        current = await session.get(CurrentServiceStatus, (alert.server_id, service_name))
+        if current is not None and current.status in ("stopped", "failed"):
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "code": "SERVICE_STILL_DOWN",
+                    "message": f"Cannot acknowledge: service {service_name} is still {current.status}",
+                },
             )
-            latest_status = result.scalar_one_or_none()
-
-            if latest_status and latest_status.status in ("stopped", "failed"):
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "code": "SERVICE_STILL_DOWN",
-                        "message": f"Cannot acknowledge: service {service_name} is still {latest_status.status}",
-                    },
-                )
 
     # Acknowledge the alert
     alert.acknowledge()
     await session.flush()
+    publish_alert_transition(alert, "acknowledged")
     await session.refresh(alert)
 
     return AlertAcknowledgeResponse(
@@ -440,6 +464,7 @@ async def resolve_alert(
     # Resolve the alert (manual resolution, not auto)
     alert.resolve(auto=False)
     await session.flush()
+    publish_alert_transition(alert, "resolved")
     await session.refresh(alert)
 
     return AlertResolveResponse(
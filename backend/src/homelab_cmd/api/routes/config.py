@@ -5,8 +5,8 @@ Supports partial updates with nested merging for metric-specific settings.
 """
 
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import ValidationError
 from sqlalchemy import select
@@ -30,6 +30,14 @@ from homelab_cmd.api.schemas.config import (
 )
 from homelab_cmd.db.models.config import Config
 from homelab_cmd.db.session import get_async_session
+from homelab_cmd.lazy_imports import lazy_import
+from homelab_cmd.services.alerting import refresh_pending_breaches
+
+if TYPE_CHECKING:
+    import httpx
+else:
+    # Loaded on first outbound request rather than at startup
+    httpx = lazy_import("httpx")
 
 router = APIRouter(prefix="/config", tags=["Configuration"])
 
@@ -218,6 +226,9 @@ async def update_thresholds(
     # Save to database
     await set_config_value(session, "thresholds", thresholds.model_dump())
 
+    # Breaches already pending now fire on the new thresholds' schedule
+    await refresh_pending_breaches(session, thresholds)
+
     return ThresholdsResponse(
         updated=updated_fields,
         thresholds=thresholds,
@@ -61,13 +61,14 @@ def get_config_apply_service(
     return ConfigApplyService(pack_service, ssh_executor)
 
 
-async def run_apply_background(apply_id: int) -> None:
+async def run_apply_background(apply_id: int, batched: bool = True) -> None:
     """Run an apply operation in the background.
 
     Creates its own database session since this runs outside the request context.
 
     Args:
         apply_id: ID of the apply operation to execute.
+        batched: Apply all items in one SSH session.
     """
     session_maker = get_session_factory()
 
@@ -93,7 +94,7 @@ async def run_apply_background(apply_id: int) -> None:
 
             # Create service and execute
             apply_service = get_config_apply_service(session)
-            await apply_service.execute_apply(apply_record, session)
+            await apply_service.execute_apply(apply_record, session, batched=batched)
 
         except Exception as e:
             logger.exception("Background apply %d failed: %s", apply_id, e)
@@ -185,7 +186,7 @@ async def apply_config_pack(
         raise HTTPException(status_code=404, detail=str(e)) from e
 
     # Start background execution
-    background_tasks.add_task(run_apply_background, apply_record.id)
+    background_tasks.add_task(run_apply_background, apply_record.id, request.batched)
 
     return ApplyInitiatedResponse(
         apply_id=apply_record.id,
@@ -9,8 +9,13 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from homelab_cmd.api.conditional import conditional_get
 from homelab_cmd.api.deps import get_async_session, verify_api_key
-from homelab_cmd.api.responses import AUTH_RESPONSES, NOT_FOUND_RESPONSE
+from homelab_cmd.api.responses import (
+    AUTH_RESPONSES,
+    NOT_FOUND_RESPONSE,
+    NOT_MODIFIED_RESPONSE,
+)
 from homelab_cmd.api.routes.config_packs import get_config_pack_service
 from homelab_cmd.api.schemas.config_check import (
     ComplianceMachineSummary,
@@ -295,7 +300,8 @@ async def get_config_diff(
     response_model=ComplianceSummaryResponse,
     operation_id="get_compliance_summary",
     summary="Get fleet-wide compliance summary",
-    responses={**AUTH_RESPONSES},
+    responses={**AUTH_RESPONSES, **NOT_MODIFIED_RESPONSE},
+    dependencies=[Depends(conditional_get(Server, ConfigCheck))],
 )
 async def get_compliance_summary(
     session: AsyncSession = Depends(get_async_session),
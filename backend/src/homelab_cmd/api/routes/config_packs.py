@@ -7,6 +7,7 @@ Part of EP0010: Configuration Management.
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from homelab_cmd.api.deps import verify_api_key
 from homelab_cmd.api.responses import AUTH_RESPONSES, NOT_FOUND_RESPONSE
@@ -14,7 +15,9 @@ from homelab_cmd.api.schemas.config_pack import (
     ConfigPack,
     ConfigPackListResponse,
 )
+from homelab_cmd.db.session import get_async_session
 from homelab_cmd.services.config_pack_service import ConfigPackError, ConfigPackService
+from homelab_cmd.services.coordination import CONFIG_PACKS_CACHE, get_coordinator
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +35,15 @@ def get_config_pack_service() -> ConfigPackService:
     return _service
 
 
+def _clear_pack_cache() -> None:
+    """Drop this worker's parsed packs so they are re-read from disk."""
+    if _service is not None:
+        _service.clear_cache()
+
+
+get_coordinator().register_cache(CONFIG_PACKS_CACHE, _clear_pack_cache)
+
+
 @router.get(
     "",
     response_model=ConfigPackListResponse,
@@ -59,6 +71,27 @@ async def list_packs(
     return ConfigPackListResponse(packs=packs, total=len(packs))
 
 
+@router.delete(
+    "/cache",
+    status_code=204,
+    operation_id="delete_config_pack_cache",
+    summary="Reload configuration packs from disk on all workers",
+    responses={**AUTH_RESPONSES},
+)
+async def delete_pack_cache(
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> None:
+    """Discard cached configuration packs on every hub worker.
+
+    Edited pack files are picked up automatically by modification time.
+    Use this to force a full re-read, e.g. after restoring files whose
+    timestamps and sizes are unchanged.
+    """
+    await get_coordinator().invalidate_cache(session, CONFIG_PACKS_CACHE)
+    logger.info("Configuration pack cache cleared")
+
+
 @router.get(
     "/{pack_name}",
     response_model=ConfigPack,
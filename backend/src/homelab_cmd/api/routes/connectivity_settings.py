@@ -1,6 +1,9 @@
 """Connectivity Settings API endpoints for US0080.
 
 Provides endpoints for managing connectivity mode (Tailscale vs Direct SSH).
+
+Tailscale status comes from the background connectivity prober, so reading
+connectivity status does not call the Tailscale API.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -9,6 +12,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from homelab_cmd.api.deps import verify_api_key
 from homelab_cmd.api.responses import AUTH_RESPONSES
 from homelab_cmd.api.schemas.connectivity import (
+    ConnectivityProbe,
+    ConnectivityProbeListResponse,
     ConnectivityStatusBarResponse,
     ConnectivityStatusResponse,
     ConnectivityUpdateRequest,
@@ -16,14 +21,21 @@ from homelab_cmd.api.schemas.connectivity import (
 )
 from homelab_cmd.config import get_settings
 from homelab_cmd.db.session import get_async_session
+from homelab_cmd.services.connectivity_prober import (
+    CONNECTIVITY_PROBE_INTERVAL_SECONDS,
+    get_connectivity_prober,
+)
 from homelab_cmd.services.connectivity_service import (
     ConnectivityService,
     TailscaleTokenRequiredError,
 )
+from homelab_cmd.services.coordination import CONNECTIVITY_STATUS_CACHE, get_coordinator
 from homelab_cmd.services.credential_service import CredentialService
 
 router = APIRouter(prefix="/settings/connectivity", tags=["Configuration"])
 
+get_coordinator().register_cache(CONNECTIVITY_STATUS_CACHE, get_connectivity_prober().invalidate)
+
 
 def _get_credential_service(session: AsyncSession) -> CredentialService:
     """Create CredentialService with encryption key from settings."""
@@ -54,12 +66,14 @@ async def get_connectivity_status(
     """Get full connectivity configuration status.
 
     Returns current mode, Tailscale connection info, and SSH configuration.
-    Mode is auto-detected if not explicitly set.
+    Mode is auto-detected if not explicitly set. Tailscale info is taken
+    from the latest connectivity probe.
     """
     credential_service = _get_credential_service(session)
     service = _get_connectivity_service(session, credential_service)
 
-    return await service.get_connectivity_status()
+    snapshot = await get_connectivity_prober().get_snapshot()
+    return await service.get_connectivity_status(tailscale=snapshot.status.tailscale)
 
 
 @router.put(
@@ -100,6 +114,7 @@ async def update_connectivity_mode(
 
     try:
         result = await service.update_connectivity_mode(request.mode, request.ssh_username)
+        await get_coordinator().invalidate_cache(session, CONNECTIVITY_STATUS_CACHE)
         await session.commit()
         return result
     except TailscaleTokenRequiredError as e:
@@ -122,14 +137,43 @@ async def update_connectivity_mode(
 )
 async def get_connectivity_status_bar(
     _: str = Depends(verify_api_key),
-    session: AsyncSession = Depends(get_async_session),
 ) -> ConnectivityStatusBarResponse:
     """Get minimal status for dashboard status bar.
 
     Returns mode, display text, and healthy status.
-    Used by frontend dashboard header.
+    Used by frontend dashboard header. Served from the latest connectivity
+    probe, so polling it is cheap.
     """
-    credential_service = _get_credential_service(session)
-    service = _get_connectivity_service(session, credential_service)
+    return await get_connectivity_prober().get_status_bar()
+
 
-    return await service.get_status_bar_info()
+@router.get(
+    "/probes",
+    response_model=ConnectivityProbeListResponse,
+    responses=AUTH_RESPONSES,
+    summary="List connectivity probes",
+    description="List recent background connectivity probes with their durations.",
+    operation_id="list_connectivity_probes",
+)
+async def list_connectivity_probes(
+    _: str = Depends(verify_api_key),
+) -> ConnectivityProbeListResponse:
+    """List recent connectivity probes for diagnostics.
+
+    Shows how long each probe took and whether the Tailscale API answered,
+    newest first.
+    """
+    return ConnectivityProbeListResponse(
+        probes=[
+            ConnectivityProbe(
+                probed_at=p.probed_at,
+                duration_ms=round(p.duration_ms, 1),
+                mode=p.mode,
+                tailscale_connected=p.tailscale_connected,
+                device_count=p.device_count,
+                error=p.error,
+            )
+            for p in get_connectivity_prober().history
+        ],
+        interval_seconds=CONNECTIVITY_PROBE_INTERVAL_SECONDS,
+    )
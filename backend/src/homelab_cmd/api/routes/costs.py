@@ -7,11 +7,13 @@ for servers (24/7) and workstations (actual usage).
 US0183: Added historical cost tracking endpoints (EP0005).
 """
 
+import time
 from datetime import UTC, date, datetime, timedelta
 from enum import Enum
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
+from pydantic import BaseModel
+from sqlalchemy import event, func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from homelab_cmd.api.deps import verify_api_key
@@ -35,10 +37,11 @@ from homelab_cmd.api.schemas.costs import (
     CostTotals,
     ServerCostItem,
 )
+from homelab_cmd.db.models.config import Config
 from homelab_cmd.db.models.metrics import Metrics
 from homelab_cmd.db.models.server import Server
 from homelab_cmd.db.session import get_async_session
-from homelab_cmd.services.cost_history import CostHistoryService
+from homelab_cmd.services.cost_history import CostHistoryService, get_avg_cpu_24h_by_server
 from homelab_cmd.services.power import (
     POWER_PROFILES,
     MachineCategory,
@@ -56,6 +59,61 @@ router = APIRouter(prefix="/costs", tags=["Costs"])
 # Default CPU percentage when no metrics available (AC6)
 DEFAULT_CPU_PERCENT = 50.0
 
+# Summary and breakdown are cached until a server's power settings or the
+# cost config change. The TTL bounds drift in the 24h CPU averages and
+# workstation uptime, and how long other workers serve a stale result.
+COST_CACHE_TTL_SECONDS = 300
+
+# Server columns that feed into cost calculations
+_COST_SERVER_FIELDS = (
+    "hostname",
+    "machine_type",
+    "machine_category",
+    "machine_category_source",
+    "idle_watts",
+    "tdp_watts",
+    "cpu_model",
+)
+
+_cost_cache: dict[str, tuple[float, BaseModel]] = {}
+
+
+def clear_cost_cache() -> None:
+    """Discard cached cost summary and breakdown results."""
+    _cost_cache.clear()
+
+
+def _get_cached(key: str) -> BaseModel | None:
+    entry = _cost_cache.get(key)
+    if entry is None or time.monotonic() - entry[0] > COST_CACHE_TTL_SECONDS:
+        return None
+    return entry[1]
+
+
+def _set_cached(key: str, response: BaseModel) -> None:
+    _cost_cache[key] = (time.monotonic(), response)
+
+
+@event.listens_for(Server, "after_insert")
+@event.listens_for(Server, "after_delete")
+def _server_added_or_removed(mapper, connection, target: Server) -> None:
+    clear_cost_cache()
+
+
+@event.listens_for(Server, "after_update")
+def _server_updated(mapper, connection, target: Server) -> None:
+    # Heartbeats update last_seen on every server; only power settings matter
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in _COST_SERVER_FIELDS):
+        clear_cost_cache()
+
+
+@event.listens_for(Config, "after_insert")
+@event.listens_for(Config, "after_update")
+def _config_changed(mapper, connection, target: Config) -> None:
+    if target.key == "cost":
+        clear_cost_cache()
+
 
 async def get_avg_cpu_24h(session: AsyncSession, server_id: str) -> float | None:
     """Get average CPU usage for a server over the last 24 hours.
@@ -120,6 +178,10 @@ async def get_cost_summary(
     Returns:
         Cost summary including daily/monthly costs, server counts, and rate info
     """
+    cached = _get_cached("summary")
+    if cached is not None:
+        return cached
+
     # Get all servers
     result = await session.execute(select(Server))
     servers = result.scalars().all()
@@ -138,6 +200,9 @@ async def get_cost_summary(
     start_date = today - timedelta(days=30)
     uptime_data = await get_all_uptime_for_period(session, start_date, today)
 
+    # 24h CPU averages for the whole fleet in one query
+    cpu_averages = await get_avg_cpu_24h_by_server(session)
+
     # Track servers by configuration status
     servers_configured = 0
     servers_unconfigured = 0
@@ -168,7 +233,7 @@ async def get_cost_summary(
             servers_configured += 1
 
             # Get average CPU or use default (AC6)
-            avg_cpu = await get_avg_cpu_24h(session, server.id)
+            avg_cpu = cpu_averages.get(server.id)
             cpu_percent = avg_cpu if avg_cpu is not None else DEFAULT_CPU_PERCENT
 
             # Calculate estimated power (AC1)
@@ -228,7 +293,7 @@ async def get_cost_summary(
     daily_cost = round(server_daily_total + workstation_daily_total, 2)
     monthly_cost = round(server_cost_total + workstation_cost_total, 2)
 
-    return CostSummaryResponse(
+    response = CostSummaryResponse(
         daily_cost=daily_cost,
         monthly_cost=monthly_cost,
         currency_symbol=cost_config.currency_symbol,
@@ -245,6 +310,8 @@ async def get_cost_summary(
         servers_missing_tdp=servers_unconfigured,
         total_tdp_watts=total_tdp_watts,
     )
+    _set_cached("summary", response)
+    return response
 
 
 @router.get(
@@ -269,6 +336,10 @@ async def get_cost_breakdown(
     Returns:
         Cost breakdown including per-server costs, totals, and settings
     """
+    cached = _get_cached("breakdown")
+    if cached is not None:
+        return cached
+
     # Get all servers
     result = await session.execute(select(Server))
     servers = result.scalars().all()
@@ -287,6 +358,9 @@ async def get_cost_breakdown(
     start_date = today - timedelta(days=30)
     uptime_data = await get_all_uptime_for_period(session, start_date, today)
 
+    # 24h CPU averages for the whole fleet in one query
+    cpu_averages = await get_avg_cpu_24h_by_server(session)
+
     # Build server cost items
     configured_servers: list[ServerCostItem] = []
     unconfigured_servers: list[ServerCostItem] = []
@@ -309,7 +383,7 @@ async def get_cost_breakdown(
 
         if power_config:
             # Server has power configuration - use usage-based calculation
-            avg_cpu = await get_avg_cpu_24h(session, server.id)
+            avg_cpu = cpu_averages.get(server.id)
             cpu_percent = avg_cpu if avg_cpu is not None else DEFAULT_CPU_PERCENT
 
             # Calculate estimated power (AC1)
@@ -430,11 +504,13 @@ async def get_cost_breakdown(
         currency_symbol=cost_config.currency_symbol,
     )
 
-    return CostBreakdownResponse(
+    response = CostBreakdownResponse(
         servers=all_servers,
         totals=totals,
         settings=settings,
     )
+    _set_cached("breakdown", response)
+    return response
 
 
 # =============================================================================
@@ -461,9 +537,7 @@ async def get_cost_history(
     start_date: date = Query(..., description="Start date (inclusive)"),
     end_date: date = Query(..., description="End date (inclusive)"),
     server_id: str | None = Query(None, description="Filter by server ID"),
-    aggregation: AggregationType = Query(
-        AggregationType.DAILY, description="Aggregation level"
-    ),
+    aggregation: AggregationType = Query(AggregationType.DAILY, description="Aggregation level"),
     session: AsyncSession = Depends(get_async_session),
     _: str = Depends(verify_api_key),
 ) -> CostHistoryResponse:
@@ -9,30 +9,45 @@ Supports metrics export (US0048):
 - CSV and JSON export formats
 - Exports respect selected time range
 - Uses appropriate data tier for each range
+
+Supports sparklines (US0113):
+- Per-server sparkline for one metric
+- Fleet-wide batch of sparklines from one grouped query
+- LTTB downsampling so peaks and troughs survive
+
+History is also available in columnar form (parallel arrays), and large
+responses are serialised directly by pydantic-core (api/serialisation.py).
 """
 
 import csv
 import json as json_module
 from collections import defaultdict
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from io import StringIO
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from homelab_cmd.api.deps import verify_api_key
-from homelab_cmd.api.responses import AUTH_RESPONSES, NOT_FOUND_RESPONSE
+from homelab_cmd.api.responses import AUTH_RESPONSES, BAD_REQUEST_RESPONSE, NOT_FOUND_RESPONSE
 from homelab_cmd.api.schemas.metrics import (
     MetricPoint,
+    MetricsColumns,
+    MetricsColumnsResponse,
     MetricsHistoryResponse,
+    ServerSparklines,
+    SparklineBatchResponse,
     SparklinePoint,
     SparklineResponse,
+    SparklineSeries,
     TimeRange,
 )
+from homelab_cmd.api.serialisation import model_response
 from homelab_cmd.db.models.metrics import Metrics, MetricsDaily, MetricsHourly
 from homelab_cmd.db.models.server import Server
 from homelab_cmd.db.session import get_async_session
@@ -155,31 +170,21 @@ def convert_daily_to_points(daily_metrics: list[MetricsDaily]) -> list[MetricPoi
     ]
 
 
-@router.get(
-    "/{server_id}/metrics",
-    response_model=MetricsHistoryResponse,
-    operation_id="get_server_metrics",
-    summary="Get historical metrics for a server",
-    responses={**AUTH_RESPONSES, **NOT_FOUND_RESPONSE},
-)
-async def get_metrics_history(
-    server_id: str,
-    range: TimeRange = Query(
-        default=TimeRange.HOURS_24,
-        description="Time range for metrics history",
-    ),
-    session: AsyncSession = Depends(get_async_session),
-    _: str = Depends(verify_api_key),
-) -> MetricsHistoryResponse:
-    """Get historical metrics for a server.
+async def load_metrics_history(
+    session: AsyncSession, server_id: str, range: TimeRange
+) -> tuple[str, list[MetricPoint]]:
+    """Load a server's metrics history from the data tier for a range.
 
-    Returns time-series data for CPU, memory, and disk usage over the
-    specified time range. Data is sourced from the appropriate tier:
+    Args:
+        session: Database session.
+        server_id: Server identifier.
+        range: Time range to load.
 
-    - **24h**: Raw data points (no aggregation)
-    - **7d**: Raw data with hourly aggregation
-    - **30d**: Hourly aggregate table (1-hour resolution)
-    - **12m**: Daily aggregate table (1-day resolution)
+    Returns:
+        Resolution label and the data points, oldest first.
+
+    Raises:
+        HTTPException: 404 if the server does not exist.
     """
     # Verify server exists
     server = await session.get(Server, server_id)
@@ -239,12 +244,98 @@ async def get_metrics_history(
         daily_metrics = list(result.scalars().all())
         data_points = convert_daily_to_points(daily_metrics)
 
-    return MetricsHistoryResponse(
-        server_id=server_id,
-        range=range.value,
-        resolution=resolution,
-        data_points=data_points,
-        total_points=len(data_points),
+    return resolution, data_points
+
+
+def to_columns(data_points: Sequence[MetricPoint]) -> MetricsColumns:
+    """Transpose data points into parallel arrays.
+
+    Args:
+        data_points: Data points, oldest first.
+
+    Returns:
+        Unix timestamps and one value array per metric.
+    """
+    return MetricsColumns(
+        timestamps=[int(_unix_seconds(p.timestamp)) for p in data_points],
+        cpu_percent=[p.cpu_percent for p in data_points],
+        memory_percent=[p.memory_percent for p in data_points],
+        disk_percent=[p.disk_percent for p in data_points],
+    )
+
+
+@router.get(
+    "/{server_id}/metrics",
+    response_model=MetricsHistoryResponse,
+    operation_id="get_server_metrics",
+    summary="Get historical metrics for a server",
+    responses={**AUTH_RESPONSES, **NOT_FOUND_RESPONSE},
+)
+async def get_metrics_history(
+    server_id: str,
+    range: TimeRange = Query(
+        default=TimeRange.HOURS_24,
+        description="Time range for metrics history",
+    ),
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> Response:
+    """Get historical metrics for a server.
+
+    Returns time-series data for CPU, memory, and disk usage over the
+    specified time range. Data is sourced from the appropriate tier:
+
+    - **24h**: Raw data points (no aggregation)
+    - **7d**: Raw data with hourly aggregation
+    - **30d**: Hourly aggregate table (1-hour resolution)
+    - **12m**: Daily aggregate table (1-day resolution)
+    """
+    resolution, data_points = await load_metrics_history(session, server_id, range)
+
+    return model_response(
+        MetricsHistoryResponse(
+            server_id=server_id,
+            range=range.value,
+            resolution=resolution,
+            data_points=data_points,
+            total_points=len(data_points),
+        )
+    )
+
+
+@router.get(
+    "/{server_id}/metrics/columns",
+    response_model=MetricsColumnsResponse,
+    operation_id="get_server_metrics_columns",
+    summary="Get historical metrics for a server as parallel arrays",
+    responses={**AUTH_RESPONSES, **NOT_FOUND_RESPONSE},
+)
+async def get_metrics_history_columns(
+    server_id: str,
+    range: TimeRange = Query(
+        default=TimeRange.HOURS_24,
+        description="Time range for metrics history",
+    ),
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> Response:
+    """Get historical metrics for a server in columnar form.
+
+    Same data as GET /servers/{server_id}/metrics, but as a timestamp array
+    with a parallel value array per metric instead of one object per point.
+    The response is about a third of the size and quicker to encode and
+    parse, which suits charts drawing long ranges.
+    """
+    resolution, data_points = await load_metrics_history(session, server_id, range)
+
+    return model_response(
+        MetricsColumnsResponse(
+            server_id=server_id,
+            range=range.value,
+            resolution=resolution,
+            columns=to_columns(data_points),
+            total_points=len(data_points),
+        )
     )
 
 
@@ -256,27 +347,225 @@ SPARKLINE_PERIODS: dict[str, tuple[int, int]] = {
 }
 
 
+# US0113: Metrics that can be drawn as sparklines
+SPARKLINE_METRICS = ("cpu_percent", "memory_percent", "disk_percent")
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], target: int) -> list[int]:
+    """Pick target points to keep using Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points between are split
+    into target - 2 buckets, and from each bucket the point forming the
+    largest triangle with the previously kept point and the average of the
+    next bucket is kept, so spikes survive where step sampling would skip
+    them. The series minimum and maximum are always kept as well, each
+    replacing the point chosen from its bucket (or, when both fall in one
+    bucket, from a neighbouring one; with target 3 there is none, and four
+    points are returned).
+
+    Args:
+        xs: X values (e.g. timestamps), ascending.
+        ys: Y values, parallel to xs.
+        target: Number of points to keep.
+
+    Returns:
+        Ascending indices of the points to keep.
+    """
+    n = len(xs)
+    if n <= target:
+        return list(range(n))
+    if target < 3:
+        return [0, n - 1][:target]
+
+    bucket_size = (n - 2) / (target - 2)
+    selected = [0]
+    previous = 0
+    for bucket in range(target - 2):
+        start = int(bucket * bucket_size) + 1
+        end = max(int((bucket + 1) * bucket_size) + 1, start + 1)
+        next_end = min(max(int((bucket + 2) * bucket_size) + 1, end + 1), n)
+
+        next_xs = xs[end:next_end]
+        next_ys = ys[end:next_end]
+        avg_x = sum(next_xs) / len(next_xs)
+        avg_y = sum(next_ys) / len(next_ys)
+
+        ax, ay = xs[previous], ys[previous]
+        best, best_area = start, -1.0
+        for i in range(start, end):
+            area = abs((ax - avg_x) * (ys[i] - ay) - (ax - xs[i]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = i, area
+        selected.append(best)
+        previous = best
+    selected.append(n - 1)
+
+    extremes = {min(range(n), key=ys.__getitem__), max(range(n), key=ys.__getitem__)}
+    for extreme in sorted(extremes - set(selected)):
+        slot = min(int((extreme - 1) / bucket_size), target - 3) + 1
+        if selected[slot] in extremes:
+            # Both extremes are in this bucket: it keeps two points, and the
+            # neighbouring bucket towards the second gives up its own
+            step = -1 if extreme < selected[slot] else 1
+            neighbours = [s for s in (slot + step, slot - step) if 0 < s < target - 1]
+            if not neighbours:
+                selected.append(extreme)
+                continue
+            slot = neighbours[0]
+        selected[slot] = extreme
+
+    return sorted(selected)
+
+
 def downsample_metrics(data_points: list[SparklinePoint], target: int) -> list[SparklinePoint]:
-    """Downsample data points to target count using step sampling.
+    """Downsample data points to target count using LTTB.
+
+    Points without a value are dropped when downsampling (sparklines join
+    across gaps anyway).
 
     Args:
-        data_points: Original data points.
+        data_points: Original data points, oldest first.
         target: Target number of points.
 
     Returns:
-        Downsampled list with approximately target points.
+        Downsampled list with at most target points.
     """
     if len(data_points) <= target:
         return data_points
 
-    step = len(data_points) / target
-    result: list[SparklinePoint] = []
-    for i in range(target):
-        idx = int(i * step)
-        if idx < len(data_points):
-            result.append(data_points[idx])
+    points = [p for p in data_points if p.value is not None]
+    keep = lttb_indices(
+        [_unix_seconds(p.timestamp) for p in points],
+        [p.value for p in points],
+        target,
+    )
+    return [points[i] for i in keep]
+
+
+def _unix_seconds(timestamp: datetime) -> float:
+    """Convert a stored timestamp (naive means UTC) to Unix seconds."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return timestamp.timestamp()
+
+
+def _validate_sparkline_request(metrics: Sequence[str], period: str) -> None:
+    """Reject unknown sparkline metrics and periods with 400."""
+    for metric in metrics:
+        if metric not in SPARKLINE_METRICS:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "code": "INVALID_METRIC",
+                    "message": f"Invalid metric '{metric}'. Valid options: {', '.join(SPARKLINE_METRICS)}",
+                },
+            )
 
-    return result
+    if period not in SPARKLINE_PERIODS:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": "INVALID_PERIOD",
+                "message": f"Invalid period '{period}'. Valid options: {', '.join(SPARKLINE_PERIODS.keys())}",
+            },
+        )
+
+
+def _build_series(
+    timestamps: list[datetime], values: list[float | None], target: int
+) -> SparklineSeries:
+    """Downsample one metric series into columnar form."""
+    xs: list[float] = []
+    ys: list[float] = []
+    for timestamp, value in zip(timestamps, values, strict=True):
+        if value is not None:
+            xs.append(_unix_seconds(timestamp))
+            ys.append(value)
+
+    keep = lttb_indices(xs, ys, target)
+    return SparklineSeries(
+        timestamps=[int(xs[i]) for i in keep],
+        values=[round(ys[i], 2) for i in keep],
+    )
+
+
+@router.get(
+    "/metrics/sparklines",
+    response_model=SparklineBatchResponse,
+    operation_id="list_server_sparklines",
+    summary="Get sparkline data for many servers",
+    responses={**AUTH_RESPONSES, **BAD_REQUEST_RESPONSE},
+)
+async def list_sparklines(
+    server_id: list[str] | None = Query(
+        default=None,
+        description="Servers to include (repeat for several; default: all servers)",
+    ),
+    metric: list[str] | None = Query(
+        default=None,
+        description="Metric types to include (repeat for several; default: cpu, memory and disk)",
+    ),
+    period: str = Query(
+        default="30m",
+        description="Time period (30m, 1h, 6h)",
+    ),
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> SparklineBatchResponse:
+    """Get sparkline data for many servers and metrics at once.
+
+    The dashboard shows a sparkline per metric on every server card. This
+    returns all of them from a single grouped query instead of one request
+    per card. Each series is downsampled with LTTB to the same number of
+    points as the per-server endpoint and returned as parallel timestamp
+    and value arrays.
+
+    Servers that do not exist are left out; servers without recent metrics
+    are included with empty series.
+    """
+    metrics = list(dict.fromkeys(metric or SPARKLINE_METRICS))
+    _validate_sparkline_request(metrics, period)
+
+    minutes, target_points = SPARKLINE_PERIODS[period]
+    cutoff = datetime.now(UTC) - timedelta(minutes=minutes)
+
+    server_query = select(Server.id).order_by(Server.id)
+    if server_id is not None:
+        server_query = server_query.where(Server.id.in_(server_id))
+    known = set((await session.execute(server_query)).scalars().all())
+    if server_id is not None:
+        server_ids = [s for s in dict.fromkeys(server_id) if s in known]
+    else:
+        server_ids = sorted(known)
+
+    # One query for every server, ordered so each server's rows are contiguous
+    metrics_query = (
+        select(Metrics.server_id, Metrics.timestamp, *(getattr(Metrics, m) for m in metrics))
+        .where(Metrics.timestamp >= cutoff)
+        .order_by(Metrics.server_id, Metrics.timestamp)
+    )
+    if server_id is not None:
+        metrics_query = metrics_query.where(Metrics.server_id.in_(server_ids))
+
+    rows_by_server: dict[str, list[Any]] = defaultdict(list)
+    for row in (await session.execute(metrics_query)).all():
+        rows_by_server[row[0]].append(row)
+
+    servers: list[ServerSparklines] = []
+    for sid in server_ids:
+        rows = rows_by_server.get(sid, [])
+        timestamps = [row[1] for row in rows]
+        servers.append(
+            ServerSparklines(
+                server_id=sid,
+                series={
+                    m: _build_series(timestamps, [row[2 + i] for row in rows], target_points)
+                    for i, m in enumerate(metrics)
+                },
+            )
+        )
+
+    return SparklineBatchResponse(period=period, metrics=metrics, servers=servers)
 
 
 @router.get(
@@ -323,44 +612,21 @@ async def get_sparkline(
             detail={"code": "NOT_FOUND", "message": f"Server '{server_id}' not found"},
         )
 
-    # Validate metric type
-    valid_metrics = {"cpu_percent", "memory_percent", "disk_percent"}
-    if metric not in valid_metrics:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "code": "INVALID_METRIC",
-                "message": f"Invalid metric '{metric}'. Valid options: {', '.join(valid_metrics)}",
-            },
-        )
-
-    # Get period configuration
-    if period not in SPARKLINE_PERIODS:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "code": "INVALID_PERIOD",
-                "message": f"Invalid period '{period}'. Valid options: {', '.join(SPARKLINE_PERIODS.keys())}",
-            },
-        )
+    _validate_sparkline_request([metric], period)
 
     minutes, target_points = SPARKLINE_PERIODS[period]
     cutoff = datetime.now(UTC) - timedelta(minutes=minutes)
 
-    # Query raw metrics for the period
+    # Query just the requested metric for the period
     result = await session.execute(
-        select(Metrics)
+        select(Metrics.timestamp, getattr(Metrics, metric))
         .where(Metrics.server_id == server_id)
         .where(Metrics.timestamp >= cutoff)
         .order_by(Metrics.timestamp)
     )
-    raw_metrics = list(result.scalars().all())
-
-    # Extract the requested metric and convert to SparklinePoints
-    data_points: list[SparklinePoint] = []
-    for m in raw_metrics:
-        value = getattr(m, metric, None)
-        data_points.append(SparklinePoint(timestamp=m.timestamp, value=value))
+    data_points = [
+        SparklinePoint(timestamp=timestamp, value=value) for timestamp, value in result.all()
+    ]
 
     # Downsample if we have more points than target
     data_points = downsample_metrics(data_points, target_points)
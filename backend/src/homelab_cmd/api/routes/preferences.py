@@ -10,8 +10,9 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from homelab_cmd.api.conditional import conditional_get
 from homelab_cmd.api.deps import verify_api_key
-from homelab_cmd.api.responses import AUTH_RESPONSES
+from homelab_cmd.api.responses import AUTH_RESPONSES, NOT_MODIFIED_RESPONSE
 from homelab_cmd.api.schemas.preferences import (
     CardOrder,
     CardOrderLoadResponse,
@@ -82,7 +83,8 @@ async def save_card_order(
     response_model=CardOrderLoadResponse,
     operation_id="get_card_order",
     summary="Get dashboard card order",
-    responses={**AUTH_RESPONSES},
+    responses={**AUTH_RESPONSES, **NOT_MODIFIED_RESPONSE},
+    dependencies=[Depends(conditional_get(Config))],
 )
 async def get_card_order(
     session: AsyncSession = Depends(get_async_session),
@@ -153,7 +155,8 @@ async def save_section_order(
     response_model=SectionCardOrderResponse,
     operation_id="get_section_order",
     summary="Get section-specific card orders",
-    responses={**AUTH_RESPONSES},
+    responses={**AUTH_RESPONSES, **NOT_MODIFIED_RESPONSE},
+    dependencies=[Depends(conditional_get(Config))],
 )
 async def get_section_order(
     session: AsyncSession = Depends(get_async_session),
@@ -223,7 +226,8 @@ async def save_collapsed_sections(
     response_model=CollapsedSectionsResponse,
     operation_id="get_collapsed_sections",
     summary="Get collapsed section state",
-    responses={**AUTH_RESPONSES},
+    responses={**AUTH_RESPONSES, **NOT_MODIFIED_RESPONSE},
+    dependencies=[Depends(conditional_get(Config))],
 )
 async def get_collapsed_sections(
     session: AsyncSession = Depends(get_async_session),
@@ -253,7 +257,8 @@ async def get_collapsed_sections(
     response_model=DashboardPreferencesResponse,
     operation_id="get_dashboard_preferences",
     summary="Get all dashboard preferences",
-    responses={**AUTH_RESPONSES},
+    responses={**AUTH_RESPONSES, **NOT_MODIFIED_RESPONSE},
+    dependencies=[Depends(conditional_get(Config))],
 )
 async def get_dashboard_preferences(
     session: AsyncSession = Depends(get_async_session),
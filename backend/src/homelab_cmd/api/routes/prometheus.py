@@ -0,0 +1,48 @@
+"""Prometheus scrape endpoint.
+
+Served at /metrics (outside /api/v1, where Prometheus looks by default).
+Accepts the API key as X-API-Key or as a bearer token, so a scrape job can
+authenticate with Prometheus' own `authorization` setting.
+"""
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from homelab_cmd.api.deps import verify_scrape_auth
+from homelab_cmd.api.responses import AUTH_RESPONSES
+from homelab_cmd.db.session import get_async_session
+from homelab_cmd.services.telemetry import (
+    OPENMETRICS_CONTENT_TYPE,
+    get_fleet_gauges,
+    render_openmetrics,
+)
+
+router = APIRouter(tags=["System"])
+
+
+@router.get(
+    "/metrics",
+    operation_id="get_prometheus_metrics",
+    summary="Prometheus metrics in OpenMetrics format",
+    response_class=Response,
+    responses={
+        200: {"content": {OPENMETRICS_CONTENT_TYPE: {}}, "description": "OpenMetrics text"},
+        **AUTH_RESPONSES,
+    },
+)
+async def get_prometheus_metrics(
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_scrape_auth),
+) -> Response:
+    """Expose fleet gauges and hub self-instrumentation for Prometheus.
+
+    Fleet gauges (per-server CPU, memory, disk, load and service states)
+    come from memory. They are reloaded from the database at most once a
+    minute, so scraping every 15 seconds costs almost nothing. Hub metrics
+    (heartbeat rate and latency, query and job durations, SSH pool size,
+    notifier queue depth) are for the worker that answers the scrape.
+    """
+    fleet = get_fleet_gauges()
+    if fleet.needs_sync:
+        await fleet.sync(session)
+    return Response(content=render_openmetrics(), media_type=OPENMETRICS_CONTENT_TYPE)
@@ -11,12 +11,13 @@ US0071: SSH Key Manager UI
 
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from sqlalchemy import desc, select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from homelab_cmd.api.deps import verify_api_key
-from homelab_cmd.api.responses import AUTH_RESPONSES
+from homelab_cmd.api.pagination import count_rows, filter_criteria, page_query, split_page
+from homelab_cmd.api.responses import AUTH_RESPONSES, BAD_REQUEST_RESPONSE
 from homelab_cmd.api.schemas.scan import (
     ScanInitiatedResponse,
     ScanListResponse,
@@ -32,6 +33,7 @@ from homelab_cmd.api.schemas.scan import (
     TestConnectionRequest,
     TestConnectionResponse,
 )
+from homelab_cmd.api.serialisation import model_response
 from homelab_cmd.config import get_settings
 from homelab_cmd.db.models.config import Config
 from homelab_cmd.db.models.scan import Scan, ScanStatus, ScanType
@@ -583,7 +585,7 @@ async def get_scan_status(
     scan_id: int,
     session: AsyncSession = Depends(get_async_session),
     _: str = Depends(verify_api_key),
-) -> ScanStatusResponse:
+) -> Response:
     """Get the status and results of a scan.
 
     US0038: Scan Initiation
@@ -607,17 +609,19 @@ async def get_scan_status(
             detail=f"Scan {scan_id} not found",
         )
 
-    return ScanStatusResponse(
-        scan_id=scan.id,
-        status=scan.status,
-        hostname=scan.hostname,
-        scan_type=scan.scan_type,
-        progress=scan.progress,
-        current_step=scan.current_step,
-        started_at=scan.started_at,
-        completed_at=scan.completed_at,
-        results=scan.results,
-        error=scan.error,
+    return model_response(
+        ScanStatusResponse(
+            scan_id=scan.id,
+            status=scan.status,
+            hostname=scan.hostname,
+            scan_type=scan.scan_type,
+            progress=scan.progress,
+            current_step=scan.current_step,
+            started_at=scan.started_at,
+            completed_at=scan.completed_at,
+            results=scan.results,
+            error=scan.error,
+        )
     )
 
 
@@ -626,7 +630,7 @@ async def get_scan_status(
     response_model=ScanListResponse,
     operation_id="list_scans",
     summary="List recent scans",
-    responses={**AUTH_RESPONSES},
+    responses={**AUTH_RESPONSES, **BAD_REQUEST_RESPONSE},
 )
 async def list_scans(
     limit: int = 20,
@@ -634,9 +638,10 @@ async def list_scans(
     hostname: str | None = None,
     scan_status: str | None = None,
     scan_type: str | None = None,
+    cursor: str | None = None,
     session: AsyncSession = Depends(get_async_session),
     _: str = Depends(verify_api_key),
-) -> ScanListResponse:
+) -> Response:
     """List recent scans with optional filtering.
 
     US0038: Scan Initiation
@@ -648,6 +653,7 @@ async def list_scans(
         hostname: Optional hostname filter.
         scan_status: Optional status filter (completed, failed, pending, running).
         scan_type: Optional scan type filter (quick, full).
+        cursor: next_cursor from the previous page, instead of offset.
 
     Returns:
         List of scans ordered by creation time (newest first).
@@ -656,54 +662,41 @@ async def list_scans(
     limit = min(max(1, limit), 100)
     offset = max(0, offset)
 
-    # Build query with filters
-    query = select(Scan).order_by(desc(Scan.created_at))
-
-    if hostname:
-        query = query.where(Scan.hostname == hostname)
-
-    if scan_status and scan_status in [s.value for s in ScanStatus]:
-        query = query.where(Scan.status == scan_status)
-
-    if scan_type and scan_type in [t.value for t in ScanType]:
-        query = query.where(Scan.scan_type == scan_type)
-
-    # Get total count with same filters
-    count_query = select(Scan)
-    if hostname:
-        count_query = count_query.where(Scan.hostname == hostname)
-    if scan_status and scan_status in [s.value for s in ScanStatus]:
-        count_query = count_query.where(Scan.status == scan_status)
-    if scan_type and scan_type in [t.value for t in ScanType]:
-        count_query = count_query.where(Scan.scan_type == scan_type)
-
-    count_result = await session.execute(count_query)
-    total = len(count_result.scalars().all())
-
-    # Get paginated results
-    query = query.offset(offset).limit(limit)
-    result = await session.execute(query)
-    scans = result.scalars().all()
-
-    return ScanListResponse(
-        scans=[
-            ScanStatusResponse(
-                scan_id=scan.id,
-                status=scan.status,
-                hostname=scan.hostname,
-                scan_type=scan.scan_type,
-                progress=scan.progress,
-                current_step=scan.current_step,
-                started_at=scan.started_at,
-                completed_at=scan.completed_at,
-                results=scan.results,
-                error=scan.error,
-            )
-            for scan in scans
-        ],
-        total=total,
-        limit=limit,
-        offset=offset,
+    # Unknown status and type values are ignored rather than matching nothing
+    filters = {
+        "hostname": hostname or None,
+        "status": scan_status if scan_status in [s.value for s in ScanStatus] else None,
+        "scan_type": scan_type if scan_type in [t.value for t in ScanType] else None,
+    }
+
+    query = select(Scan).where(*filter_criteria(Scan, filters))
+    result = await session.execute(page_query(query, Scan, limit, cursor, offset))
+    scans, next_cursor = split_page(result.scalars().all(), limit)
+
+    total = await count_rows(session, Scan, filters)
+
+    return model_response(
+        ScanListResponse(
+            scans=[
+                ScanStatusResponse(
+                    scan_id=scan.id,
+                    status=scan.status,
+                    hostname=scan.hostname,
+                    scan_type=scan.scan_type,
+                    progress=scan.progress,
+                    current_step=scan.current_step,
+                    started_at=scan.started_at,
+                    completed_at=scan.completed_at,
+                    results=scan.results,
+                    error=scan.error,
+                )
+                for scan in scans
+            ],
+            total=total,
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
+        )
     )
 
 
@@ -2,13 +2,19 @@
 
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
+from homelab_cmd.api.conditional import conditional_get
 from homelab_cmd.api.deps import get_credential_service, verify_api_key
-from homelab_cmd.api.responses import AUTH_RESPONSES, CONFLICT_RESPONSE, NOT_FOUND_RESPONSE
+from homelab_cmd.api.responses import (
+    AUTH_RESPONSES,
+    CONFLICT_RESPONSE,
+    NOT_FOUND_RESPONSE,
+    NOT_MODIFIED_RESPONSE,
+)
 from homelab_cmd.api.schemas.actions import ActionListResponse, ActionResponse
 from homelab_cmd.api.schemas.server import (
     LatestMetrics,
@@ -25,6 +31,7 @@ from homelab_cmd.api.schemas.server import (
     StoreServerCredentialRequest,
     StoreServerCredentialResponse,
 )
+from homelab_cmd.api.serialisation import model_response
 from homelab_cmd.db.models.alert import Alert, AlertStatus
 from homelab_cmd.db.models.metrics import Metrics
 from homelab_cmd.db.models.remediation import RemediationAction
@@ -37,25 +44,39 @@ from homelab_cmd.services.credential_service import (
 
 router = APIRouter(prefix="/servers", tags=["Servers"])
 
+# ServerResponse fields not read from the Server row itself
+_SERVER_DERIVED_FIELDS = frozenset(
+    {"latest_metrics", "active_alert_count", "active_alert_summaries"}
+)
+# ServerResponse fields copied from the Server row
+_SERVER_FIELDS = tuple(
+    name for name in ServerResponse.model_fields if name not in _SERVER_DERIVED_FIELDS
+)
+# LatestMetrics fields, all copied from the Metrics row
+_LATEST_METRICS_FIELDS = tuple(LatestMetrics.model_fields)
+
 
 @router.get(
     "",
     response_model=ServerListResponse,
     operation_id="list_servers",
     summary="List all registered servers",
-    responses={**AUTH_RESPONSES},
+    responses={**AUTH_RESPONSES, **NOT_MODIFIED_RESPONSE},
+    dependencies=[Depends(conditional_get(Server, Metrics, Alert))],
 )
 async def list_servers(
+    response: Response,
     session: AsyncSession = Depends(get_async_session),
     _: str = Depends(verify_api_key),
-) -> ServerListResponse:
+) -> Response:
     """List all registered servers.
 
     Returns a list of all servers with their current status, basic information,
     latest metrics, and active alert counts (US0110).
 
     Performance: Uses a single query with window function to fetch latest metrics
-    for all servers (O(1) queries instead of O(N) - fixes BG0020).
+    for all servers (O(1) queries instead of O(N) - fixes BG0020). The list is
+    serialised directly by pydantic-core (see api/serialisation.py).
     """
     # Subquery: rank metrics by timestamp per server, keeping only the latest (rn=1)
     # Uses row_number() window function partitioned by server_id
@@ -117,37 +138,23 @@ async def list_servers(
         if len(server_alert_summaries[server_id]) < 3:
             server_alert_summaries[server_id].append(title)
 
-    # Build response - each row is (Server, Metrics or None, active_count or None)
-    server_responses = []
+    # Build response - each row is (Server, Metrics or None, active_count or None).
+    # Rows become plain dicts so the whole list is validated once, in one pass
+    servers = []
     for server, latest_metrics_record, active_count in rows:
-        response = ServerResponse.model_validate(server)
-
+        data = {name: getattr(server, name) for name in _SERVER_FIELDS}
         if latest_metrics_record:
-            response.latest_metrics = LatestMetrics(
-                cpu_percent=latest_metrics_record.cpu_percent,
-                memory_percent=latest_metrics_record.memory_percent,
-                memory_total_mb=latest_metrics_record.memory_total_mb,
-                memory_used_mb=latest_metrics_record.memory_used_mb,
-                disk_percent=latest_metrics_record.disk_percent,
-                disk_total_gb=latest_metrics_record.disk_total_gb,
-                disk_used_gb=latest_metrics_record.disk_used_gb,
-                network_rx_bytes=latest_metrics_record.network_rx_bytes,
-                network_tx_bytes=latest_metrics_record.network_tx_bytes,
-                load_1m=latest_metrics_record.load_1m,
-                load_5m=latest_metrics_record.load_5m,
-                load_15m=latest_metrics_record.load_15m,
-                uptime_seconds=latest_metrics_record.uptime_seconds,
-            )
-
+            data["latest_metrics"] = {
+                name: getattr(latest_metrics_record, name) for name in _LATEST_METRICS_FIELDS
+            }
         # US0110: Populate alert count and summaries
-        response.active_alert_count = active_count or 0
-        response.active_alert_summaries = server_alert_summaries.get(server.id, [])
+        data["active_alert_count"] = active_count or 0
+        data["active_alert_summaries"] = server_alert_summaries.get(server.id, [])
+        servers.append(data)
 
-        server_responses.append(response)
-
-    return ServerListResponse(
-        servers=server_responses,
-        total=len(rows),
+    return model_response(
+        ServerListResponse.model_validate({"servers": servers, "total": len(rows)}),
+        response,
     )
 
 
@@ -963,6 +970,7 @@ async def update_assigned_packs(
 async def get_server_cost_history(
     server_id: str,
     period: str = Query("30d", description="Period: 7d, 30d, 90d, or 12m"),
+    aggregation: str = Query("daily", description="Aggregation: daily, weekly, or monthly"),
     session: AsyncSession = Depends(get_async_session),
     _: str = Depends(verify_api_key),
 ):
@@ -973,6 +981,8 @@ async def get_server_cost_history(
     Args:
         server_id: The server identifier
         period: Time period ('7d', '30d', '90d', or '12m')
+        aggregation: 'daily' snapshots, or one item per 'weekly' or
+            'monthly' period read from the materialised aggregates
 
     Returns:
         Server cost history response
@@ -996,6 +1006,18 @@ async def get_server_cost_history(
             },
         )
 
+    valid_aggregations = ["daily", "weekly", "monthly"]
+    if aggregation not in valid_aggregations:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "code": "INVALID_AGGREGATION",
+                "message": (
+                    f"Invalid aggregation. Must be one of: {', '.join(valid_aggregations)}"
+                ),
+            },
+        )
+
     # Get cost configuration for currency symbol
     cost_data = await get_config_value(session, "cost")
     if cost_data:
@@ -1005,7 +1027,7 @@ async def get_server_cost_history(
 
     # Get server cost history from service
     service = CostHistoryService(session)
-    result = await service.get_server_history(server_id, period)
+    result = await service.get_server_history(server_id, period, aggregation)
 
     if result is None:
         raise HTTPException(
@@ -1030,6 +1052,7 @@ async def get_server_cost_history(
         server_id=result.server_id,
         hostname=result.hostname,
         period=result.period,
+        aggregation=result.aggregation,
         items=items,
         currency_symbol=cost_config.currency_symbol,
     )
@@ -4,23 +4,31 @@ import logging
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from sqlalchemy import and_, desc, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from homelab_cmd.api.conditional import conditional_get
 from homelab_cmd.api.deps import verify_api_key
-from homelab_cmd.api.responses import AUTH_RESPONSES, CONFLICT_RESPONSE, NOT_FOUND_RESPONSE
+from homelab_cmd.api.responses import (
+    AUTH_RESPONSES,
+    CONFLICT_RESPONSE,
+    NOT_FOUND_RESPONSE,
+    NOT_MODIFIED_RESPONSE,
+)
 from homelab_cmd.api.schemas.service import (
     DuplicateActionError,
     ExpectedServiceCreate,
     ExpectedServiceListResponse,
     ExpectedServiceResponse,
     ExpectedServiceUpdate,
+    FleetServicesResponse,
     RestartActionResponse,
+    ServerServicesItem,
     ServiceCurrentStatus,
 )
 from homelab_cmd.db.models.remediation import ActionStatus, RemediationAction
 from homelab_cmd.db.models.server import Server
-from homelab_cmd.db.models.service import ExpectedService, ServiceStatus
+from homelab_cmd.db.models.service import CurrentServiceStatus, ExpectedService
 from homelab_cmd.db.session import get_async_session
 from homelab_cmd.services.agent_config_sync import sync_services_to_agent
 
@@ -28,13 +36,108 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/servers", tags=["Services"])
 
+# Fleet-wide service listing (separate prefix so it can't shadow /servers/{server_id})
+fleet_router = APIRouter(prefix="/services", tags=["Services"])
+
+
+async def _list_services_with_status(
+    session: AsyncSession, server_id: str | None = None
+) -> list[tuple[ExpectedService, CurrentServiceStatus | None]]:
+    """Load expected services with their latest status in one query.
+
+    Args:
+        session: Database session.
+        server_id: Restrict to one server (default: all servers).
+
+    Returns:
+        (expected service, current status or None) pairs ordered by server
+        and service name.
+    """
+    query = (
+        select(ExpectedService, CurrentServiceStatus)
+        .outerjoin(
+            CurrentServiceStatus,
+            and_(
+                CurrentServiceStatus.server_id == ExpectedService.server_id,
+                CurrentServiceStatus.service_name == ExpectedService.service_name,
+            ),
+        )
+        .order_by(ExpectedService.server_id, ExpectedService.service_name)
+    )
+    if server_id is not None:
+        query = query.where(ExpectedService.server_id == server_id)
+
+    result = await session.execute(query)
+    return [(svc, current) for svc, current in result.all()]
+
+
+def _to_service_response(
+    svc: ExpectedService, current: CurrentServiceStatus | None
+) -> ExpectedServiceResponse:
+    """Build the API response for an expected service and its latest status."""
+    return ExpectedServiceResponse(
+        service_name=svc.service_name,
+        display_name=svc.display_name,
+        is_critical=svc.is_critical,
+        enabled=svc.enabled,
+        current_status=ServiceCurrentStatus(
+            status=current.status,
+            status_reason=current.status_reason,
+            pid=current.pid,
+            memory_mb=current.memory_mb,
+            cpu_percent=current.cpu_percent,
+            last_seen=current.timestamp,
+        )
+        if current
+        else None,
+    )
+
+
+@fleet_router.get(
+    "",
+    response_model=FleetServicesResponse,
+    operation_id="list_fleet_services",
+    summary="List expected services for all servers",
+    responses={**AUTH_RESPONSES, **NOT_MODIFIED_RESPONSE},
+    dependencies=[Depends(conditional_get(ExpectedService, CurrentServiceStatus, Server))],
+)
+async def list_fleet_services(
+    session: AsyncSession = Depends(get_async_session),
+    _: str = Depends(verify_api_key),
+) -> FleetServicesResponse:
+    """List expected services and their current status for every server.
+
+    Lets the dashboard show service state across the fleet with one request
+    instead of one per server. Servers without expected services are omitted.
+    """
+    rows = await _list_services_with_status(session)
+
+    result = await session.execute(select(Server.id, Server.display_name, Server.hostname))
+    server_names = {
+        server_id: display_name or hostname for server_id, display_name, hostname in result.all()
+    }
+
+    servers: dict[str, ServerServicesItem] = {}
+    for svc, current in rows:
+        item = servers.get(svc.server_id)
+        if item is None:
+            item = servers[svc.server_id] = ServerServicesItem(
+                server_id=svc.server_id,
+                server_name=server_names.get(svc.server_id, svc.server_id),
+                services=[],
+            )
+        item.services.append(_to_service_response(svc, current))
+
+    return FleetServicesResponse(servers=list(servers.values()), total=len(rows))
+
 
 @router.get(
     "/{server_id}/services",
     response_model=ExpectedServiceListResponse,
     operation_id="list_server_services",
     summary="List expected services for a server",
-    responses={**AUTH_RESPONSES, **NOT_FOUND_RESPONSE},
+    responses={**AUTH_RESPONSES, **NOT_FOUND_RESPONSE, **NOT_MODIFIED_RESPONSE},
+    dependencies=[Depends(conditional_get(Server, ExpectedService, CurrentServiceStatus))],
 )
 async def list_server_services(
     server_id: str,
@@ -53,52 +156,13 @@ async def list_server_services(
             detail={"code": "NOT_FOUND", "message": f"Server '{server_id}' not found"},
         )
 
-    # Query all expected services for this server
-    result = await session.execute(
-        select(ExpectedService).where(ExpectedService.server_id == server_id)
-    )
-    services = result.scalars().all()
-
-    # Build response with current status for each service
-    service_responses = []
-    for svc in services:
-        response = ExpectedServiceResponse(
-            service_name=svc.service_name,
-            display_name=svc.display_name,
-            is_critical=svc.is_critical,
-            enabled=svc.enabled,
-            current_status=None,
-        )
-
-        # Query latest ServiceStatus for this service
-        status_result = await session.execute(
-            select(ServiceStatus)
-            .where(
-                and_(
-                    ServiceStatus.server_id == server_id,
-                    ServiceStatus.service_name == svc.service_name,
-                )
-            )
-            .order_by(desc(ServiceStatus.timestamp))
-            .limit(1)
-        )
-        latest_status = status_result.scalar_one_or_none()
-
-        if latest_status:
-            response.current_status = ServiceCurrentStatus(
-                status=latest_status.status,
-                status_reason=latest_status.status_reason,
-                pid=latest_status.pid,
-                memory_mb=latest_status.memory_mb,
-                cpu_percent=latest_status.cpu_percent,
-                last_seen=latest_status.timestamp,
-            )
-
-        service_responses.append(response)
+    # Expected services joined to their latest status (US0018 - AC5)
+    rows = await _list_services_with_status(session, server_id)
+    service_responses = [_to_service_response(svc, current) for svc, current in rows]
 
     return ExpectedServiceListResponse(
         services=service_responses,
-        total=len(services),
+        total=len(service_responses),
     )
 
 
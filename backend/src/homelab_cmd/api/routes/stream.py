@@ -0,0 +1,141 @@
+"""Live update stream (Server-Sent Events) for the dashboard.
+
+Fans out events from the in-process event bus so the frontend can react to
+server status changes, new metric points, alert transitions, scan/discovery/
+apply progress and action completion instead of polling each endpoint.
+"""
+
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from homelab_cmd.api.deps import verify_api_key
+from homelab_cmd.api.responses import AUTH_RESPONSES, BAD_REQUEST_RESPONSE
+from homelab_cmd.services.event_bus import (
+    BusEvent,
+    EventTopic,
+    Subscription,
+    get_event_bus,
+)
+
+router = APIRouter(prefix="/stream", tags=["Live Updates"])
+logger = logging.getLogger(__name__)
+
+# Seconds between keep-alive comments when no events are published
+KEEPALIVE_SECONDS = 15.0
+
+# Client reconnect delay advertised to EventSource (milliseconds)
+RETRY_MILLISECONDS = 5000
+
+
+def format_sse(event: BusEvent) -> str:
+    """Format a bus event as a Server-Sent Events message."""
+    data = json.dumps(
+        {"timestamp": event.timestamp.isoformat(), **event.data},
+        separators=(",", ":"),
+        default=str,
+    )
+    return f"id: {event.id}\nevent: {event.topic.value}\ndata: {data}\n\n"
+
+
+async def sse_messages(
+    subscription: Subscription,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    keepalive_seconds: float = KEEPALIVE_SECONDS,
+) -> AsyncIterator[str]:
+    """Yield SSE messages for a subscription until the client disconnects.
+
+    Args:
+        subscription: Event bus subscription to drain.
+        is_disconnected: Returns True once the client has gone away.
+        keepalive_seconds: Idle time before a keep-alive comment is sent.
+
+    Yields:
+        SSE-formatted message strings.
+    """
+    yield f"retry: {RETRY_MILLISECONDS}\n\n"
+    while not await is_disconnected():
+        event = await subscription.get(timeout=keepalive_seconds)
+        if event is None:
+            # Comment line keeps proxies from closing an idle connection
+            yield ": keepalive\n\n"
+        else:
+            yield format_sse(event)
+
+
+def _parse_topics(topics: str | None) -> set[EventTopic] | None:
+    """Parse a comma-separated topic list (None/empty means all topics)."""
+    if not topics:
+        return None
+    parsed: set[EventTopic] = set()
+    for name in topics.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        try:
+            parsed.add(EventTopic(name))
+        except ValueError:
+            valid = ", ".join(t.value for t in EventTopic)
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "code": "INVALID_TOPIC",
+                    "message": f"Unknown topic '{name}'. Valid topics: {valid}",
+                },
+            ) from None
+    return parsed or None
+
+
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    operation_id="get_event_stream",
+    summary="Subscribe to live dashboard updates (Server-Sent Events)",
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": "Stream of events; the SSE event name is the topic",
+        },
+        **AUTH_RESPONSES,
+        **BAD_REQUEST_RESPONSE,
+    },
+)
+async def get_event_stream(
+    request: Request,
+    topics: str | None = Query(
+        None,
+        description="Comma-separated topics to receive (default: all). "
+        "server_status, metrics, alert, scan_progress, discovery_progress, "
+        "apply_progress, rollout_progress, action",
+    ),
+    last_event_id: Annotated[str | None, Header(alias="Last-Event-ID")] = None,
+    _: str = Depends(verify_api_key),
+) -> StreamingResponse:
+    """Stream live updates as Server-Sent Events.
+
+    Each message carries the topic as the SSE event name and a JSON payload
+    identifying what changed (e.g. server_id and new status), so the UI can
+    update in place or refetch just the affected resource. Send
+    Last-Event-ID when reconnecting to replay recently missed events.
+    """
+    topic_set = _parse_topics(topics)
+    replay_from = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+
+    async def stream() -> AsyncIterator[str]:
+        async with get_event_bus().subscribe(topic_set, replay_from) as subscription:
+            async for message in sse_messages(subscription, request.is_disconnected):
+                yield message
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Disable response buffering in nginx-style reverse proxies
+            "X-Accel-Buffering": "no",
+        },
+    )
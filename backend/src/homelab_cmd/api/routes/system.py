@@ -1,12 +1,24 @@
-"""System endpoints including health check."""
+"""System endpoints including health check and performance summary."""
 
 from datetime import UTC, datetime
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, Field
 
+from homelab_cmd.api.deps import verify_api_key
+from homelab_cmd.api.responses import AUTH_RESPONSES
+from homelab_cmd.api.schemas.performance import (
+    PerformanceOrder,
+    PerformanceSummaryResponse,
+    RouteTiming,
+    SlowQueryEntry,
+    StartupPhaseTiming,
+    StartupTiming,
+    StatementTiming,
+)
 from homelab_cmd.config import get_settings
 from homelab_cmd.db.session import check_database_connection
+from homelab_cmd.services.profiling import TimingStats, get_profiler, get_startup_profile
 
 router = APIRouter(prefix="/system", tags=["System"])
 
@@ -66,3 +78,96 @@ async def health_check() -> HealthResponse:
         database=database_status,
         timestamp=datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
     )
+
+
+def _rank_key(order: PerformanceOrder):
+    attribute = {
+        PerformanceOrder.MEAN: "mean_ms",
+        PerformanceOrder.MAX: "max_ms",
+        PerformanceOrder.TOTAL: "total_ms",
+    }[order]
+    return lambda item: getattr(item[1], attribute)
+
+
+def _top(stats: dict[str, TimingStats], order: PerformanceOrder, limit: int) -> list:
+    return sorted(stats.items(), key=_rank_key(order), reverse=True)[:limit]
+
+
+@router.get(
+    "/performance",
+    response_model=PerformanceSummaryResponse,
+    operation_id="get_performance_summary",
+    summary="Slowest routes and SQL statements",
+    responses={**AUTH_RESPONSES},
+)
+async def get_performance_summary(
+    limit: int = Query(10, ge=1, le=100, description="Routes and statements to return"),
+    order_by: PerformanceOrder = Query(
+        PerformanceOrder.MEAN, description="Rank by mean, max or total time"
+    ),
+    _: str = Depends(verify_api_key),
+) -> PerformanceSummaryResponse:
+    """Summarise request and SQL timings recorded by this worker.
+
+    Returns the top routes and statements ranked by mean, maximum or total
+    time, and the most recent statements that exceeded the slow-query
+    threshold with their query plans. Figures cover this worker since it
+    started or was last reset. Startup timings are kept across resets.
+    """
+    profiler = get_profiler()
+    startup = get_startup_profile()
+    return PerformanceSummaryResponse(
+        since=profiler.since,
+        slow_query_threshold_ms=profiler.slow_query_threshold_ms,
+        routes=[
+            RouteTiming(
+                route=route,
+                count=s.count,
+                mean_ms=round(s.mean_ms, 3),
+                max_ms=round(s.max_ms, 3),
+                total_ms=round(s.total_ms, 3),
+                mean_queries=round(s.query_count / s.count, 2),
+                mean_query_ms=round(s.query_ms / s.count, 3),
+            )
+            for route, s in _top(profiler.routes, order_by, limit)
+        ],
+        statements=[
+            StatementTiming(
+                statement=statement,
+                count=s.count,
+                mean_ms=round(s.mean_ms, 3),
+                max_ms=round(s.max_ms, 3),
+                total_ms=round(s.total_ms, 3),
+            )
+            for statement, s in _top(profiler.statements, order_by, limit)
+        ],
+        slow_queries=[
+            SlowQueryEntry(
+                occurred_at=q.occurred_at,
+                duration_ms=round(q.duration_ms, 3),
+                statement=q.statement,
+                route=q.route,
+                plan=q.plan,
+            )
+            for q in reversed(profiler.slow_queries)
+        ],
+        startup=StartupTiming(
+            ready_ms=None if startup.ready_ms is None else round(startup.ready_ms, 1),
+            phases=[
+                StartupPhaseTiming(phase=phase, duration_ms=round(duration_ms, 3))
+                for phase, duration_ms in startup.phases.items()
+            ],
+        ),
+    )
+
+
+@router.delete(
+    "/performance",
+    status_code=204,
+    operation_id="delete_performance_summary",
+    summary="Reset recorded route and SQL timings",
+    responses={**AUTH_RESPONSES},
+)
+async def delete_performance_summary(_: str = Depends(verify_api_key)) -> None:
+    """Discard this worker's recorded timings, e.g. before measuring a change."""
+    get_profiler().reset()
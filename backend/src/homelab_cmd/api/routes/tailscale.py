@@ -12,11 +12,10 @@ Provides endpoints for:
 - SSH testing for Tailscale devices (US0096, US0097)
 """
 
-import asyncio
 import logging
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -38,16 +37,28 @@ from homelab_cmd.api.schemas.tailscale import (
     TailscaleTokenRequest,
     TailscaleTokenResponse,
 )
+from homelab_cmd.api.serialisation import model_response
 from homelab_cmd.config import get_settings
-from homelab_cmd.db.models.config import Config
 from homelab_cmd.db.models.server import Server
 from homelab_cmd.db.session import get_async_session
+from homelab_cmd.services.coordination import (
+    CONNECTIVITY_STATUS_CACHE,
+    TAILSCALE_DEVICES_CACHE,
+    get_coordinator,
+)
 from homelab_cmd.services.credential_service import CredentialService
+from homelab_cmd.services.ssh_reachability import (
+    NO_SSH_KEY_ERROR,
+    check_device_ssh,
+    clear_reachability,
+    get_reachability,
+    get_ssh_settings,
+    store_reachability,
+)
 from homelab_cmd.services.tailscale_service import (
     TailscaleAuthError,
     TailscaleCache,
     TailscaleConnectionError,
-    TailscaleDevice,
     TailscaleNotConfiguredError,
     TailscaleRateLimitError,
     TailscaleService,
@@ -139,6 +150,9 @@ async def save_token(
     """
     credential_service = _get_credential_service(session)
     await credential_service.store_credential("tailscale_token", request.token)
+    # Devices cached for the old token may belong to a different tailnet
+    await get_coordinator().invalidate_cache(session, TAILSCALE_DEVICES_CACHE)
+    await get_coordinator().invalidate_cache(session, CONNECTIVITY_STATUS_CACHE)
     await session.commit()
 
     logger.info("Tailscale API token saved")
@@ -167,6 +181,8 @@ async def remove_token(
     """
     credential_service = _get_credential_service(session)
     deleted = await credential_service.delete_credential("tailscale_token")
+    await get_coordinator().invalidate_cache(session, TAILSCALE_DEVICES_CACHE)
+    await get_coordinator().invalidate_cache(session, CONNECTIVITY_STATUS_CACHE)
     await session.commit()
 
     if deleted:
@@ -284,13 +300,15 @@ async def list_devices(
     online: bool | None = Query(None, description="Filter by online status"),
     os: str | None = Query(None, description="Filter by OS (linux, windows, macos, ios, android)"),
     refresh: bool = Query(False, description="Bypass cache and fetch fresh data"),
-) -> TailscaleDeviceListResponse:
+) -> Response:
     """List all devices in the Tailscale tailnet.
 
     Part of US0077: Tailscale Device Discovery.
 
     Returns a list of all devices with caching support. Results are cached
-    for 5 minutes to avoid excessive API calls. Use refresh=true to bypass cache.
+    for 5 minutes to avoid excessive API calls; for up to an hour after that
+    the cached list is returned while a background refresh fetches a new one.
+    Use refresh=true to bypass cache.
 
     Filtering:
     - online: Filter by online status (true/false)
@@ -311,6 +329,10 @@ async def list_devices(
         result = await session.execute(select(Server.hostname))
         imported_hostnames = {row[0] for row in result.fetchall() if row[0]}
 
+        # A refresh on one worker refreshes the cache on all of them
+        if refresh:
+            await get_coordinator().invalidate_cache(session, TAILSCALE_DEVICES_CACHE)
+
         # Get devices with caching
         device_list = await tailscale_service.get_devices_cached(
             cache=_device_cache,
@@ -333,25 +355,27 @@ async def list_devices(
                 logger.warning("Invalid OS filter value ignored: %s", os)
 
         # Convert to response schema
-        return TailscaleDeviceListResponse(
-            devices=[
-                TailscaleDeviceSchema(
-                    id=d.id,
-                    name=d.name,
-                    hostname=d.hostname,
-                    tailscale_ip=d.tailscale_ip,
-                    os=d.os,
-                    os_version=d.os_version,
-                    last_seen=d.last_seen,
-                    online=d.online,
-                    authorized=d.authorized,
-                    already_imported=d.already_imported,
-                )
-                for d in devices
-            ],
-            count=len(devices),
-            cache_hit=device_list.cache_hit,
-            cached_at=device_list.cached_at,
+        return model_response(
+            TailscaleDeviceListResponse(
+                devices=[
+                    TailscaleDeviceSchema(
+                        id=d.id,
+                        name=d.name,
+                        hostname=d.hostname,
+                        tailscale_ip=d.tailscale_ip,
+                        os=d.os,
+                        os_version=d.os_version,
+                        last_seen=d.last_seen,
+                        online=d.online,
+                        authorized=d.authorized,
+                        already_imported=d.already_imported,
+                    )
+                    for d in devices
+                ],
+                count=len(devices),
+                cache_hit=device_list.cache_hit,
+                cached_at=device_list.cached_at,
+            )
         )
 
     except TailscaleNotConfiguredError:
@@ -526,92 +550,8 @@ async def check_import(
 # SSH Testing Endpoints (EP0016: US0096, US0097)
 # =============================================================================
 
-# In-memory cache for SSH status with 5-minute TTL
-_ssh_status_cache: dict[str, tuple[str, str | None, str | None, datetime]] = {}
-SSH_STATUS_CACHE_TTL_SECONDS = 300  # 5 minutes
-
-
-async def _get_ssh_username(session: AsyncSession) -> str:
-    """Get the configured SSH username from database."""
-    stmt = select(Config).where(Config.key == "ssh_username")
-    result = await session.execute(stmt)
-    config = result.scalar_one_or_none()
-    return config.value if config else "homelabcmd"
-
-
-async def _test_ssh_for_device(
-    device: TailscaleDevice,
-    session: AsyncSession,
-    credential_service: CredentialService,
-) -> tuple[str, str | None, str | None]:
-    """Test SSH connection to a single device.
-
-    Uses the unified SSH key management (US0093) via SSHConnectionService.
-
-    Returns:
-        Tuple of (status, error, key_used) where status is 'available', 'unavailable', or 'untested'.
-    """
-    from homelab_cmd.services.ssh import get_ssh_service
-
-    if not device.online:
-        return (
-            "unavailable",
-            f"Offline - last seen {_format_relative_time(device.last_seen)}",
-            None,
-        )
-
-    # Check SSH status cache
-    cache_key = device.id
-    if cache_key in _ssh_status_cache:
-        status, error, key_used, cached_at = _ssh_status_cache[cache_key]
-        if (datetime.now(UTC) - cached_at).total_seconds() < SSH_STATUS_CACHE_TTL_SECONDS:
-            return (status, error, key_used)
-
-    # Test SSH connection using unified SSH service (US0093)
-    ssh_service = get_ssh_service()
-    username = await _get_ssh_username(session)
-
-    # Check if any SSH keys are configured
-    keys = ssh_service.list_keys_with_metadata()
-    if not keys:
-        error = "No SSH key configured. Upload a key in Settings > Connectivity."
-        _ssh_status_cache[cache_key] = ("unavailable", error, None, datetime.now(UTC))
-        return ("unavailable", error, None)
-
-    # Read key_usernames from database config (US0072)
-    # Usernames are stored in Config["ssh"]["key_usernames"] dict
-    result = await session.execute(select(Config).where(Config.key == "ssh"))
-    config = result.scalar_one_or_none()
-    ssh_config = config.value if config else {}
-    key_usernames = ssh_config.get("key_usernames", {})
-
-    try:
-        # Use Tailscale IP for reliable connectivity (hostname may not resolve)
-        ssh_hostname = device.tailscale_ip or device.name or device.hostname
-        result = await ssh_service.test_connection(
-            hostname=ssh_hostname,
-            username=username,
-            key_usernames=key_usernames,
-        )
-
-        if result.success:
-            status = "available"
-            error = None
-            key_used = result.key_used
-        else:
-            status = "unavailable"
-            error = result.error or "SSH connection failed"
-            key_used = None
-
-        # Cache the result
-        _ssh_status_cache[cache_key] = (status, error, key_used, datetime.now(UTC))
-
-        return (status, error, key_used)
-
-    except Exception as e:
-        error = str(e) if str(e) else "SSH connection failed"
-        _ssh_status_cache[cache_key] = ("unavailable", error, None, datetime.now(UTC))
-        return ("unavailable", error, None)
+# The device cache is per worker; invalidations are broadcast to the others
+get_coordinator().register_cache(TAILSCALE_DEVICES_CACHE, _device_cache.invalidate)
 
 
 def _format_relative_time(dt: datetime) -> str:
@@ -679,7 +619,20 @@ async def test_device_ssh(
 
         # Test SSH connection
         start_time = datetime.now(UTC)
-        status, error, key_used = await _test_ssh_for_device(device, session, credential_service)
+        if device.online:
+            username, key_usernames = await get_ssh_settings(session)
+            reachability = await check_device_ssh(device, username, key_usernames)
+            if reachability.error != NO_SSH_KEY_ERROR:
+                await store_reachability(session, {device.id: reachability})
+            status, error, key_used = (
+                reachability.status,
+                reachability.error,
+                reachability.key_used,
+            )
+        else:
+            status = "unavailable"
+            error = f"Offline - last seen {_format_relative_time(device.last_seen)}"
+            key_used = None
         elapsed = datetime.now(UTC) - start_time
         latency_ms = int(elapsed.total_seconds() * 1000)
 
@@ -727,13 +680,15 @@ async def list_devices_with_ssh(
     os: str | None = Query(None, description="Filter by OS (linux, windows, macos, ios, android)"),
     refresh: bool = Query(False, description="Bypass cache and fetch fresh data"),
     test_ssh: bool = Query(True, description="Test SSH connectivity for online devices"),
-) -> TailscaleDeviceListWithSSHResponse:
+) -> Response:
     """List all devices with SSH connectivity status.
 
     EP0016: Unified Discovery Experience (US0097).
 
-    Returns a list of all devices with SSH status. SSH is tested in parallel
-    for all online devices. Results are cached for 5 minutes.
+    Returns a list of all devices with SSH status. SSH results are stored per
+    device: current results are returned as they are, results older than 15
+    minutes are returned and re-tested in the background, and only devices
+    never tested are tested (in parallel) before responding.
 
     Filtering:
     - online: Filter by online status (true/false)
@@ -749,9 +704,10 @@ async def list_devices_with_ssh(
         result = await session.execute(select(Server.hostname))
         imported_hostnames = {row[0] for row in result.fetchall() if row[0]}
 
-        # Clear SSH cache if refresh requested
+        # Clear device caches on every worker and forget SSH results if refresh requested
         if refresh:
-            _ssh_status_cache.clear()
+            await get_coordinator().invalidate_cache(session, TAILSCALE_DEVICES_CACHE)
+            await clear_reachability(session)
 
         # Get devices with caching
         device_list = await tailscale_service.get_devices_cached(
@@ -771,88 +727,23 @@ async def list_devices_with_ssh(
             if os_lower in VALID_OS_VALUES:
                 devices = [d for d in devices if d.os.lower() == os_lower]
 
-        # Test SSH in parallel for online devices
-        if test_ssh:
-            SSH_TEST_TIMEOUT_SECONDS = 10.0
-
-            async def test_device(
-                d: TailscaleDevice,
-            ) -> tuple[TailscaleDevice, str, str | None, str | None]:
-                status, error, key_used = await _test_ssh_for_device(d, session, credential_service)
-                return (d, status, error, key_used)
-
-            async def test_device_with_timeout(
-                d: TailscaleDevice,
-            ) -> tuple[TailscaleDevice, str, str | None, str | None]:
-                """Wrap test_device with per-device timeout to prevent hanging."""
-                try:
-                    return await asyncio.wait_for(test_device(d), timeout=SSH_TEST_TIMEOUT_SECONDS)
-                except TimeoutError:
-                    return (
-                        d,
-                        "unavailable",
-                        f"SSH test timed out after {int(SSH_TEST_TIMEOUT_SECONDS)}s",
-                        None,
-                    )
-
-            online_devices = [d for d in devices if d.online]
-            offline_devices = [d for d in devices if not d.online]
-
-            # Test online devices in parallel with per-device timeout
-            ssh_results = await asyncio.gather(
-                *[test_device_with_timeout(d) for d in online_devices],
-                return_exceptions=True,
-            )
-
-            # Build result list
-            device_results = []
-
-            for result_or_exc in ssh_results:
-                if isinstance(result_or_exc, Exception):
-                    # Log unexpected exceptions for debugging
-                    logger.warning("SSH test failed with unexpected exception: %s", result_or_exc)
-                    continue
-                d, status, error, key_used = result_or_exc
-                device_results.append(
-                    TailscaleDeviceWithSSHSchema(
-                        id=d.id,
-                        name=d.name,
-                        hostname=d.hostname,
-                        tailscale_ip=d.tailscale_ip,
-                        os=d.os,
-                        os_version=d.os_version,
-                        last_seen=d.last_seen,
-                        online=d.online,
-                        authorized=d.authorized,
-                        already_imported=d.already_imported,
-                        ssh_status=status,
-                        ssh_error=error,
-                        ssh_key_used=key_used,
-                    )
-                )
+        # Stored SSH results for online devices; only untested devices are tested now
+        reachability = (
+            await get_reachability(session, [d for d in devices if d.online]) if test_ssh else {}
+        )
 
-            # Add offline devices
-            for d in offline_devices:
-                device_results.append(
-                    TailscaleDeviceWithSSHSchema(
-                        id=d.id,
-                        name=d.name,
-                        hostname=d.hostname,
-                        tailscale_ip=d.tailscale_ip,
-                        os=d.os,
-                        os_version=d.os_version,
-                        last_seen=d.last_seen,
-                        online=d.online,
-                        authorized=d.authorized,
-                        already_imported=d.already_imported,
-                        ssh_status="unavailable",
-                        ssh_error=f"Offline - last seen {_format_relative_time(d.last_seen)}",
-                        ssh_key_used=None,
-                    )
-                )
-        else:
-            # Don't test SSH, just mark all as untested
-            device_results = [
+        device_results = []
+        for d in devices:
+            r = reachability.get(d.id)
+            if r is not None:
+                ssh_status, ssh_error, ssh_key_used = r.status, r.error, r.key_used
+            elif test_ssh and not d.online:
+                ssh_status = "unavailable"
+                ssh_error = f"Offline - last seen {_format_relative_time(d.last_seen)}"
+                ssh_key_used = None
+            else:
+                ssh_status, ssh_error, ssh_key_used = "untested", None, None
+            device_results.append(
                 TailscaleDeviceWithSSHSchema(
                     id=d.id,
                     name=d.name,
@@ -864,18 +755,20 @@ async def list_devices_with_ssh(
                     online=d.online,
                     authorized=d.authorized,
                     already_imported=d.already_imported,
-                    ssh_status="untested",
-                    ssh_error=None,
-                    ssh_key_used=None,
+                    ssh_status=ssh_status,
+                    ssh_error=ssh_error,
+                    ssh_key_used=ssh_key_used,
+                    ssh_tested_at=r.tested_at if r is not None else None,
                 )
-                for d in devices
-            ]
-
-        return TailscaleDeviceListWithSSHResponse(
-            devices=device_results,
-            count=len(device_results),
-            cache_hit=device_list.cache_hit,
-            cached_at=device_list.cached_at,
+            )
+
+        return model_response(
+            TailscaleDeviceListWithSSHResponse(
+                devices=device_results,
+                count=len(device_results),
+                cache_hit=device_list.cache_hit,
+                cached_at=device_list.cached_at,
+            )
         )
 
     except TailscaleNotConfiguredError:
@@ -12,8 +12,9 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from homelab_cmd.api.conditional import conditional_get
 from homelab_cmd.api.deps import verify_api_key
-from homelab_cmd.api.responses import AUTH_RESPONSES, NOT_FOUND_RESPONSE
+from homelab_cmd.api.responses import AUTH_RESPONSES, NOT_FOUND_RESPONSE, NOT_MODIFIED_RESPONSE
 from homelab_cmd.api.schemas.widget_layout import (
     WidgetLayoutDeleteResponse,
     WidgetLayoutRequest,
@@ -45,7 +46,8 @@ async def _verify_machine_exists(session: AsyncSession, machine_id: str) -> None
     response_model=WidgetLayoutResponse,
     operation_id="get_widget_layout",
     summary="Get widget layout for a machine",
-    responses={**AUTH_RESPONSES, **NOT_FOUND_RESPONSE},
+    responses={**AUTH_RESPONSES, **NOT_FOUND_RESPONSE, **NOT_MODIFIED_RESPONSE},
+    dependencies=[Depends(conditional_get(Server, Config))],
 )
 async def get_widget_layout(
     machine_id: str,
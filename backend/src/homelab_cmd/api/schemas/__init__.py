@@ -16,6 +16,8 @@ from homelab_cmd.api.schemas.connectivity import (
     TailscaleInfo,
 )
 from homelab_cmd.api.schemas.heartbeat import (
+    HeartbeatBatchRequest,
+    HeartbeatBatchResponse,
     HeartbeatRequest,
     HeartbeatResponse,
     MetricsPayload,
@@ -34,6 +36,8 @@ __all__ = [
     "AlertListResponse",
     "AlertResolveResponse",
     "AlertResponse",
+    "HeartbeatBatchRequest",
+    "HeartbeatBatchResponse",
     "HeartbeatRequest",
     "HeartbeatResponse",
     "LatestMetrics",
@@ -91,6 +91,9 @@ class ActionListResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total number of matching actions")
     limit: int = Field(..., ge=1, description="Page size limit")
     offset: int = Field(..., ge=0, description="Page offset")
+    next_cursor: str | None = Field(
+        None, description="Pass as cursor to fetch the next page; null on the last page"
+    )
 
 
 class RejectActionRequest(BaseModel):
@@ -0,0 +1,29 @@
+"""Pydantic schemas for the persistent agent channel."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from homelab_cmd.api.schemas.heartbeat import MetricsPayload
+
+
+class AgentChannelInfo(BaseModel):
+    """A live agent channel connection."""
+
+    server_id: str = Field(..., description="Server the agent reports for")
+    connected_at: datetime = Field(..., description="When the channel was opened")
+
+
+class AgentChannelListResponse(BaseModel):
+    """Schema for the list of live agent channels."""
+
+    channels: list[AgentChannelInfo] = Field(..., description="Connected agents")
+    total: int = Field(..., description="Number of connected agents")
+
+
+class LiveMetricsResponse(BaseModel):
+    """Metrics pulled from an agent on demand over its channel."""
+
+    server_id: str = Field(..., description="Server identifier")
+    collected_at: datetime = Field(..., description="When the hub received the metrics")
+    metrics: MetricsPayload = Field(..., description="Current system metrics")
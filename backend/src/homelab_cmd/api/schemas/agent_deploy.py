@@ -4,6 +4,8 @@ EP0007: Agent Management
 US0069: Service Discovery During Agent Installation
 """
 
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -154,3 +156,97 @@ class ServerActivateResponse(BaseModel):
     server_id: str = Field(..., description="Server identifier")
     message: str = Field("", description="Status message")
     error: str | None = Field(None, description="Error message if failed")
+
+
+class AgentRolloutRequest(BaseModel):
+    """Request schema for starting a fleet agent rollout."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "server_ids": ["pihole-primary", "media-server", "nas"],
+                    "canary_size": 1,
+                    "wave_size": 5,
+                    "heartbeat_timeout_seconds": 180,
+                }
+            ]
+        }
+    )
+
+    server_ids: list[str] | None = Field(
+        None,
+        min_length=1,
+        description="Servers to upgrade, in order "
+        "(default: every active agent server not on the current version)",
+    )
+    canary_size: int = Field(
+        1,
+        ge=1,
+        le=50,
+        description="Servers in the first (canary) wave",
+    )
+    wave_size: int = Field(
+        5,
+        ge=1,
+        le=50,
+        description="Servers upgraded concurrently in each wave after the canary",
+    )
+    heartbeat_timeout_seconds: int = Field(
+        180,
+        ge=10,
+        le=3600,
+        description="How long to wait for upgraded servers to heartbeat the new version",
+    )
+
+
+class AgentRolloutHostResult(BaseModel):
+    """Result for one server in a rollout."""
+
+    server_id: str = Field(..., description="Server identifier")
+    wave: int = Field(..., description="Wave index (0 is the canary wave)")
+    status: str = Field(
+        ...,
+        description="Host status (pending, upgrading, verifying, succeeded, failed)",
+    )
+    error: str | None = Field(None, description="Error message if failed")
+    upgraded_at: datetime | None = Field(None, description="When the upgrade command finished")
+    verified_at: datetime | None = Field(
+        None, description="First heartbeat with the target version after upgrade"
+    )
+
+
+class AgentRolloutResponse(BaseModel):
+    """Response schema for a fleet agent rollout."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int = Field(..., description="Rollout identifier")
+    target_version: str = Field(..., description="Agent version being rolled out")
+    status: str = Field(
+        ...,
+        description="Rollout status (pending, running, paused, completed, failed, cancelled)",
+    )
+    canary_size: int = Field(..., description="Servers in the first (canary) wave")
+    wave_size: int = Field(..., description="Servers upgraded concurrently per wave")
+    heartbeat_timeout_seconds: int = Field(..., description="Post-upgrade heartbeat timeout")
+    waves_completed: int = Field(..., description="Waves already processed")
+    waves_total: int = Field(..., description="Waves in the rollout")
+    hosts_total: int = Field(..., description="Servers in the rollout")
+    hosts_succeeded: int = Field(..., description="Servers upgraded and heartbeating")
+    hosts_failed: int = Field(..., description="Servers whose upgrade or heartbeat failed")
+    hosts: list[AgentRolloutHostResult] = Field(
+        default_factory=list, description="Per-server results"
+    )
+    error: str | None = Field(None, description="Why the rollout paused or failed")
+    triggered_by: str = Field(..., description="User/source that started the rollout")
+    created_at: datetime = Field(..., description="When the rollout was requested")
+    started_at: datetime | None = Field(None, description="When the rollout started")
+    completed_at: datetime | None = Field(None, description="When the rollout finished")
+
+
+class AgentRolloutListResponse(BaseModel):
+    """Response schema for listing fleet agent rollouts."""
+
+    rollouts: list[AgentRolloutResponse] = Field(..., description="Rollouts, newest first")
+    total: int = Field(..., description="Number of rollouts returned")
@@ -0,0 +1,133 @@
+"""Pydantic schemas for agent event push (state changes between heartbeats).
+
+Agents push small event messages as soon as a watched state changes, so the
+hub can alert within seconds instead of waiting for the next heartbeat or
+for stale-server detection.
+"""
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from homelab_cmd.api.schemas.heartbeat import FilesystemMetric, ServiceStatusPayload
+
+# Maximum number of events accepted in a single push
+MAX_EVENTS_PER_REQUEST = 100
+
+
+class AgentEventType(str, Enum):
+    """Types of state-change events pushed by agents."""
+
+    SERVICE_STATE = "service_state"
+    FILESYSTEM_THRESHOLD = "filesystem_threshold"
+    SHUTDOWN = "shutdown"
+
+
+class ShutdownReason(str, Enum):
+    """Why an agent is shutting down."""
+
+    SYSTEM_SHUTDOWN = "system_shutdown"  # Host is powering off or rebooting
+    AGENT_STOP = "agent_stop"  # Only the agent service is stopping
+
+
+class AgentEvent(BaseModel):
+    """A single state-change event.
+
+    The payload field that must be present depends on event_type:
+    - service_state: service
+    - filesystem_threshold: filesystem
+    - shutdown: shutdown_reason
+    """
+
+    event_type: AgentEventType = Field(
+        ...,
+        description="Event type (service_state, filesystem_threshold, shutdown)",
+        examples=["service_state"],
+    )
+    timestamp: datetime = Field(
+        ...,
+        description="When the state change was observed (ISO8601)",
+    )
+    service: ServiceStatusPayload | None = Field(
+        None,
+        description="New service state (service_state events)",
+    )
+    filesystem: FilesystemMetric | None = Field(
+        None,
+        description="Filesystem usage at threshold crossing (filesystem_threshold events)",
+    )
+    shutdown_reason: ShutdownReason | None = Field(
+        None,
+        description="Reason for shutdown (shutdown events)",
+        examples=["system_shutdown"],
+    )
+
+    @model_validator(mode="after")
+    def check_payload(self) -> "AgentEvent":
+        """Ensure the payload matching event_type is present."""
+        required = {
+            AgentEventType.SERVICE_STATE: ("service", self.service),
+            AgentEventType.FILESYSTEM_THRESHOLD: ("filesystem", self.filesystem),
+            AgentEventType.SHUTDOWN: ("shutdown_reason", self.shutdown_reason),
+        }
+        field_name, value = required[self.event_type]
+        if value is None:
+            raise ValueError(f"{self.event_type.value} events require '{field_name}'")
+        return self
+
+
+class AgentEventsRequest(BaseModel):
+    """Schema for an agent event push."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "server_guid": "a1b2c3d4-e5f6-4890-abcd-ef1234567890",
+                    "server_id": "omv-mediaserver",
+                    "events": [
+                        {
+                            "event_type": "service_state",
+                            "timestamp": "2026-01-19T12:00:05Z",
+                            "service": {"name": "plex", "status": "failed"},
+                        }
+                    ],
+                }
+            ]
+        }
+    )
+
+    server_guid: str | None = Field(
+        None,
+        min_length=36,
+        max_length=36,
+        pattern=r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$",
+        description="Agent's permanent UUID v4",
+        examples=["a1b2c3d4-e5f6-4890-abcd-ef1234567890"],
+    )
+    server_id: str = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        pattern=r"^[a-z0-9-]+$",
+        description="Server identifier",
+        examples=["omv-mediaserver"],
+    )
+    events: list[AgentEvent] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_EVENTS_PER_REQUEST,
+        description="State-change events, in any order",
+    )
+
+
+class AgentEventsResponse(BaseModel):
+    """Schema for agent event push response."""
+
+    status: str = Field("ok", description="Response status (ok)")
+    processed: int = Field(..., description="Number of events processed")
+    alerts_triggered: int = Field(
+        0,
+        description="Number of alert notifications (new, reminder or resolved) raised",
+    )
@@ -60,6 +60,9 @@ class AlertListResponse(BaseModel):
     total: int = Field(..., description="Total number of matching alerts")
     limit: int = Field(..., description="Maximum results returned")
     offset: int = Field(..., description="Number of results skipped")
+    next_cursor: str | None = Field(
+        None, description="Pass as cursor to fetch the next page; null on the last page"
+    )
 
 
 class AlertAcknowledgeResponse(BaseModel):
@@ -20,6 +20,10 @@ class ApplyRequest(BaseModel):
     dry_run: bool = Field(
         default=False, description="If true, preview changes without applying"
     )
+    batched: bool = Field(
+        default=True,
+        description="Apply all items in one SSH session; false runs one command per item",
+    )
 
 
 # Dry-run preview item schemas
@@ -87,3 +87,22 @@ class ConnectivityStatusBarResponse(BaseModel):
     mode: ConnectivityMode = Field(..., description="Current connectivity mode")
     display: str = Field(..., description="Display text for status bar")
     healthy: bool = Field(True, description="Whether connectivity is healthy")
+    checked_at: datetime | None = Field(None, description="When connectivity was last probed")
+
+
+class ConnectivityProbe(BaseModel):
+    """Outcome of one background connectivity probe."""
+
+    probed_at: datetime = Field(..., description="When the probe ran")
+    duration_ms: float = Field(..., description="How long the probe took in milliseconds")
+    mode: ConnectivityMode | None = Field(None, description="Connectivity mode seen (if probed)")
+    tailscale_connected: bool = Field(False, description="Whether the Tailscale API answered")
+    device_count: int = Field(0, description="Number of devices in tailnet")
+    error: str | None = Field(None, description="Error if the probe failed")
+
+
+class ConnectivityProbeListResponse(BaseModel):
+    """Response for GET /api/v1/settings/connectivity/probes."""
+
+    probes: list[ConnectivityProbe] = Field(..., description="Recent probes, newest first")
+    interval_seconds: int = Field(..., description="Seconds between scheduled probes")
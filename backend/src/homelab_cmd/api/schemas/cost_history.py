@@ -67,5 +67,8 @@ class ServerCostHistoryResponse(BaseModel):
     server_id: str = Field(description="Server identifier")
     hostname: str = Field(description="Server hostname")
     period: str = Field(description="Period: '7d', '30d', '90d', or '12m'")
+    aggregation: str = Field(
+        default="daily", description="Aggregation level: 'daily', 'weekly', or 'monthly'"
+    )
     items: list[CostHistoryItem] = Field(description="Cost history records")
     currency_symbol: str = Field(description="Currency symbol (e.g., '$', '£')")
@@ -488,3 +488,70 @@ class HeartbeatResponse(BaseModel):
         default_factory=list,
         description="Action IDs whose results were acknowledged (US0025)",
     )
+
+
+# Maximum number of samples accepted in a single batch request
+MAX_BATCH_SAMPLES = 1000
+
+
+class HeartbeatBatchRequest(BaseModel):
+    """Schema for batched heartbeat ingestion.
+
+    Carries many timestamped heartbeat samples in one request. Samples may
+    come from a single agent (backfill after an outage, high-frequency
+    sampling) or from a relay forwarding for several agents. For each server
+    only the most recent sample updates server state and is evaluated for
+    alerts; all samples are stored as metrics history.
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "heartbeats": [
+                        {
+                            "server_id": "omv-mediaserver",
+                            "hostname": "mediaserver.home.lan",
+                            "timestamp": "2026-01-19T12:00:00Z",
+                            "metrics": {"cpu_percent": 41.0, "memory_percent": 62.1},
+                        },
+                        {
+                            "server_id": "omv-mediaserver",
+                            "hostname": "mediaserver.home.lan",
+                            "timestamp": "2026-01-19T12:00:10Z",
+                            "metrics": {"cpu_percent": 45.2, "memory_percent": 62.5},
+                        },
+                    ]
+                }
+            ]
+        }
+    )
+
+    heartbeats: list[HeartbeatRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SAMPLES,
+        description="Timestamped heartbeat samples (oldest first recommended)",
+    )
+
+
+class HeartbeatBatchServerResult(BaseModel):
+    """Per-server outcome of a batch heartbeat request."""
+
+    server_id: str = Field(..., description="Server identifier")
+    samples_accepted: int = Field(..., description="Number of samples stored for this server")
+    server_registered: bool = Field(
+        False,
+        description="True if server was auto-registered by this batch",
+    )
+
+
+class HeartbeatBatchResponse(BaseModel):
+    """Schema for batch heartbeat response."""
+
+    status: str = Field("ok", description="Response status (ok)")
+    accepted: int = Field(..., description="Total number of samples stored")
+    servers: list[HeartbeatBatchServerResult] = Field(
+        default_factory=list,
+        description="Per-server ingestion results",
+    )
@@ -45,6 +45,39 @@ class MetricsHistoryResponse(BaseModel):
     total_points: int = Field(..., description="Number of data points returned")
 
 
+class MetricsColumns(BaseModel):
+    """Metrics time series as parallel arrays, one entry per data point."""
+
+    timestamps: list[int] = Field(
+        default_factory=list, description="Unix timestamps in seconds, ascending"
+    )
+    cpu_percent: list[float | None] = Field(
+        default_factory=list, description="CPU usage percentages, parallel to timestamps"
+    )
+    memory_percent: list[float | None] = Field(
+        default_factory=list, description="Memory usage percentages, parallel to timestamps"
+    )
+    disk_percent: list[float | None] = Field(
+        default_factory=list, description="Disk usage percentages, parallel to timestamps"
+    )
+
+
+class MetricsColumnsResponse(BaseModel):
+    """Response schema for the columnar metrics history endpoint.
+
+    Carries the same data as MetricsHistoryResponse without repeating the
+    field names for every point.
+    """
+
+    server_id: str = Field(..., description="Server identifier")
+    range: str = Field(..., description="Time range requested (24h, 7d, 30d, 12m)")
+    resolution: str = Field(..., description="Data resolution (1m, 1h, 4h, 1d)")
+    columns: MetricsColumns = Field(
+        default_factory=MetricsColumns, description="Time-series data as parallel arrays"
+    )
+    total_points: int = Field(..., description="Number of data points returned")
+
+
 # US0113: Sparkline schemas for inline metric charts
 
 
@@ -71,3 +104,41 @@ class SparklineResponse(BaseModel):
     data: list[SparklinePoint] = Field(
         default_factory=list, description="Time-series data points for sparkline"
     )
+
+
+class SparklineSeries(BaseModel):
+    """One downsampled metric series in columnar form.
+
+    Timestamps and values are parallel arrays rather than per-point objects,
+    which keeps a fleet-wide response small.
+    """
+
+    timestamps: list[int] = Field(
+        default_factory=list, description="Unix timestamps in seconds, ascending"
+    )
+    values: list[float] = Field(
+        default_factory=list, description="Metric values, parallel to timestamps"
+    )
+
+
+class ServerSparklines(BaseModel):
+    """Sparkline series for one server."""
+
+    server_id: str = Field(..., description="Server identifier")
+    series: dict[str, SparklineSeries] = Field(
+        default_factory=dict, description="Series keyed by metric type"
+    )
+
+
+class SparklineBatchResponse(BaseModel):
+    """Response schema for the batch sparkline endpoint.
+
+    Returns sparklines for many servers and metrics in one response so a
+    dashboard of server cards needs a single request.
+    """
+
+    period: str = Field(..., description="Time period covered (e.g., 30m)")
+    metrics: list[str] = Field(..., description="Metric types included for each server")
+    servers: list[ServerSparklines] = Field(
+        default_factory=list, description="Sparklines per server"
+    )
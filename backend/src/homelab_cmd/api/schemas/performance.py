@@ -0,0 +1,82 @@
+"""Schemas for the hub performance summary."""
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class PerformanceOrder(str, Enum):
+    """How routes and statements are ranked in the summary."""
+
+    MEAN = "mean"
+    MAX = "max"
+    TOTAL = "total"
+
+
+class RouteTiming(BaseModel):
+    """Latency and SQL activity of one route."""
+
+    route: str = Field(..., description="Method and route template")
+    count: int = Field(..., description="Requests handled")
+    mean_ms: float = Field(..., description="Mean latency in milliseconds")
+    max_ms: float = Field(..., description="Slowest request in milliseconds")
+    total_ms: float = Field(..., description="Total time spent in milliseconds")
+    mean_queries: float = Field(..., description="Mean SQL statements per request")
+    mean_query_ms: float = Field(..., description="Mean SQL time per request in milliseconds")
+
+
+class StatementTiming(BaseModel):
+    """Execution time of one SQL statement."""
+
+    statement: str = Field(..., description="SQL text with parameter placeholders")
+    count: int = Field(..., description="Executions")
+    mean_ms: float = Field(..., description="Mean execution time in milliseconds")
+    max_ms: float = Field(..., description="Slowest execution in milliseconds")
+    total_ms: float = Field(..., description="Total execution time in milliseconds")
+
+
+class SlowQueryEntry(BaseModel):
+    """One statement that exceeded the slow-query threshold."""
+
+    occurred_at: datetime = Field(..., description="When the statement finished")
+    duration_ms: float = Field(..., description="Execution time in milliseconds")
+    statement: str = Field(..., description="SQL text with parameter placeholders")
+    route: str | None = Field(None, description="Route being handled, if any")
+    plan: list[str] = Field(default_factory=list, description="EXPLAIN QUERY PLAN steps")
+
+
+class StartupPhaseTiming(BaseModel):
+    """Duration of one phase of the worker's startup."""
+
+    phase: str = Field(..., description="Startup phase")
+    duration_ms: float = Field(..., description="Duration in milliseconds")
+
+
+class StartupTiming(BaseModel):
+    """How long the worker took to start."""
+
+    ready_ms: float | None = Field(
+        None,
+        description="Time from the hub starting to load until it served requests, in milliseconds",
+    )
+    phases: list[StartupPhaseTiming] = Field(
+        default_factory=list, description="Startup phases in the order they finished"
+    )
+
+
+class PerformanceSummaryResponse(BaseModel):
+    """Response for GET /api/v1/system/performance."""
+
+    since: datetime = Field(..., description="When recording started (worker start or reset)")
+    slow_query_threshold_ms: float = Field(
+        ..., description="Statements at least this slow are logged (0 = disabled)"
+    )
+    routes: list[RouteTiming] = Field(..., description="Slowest routes")
+    statements: list[StatementTiming] = Field(..., description="Slowest statements")
+    slow_queries: list[SlowQueryEntry] = Field(
+        ..., description="Recent slow statements, newest first"
+    )
+    startup: StartupTiming = Field(
+        default_factory=StartupTiming, description="This worker's startup timings"
+    )
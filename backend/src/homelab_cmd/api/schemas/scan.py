@@ -374,3 +374,6 @@ class ScanListResponse(BaseModel):
     total: int = Field(description="Total number of scans matching filters")
     limit: int = Field(default=20, description="Page size used")
     offset: int = Field(default=0, description="Offset used for pagination")
+    next_cursor: str | None = Field(
+        default=None, description="Pass as cursor to fetch the next page; null on the last page"
+    )
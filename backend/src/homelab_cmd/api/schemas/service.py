@@ -112,6 +112,27 @@ class ExpectedServiceListResponse(BaseModel):
     total: int = Field(..., description="Total number of expected services")
 
 
+class ServerServicesItem(BaseModel):
+    """Expected services and their current status for one server."""
+
+    server_id: str = Field(..., description="Server identifier")
+    server_name: str = Field(..., description="Server display name or hostname")
+    services: list[ExpectedServiceResponse] = Field(
+        ...,
+        description="Expected services for this server",
+    )
+
+
+class FleetServicesResponse(BaseModel):
+    """Schema for the fleet-wide expected services response."""
+
+    servers: list[ServerServicesItem] = Field(
+        ...,
+        description="Servers with at least one expected service",
+    )
+    total: int = Field(..., description="Total number of expected services")
+
+
 class RestartActionResponse(BaseModel):
     """Response after queuing a service restart action."""
 
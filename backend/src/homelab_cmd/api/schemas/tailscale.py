@@ -195,6 +195,7 @@ class TailscaleDeviceWithSSHSchema(TailscaleDeviceSchema):
     )
     ssh_error: str | None = Field(None, description="SSH error message if unavailable")
     ssh_key_used: str | None = Field(None, description="Name of SSH key that succeeded")
+    ssh_tested_at: datetime | None = Field(None, description="When SSH was last tested")
 
 
 class TailscaleDeviceListWithSSHResponse(BaseModel):
@@ -2,12 +2,37 @@
 
 Part of EP0008: Tailscale Integration (US0081).
 
-Provides utility commands for credential management and system setup.
+Provides utility commands for credential management, system setup, load
+testing and startup profiling.
 """
 
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
 import click
+import httpx
 from cryptography.fernet import Fernet
 
+from homelab_cmd.config import DEV_API_KEY
+from homelab_cmd.loadtest import (
+    SERVER_ID_PREFIX,
+    LoadTest,
+    LoadTestConfig,
+    compare_reports,
+    database_snapshot,
+    format_report,
+    load_report,
+)
+from homelab_cmd.startup_profile import (
+    APP_MODULE,
+    format_startup_report,
+    measure_cold_start,
+    profile_imports,
+)
+
 
 @click.group()
 def cli() -> None:
@@ -44,5 +69,146 @@ def generate_key() -> None:
     )
 
 
+@cli.command("load-test")
+@click.option("--url", default="http://localhost:8080", show_default=True, help="Hub base URL.")
+@click.option(
+    "--api-key",
+    envvar="HOMELAB_CMD_API_KEY",
+    default=DEV_API_KEY,
+    help="Hub API key (default: $HOMELAB_CMD_API_KEY).",
+)
+@click.option("--agents", "-n", default=100, show_default=True, help="Simulated agents.")
+@click.option(
+    "--interval",
+    default=60.0,
+    show_default=True,
+    help="Seconds between heartbeats from each agent.",
+)
+@click.option("--duration", default=120.0, show_default=True, help="Seconds to run for.")
+@click.option("--concurrency", default=50, show_default=True, help="Maximum requests in flight.")
+@click.option("--seed", default=1, show_default=True, help="Seed for repeatable payloads.")
+@click.option(
+    "--database",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Hub SQLite file, to report database growth (local hubs only).",
+)
+@click.option("--output", type=click.Path(dir_okay=False), help="Write the report as JSON.")
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Earlier JSON report to compare with; exits 1 on regression.",
+)
+@click.option(
+    "--tolerance",
+    default=0.2,
+    show_default=True,
+    help="Allowed relative latency/throughput change against the baseline.",
+)
+@click.option("--keep-servers", is_flag=True, help="Leave the simulated servers registered.")
+def load_test(
+    url: str,
+    api_key: str,
+    agents: int,
+    interval: float,
+    duration: float,
+    concurrency: int,
+    seed: int,
+    database: str | None,
+    output: str | None,
+    baseline: str | None,
+    tolerance: float,
+    keep_servers: bool,
+) -> None:
+    """Simulate a fleet of agents sending heartbeats to a hub.
+
+    Reports throughput, latency percentiles, error rate and (with
+    --database) database growth. Save a report with --output before an
+    upgrade and pass it as --baseline afterwards to spot regressions.
+
+    Simulated servers are named loadtest-NNNN and are deleted afterwards
+    unless --keep-servers is given.
+    """
+    config = LoadTestConfig(
+        agents=agents,
+        interval_seconds=interval,
+        duration_seconds=duration,
+        concurrency=concurrency,
+        seed=seed,
+        server_id_prefix=SERVER_ID_PREFIX,
+    )
+    click.echo(
+        f"Simulating {agents} agents against {url} for {duration:.0f}s "
+        f"({config.target_rate:.1f} heartbeats/s)..."
+    )
+
+    async def run() -> dict:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(
+            base_url=url, headers={"X-API-Key": api_key}, limits=limits, timeout=30.0
+        ) as client:
+            test = LoadTest(client, config)
+            before = database_snapshot(database) if database else None
+            result = await test.run()
+            result.database_before = before
+            result.database_after = database_snapshot(database) if database else None
+            if not keep_servers:
+                removed = await test.remove_servers()
+                click.echo(f"Removed {removed} simulated servers.")
+            return result.to_report()
+
+    report = asyncio.run(run())
+    click.echo()
+    click.echo(format_report(report))
+
+    if output:
+        Path(output).write_text(json.dumps(report, indent=2) + "\n")
+        click.echo(f"\nReport written to {output}")
+
+    if baseline:
+        regressions = compare_reports(load_report(baseline), report, tolerance)
+        if regressions:
+            click.secho("\nRegressions against baseline:", fg="red", bold=True)
+            for regression in regressions:
+                click.echo(f"  {regression}")
+            sys.exit(1)
+        click.secho("\nNo regressions against baseline.", fg="green")
+
+
+@cli.command("startup-profile")
+@click.option(
+    "--starts",
+    default=2,
+    show_default=True,
+    help="Hub starts to time; the first creates the database, later ones reuse it.",
+)
+@click.option("--top", default=10, show_default=True, help="Packages and modules to list.")
+@click.option("--imports-only", is_flag=True, help="Only report import time; start no hub.")
+def startup_profile(starts: int, top: int, imports_only: bool) -> None:
+    """Report what the hub spends its startup time on.
+
+    Imports the application with python -X importtime and lists the
+    packages and modules that take longest, then starts a local hub
+    against a scratch database (--starts times) and reports how long each
+    start took to accept its first heartbeat, phase by phase.
+    """
+    click.echo(f"Profiling imports of {APP_MODULE}...")
+    imports = profile_imports()
+
+    cold_starts = []
+    if not imports_only:
+        with tempfile.TemporaryDirectory() as scratch:
+            database = Path(scratch) / "homelab.db"
+            for number in range(1, starts + 1):
+                click.echo(f"Starting hub ({number}/{starts})...")
+                try:
+                    cold_starts.append(measure_cold_start(database))
+                except RuntimeError as e:
+                    click.secho(str(e), fg="red", err=True)
+                    sys.exit(1)
+
+    click.echo()
+    click.echo(format_startup_report(imports, cold_starts, top))
+
+
 if __name__ == "__main__":
     cli()
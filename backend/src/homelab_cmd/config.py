@@ -31,6 +31,7 @@ class Settings(BaseSettings):
     port: int = 8080
     debug: bool = False
     external_url: str | None = None  # External URL for agent callbacks (e.g., behind reverse proxy)
+    workers: int = 1  # uvicorn worker processes; scheduled jobs run on one elected leader
 
     # Database (placeholder for US0001)
     database_url: str = "sqlite:///./data/homelab.db"
@@ -44,6 +45,10 @@ class Settings(BaseSettings):
     # Configuration Packs (EP0010: Configuration Management)
     config_packs_dir: str = "/app/data/config-packs"
 
+    # Performance instrumentation: SQL statements at least this slow are logged
+    # with their query plan (0 disables the slow-query log)
+    slow_query_threshold_ms: float = 200.0
+
     # Credential Encryption (EP0008: Tailscale Integration)
     # Must be set in production; validated at startup in main.py lifespan
     encryption_key: str | None = None
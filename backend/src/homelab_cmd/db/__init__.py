@@ -11,11 +11,13 @@ from homelab_cmd.db.session import (
     get_engine,
     init_database,
 )
+from homelab_cmd.db.versions import get_table_versions
 
 __all__ = [
     "Base",
     "dispose_engine",
     "get_async_session",
     "get_engine",
+    "get_table_versions",
     "init_database",
 ]
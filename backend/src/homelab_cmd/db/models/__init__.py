@@ -5,12 +5,18 @@ metadata when the database is initialised.
 """
 
 from homelab_cmd.db.models.agent_credential import AgentCredential
+from homelab_cmd.db.models.agent_rollout import AgentRollout, AgentRolloutStatus
 from homelab_cmd.db.models.alert import Alert, AlertStatus, AlertType
 from homelab_cmd.db.models.alert_state import AlertSeverity, AlertState, MetricType
 from homelab_cmd.db.models.config import Config
 from homelab_cmd.db.models.config_apply import ConfigApply, ConfigApplyStatus
 from homelab_cmd.db.models.config_check import ConfigCheck
-from homelab_cmd.db.models.cost_snapshot import CostSnapshot, CostSnapshotMonthly
+from homelab_cmd.db.models.coordination import CacheGeneration, LeaderLease
+from homelab_cmd.db.models.cost_snapshot import (
+    CostSnapshot,
+    CostSnapshotMonthly,
+    CostSnapshotWeekly,
+)
 from homelab_cmd.db.models.credential import Credential
 from homelab_cmd.db.models.discovery import Discovery, DiscoveryStatus
 from homelab_cmd.db.models.metrics import FilesystemMetrics, Metrics, NetworkInterfaceMetrics
@@ -20,33 +26,42 @@ from homelab_cmd.db.models.remediation import ActionStatus, RemediationAction
 from homelab_cmd.db.models.scan import Scan, ScanStatus, ScanType
 from homelab_cmd.db.models.server import Server, ServerStatus
 from homelab_cmd.db.models.service import (
+    CurrentServiceStatus,
     ExpectedService,
     ServiceStatus,
     ServiceStatusValue,
 )
 from homelab_cmd.db.models.ssh_host_key import SSHHostKey
+from homelab_cmd.db.models.ssh_reachability import DeviceSSHReachability
 from homelab_cmd.db.models.uptime import ServerUptimeDaily
 
 __all__ = [
     "ActionStatus",
     "AgentCredential",
     "AgentMode",
+    "AgentRollout",
+    "AgentRolloutStatus",
     "Alert",
     "ConfigApply",
     "ConfigApplyStatus",
     "ConfigCheck",
     "CostSnapshot",
     "CostSnapshotMonthly",
+    "CostSnapshotWeekly",
     "Credential",
+    "CurrentServiceStatus",
     "AlertSeverity",
     "AlertState",
     "AlertStatus",
     "AlertType",
+    "CacheGeneration",
     "Config",
+    "DeviceSSHReachability",
     "Discovery",
     "DiscoveryStatus",
     "ExpectedService",
     "FilesystemMetrics",
+    "LeaderLease",
     "MetricType",
     "Metrics",
     "NetworkInterfaceMetrics",
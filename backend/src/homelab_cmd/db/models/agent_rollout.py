@@ -0,0 +1,108 @@
+"""Database model for fleet agent rollouts.
+
+EP0007: Agent Management - upgrade many servers in canary-first waves.
+"""
+
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from homelab_cmd.db.base import Base, TimestampMixin
+
+
+class AgentRolloutStatus(str, Enum):
+    """Status values for an agent rollout lifecycle."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    PAUSED = "paused"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class AgentRollout(TimestampMixin, Base):
+    """SQLAlchemy model for fleet agent rollouts.
+
+    A rollout upgrades a set of servers to one agent version. The first wave
+    is a small canary; later waves upgrade wave_size servers concurrently.
+    After each wave the rollout waits for every upgraded server to heartbeat
+    with the target version and pauses if any upgrade or heartbeat is missing.
+
+    Attributes:
+        id: Auto-incrementing primary key
+        target_version: Agent version being rolled out
+        status: Current status (pending, running, paused, completed, failed, cancelled)
+        server_ids: JSON array of server IDs in rollout order
+        canary_size: Number of servers in the first wave
+        wave_size: Number of servers upgraded concurrently in later waves
+        heartbeat_timeout_seconds: How long to wait for post-upgrade heartbeats
+        waves_completed: Number of waves already processed
+        waves_total: Number of waves in the rollout
+        hosts_succeeded: Servers upgraded and heartbeating with target_version
+        hosts_failed: Servers whose upgrade or heartbeat check failed
+        results: JSON array with per-server results, updated as hosts finish
+        error: Reason the rollout paused or failed
+        started_at: When the rollout started executing
+        completed_at: When the rollout finished, failed or was cancelled
+        triggered_by: User/source that triggered the rollout (for audit)
+        created_at: When the rollout was requested (from TimestampMixin)
+        updated_at: When the record was last updated (from TimestampMixin)
+    """
+
+    __tablename__ = "agent_rollout"
+
+    __table_args__ = (
+        Index("idx_agent_rollout_status", "status"),
+        Index("idx_agent_rollout_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    target_version: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default=AgentRolloutStatus.PENDING.value,
+        nullable=False,
+    )
+
+    # Plan
+    server_ids: Mapped[list] = mapped_column(JSON, nullable=False)
+    canary_size: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    wave_size: Mapped[int] = mapped_column(Integer, default=5, nullable=False)
+    heartbeat_timeout_seconds: Mapped[int] = mapped_column(Integer, default=180, nullable=False)
+
+    # Progress
+    waves_completed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    waves_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    hosts_succeeded: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    hosts_failed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Results (JSON array of per-server results)
+    results: Mapped[list | None] = mapped_column(JSON, nullable=True)
+
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Lifecycle timestamps
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    triggered_by: Mapped[str] = mapped_column(String(100), default="user", nullable=False)
+
+    def __repr__(self) -> str:
+        """Return string representation of the rollout."""
+        return (
+            f"<AgentRollout(id={self.id}, version={self.target_version!r}, status={self.status!r})>"
+        )
+
+    @property
+    def is_active(self) -> bool:
+        """Check if the rollout is pending, running or paused."""
+        return self.status in (
+            AgentRolloutStatus.PENDING.value,
+            AgentRolloutStatus.RUNNING.value,
+            AgentRolloutStatus.PAUSED.value,
+        )
@@ -69,6 +69,10 @@ class Alert(TimestampMixin, Base):
         Index("idx_alerts_server_status", "server_id", "status"),
         Index("idx_alerts_severity_status", "severity", "status"),
         Index("idx_alerts_created_at", "created_at"),
+        # Keyset pagination of the alert list, newest first, per filter
+        Index("idx_alerts_status_created", "status", "created_at", "id"),
+        Index("idx_alerts_severity_created", "severity", "created_at", "id"),
+        Index("idx_alerts_server_created", "server_id", "created_at", "id"),
     )
 
     # Primary key
@@ -5,12 +5,13 @@ This model supports:
 - Current severity state for deduplication
 - Notification timing for cooldown logic
 - Resolution tracking for auto-resolve
+- Pending breaches: when a breach that has not yet fired will fire
 """
 
 from datetime import UTC, datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from homelab_cmd.db.base import Base
@@ -55,6 +56,9 @@ class AlertState(Base):
         consecutive_breaches: Number of consecutive threshold breaches
         current_value: Most recent metric value
         first_breach_at: When the current breach sequence started
+        fires_at: When the pending breach fires if it persists (null = none pending)
+        pending_severity: Severity the pending breach would fire at
+        pending_threshold: Threshold the pending breach exceeds
         last_notified_at: When the last notification was sent
         resolved_at: When the alert was last resolved
         created_at: Record creation timestamp
@@ -62,7 +66,11 @@ class AlertState(Base):
     """
 
     __tablename__ = "alert_states"
-    __table_args__ = (UniqueConstraint("server_id", "metric_type", name="uq_server_metric"),)
+    __table_args__ = (
+        UniqueConstraint("server_id", "metric_type", name="uq_server_metric"),
+        # Pending breaches, soonest to fire first
+        Index("idx_alert_states_fires_at", "fires_at"),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -107,6 +115,21 @@ class AlertState(Base):
         nullable=True,
     )
 
+    # Pending breach (threshold exceeded, sustained duration not yet met),
+    # maintained by the alerting service on each evaluation
+    fires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    pending_severity: Mapped[str | None] = mapped_column(
+        String(20),
+        nullable=True,
+    )
+    pending_threshold: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+    )
+
     # When the last notification was sent (for cooldown logic)
     last_notified_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
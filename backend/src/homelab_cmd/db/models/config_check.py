@@ -27,6 +27,8 @@ class ConfigCheck(Base):
     mismatches = Column(JSON, default=list)
     checked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     check_duration_ms = Column(Integer, nullable=False)
+    # sha256 of the host manifest, set by manifest checks (drift detection)
+    manifest_digest = Column(String(64), nullable=True)
 
     # Relationships
     server = relationship("Server", back_populates="config_checks")
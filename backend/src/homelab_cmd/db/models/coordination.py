@@ -0,0 +1,68 @@
+"""Coordination models for running several hub workers against one database.
+
+- LeaderLease: time-limited lease naming the worker that runs scheduled jobs
+- CacheGeneration: per-cache counter bumped to tell other workers to clear
+  their in-memory copy
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from homelab_cmd.db.base import Base
+
+
+class LeaderLease(Base):
+    """SQLAlchemy model for a leader election lease.
+
+    The worker named in holder runs the work guarded by the lease until
+    expires_at. It renews the lease periodically; any worker may take it
+    over once it has expired.
+
+    Attributes:
+        name: Lease name (e.g., "scheduler")
+        holder: Worker identifier of the current holder
+        expires_at: When the lease lapses unless renewed
+        acquired_at: When the current holder took the lease
+    """
+
+    __tablename__ = "leader_leases"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    holder: Mapped[str] = mapped_column(String(200), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    acquired_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of the lease."""
+        return f"<LeaderLease(name={self.name!r}, holder={self.holder!r})>"
+
+
+class CacheGeneration(Base):
+    """SQLAlchemy model for a shared cache invalidation counter.
+
+    Attributes:
+        name: Cache name (e.g., "tailscale_devices")
+        generation: Incremented each time the cache is invalidated
+        updated_at: Timestamp of the last invalidation
+    """
+
+    __tablename__ = "cache_generations"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    generation: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of the cache generation."""
+        return f"<CacheGeneration(name={self.name!r}, generation={self.generation})>"
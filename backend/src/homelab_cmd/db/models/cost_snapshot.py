@@ -2,11 +2,13 @@
 
 US0183: Historical Cost Tracking (EP0005)
 
-Stores daily cost snapshots for each server and monthly aggregates for
-long-term retention. Daily snapshots are rolled up to monthly after 2 years.
+Stores daily cost snapshots for each server plus weekly and monthly
+aggregates. The aggregates are maintained as each daily snapshot is captured,
+so history views read them directly instead of grouping daily rows.
 
 Retention tiers:
 - Daily: 2-year retention
+- Weekly: Indefinite retention
 - Monthly: Indefinite retention
 """
 
@@ -90,13 +92,75 @@ class CostSnapshot(Base):
         )
 
 
+class CostSnapshotWeekly(Base):
+    """Weekly aggregated cost snapshot.
+
+    Maintained alongside the daily snapshots (one row per server per week).
+    Weeks follow the "%Y-W%W" labels used by the history API: they start on
+    Monday and days before a year's first Monday fall in week 00, so a week
+    never spans two years. Server_id is nullable to allow retention of
+    historical data even after server deletion.
+
+    Attributes:
+        id: Auto-incrementing primary key
+        server_id: Foreign key to server (nullable for deleted servers)
+        year_week: Year-week string "YYYY-Www"
+        total_kwh: Total kWh for the week
+        total_cost: Total cost for the week
+        avg_electricity_rate: Average rate for the week
+        snapshot_count: Number of daily snapshots aggregated
+    """
+
+    __tablename__ = "cost_snapshots_weekly"
+
+    __table_args__ = (
+        # Unique constraint: one weekly record per server per week
+        UniqueConstraint("server_id", "year_week", name="uq_weekly_cost_snapshot"),
+        # Index for efficient queries
+        Index("idx_cost_snapshot_weekly_server", "server_id", "year_week"),
+        Index("idx_cost_snapshot_weekly_yw", "year_week"),
+    )
+
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # Foreign key to server (nullable for historical data after server deletion)
+    server_id: Mapped[str | None] = mapped_column(
+        String(100),
+        ForeignKey("servers.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+
+    # Year-week identifier (e.g., "2026-W03")
+    year_week: Mapped[str] = mapped_column(String(8), nullable=False)
+
+    # Aggregated cost data
+    total_kwh: Mapped[float] = mapped_column(Float, nullable=False)
+    total_cost: Mapped[float] = mapped_column(Float, nullable=False)
+    avg_electricity_rate: Mapped[float] = mapped_column(Float, nullable=False)
+
+    # Number of daily snapshots included in this aggregate
+    snapshot_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        """Return string representation of the weekly cost snapshot."""
+        return (
+            f"<CostSnapshotWeekly(id={self.id}, server_id={self.server_id!r}, "
+            f"year_week={self.year_week!r}, cost={self.total_cost})>"
+        )
+
+
 class CostSnapshotMonthly(Base):
     """Monthly aggregated cost snapshot.
 
-    AC6: Data retention - monthly aggregates for data older than 2 years.
+    Maintained alongside the daily snapshots (one row per server per month)
+    and kept after the daily rows are pruned.
+
+    AC6: Data retention - monthly aggregates outlive the 2-year daily tier.
 
-    Created by rolling up daily snapshots. Server_id is nullable to allow
-    retention of historical data even after server deletion.
+    Server_id is nullable to allow retention of historical data even after
+    server deletion.
 
     Attributes:
         id: Auto-incrementing primary key
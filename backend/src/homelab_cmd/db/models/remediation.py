@@ -115,6 +115,10 @@ class RemediationAction(Base):
     __table_args__ = (
         Index("idx_remediation_actions_server_status", "server_id", "status"),
         Index("idx_remediation_actions_status", "status"),
+        # Keyset pagination of the action list, newest first, per filter
+        Index("idx_remediation_actions_created", "created_at", "id"),
+        Index("idx_remediation_actions_status_created", "status", "created_at", "id"),
+        Index("idx_remediation_actions_server_created", "server_id", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
@@ -60,6 +60,8 @@ class Scan(TimestampMixin, Base):
     __table_args__ = (
         Index("idx_scans_hostname_status", "hostname", "status"),
         Index("idx_scans_created_at", "created_at"),
+        # Keyset pagination of scan history for one host, newest first
+        Index("idx_scans_hostname_created", "hostname", "created_at", "id"),
     )
 
     # Primary key
@@ -1,7 +1,7 @@
 """Service models for HomelabCmd.
 
-This module contains models for tracking expected services per server
-and their historical status.
+This module contains models for tracking expected services per server,
+their historical status and their latest status.
 """
 
 from datetime import UTC, datetime
@@ -128,3 +128,48 @@ class ServiceStatus(Base):
             f"<ServiceStatus(id={self.id!r}, server_id={self.server_id!r}, "
             f"service_name={self.service_name!r}, status={self.status!r})>"
         )
+
+
+class CurrentServiceStatus(Base):
+    """SQLAlchemy model for the latest reported status of each service.
+
+    One row per server and service, overwritten by the heartbeat and agent
+    event paths whenever a newer status arrives. Lets service listings read
+    current state with a single query instead of searching the status
+    history for each service.
+
+    Attributes:
+        server_id: Reference to the server
+        service_name: Systemd service name
+        status: Latest status (running/stopped/failed/unknown)
+        status_reason: Explanation when status is unknown
+        pid: Process ID if running
+        memory_mb: Memory usage in MB
+        cpu_percent: CPU usage percentage
+        timestamp: When the latest status was recorded
+    """
+
+    __tablename__ = "service_current_status"
+
+    server_id: Mapped[str] = mapped_column(
+        String(100),
+        ForeignKey("servers.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    service_name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    status_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    pid: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    memory_mb: Mapped[float | None] = mapped_column(Float, nullable=True)
+    cpu_percent: Mapped[float | None] = mapped_column(Float, nullable=True)
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of the current service status."""
+        return (
+            f"<CurrentServiceStatus(server_id={self.server_id!r}, "
+            f"service_name={self.service_name!r}, status={self.status!r})>"
+        )
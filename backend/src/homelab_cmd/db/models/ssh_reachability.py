@@ -0,0 +1,38 @@
+"""SSH reachability model for Tailscale devices.
+
+EP0016: Unified Discovery Experience (US0097).
+
+Stores the last SSH test result per Tailscale device so the discovery page
+can show reachability without testing every device on every load.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from homelab_cmd.db.base import Base
+
+
+class DeviceSSHReachability(Base):
+    """Last SSH test result for a Tailscale device.
+
+    Attributes:
+        device_id: Tailscale device ID.
+        status: 'available' or 'unavailable'.
+        error: Error message if unavailable.
+        key_used: Name of the SSH key that succeeded.
+        tested_at: When the device was tested.
+    """
+
+    __tablename__ = "device_ssh_reachability"
+
+    device_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    key_used: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    tested_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        """Return string representation of the reachability record."""
+        return f"<DeviceSSHReachability(device={self.device_id!r}, status={self.status!r})>"
@@ -1,10 +1,12 @@
 """Database session management for HomelabCmd."""
 
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from pathlib import Path
 
-from sqlalchemy import text
+from sqlalchemy import Connection, Table, event, inspect, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -17,6 +19,12 @@ from homelab_cmd.db.base import Base
 
 logger = logging.getLogger(__name__)
 
+# How long SQLite waits for another worker's write lock before failing
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+# Attempts at creating tables when several workers start at once
+CREATE_TABLES_ATTEMPTS = 5
+
 # Global engine and session factory
 _engine: AsyncEngine | None = None
 _async_session_factory: async_sessionmaker[AsyncSession] | None = None
@@ -34,6 +42,18 @@ def _get_async_database_url() -> str:
     return url
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure SQLite for concurrent access from several hub workers.
+
+    WAL lets readers proceed while another process writes, and busy_timeout
+    waits for the write lock instead of failing with "database is locked".
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+
 def get_engine() -> AsyncEngine:
     """Get or create the async database engine."""
     global _engine
@@ -48,6 +68,14 @@ def get_engine() -> AsyncEngine:
             connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
         )
 
+        if "sqlite" in database_url:
+            event.listen(_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+        # Deferred: the services package imports this module
+        from homelab_cmd.services.telemetry import instrument_engine
+
+        instrument_engine(_engine.sync_engine)
+
     return _engine
 
 
@@ -84,13 +112,22 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+def _missing_tables(connection: Connection) -> list[Table]:
+    """Tables defined in the models that the database does not have yet."""
+    existing = set(inspect(connection).get_table_names())
+    return [table for table in Base.metadata.sorted_tables if table.name not in existing]
+
+
 async def init_database() -> None:
     """Initialise the database, creating tables if they don't exist.
 
     This function:
     1. Ensures the data directory exists
-    2. Creates all tables defined in the models
+    2. Creates the tables defined in the models that are missing
     3. Verifies database connectivity
+
+    Tables are listed with one catalogue query; create_all would check each
+    table separately, so a current schema is confirmed without it.
     """
     settings = get_settings()
 
@@ -111,10 +148,23 @@ async def init_database() -> None:
 
     engine = get_engine()
 
-    # Create all tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database tables created/verified")
+    # Create missing tables. Workers starting together race between the
+    # existence check and CREATE TABLE; a retry skips tables another worker created.
+    for attempt in range(1, CREATE_TABLES_ATTEMPTS + 1):
+        try:
+            async with engine.begin() as conn:
+                missing = await conn.run_sync(_missing_tables)
+                if missing:
+                    await conn.run_sync(Base.metadata.create_all, tables=missing)
+            break
+        except OperationalError:
+            if attempt == CREATE_TABLES_ATTEMPTS:
+                raise
+            await asyncio.sleep(0.1 * attempt)
+    if missing:
+        logger.info("Created %d database tables", len(missing))
+    else:
+        logger.info("Database schema is current")
 
     # Verify connectivity
     async with engine.connect() as conn:
@@ -0,0 +1,106 @@
+"""Change versions for database tables.
+
+Every commit that writes to a table bumps that table's version. Versions are
+stored as cache generation counters (table name prefixed with "table:"), so
+all hub workers see the same values. Read endpoints combine the versions of
+the tables they read into an ETag and answer a conditional GET without
+running their queries (see api/conditional.py).
+
+Writes are picked up from the ORM: objects added, changed or deleted by a
+flush, and ORM-enabled INSERT/UPDATE/DELETE statements such as
+session.execute(delete(Metrics)...). Statements run on bare Table objects,
+raw SQL or connections outside a Session are not seen.
+"""
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from itertools import chain
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+from homelab_cmd.db.models.coordination import CacheGeneration
+
+# Prefix distinguishing table versions from other cache generations
+VERSION_PREFIX = "table:"
+
+# Tables whose writes are bookkeeping rather than content
+UNTRACKED_TABLES = frozenset({"cache_generations", "leader_leases"})
+
+# Session.info key collecting tables written since the last commit
+_CHANGED_TABLES = "changed_tables"
+
+
+def version_name(table: str) -> str:
+    """Cache generation name holding a table's version."""
+    return f"{VERSION_PREFIX}{table}"
+
+
+def _record(session: Session, tables: Iterable[str]) -> None:
+    changed = session.info.setdefault(_CHANGED_TABLES, set())
+    changed.update(table for table in tables if table not in UNTRACKED_TABLES)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flush(session: Session, flush_context: UOWTransaction) -> None:
+    """Note the tables of objects written by a flush."""
+    objects = chain(
+        session.new,
+        session.deleted,
+        (obj for obj in session.dirty if session.is_modified(obj, include_collections=False)),
+    )
+    _record(session, (table.name for obj in objects for table in inspect(obj).mapper.tables))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_statement(orm_execute_state: ORMExecuteState) -> None:
+    """Note the table of an ORM-enabled INSERT, UPDATE or DELETE statement."""
+    state = orm_execute_state
+    if (state.is_insert or state.is_update or state.is_delete) and state.bind_mapper:
+        _record(state.session, (table.name for table in state.bind_mapper.tables))
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_versions(session: Session) -> None:
+    """Bump the versions of tables written in the committing transaction."""
+    if session.in_nested_transaction():
+        return
+    # Pending changes are flushed after this hook, so flush them now
+    session.flush()
+    changed = session.info.pop(_CHANGED_TABLES, None)
+    if not changed:
+        return
+
+    now = datetime.now(UTC)
+    stmt = sqlite_insert(CacheGeneration).values(
+        [{"name": version_name(table), "generation": 1, "updated_at": now} for table in changed]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CacheGeneration.name],
+        set_={"generation": CacheGeneration.generation + 1, "updated_at": now},
+    )
+    session.execute(stmt)
+
+
+async def get_table_versions(session: AsyncSession, tables: Iterable[str]) -> dict[str, int]:
+    """Read the current versions of some tables.
+
+    Args:
+        session: Database session.
+        tables: Table names.
+
+    Returns:
+        Version of each table; tables never written since versions were
+        introduced are 0.
+    """
+    versions = dict.fromkeys(tables, 0)
+    result = await session.execute(
+        select(CacheGeneration.name, CacheGeneration.generation).where(
+            CacheGeneration.name.in_([version_name(table) for table in versions])
+        )
+    )
+    for name, generation in result.all():
+        versions[name.removeprefix(VERSION_PREFIX)] = generation
+    return versions
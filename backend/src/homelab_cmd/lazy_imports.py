@@ -0,0 +1,57 @@
+"""Deferred imports for heavy libraries used by optional subsystems.
+
+SSH (paramiko), Tailscale and notifications (httpx) and configuration packs
+(yaml) are only needed once those features are used, but importing them
+when the route modules load adds about half a second to every hub start.
+Modules that use them bind a lazy module instead, which imports the real
+library on first attribute access:
+
+    if TYPE_CHECKING:
+        import paramiko
+    else:
+        paramiko = lazy_import("paramiko")
+
+Attribute reads, writes and deletes go to the real module, so
+patch("homelab_cmd.services.ssh.paramiko.SSHClient") patches paramiko
+itself, as it did with a plain import. Concurrent first accesses from
+worker threads are serialised by the import system's module locks.
+"""
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def _load(self) -> ModuleType:
+        return importlib.import_module(self.__name__)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._load(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._load(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module that is imported when first used.
+
+    Args:
+        name: Absolute module name, e.g. "paramiko".
+
+    Returns:
+        The module itself if it is already imported, otherwise a LazyModule.
+    """
+    return sys.modules.get(name) or LazyModule(name)
@@ -0,0 +1,522 @@
+"""Synthetic agent fleet for load-testing a hub.
+
+Simulates N agents sending realistic heartbeats (metrics, services,
+filesystems, network interfaces and pending packages) to a running hub at
+a fixed interval, and reports throughput, latency percentiles, errors and
+database growth. Run it with `homelabcmd-cli load-test`.
+
+Runs are repeatable: each agent's payloads come from its own random
+generator seeded from the run seed, and heartbeats are staggered over the
+interval the same way every time. A report saved with --output can be
+passed as --baseline to a later run (say, after an upgrade) to flag
+latency or error-rate regressions.
+
+Simulated servers are registered under SERVER_ID_PREFIX and removed at
+the end of the run unless asked to keep them.
+"""
+
+import asyncio
+import json
+import platform
+import random
+import sqlite3
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+# Prefix for simulated server IDs, so they are easy to find and remove
+SERVER_ID_PREFIX = "loadtest"
+
+# Latency percentiles reported
+PERCENTILES = (50, 90, 95, 99)
+
+# Tables whose row counts are reported as database growth
+GROWTH_TABLES = (
+    "servers",
+    "metrics",
+    "service_status",
+    "service_current_status",
+    "filesystem_metrics",
+    "network_interface_metrics",
+    "pending_packages",
+)
+
+# Agent version reported by simulated agents
+SIMULATED_AGENT_VERSION = "2.0.0"
+
+# Services a simulated agent picks its monitored services from
+SERVICE_POOL = (
+    "sshd",
+    "cron",
+    "docker",
+    "containerd",
+    "nginx",
+    "postgresql",
+    "redis-server",
+    "plex",
+    "sonarr",
+    "radarr",
+    "jellyfin",
+    "home-assistant",
+    "mosquitto",
+    "pihole-FTL",
+    "smbd",
+    "nfs-server",
+    "tailscaled",
+    "prometheus",
+    "grafana-server",
+    "unattended-upgrades",
+)
+
+# Packages a simulated agent may report as upgradable
+PACKAGE_POOL = (
+    "openssl",
+    "libssl3",
+    "curl",
+    "libcurl4",
+    "openssh-server",
+    "linux-image-generic",
+    "python3",
+    "tzdata",
+    "systemd",
+    "sudo",
+    "git",
+    "docker-ce",
+    "containerd.io",
+    "nginx",
+    "vim",
+)
+
+# Operating systems a simulated agent reports: (distribution, version, kernel)
+OS_POOL = (
+    ("Ubuntu", "24.04", "6.8.0-45-generic"),
+    ("Debian GNU/Linux", "12", "6.1.0-25-amd64"),
+    ("Raspbian GNU/Linux", "12", "6.6.31+rpt-rpi-v8"),
+)
+
+
+@dataclass
+class LoadTestConfig:
+    """Parameters of a load-test run."""
+
+    agents: int = 100
+    interval_seconds: float = 60.0
+    duration_seconds: float = 120.0
+    concurrency: int = 50
+    seed: int = 1
+    server_id_prefix: str = SERVER_ID_PREFIX
+
+    @property
+    def target_rate(self) -> float:
+        """Heartbeats per second the fleet should generate."""
+        return self.agents / self.interval_seconds
+
+
+class SyntheticAgent:
+    """One simulated agent with a stable profile and drifting metrics."""
+
+    def __init__(self, index: int, seed: int, prefix: str = SERVER_ID_PREFIX) -> None:
+        """Create the agent's profile.
+
+        Args:
+            index: Position in the fleet (determines the server ID).
+            seed: Run seed; the same seed and index give the same payloads.
+            prefix: Server ID prefix.
+        """
+        self.rng = random.Random(seed * 1_000_003 + index)
+        rng = self.rng
+        self.server_id = f"{prefix}-{index:04d}"
+        self.server_guid = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        self.hostname = f"{self.server_id}.lab"
+
+        self.os_info = dict(
+            zip(("distribution", "version", "kernel"), rng.choice(OS_POOL), strict=True)
+        )
+        self.os_info["architecture"] = "aarch64" if "rpi" in self.os_info["kernel"] else "x86_64"
+        self.cpu_cores = rng.choice((2, 4, 4, 8, 8, 16))
+        self.memory_total_mb = rng.choice((2048, 4096, 8192, 16384, 32768))
+        self.disk_total_gb = float(rng.choice((32, 128, 256, 512, 1024, 2048)))
+        self.services = rng.sample(SERVICE_POOL, rng.randint(4, 12))
+        self.mounts = ["/", "/boot"] + rng.sample(
+            ["/home", "/var", "/srv", "/mnt/data"], rng.randint(0, 2)
+        )
+        self.interfaces = ["lo", "eth0"] + rng.sample(
+            ["eth1", "wlan0", "docker0", "tailscale0"], rng.randint(0, 2)
+        )
+        self.packages = rng.sample(PACKAGE_POOL, rng.randint(0, 8))
+
+        self.cpu = rng.uniform(2, 40)
+        self.memory = rng.uniform(20, 70)
+        self.disk = rng.uniform(15, 80)
+        self.uptime = rng.randint(3600, 90 * 86400)
+        self.rx_bytes = rng.randint(10**8, 10**11)
+        self.tx_bytes = rng.randint(10**8, 10**11)
+
+    def _drift(self, value: float, step: float, low: float = 0.0, high: float = 100.0) -> float:
+        return min(high, max(low, value + self.rng.uniform(-step, step)))
+
+    def heartbeat(self, interval_seconds: float) -> dict[str, Any]:
+        """Build the next heartbeat payload, advancing the agent's state.
+
+        Args:
+            interval_seconds: Time since the previous heartbeat.
+
+        Returns:
+            JSON-ready HeartbeatRequest body.
+        """
+        rng = self.rng
+        self.cpu = self._drift(self.cpu, 8)
+        self.memory = self._drift(self.memory, 2)
+        self.disk = self._drift(self.disk, 0.05)
+        self.uptime += int(interval_seconds)
+        self.rx_bytes += rng.randint(10**5, 10**8)
+        self.tx_bytes += rng.randint(10**5, 10**8)
+        load = self.cpu / 100 * self.cpu_cores
+
+        services = []
+        for name in self.services:
+            status = "running" if rng.random() > 0.01 else rng.choice(("stopped", "failed"))
+            services.append(
+                {
+                    "name": name,
+                    "status": status,
+                    "pid": rng.randint(100, 65000) if status == "running" else None,
+                    "memory_mb": round(rng.uniform(5, 800), 1) if status == "running" else None,
+                    "cpu_percent": round(rng.uniform(0, 15), 1) if status == "running" else None,
+                }
+            )
+
+        filesystems = []
+        for mount in self.mounts:
+            total = int(self.disk_total_gb * 1024**3) if mount == "/" else 512 * 1024**2
+            percent = self.disk if mount == "/" else 30.0
+            used = int(total * percent / 100)
+            filesystems.append(
+                {
+                    "mount_point": mount,
+                    "device": f"/dev/sda{len(filesystems) + 1}",
+                    "fs_type": "vfat" if mount == "/boot" else "ext4",
+                    "total_bytes": total,
+                    "used_bytes": used,
+                    "available_bytes": total - used,
+                    "percent": round(percent, 1),
+                }
+            )
+
+        interfaces = [
+            {
+                "name": name,
+                "rx_bytes": self.rx_bytes // (i + 1),
+                "tx_bytes": self.tx_bytes // (i + 1),
+                "rx_packets": self.rx_bytes // 1200 // (i + 1),
+                "tx_packets": self.tx_bytes // 1200 // (i + 1),
+                "is_up": True,
+            }
+            for i, name in enumerate(self.interfaces)
+        ]
+
+        packages = [
+            {
+                "name": name,
+                "current_version": "1.0.0-1",
+                "new_version": "1.0.1-1",
+                "repository": "security" if name.startswith(("openssl", "libssl")) else "updates",
+                "is_security": name.startswith(("openssl", "libssl", "openssh")),
+            }
+            for name in self.packages
+        ]
+
+        memory_used = int(self.memory_total_mb * self.memory / 100)
+        return {
+            "server_id": self.server_id,
+            "server_guid": self.server_guid,
+            "hostname": self.hostname,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "agent_version": SIMULATED_AGENT_VERSION,
+            "agent_mode": "readonly",
+            "os_info": self.os_info,
+            "cpu_info": {"cpu_model": "Simulated CPU", "cpu_cores": self.cpu_cores},
+            "metrics": {
+                "cpu_percent": round(self.cpu, 1),
+                "memory_percent": round(self.memory, 1),
+                "memory_total_mb": self.memory_total_mb,
+                "memory_used_mb": memory_used,
+                "disk_percent": round(self.disk, 1),
+                "disk_total_gb": self.disk_total_gb,
+                "disk_used_gb": round(self.disk_total_gb * self.disk / 100, 1),
+                "network_rx_bytes": self.rx_bytes,
+                "network_tx_bytes": self.tx_bytes,
+                "load_1m": round(load, 2),
+                "load_5m": round(load * 0.9, 2),
+                "load_15m": round(load * 0.8, 2),
+                "uptime_seconds": self.uptime,
+            },
+            "updates_available": len(packages),
+            "security_updates": sum(p["is_security"] for p in packages),
+            "packages": packages,
+            "services": services,
+            "filesystems": filesystems,
+            "network_interfaces": interfaces,
+        }
+
+
+@dataclass
+class DatabaseSnapshot:
+    """Size and row counts of the hub database at one moment."""
+
+    size_bytes: int
+    rows: dict[str, int]
+
+
+def database_snapshot(path: str | Path) -> DatabaseSnapshot:
+    """Measure a hub SQLite database, read-only.
+
+    Args:
+        path: Database file (its -wal file is included in the size).
+
+    Returns:
+        File size and row counts of GROWTH_TABLES (missing tables are skipped).
+    """
+    path = Path(path)
+    size = sum(p.stat().st_size for p in (path, Path(f"{path}-wal")) if p.exists())
+    rows = {}
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        for table in GROWTH_TABLES:
+            try:
+                rows[table] = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            except sqlite3.OperationalError:
+                continue
+    finally:
+        conn.close()
+    return DatabaseSnapshot(size_bytes=size, rows=rows)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@dataclass
+class LoadTestResult:
+    """Outcome of a load-test run."""
+
+    config: LoadTestConfig
+    started_at: datetime
+    elapsed_seconds: float
+    requests: int = 0
+    succeeded: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+    latencies_ms: list[float] = field(default_factory=list)
+    max_lag_ms: float = 0.0
+    hub_version: str | None = None
+    database_before: DatabaseSnapshot | None = None
+    database_after: DatabaseSnapshot | None = None
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of requests that failed."""
+        return (self.requests - self.succeeded) / self.requests if self.requests else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return self.requests / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def latency_percentiles(self) -> dict[str, float]:
+        """Latency percentiles and maximum in milliseconds."""
+        ordered = sorted(self.latencies_ms)
+        summary = {f"p{p}": round(percentile(ordered, p), 2) for p in PERCENTILES}
+        summary["max"] = round(ordered[-1], 2) if ordered else 0.0
+        return summary
+
+    def to_report(self) -> dict[str, Any]:
+        """Summarise the run as a JSON-ready report."""
+        report: dict[str, Any] = {
+            "started_at": self.started_at.isoformat(),
+            "config": asdict(self.config),
+            "environment": {
+                "hub_version": self.hub_version,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "requests": self.requests,
+            "succeeded": self.succeeded,
+            "errors": dict(sorted(self.errors.items())),
+            "error_rate": round(self.error_rate, 4),
+            "target_rate": round(self.config.target_rate, 2),
+            "throughput": round(self.throughput, 2),
+            "max_schedule_lag_ms": round(self.max_lag_ms, 1),
+            "latency_ms": self.latency_percentiles(),
+        }
+        if self.database_before and self.database_after:
+            before, after = self.database_before, self.database_after
+            report["database"] = {
+                "size_bytes_before": before.size_bytes,
+                "size_bytes_after": after.size_bytes,
+                "growth_bytes": after.size_bytes - before.size_bytes,
+                "rows_added": {
+                    table: after.rows[table] - before.rows.get(table, 0) for table in after.rows
+                },
+            }
+        return report
+
+
+class LoadTest:
+    """Drives a synthetic fleet against a hub."""
+
+    def __init__(self, client: httpx.AsyncClient, config: LoadTestConfig) -> None:
+        """Initialise the run.
+
+        Args:
+            client: HTTP client with the hub's base URL and API key header.
+            config: Run parameters.
+        """
+        self.client = client
+        self.config = config
+        self.agents = [
+            SyntheticAgent(i, config.seed, config.server_id_prefix) for i in range(config.agents)
+        ]
+        self._semaphore = asyncio.Semaphore(config.concurrency)
+
+    async def run(self) -> LoadTestResult:
+        """Send heartbeats from every agent for the configured duration."""
+        config = self.config
+        result = LoadTestResult(config=config, started_at=datetime.now(UTC), elapsed_seconds=0.0)
+        try:
+            health = await self.client.get("/api/v1/system/health")
+            result.hub_version = health.json().get("version")
+        except (httpx.HTTPError, ValueError):
+            pass
+
+        # Stagger agents evenly across one interval, in a seed-dependent order
+        offsets = [config.interval_seconds * i / len(self.agents) for i in range(len(self.agents))]
+        random.Random(config.seed).shuffle(offsets)
+
+        started = time.monotonic()
+        await asyncio.gather(
+            *(
+                self._run_agent(agent, offset, started, result)
+                for agent, offset in zip(self.agents, offsets, strict=True)
+            )
+        )
+        result.elapsed_seconds = time.monotonic() - started
+        return result
+
+    async def _run_agent(
+        self, agent: SyntheticAgent, offset: float, started: float, result: LoadTestResult
+    ) -> None:
+        config = self.config
+        beat = 0
+        while (at := offset + beat * config.interval_seconds) < config.duration_seconds:
+            due = started + at
+            await asyncio.sleep(max(0.0, due - time.monotonic()))
+            await self._send(agent.heartbeat(config.interval_seconds), due, result)
+            beat += 1
+
+    async def _send(self, payload: dict[str, Any], due: float, result: LoadTestResult) -> None:
+        async with self._semaphore:
+            sent = time.monotonic()
+            result.max_lag_ms = max(result.max_lag_ms, (sent - due) * 1000)
+            try:
+                response = await self.client.post("/api/v1/agents/heartbeat", json=payload)
+                error = None if response.status_code == 200 else f"HTTP {response.status_code}"
+            except httpx.HTTPError as e:
+                error = type(e).__name__
+            result.latencies_ms.append((time.monotonic() - sent) * 1000)
+        result.requests += 1
+        if error is None:
+            result.succeeded += 1
+        else:
+            result.errors[error] = result.errors.get(error, 0) + 1
+
+    async def remove_servers(self) -> int:
+        """Delete the simulated servers from the hub.
+
+        Returns:
+            Number of servers deleted.
+        """
+
+        async def remove(agent: SyntheticAgent) -> bool:
+            async with self._semaphore:
+                try:
+                    response = await self.client.delete(f"/api/v1/servers/{agent.server_id}")
+                except httpx.HTTPError:
+                    return False
+                return response.status_code == 204
+
+        return sum(await asyncio.gather(*(remove(a) for a in self.agents)))
+
+
+def compare_reports(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Find regressions of a run against a baseline report.
+
+    Args:
+        baseline: Earlier report (from LoadTestResult.to_report).
+        current: Report of this run.
+        tolerance: Allowed relative increase in latency, e.g. 0.2 for 20%.
+
+    Returns:
+        Description of each regression (empty if none).
+    """
+    regressions = []
+    for key in ("p50", "p95", "p99"):
+        before = baseline["latency_ms"].get(key, 0.0)
+        after = current["latency_ms"].get(key, 0.0)
+        if before and after > before * (1 + tolerance):
+            regressions.append(
+                f"{key} latency {after:.1f} ms vs {before:.1f} ms baseline "
+                f"(+{(after / before - 1) * 100:.0f}%)"
+            )
+    if current["error_rate"] > baseline["error_rate"] + 0.001:
+        regressions.append(
+            f"error rate {current['error_rate']:.2%} vs {baseline['error_rate']:.2%} baseline"
+        )
+    if current["throughput"] < baseline["throughput"] * (1 - tolerance):
+        regressions.append(
+            f"throughput {current['throughput']:.1f}/s vs {baseline['throughput']:.1f}/s baseline"
+        )
+    return regressions
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a report for the terminal."""
+    config = report["config"]
+    latency = report["latency_ms"]
+    lines = [
+        f"Agents: {config['agents']}  interval: {config['interval_seconds']}s  "
+        f"duration: {config['duration_seconds']}s  seed: {config['seed']}",
+        f"Hub version: {report['environment']['hub_version'] or 'unknown'}",
+        f"Requests: {report['requests']}  succeeded: {report['succeeded']}  "
+        f"error rate: {report['error_rate']:.2%}",
+        f"Throughput: {report['throughput']:.1f}/s (target {report['target_rate']:.1f}/s)  "
+        f"max schedule lag: {report['max_schedule_lag_ms']:.0f} ms",
+        "Latency (ms): " + "  ".join(f"{k} {v:.1f}" for k, v in latency.items()),
+    ]
+    for error, count in report["errors"].items():
+        lines.append(f"  {error}: {count}")
+    if "database" in report:
+        db = report["database"]
+        lines.append(
+            f"Database: {db['size_bytes_before'] / 1024**2:.1f} MB -> "
+            f"{db['size_bytes_after'] / 1024**2:.1f} MB "
+            f"(+{db['growth_bytes'] / 1024:.0f} KB)"
+        )
+        lines.extend(f"  {table}: +{count}" for table, count in db["rows_added"].items())
+    return "\n".join(lines)
+
+
+def load_report(path: str | Path) -> dict[str, Any]:
+    """Read a report written with --output."""
+    return json.loads(Path(path).read_text())
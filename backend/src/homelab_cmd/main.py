@@ -1,9 +1,11 @@
 """FastAPI application factory and entry point for HomelabCmd."""
 
+import asyncio
 import logging
 import os
+import time
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from datetime import UTC, datetime
 
 import uvicorn
@@ -15,6 +17,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from homelab_cmd import __version__
+from homelab_cmd.api.middleware import CompressionMiddleware, RequestTimingMiddleware
 from homelab_cmd.api.routes import (
     actions,
     agent_deploy,
@@ -31,15 +34,23 @@ from homelab_cmd.api.routes import (
     discovery,
     metrics,
     preferences,
+    prometheus,
     scan,
     servers,
     services,
+    stream,
     system,
     tailscale,
     widget_layout,
 )
 from homelab_cmd.config import get_settings
 from homelab_cmd.db import dispose_engine, init_database
+from homelab_cmd.services.connectivity_prober import (
+    CONNECTIVITY_PROBE_INTERVAL_SECONDS,
+    probe_connectivity,
+)
+from homelab_cmd.services.coordination import get_coordinator
+from homelab_cmd.services.profiling import get_startup_profile
 from homelab_cmd.services.scheduler import (
     STALE_CHECK_INTERVAL_SECONDS,
     capture_daily_costs,
@@ -82,12 +93,71 @@ def _validate_encryption_key() -> None:
         ) from e
 
 
+async def _run_deferred_startup() -> None:
+    """One-off data migrations, run once the hub is already serving.
+
+    All are idempotent and nothing waits on them, so agents are not kept
+    waiting for their first heartbeat while they run.
+    """
+    from homelab_cmd.api.routes.agents import backfill_current_service_status
+    from homelab_cmd.api.routes.config import DEFAULT_THRESHOLDS, get_config_value
+    from homelab_cmd.api.schemas.config import ThresholdsConfig
+    from homelab_cmd.db.session import get_session_factory
+    from homelab_cmd.services.alerting import refresh_pending_breaches
+    from homelab_cmd.services.cost_history import CostHistoryService
+    from homelab_cmd.services.ssh import migrate_tailscale_ssh_key
+
+    startup = get_startup_profile()
+    session_factory = get_session_factory()
+
+    # US0093: Migrate any existing Tailscale SSH key to unified storage
+    try:
+        with startup.phase("ssh_key_migration"):
+            async with session_factory() as session:
+                if await migrate_tailscale_ssh_key(session):
+                    logger.info("SSH key migration completed")
+    except Exception as e:
+        logger.warning("SSH key migration failed (non-fatal): %s", e)
+
+    # Build weekly/monthly cost aggregates for databases that predate them
+    try:
+        with startup.phase("cost_backfill"):
+            async with session_factory() as session:
+                await CostHistoryService(session).backfill_period_totals()
+    except Exception as e:
+        logger.warning("Cost aggregate backfill failed (non-fatal): %s", e)
+
+    # Current service states for databases created without the migration
+    try:
+        with startup.phase("service_status_backfill"):
+            async with session_factory() as session:
+                if await backfill_current_service_status(session):
+                    logger.info("Current service status backfilled")
+                await session.commit()
+    except Exception as e:
+        logger.warning("Current service status backfill failed (non-fatal): %s", e)
+
+    # Schedule breaches that were pending before the hub kept a schedule
+    try:
+        with startup.phase("pending_breaches"):
+            async with session_factory() as session:
+                thresholds_data = await get_config_value(session, "thresholds")
+                thresholds = (
+                    ThresholdsConfig(**thresholds_data) if thresholds_data else DEFAULT_THRESHOLDS
+                )
+                await refresh_pending_breaches(session, thresholds)
+                await session.commit()
+    except Exception as e:
+        logger.warning("Pending breach backfill failed (non-fatal): %s", e)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler for startup and shutdown."""
     # Startup
     logger.info("Starting HomelabCmd v%s", __version__)
     system.set_start_time(datetime.now(UTC))
+    startup = get_startup_profile()
 
     # Trigger settings load and dev key warning
     get_settings()
@@ -99,22 +169,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("Encryption key validated")
 
     # Initialise database
-    await init_database()
+    with startup.phase("database"):
+        await init_database()
     logger.info("Database initialised")
 
-    # US0093: Migrate any existing Tailscale SSH key to unified storage
-    from homelab_cmd.db.session import get_session_factory
-    from homelab_cmd.services.ssh import migrate_tailscale_ssh_key
-
-    try:
-        session_factory = get_session_factory()
-        async with session_factory() as session:
-            if await migrate_tailscale_ssh_key(session):
-                logger.info("SSH key migration completed")
-    except Exception as e:
-        logger.warning("SSH key migration failed (non-fatal): %s", e)
+    # Join leader election so only one worker runs the scheduled jobs, and
+    # start listening for cache invalidations from other workers
+    coordinator = get_coordinator()
+    with startup.phase("coordination"):
+        await coordinator.start()
 
     # Start background scheduler for status detection and data retention
+    scheduler_started = time.perf_counter()
     async with AsyncScheduler() as scheduler:
         # Stale server detection (every 60 seconds)
         await scheduler.add_schedule(
@@ -158,14 +224,33 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             id="rollup_cost_snapshots",
         )
 
+        # Connectivity status for the dashboard status bar (every 60 seconds).
+        # Runs on every worker: each serves status from its own snapshot.
+        await scheduler.add_schedule(
+            probe_connectivity,
+            IntervalTrigger(seconds=CONNECTIVITY_PROBE_INTERVAL_SECONDS),
+            id="probe_connectivity",
+        )
+
         await scheduler.start_in_background()
-        logger.info("Background scheduler started with 6 jobs")
+        logger.info("Background scheduler started with 7 jobs")
+        startup.phases["scheduler"] = (time.perf_counter() - scheduler_started) * 1000
+
+        startup.mark_ready()
+        deferred = asyncio.create_task(_run_deferred_startup())
 
         yield
 
+        if not deferred.done():
+            deferred.cancel()
+            with suppress(asyncio.CancelledError):
+                await deferred
+
         # Scheduler auto-stops when exiting async context
         logger.info("Background scheduler stopping")
 
+    await coordinator.stop()
+
     # Shutdown
     await dispose_engine()
     logger.info("Shutting down HomelabCmd")
@@ -175,7 +260,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 OPENAPI_TAGS = [
     {
         "name": "System",
-        "description": "System health and status. No authentication required.",
+        "description": "System health (no authentication required), Prometheus metrics "
+        "and request/SQL performance summary.",
     },
     {
         "name": "Servers",
@@ -233,6 +319,10 @@ OPENAPI_TAGS = [
         "name": "Preferences",
         "description": "Dashboard preferences and personalisation settings.",
     },
+    {
+        "name": "Live Updates",
+        "description": "Server-Sent Events stream of status, metric, alert and progress changes.",
+    },
 ]
 
 
@@ -280,6 +370,12 @@ homelab infrastructure. Features include:
         allow_headers=["*"],
     )
 
+    # Time every request per route and count its SQL statements
+    app.add_middleware(RequestTimingMiddleware)
+
+    # Gzip large responses
+    app.add_middleware(CompressionMiddleware)
+
     # Mount system routes (health check - no auth required)
     app.include_router(system.router, prefix="/api/v1")
 
@@ -327,6 +423,7 @@ homelab infrastructure. Features include:
 
     # Mount services routes (auth required)
     app.include_router(services.router, prefix="/api/v1")
+    app.include_router(services.fleet_router, prefix="/api/v1")
 
     # Mount actions routes (auth required)
     app.include_router(actions.router, prefix="/api/v1")
@@ -350,6 +447,12 @@ homelab infrastructure. Features include:
     # Mount widget layout routes (auth required) - US0173: Widget Layout Persistence
     app.include_router(widget_layout.router, prefix="/api/v1")
 
+    # Mount live update stream (auth required)
+    app.include_router(stream.router, prefix="/api/v1")
+
+    # Mount Prometheus scrape endpoint at /metrics (auth required)
+    app.include_router(prometheus.router)
+
     return app
 
 
@@ -365,6 +468,7 @@ def run() -> None:
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        workers=settings.workers,
     )
 
 
@@ -0,0 +1,296 @@
+"""Persistent WebSocket channel between agents and the hub.
+
+Agents that enable the channel keep one authenticated WebSocket open to
+``/api/v1/agents/channel``. Heartbeats and events flow agent to hub over it,
+and the hub sends commands back (config sync, service restart, metric pull)
+without an SSH handshake per command.
+
+A dropped connection is also a much faster liveness signal than missed
+heartbeats: the server is marked offline after CHANNEL_OFFLINE_GRACE_SECONDS
+unless the agent reconnects, instead of after OFFLINE_THRESHOLD_SECONDS.
+
+Frame format (JSON text frames):
+    agent -> hub: {"type": "heartbeat" | "events", "id": str, "payload": {...}}
+    hub -> agent: {"type": "ack", "id": str, "payload": {...}}
+                  {"type": "error", "id": str, "code": str, "message": str}
+    hub -> agent: {"type": "command", "id": str, "command": str, "params": {...}}
+    agent -> hub: {"type": "command_result", "id": str, "success": bool,
+                   "result": {...}, "error": str | None}
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+
+from fastapi import WebSocket
+from sqlalchemy import select
+
+from homelab_cmd.api.routes.config import DEFAULT_NOTIFICATIONS, get_config_value
+from homelab_cmd.api.schemas.config import NotificationsConfig
+from homelab_cmd.db.models.server import Server, ServerStatus
+from homelab_cmd.db.session import get_session_factory
+from homelab_cmd.services.alerting import AlertingService
+from homelab_cmd.services.event_bus import EventTopic, publish
+from homelab_cmd.services.notifier import get_notifier
+
+logger = logging.getLogger(__name__)
+
+# Default time to wait for an agent to answer a command
+CHANNEL_COMMAND_TIMEOUT = 30.0
+
+# Time an agent has to reconnect before a dropped channel marks it offline
+CHANNEL_OFFLINE_GRACE_SECONDS = 15
+
+
+class ChannelCommand(str, Enum):
+    """Commands the hub can send to a connected agent."""
+
+    SYNC_CONFIG = "sync_config"  # Update monitored_services in the agent config
+    RESTART_SERVICE = "restart_service"  # systemctl restart <service_name>
+    COLLECT_METRICS = "collect_metrics"  # Return current metrics immediately
+
+
+class AgentChannelError(Exception):
+    """Raised when a command cannot be delivered or answered over the channel."""
+
+
+class AgentChannelTimeoutError(AgentChannelError):
+    """Raised when a command was sent but the agent did not answer in time.
+
+    The agent may still have run the command, so its outcome is unknown.
+    """
+
+
+@dataclass
+class ChannelCommandResult:
+    """Result returned by an agent for a channel command."""
+
+    success: bool
+    result: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+class AgentConnection:
+    """A single connected agent and its in-flight commands."""
+
+    def __init__(self, server_id: str, server_guid: str, websocket: WebSocket) -> None:
+        """Initialise the connection.
+
+        Args:
+            server_id: Server the agent reports for.
+            server_guid: Server GUID the agent authenticated with.
+            websocket: Accepted WebSocket.
+        """
+        self.server_id = server_id
+        self.server_guid = server_guid
+        self.websocket = websocket
+        self.connected_at = datetime.now(UTC)
+        # Set when the agent announces a clean stop, so the disconnect is not alerted
+        self.clean_shutdown = False
+        self._pending: dict[str, asyncio.Future[ChannelCommandResult]] = {}
+        self._send_lock = asyncio.Lock()
+
+    async def send_json(self, message: dict[str, Any]) -> None:
+        """Send a frame (serialised so concurrent senders do not interleave)."""
+        async with self._send_lock:
+            await self.websocket.send_json(message)
+
+    async def send_command(
+        self,
+        command: ChannelCommand,
+        params: dict[str, Any] | None = None,
+        timeout: float = CHANNEL_COMMAND_TIMEOUT,
+    ) -> ChannelCommandResult:
+        """Send a command and wait for the agent's result.
+
+        Raises:
+            AgentChannelTimeoutError: If the command was sent but not answered in time.
+            AgentChannelError: If sending fails.
+        """
+        command_id = uuid.uuid4().hex
+        future: asyncio.Future[ChannelCommandResult] = asyncio.get_running_loop().create_future()
+        self._pending[command_id] = future
+        try:
+            await self.send_json(
+                {
+                    "type": "command",
+                    "id": command_id,
+                    "command": command.value,
+                    "params": params or {},
+                }
+            )
+            return await asyncio.wait_for(future, timeout=timeout)
+        except TimeoutError as e:
+            raise AgentChannelTimeoutError(
+                f"Agent {self.server_id} did not answer '{command.value}' within {timeout:.0f}s"
+            ) from e
+        except (RuntimeError, OSError) as e:
+            raise AgentChannelError(f"Channel to {self.server_id} failed: {e}") from e
+        finally:
+            self._pending.pop(command_id, None)
+
+    def resolve(self, message: dict[str, Any]) -> None:
+        """Complete the pending command matching a command_result frame."""
+        future = self._pending.get(str(message.get("id")))
+        if future is None or future.done():
+            logger.debug("Ignoring unmatched command result from %s", self.server_id)
+            return
+        future.set_result(
+            ChannelCommandResult(
+                success=bool(message.get("success")),
+                result=message.get("result") or {},
+                error=message.get("error"),
+            )
+        )
+
+    def fail_pending(self) -> None:
+        """Fail all in-flight commands (connection closed)."""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(AgentChannelError(f"Channel to {self.server_id} closed"))
+        self._pending.clear()
+
+
+class AgentChannelManager:
+    """Registry of connected agents, keyed by server_id."""
+
+    def __init__(self) -> None:
+        """Initialise an empty registry."""
+        self._connections: dict[str, AgentConnection] = {}
+
+    def register(self, connection: AgentConnection) -> AgentConnection | None:
+        """Register a connection, returning any connection it replaces."""
+        previous = self._connections.get(connection.server_id)
+        self._connections[connection.server_id] = connection
+        logger.info("Agent channel connected: %s", connection.server_id)
+        return previous
+
+    def unregister(self, connection: AgentConnection) -> bool:
+        """Remove a connection if it is still the current one for its server.
+
+        Returns:
+            True if the connection was current (the agent is now disconnected).
+        """
+        connection.fail_pending()
+        if self._connections.get(connection.server_id) is not connection:
+            return False
+        del self._connections[connection.server_id]
+        logger.info("Agent channel disconnected: %s", connection.server_id)
+        return True
+
+    def get(self, server_id: str) -> AgentConnection | None:
+        """Get the live connection for a server, if any."""
+        return self._connections.get(server_id)
+
+    def is_connected(self, server_id: str) -> bool:
+        """Check whether a server's agent has a live channel."""
+        return server_id in self._connections
+
+    def connections(self) -> list[AgentConnection]:
+        """List live connections."""
+        return list(self._connections.values())
+
+    async def send_command(
+        self,
+        server_id: str,
+        command: ChannelCommand,
+        params: dict[str, Any] | None = None,
+        timeout: float = CHANNEL_COMMAND_TIMEOUT,
+    ) -> ChannelCommandResult:
+        """Send a command to a server's agent over its channel.
+
+        Args:
+            server_id: Target server.
+            command: Command to run.
+            params: Command parameters.
+            timeout: Seconds to wait for the result.
+
+        Returns:
+            The agent's result.
+
+        Raises:
+            AgentChannelTimeoutError: If the agent does not answer in time.
+            AgentChannelError: If the agent is not connected or sending fails.
+        """
+        connection = self._connections.get(server_id)
+        if connection is None:
+            raise AgentChannelError(f"Agent {server_id} has no channel connected")
+        return await connection.send_command(command, params, timeout)
+
+
+_manager = AgentChannelManager()
+
+
+def get_agent_channel_manager() -> AgentChannelManager:
+    """Get the process-wide agent channel registry."""
+    return _manager
+
+
+async def handle_channel_lost(server_id: str, grace_seconds: float | None = None) -> bool:
+    """Mark a server offline if its agent does not reconnect within the grace period.
+
+    Args:
+        server_id: Server whose channel dropped.
+        grace_seconds: Seconds to wait for a reconnect
+            (default CHANNEL_OFFLINE_GRACE_SECONDS).
+
+    Returns:
+        True if the server was marked offline.
+    """
+    disconnected_at = datetime.now(UTC)
+    await asyncio.sleep(CHANNEL_OFFLINE_GRACE_SECONDS if grace_seconds is None else grace_seconds)
+    if _manager.is_connected(server_id):
+        return False
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        result = await session.execute(
+            select(Server)
+            .where(Server.id == server_id)
+            .where(Server.status == ServerStatus.ONLINE.value)
+            .where(Server.is_inactive.is_(False))
+        )
+        server = result.scalar_one_or_none()
+        if server is None:
+            return False
+
+        # A heartbeat over HTTP after the drop means the agent is still alive
+        last_seen = server.last_seen
+        if last_seen and last_seen.tzinfo is None:
+            last_seen = last_seen.replace(tzinfo=UTC)
+        if last_seen and last_seen > disconnected_at:
+            return False
+
+        server.status = ServerStatus.OFFLINE.value
+        logger.info("Server %s marked offline (agent channel lost)", server_id)
+        publish(
+            EventTopic.SERVER_STATUS,
+            {
+                "server_id": server_id,
+                "status": ServerStatus.OFFLINE.value,
+                "previous_status": ServerStatus.ONLINE.value,
+            },
+        )
+
+        # Skip offline alerts for workstations (EP0009: US0089)
+        if server.machine_type != "workstation":
+            notifications_data = await get_config_value(session, "notifications")
+            notifications = (
+                NotificationsConfig(**notifications_data)
+                if notifications_data
+                else DEFAULT_NOTIFICATIONS
+            )
+            event = await AlertingService(session).trigger_offline_alert(
+                server_id=server.id,
+                server_name=server.display_name or server.hostname,
+                cooldowns=notifications.cooldowns,
+            )
+            if event and notifications.slack_webhook_url:
+                await get_notifier(notifications.slack_webhook_url).send_alert(event, notifications)
+
+        await session.commit()
+    return True
@@ -1,7 +1,8 @@
 """Agent config sync service.
 
-Synchronises expected services from the database to the agent's config file via SSH.
+Synchronises expected services from the database to the agent's config file.
 When services are added/removed in the UI, this updates the agent's monitored_services list.
+Agents with a persistent channel are updated over it; others via SSH.
 """
 
 import logging
@@ -12,6 +13,11 @@ from sqlalchemy import select
 from homelab_cmd.db.models.config import Config
 from homelab_cmd.db.models.server import Server
 from homelab_cmd.db.models.service import ExpectedService
+from homelab_cmd.services.agent_channel import (
+    AgentChannelError,
+    ChannelCommand,
+    get_agent_channel_manager,
+)
 from homelab_cmd.services.ssh import get_ssh_service
 
 if TYPE_CHECKING:
@@ -51,10 +57,11 @@ async def sync_services_to_agent(
     server_id: str,
     key_id: str | None = None,
 ) -> tuple[bool, str]:
-    """Sync expected services from database to agent config via SSH.
+    """Sync expected services from database to agent config.
 
-    Updates the agent's monitored_services list in its YAML config file,
-    then restarts the agent to apply changes.
+    Updates the agent's monitored_services list in its YAML config file.
+    Agents with a persistent channel apply the change in place; otherwise
+    the file is edited over SSH and the agent restarted.
 
     Args:
         session: Database session.
@@ -84,6 +91,30 @@ async def sync_services_to_agent(
     services = result.scalars().all()
     service_names = [s.service_name for s in services]
 
+    # Prefer the agent channel: no SSH handshake and no agent restart
+    manager = get_agent_channel_manager()
+    if manager.is_connected(server_id):
+        try:
+            channel_result = await manager.send_command(
+                server_id,
+                ChannelCommand.SYNC_CONFIG,
+                {"monitored_services": sorted(service_names)},
+            )
+            if channel_result.success:
+                logger.info(
+                    "Synced %d services to agent on %s via channel",
+                    len(service_names),
+                    server_id,
+                )
+                return True, f"Synced {len(service_names)} services to agent"
+            logger.warning(
+                "Agent channel config sync failed for %s: %s",
+                server_id,
+                channel_result.error,
+            )
+        except AgentChannelError as e:
+            logger.warning("Agent channel unavailable for %s, using SSH: %s", server_id, e)
+
     # SSH command to update the config file using Python (safer YAML handling)
     # This preserves other config values and handles YAML properly
     # Uses sudo for file access since config is owned by root
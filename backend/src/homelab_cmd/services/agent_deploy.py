@@ -12,7 +12,8 @@ EP0007: Agent Management
 from __future__ import annotations
 
 import base64
-import io
+import gzip
+import hashlib
 import logging
 import tarfile
 import uuid
@@ -21,7 +22,6 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import yaml
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -30,11 +30,17 @@ from homelab_cmd.db.models.agent_credential import AgentCredential
 from homelab_cmd.db.models.config import Config
 from homelab_cmd.db.models.server import Server, ServerStatus
 from homelab_cmd.db.models.service import ExpectedService
+from homelab_cmd.lazy_imports import lazy_import
 from homelab_cmd.services.ssh import SSHConnectionService
 from homelab_cmd.services.token_service import TokenService
 
 if TYPE_CHECKING:
+    import yaml
+
     from homelab_cmd.services.credential_service import CredentialService
+else:
+    # Loaded on first deployment rather than at startup
+    yaml = lazy_import("yaml")
 
 logger = logging.getLogger(__name__)
 
@@ -42,8 +48,10 @@ logger = logging.getLogger(__name__)
 AGENT_FILES = [
     "__init__.py",
     "__main__.py",
+    "channel.py",
     "config.py",
     "collectors.py",
+    "events.py",
     "heartbeat.py",
     "executor.py",
     "homelab-agent.service",
@@ -56,6 +64,9 @@ AGENT_FILES = [
 INSTALL_DIR = "/opt/homelab-agent"
 CONFIG_DIR = "/etc/homelab-agent"
 
+# Gzip member holding a tar end-of-archive marker (two zero blocks)
+_TAR_END_MEMBER = gzip.compress(b"\0" * (2 * tarfile.BLOCKSIZE), mtime=0)
+
 
 @dataclass
 class DeploymentResult:
@@ -123,6 +134,89 @@ def _get_agent_source_path() -> Path:
     return agent_dir
 
 
+@dataclass(frozen=True)
+class AgentArchive:
+    """Prebuilt, compressed agent files for one agent version.
+
+    ``files`` is a gzip member holding tar entries for the agent files with
+    no end-of-archive marker, so per-server members can be appended to it
+    without recompressing the agent. ``download`` is the standalone archive.
+    """
+
+    version: str
+    files: bytes
+    download: bytes
+    etag: str
+
+
+# Agent directory -> (file signature, archive)
+_archive_cache: dict[Path, tuple[tuple, AgentArchive]] = {}
+
+
+def _tar_entry(name: str, data: bytes, mode: int, mtime: float = 0) -> bytes:
+    """Encode one regular file as tar header and padded data blocks."""
+    info = tarfile.TarInfo(name=name)
+    info.size = len(data)
+    info.mode = mode
+    info.mtime = int(mtime)
+    return info.tobuf() + data + b"\0" * (-len(data) % tarfile.BLOCKSIZE)
+
+
+def get_agent_archive() -> AgentArchive:
+    """Get the prebuilt agent archive, rebuilding it if agent files changed.
+
+    The archive is rebuilt when the agent version or any agent file's
+    modification time or size changes; otherwise the cached copy is
+    returned after one stat per file.
+
+    Returns:
+        Cached AgentArchive for the current agent files.
+
+    Raises:
+        FileNotFoundError: If agent directory cannot be located.
+    """
+    agent_dir = _get_agent_source_path()
+    version = get_agent_version()
+
+    sources = []
+    missing = []
+    for filename in AGENT_FILES:
+        src_path = agent_dir / filename
+        try:
+            sources.append((filename, src_path.stat()))
+        except FileNotFoundError:
+            missing.append(src_path)
+    signature = (version, *((f, st.st_mtime_ns, st.st_size) for f, st in sources))
+
+    cached = _archive_cache.get(agent_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    for src_path in missing:
+        logger.warning("Agent file not found: %s", src_path)
+
+    # Paths relative to / (as tar stores them), extracted with -C /
+    entries = b"".join(
+        _tar_entry(
+            f"{INSTALL_DIR}/{filename}".lstrip("/"),
+            (agent_dir / filename).read_bytes(),
+            st.st_mode & 0o7777,
+            st.st_mtime,
+        )
+        for filename, st in sources
+    )
+    files = gzip.compress(entries, mtime=0)
+    archive = AgentArchive(
+        version=version,
+        files=files,
+        download=files + _TAR_END_MEMBER,
+        etag=f'"{hashlib.sha256(files).hexdigest()}"',
+    )
+    _archive_cache[agent_dir] = (signature, archive)
+    logger.info("Built agent archive for version %s (%d bytes)", version, len(files))
+    return archive
+
+
 def build_agent_tarball(
     hub_url: str,
     server_id: str,
@@ -136,6 +230,9 @@ def build_agent_tarball(
 ) -> bytes:
     """Build a tarball of the agent with pre-configured config.yaml.
 
+    The cached agent archive is reused and a small gzip member holding
+    config.yaml is appended, so nothing else is recompressed per server.
+
     Args:
         hub_url: URL of the HomelabCmd server.
         server_id: Unique identifier for the server.
@@ -150,55 +247,40 @@ def build_agent_tarball(
     Returns:
         Bytes of the gzipped tarball.
     """
-    agent_dir = _get_agent_source_path()
-
-    # Create tarball in memory
-    tar_buffer = io.BytesIO()
-
-    with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
-        # Add agent files to /opt/homelab-agent/
-        for filename in AGENT_FILES:
-            src_path = agent_dir / filename
-            if src_path.exists():
-                arcname = f"{INSTALL_DIR}/{filename}"
-                tar.add(str(src_path), arcname=arcname)
-            else:
-                logger.warning("Agent file not found: %s", src_path)
-
-        # Create config.yaml content
-        config_data = {
-            "hub_url": hub_url,
-            "server_id": server_id,
-            "server_guid": server_guid,
-            "api_token": api_token,
-            "heartbeat_interval": heartbeat_interval,
+    # Agent files come precompressed; only config.yaml is compressed here
+    archive = get_agent_archive()
+
+    # Create config.yaml content
+    config_data = {
+        "hub_url": hub_url,
+        "server_id": server_id,
+        "server_guid": server_guid,
+        "api_token": api_token,
+        "heartbeat_interval": heartbeat_interval,
+    }
+
+    if monitored_services:
+        config_data["monitored_services"] = monitored_services
+
+    # US0069: Add core_services for service classification
+    if core_services:
+        config_data["core_services"] = core_services
+
+    if command_execution_enabled:
+        config_data["mode"] = "readwrite"  # Enable command execution mode
+        config_data["command_execution"] = {
+            "enabled": True,
+            "use_sudo": use_sudo,
+            "timeout_seconds": 30,
         }
 
-        if monitored_services:
-            config_data["monitored_services"] = monitored_services
-
-        # US0069: Add core_services for service classification
-        if core_services:
-            config_data["core_services"] = core_services
-
-        if command_execution_enabled:
-            config_data["mode"] = "readwrite"  # Enable command execution mode
-            config_data["command_execution"] = {
-                "enabled": True,
-                "use_sudo": use_sudo,
-                "timeout_seconds": 30,
-            }
-
-        config_yaml = yaml.dump(config_data, default_flow_style=False)
+    config_yaml = yaml.dump(config_data, default_flow_style=False)
 
-        # Add config.yaml to /etc/homelab-agent/
-        config_info = tarfile.TarInfo(name=f"{CONFIG_DIR}/config.yaml")
-        config_bytes = config_yaml.encode("utf-8")
-        config_info.size = len(config_bytes)
-        config_info.mode = 0o600  # Secure permissions
-        tar.addfile(config_info, io.BytesIO(config_bytes))
+    # Add config.yaml to /etc/homelab-agent/ (secure permissions), then end the archive
+    config_entry = _tar_entry(f"{CONFIG_DIR}/config.yaml", config_yaml.encode("utf-8"), 0o600)
 
-    return tar_buffer.getvalue()
+    # gzip readers treat concatenated members as one stream
+    return archive.files + gzip.compress(config_entry + b"\0" * (2 * tarfile.BLOCKSIZE), mtime=0)
 
 
 class AgentDeploymentService:
@@ -208,15 +290,17 @@ class AgentDeploymentService:
         self,
         session: AsyncSession,
         credential_service: CredentialService | None = None,
+        ssh: SSHConnectionService | None = None,
     ) -> None:
         """Initialise the deployment service.
 
         Args:
             session: Database session for server operations.
             credential_service: Optional credential service for retrieving stored credentials.
+            ssh: SSH service to share across deployments (a new one if omitted).
         """
         self.session = session
-        self.ssh = SSHConnectionService()
+        self.ssh = ssh or SSHConnectionService()
         self.settings = get_settings()
         self.credential_service = credential_service
 
@@ -868,14 +952,16 @@ class AgentDeploymentService:
 def get_deployment_service(
     session: AsyncSession,
     credential_service: CredentialService | None = None,
+    ssh: SSHConnectionService | None = None,
 ) -> AgentDeploymentService:
     """Get an agent deployment service instance.
 
     Args:
         session: Database session.
         credential_service: Optional credential service for retrieving stored credentials.
+        ssh: Optional SSH service to share across deployments.
 
     Returns:
         AgentDeploymentService instance.
     """
-    return AgentDeploymentService(session, credential_service=credential_service)
+    return AgentDeploymentService(session, credential_service=credential_service, ssh=ssh)
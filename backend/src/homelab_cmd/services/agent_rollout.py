@@ -0,0 +1,537 @@
+"""Fleet agent rollout service.
+
+Upgrades the agent on many servers as one job:
+
+- The first wave is a small canary; later waves upgrade wave_size servers
+  concurrently.
+- After each wave the rollout waits for every upgraded server to heartbeat
+  with the target agent_version. A failed upgrade or a missing heartbeat
+  pauses the rollout before the next wave.
+- Per-server results are written to the rollout record (and published on the
+  event bus) as each server finishes, not at the end of the wave.
+
+Every upgrade shares one SSH service and the cached agent archive.
+
+EP0007: Agent Management
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from homelab_cmd.config import get_settings
+from homelab_cmd.db.models.agent_rollout import AgentRollout, AgentRolloutStatus
+from homelab_cmd.db.models.server import Server
+from homelab_cmd.db.session import get_session_factory
+from homelab_cmd.services.agent_deploy import get_agent_version, get_deployment_service
+from homelab_cmd.services.credential_service import CredentialService
+from homelab_cmd.services.event_bus import EventTopic, publish
+from homelab_cmd.services.ssh import SSHConnectionService, get_ssh_service
+
+logger = logging.getLogger(__name__)
+
+# Servers in the first (canary) wave by default
+DEFAULT_CANARY_SIZE = 1
+
+# Servers upgraded concurrently in each wave after the canary by default
+DEFAULT_WAVE_SIZE = 5
+
+# How long to wait for upgraded servers to heartbeat the new version by default
+DEFAULT_HEARTBEAT_TIMEOUT_SECONDS = 180
+
+# How often to look for post-upgrade heartbeats
+HEARTBEAT_POLL_INTERVAL_SECONDS = 5
+
+# Per-server result states
+HOST_PENDING = "pending"
+HOST_UPGRADING = "upgrading"
+HOST_VERIFYING = "verifying"
+HOST_SUCCEEDED = "succeeded"
+HOST_FAILED = "failed"
+
+# One runner per rollout at a time (per worker): a rollout paused and
+# unpaused mid-wave gets a second runner, which waits for the first to
+# finish its wave rather than running that wave again
+_run_locks: dict[int, asyncio.Lock] = {}
+
+
+class RolloutError(Exception):
+    """Raised when a rollout cannot be created or changed."""
+
+
+class RolloutConflictError(RolloutError):
+    """Raised when another rollout is already active."""
+
+
+def plan_waves(server_ids: list[str], canary_size: int, wave_size: int) -> list[list[str]]:
+    """Split servers into a canary wave followed by fixed-size waves.
+
+    Args:
+        server_ids: Servers in rollout order.
+        canary_size: Servers in the first wave.
+        wave_size: Servers in each later wave.
+
+    Returns:
+        List of waves, each a list of server IDs.
+    """
+    waves = [server_ids[:canary_size]] if server_ids else []
+    rest = server_ids[canary_size:]
+    waves.extend(rest[i : i + wave_size] for i in range(0, len(rest), wave_size))
+    return waves
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    """Treat naive datetimes (as SQLite returns them) as UTC."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def _publish_rollout_progress(rollout: AgentRollout, host: dict[str, Any] | None = None) -> None:
+    """Publish a rollout's progress on the live update bus."""
+    publish(
+        EventTopic.ROLLOUT_PROGRESS,
+        {
+            "rollout_id": rollout.id,
+            "target_version": rollout.target_version,
+            "status": rollout.status,
+            "waves_completed": rollout.waves_completed,
+            "waves_total": rollout.waves_total,
+            "hosts_succeeded": rollout.hosts_succeeded,
+            "hosts_failed": rollout.hosts_failed,
+            "host": host,
+        },
+    )
+
+
+class AgentRolloutService:
+    """Service for creating and running fleet agent rollouts."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        ssh: SSHConnectionService | None = None,
+    ) -> None:
+        """Initialise the rollout service.
+
+        Args:
+            session_factory: Factory for the sessions a running rollout opens
+                (default: the application session factory).
+            ssh: SSH service shared by every upgrade (default: the process-wide one).
+        """
+        self._session_factory = session_factory
+        self._ssh = ssh
+
+    def _open_session(self) -> AsyncSession:
+        factory = self._session_factory or get_session_factory()
+        return factory()
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def create_rollout(
+        self,
+        session: AsyncSession,
+        server_ids: list[str] | None = None,
+        canary_size: int = DEFAULT_CANARY_SIZE,
+        wave_size: int = DEFAULT_WAVE_SIZE,
+        heartbeat_timeout_seconds: int = DEFAULT_HEARTBEAT_TIMEOUT_SECONDS,
+        triggered_by: str = "user",
+    ) -> AgentRollout:
+        """Create a pending rollout.
+
+        Args:
+            session: Database session.
+            server_ids: Servers to upgrade, in order. Defaults to every active
+                agent server not already on the current version.
+            canary_size: Servers in the first wave.
+            wave_size: Servers upgraded concurrently in each later wave.
+            heartbeat_timeout_seconds: How long to wait for post-upgrade heartbeats.
+            triggered_by: User/source requesting the rollout.
+
+        Returns:
+            The new rollout record.
+
+        Raises:
+            RolloutConflictError: Another rollout is pending, running or paused.
+            RolloutError: A server cannot be upgraded, or there is nothing to do.
+        """
+        active = await session.execute(
+            select(AgentRollout.id).where(
+                AgentRollout.status.in_(
+                    [
+                        AgentRolloutStatus.PENDING.value,
+                        AgentRolloutStatus.RUNNING.value,
+                        AgentRolloutStatus.PAUSED.value,
+                    ]
+                )
+            )
+        )
+        active_id = active.scalars().first()
+        if active_id is not None:
+            raise RolloutConflictError(f"Rollout {active_id} is already active")
+
+        target_version = get_agent_version()
+
+        if server_ids is None:
+            result = await session.execute(
+                select(Server.id)
+                .where(
+                    Server.is_inactive.is_(False),
+                    Server.agent_version.is_not(None),
+                    Server.agent_version != target_version,
+                )
+                .order_by(Server.id)
+            )
+            server_ids = list(result.scalars().all())
+        else:
+            server_ids = list(dict.fromkeys(server_ids))
+            result = await session.execute(select(Server).where(Server.id.in_(server_ids)))
+            servers = {server.id: server for server in result.scalars().all()}
+            for server_id in server_ids:
+                server = servers.get(server_id)
+                if server is None:
+                    raise RolloutError(f"Server '{server_id}' not found")
+                if server.is_inactive:
+                    raise RolloutError(f"Server '{server_id}' is inactive")
+
+        if not server_ids:
+            raise RolloutError(f"No servers need upgrading to agent {target_version}")
+
+        waves = plan_waves(server_ids, canary_size, wave_size)
+        rollout = AgentRollout(
+            target_version=target_version,
+            status=AgentRolloutStatus.PENDING.value,
+            server_ids=server_ids,
+            canary_size=canary_size,
+            wave_size=wave_size,
+            heartbeat_timeout_seconds=heartbeat_timeout_seconds,
+            waves_completed=0,
+            waves_total=len(waves),
+            hosts_succeeded=0,
+            hosts_failed=0,
+            results=[
+                {
+                    "server_id": server_id,
+                    "wave": wave_index,
+                    "status": HOST_PENDING,
+                    "error": None,
+                    "upgraded_at": None,
+                    "verified_at": None,
+                }
+                for wave_index, wave in enumerate(waves)
+                for server_id in wave
+            ],
+            triggered_by=triggered_by,
+        )
+        session.add(rollout)
+        await session.flush()
+        await session.refresh(rollout)
+
+        logger.info(
+            "Created agent rollout %d: %d servers to %s in %d waves",
+            rollout.id,
+            len(server_ids),
+            target_version,
+            len(waves),
+        )
+        return rollout
+
+    async def pause_rollout(self, session: AsyncSession, rollout: AgentRollout) -> None:
+        """Pause a pending or running rollout after its current wave.
+
+        Raises:
+            RolloutError: The rollout is not pending or running.
+        """
+        if rollout.status not in (
+            AgentRolloutStatus.PENDING.value,
+            AgentRolloutStatus.RUNNING.value,
+        ):
+            raise RolloutError(f"Rollout {rollout.id} is {rollout.status}, not running")
+        rollout.status = AgentRolloutStatus.PAUSED.value
+        rollout.error = "Paused by user"
+        await session.flush()
+
+    async def unpause_rollout(self, session: AsyncSession, rollout: AgentRollout) -> None:
+        """Queue a paused rollout to continue with its next wave.
+
+        Raises:
+            RolloutError: The rollout is not paused.
+        """
+        if rollout.status != AgentRolloutStatus.PAUSED.value:
+            raise RolloutError(f"Rollout {rollout.id} is {rollout.status}, not paused")
+        rollout.status = AgentRolloutStatus.PENDING.value
+        rollout.error = None
+        await session.flush()
+
+    async def cancel_rollout(self, session: AsyncSession, rollout: AgentRollout) -> None:
+        """Cancel an active rollout; servers already upgraded keep the new agent.
+
+        Raises:
+            RolloutError: The rollout has already finished.
+        """
+        if not rollout.is_active:
+            raise RolloutError(f"Rollout {rollout.id} is already {rollout.status}")
+        rollout.status = AgentRolloutStatus.CANCELLED.value
+        rollout.completed_at = datetime.now(UTC)
+        await session.flush()
+
+    # =========================================================================
+    # Execution
+    # =========================================================================
+
+    async def execute_rollout(self, rollout_id: int) -> None:
+        """Run a pending rollout's remaining waves.
+
+        Stops when every wave is done, when a wave fails (the rollout is
+        paused) or when the rollout is paused or cancelled through the API.
+        If another runner is still finishing a wave of the same rollout, waits
+        for it first.
+
+        Args:
+            rollout_id: ID of the rollout to run.
+        """
+        async with _run_locks.setdefault(rollout_id, asyncio.Lock()):
+            await self._execute_rollout(rollout_id)
+
+    async def _execute_rollout(self, rollout_id: int) -> None:
+        async with self._open_session() as session:
+            rollout = await session.get(AgentRollout, rollout_id)
+            if rollout is None:
+                logger.error("Rollout %d not found for execution", rollout_id)
+                return
+            if rollout.status != AgentRolloutStatus.PENDING.value:
+                logger.warning(
+                    "Rollout %d is not pending (status=%s), skipping",
+                    rollout_id,
+                    rollout.status,
+                )
+                return
+
+            rollout.status = AgentRolloutStatus.RUNNING.value
+            rollout.started_at = rollout.started_at or datetime.now(UTC)
+            await session.commit()
+            _publish_rollout_progress(rollout)
+
+            try:
+                await self._run_waves(session, rollout)
+            except Exception as e:
+                logger.exception("Rollout %d failed: %s", rollout_id, e)
+                await session.rollback()
+                await session.refresh(rollout)
+                rollout.status = AgentRolloutStatus.FAILED.value
+                rollout.error = str(e)
+                rollout.completed_at = datetime.now(UTC)
+                await session.commit()
+                _publish_rollout_progress(rollout)
+
+    async def _run_waves(self, session: AsyncSession, rollout: AgentRollout) -> None:
+        waves = plan_waves(rollout.server_ids, rollout.canary_size, rollout.wave_size)
+        lock = asyncio.Lock()
+
+        while rollout.waves_completed < len(waves):
+            wave_index = rollout.waves_completed
+            failed = await self._run_wave(session, rollout, waves[wave_index], lock)
+
+            await session.refresh(rollout)
+            rollout.waves_completed = wave_index + 1
+            if rollout.status != AgentRolloutStatus.RUNNING.value:
+                # Paused or cancelled through the API during the wave
+                await session.commit()
+                _publish_rollout_progress(rollout)
+                return
+
+            if failed:
+                label = "Canary wave" if wave_index == 0 else f"Wave {wave_index + 1}"
+                rollout.status = AgentRolloutStatus.PAUSED.value
+                rollout.error = f"{label} failed on {', '.join(failed)}"
+                await session.commit()
+                _publish_rollout_progress(rollout)
+                logger.warning("Rollout %d paused: %s", rollout.id, rollout.error)
+                return
+
+            await session.commit()
+            _publish_rollout_progress(rollout)
+
+        rollout.status = AgentRolloutStatus.COMPLETED.value
+        rollout.completed_at = datetime.now(UTC)
+        await session.commit()
+        _publish_rollout_progress(rollout)
+        logger.info("Rollout %d completed", rollout.id)
+
+    async def _run_wave(
+        self,
+        session: AsyncSession,
+        rollout: AgentRollout,
+        server_ids: list[str],
+        lock: asyncio.Lock,
+    ) -> list[str]:
+        """Upgrade one wave concurrently and verify its heartbeats.
+
+        Returns:
+            Servers in the wave that failed.
+        """
+
+        async def upgrade(server_id: str) -> datetime | None:
+            await self._record_host(session, rollout, lock, server_id, status=HOST_UPGRADING)
+            try:
+                error = await self._upgrade_host(server_id)
+            except Exception as e:
+                logger.exception("Rollout %d: upgrade of %s failed", rollout.id, server_id)
+                error = str(e)
+            if error:
+                await self._record_host(
+                    session, rollout, lock, server_id, status=HOST_FAILED, error=error
+                )
+                return None
+            upgraded_at = datetime.now(UTC)
+            await self._record_host(
+                session,
+                rollout,
+                lock,
+                server_id,
+                status=HOST_VERIFYING,
+                upgraded_at=upgraded_at.isoformat(),
+            )
+            return upgraded_at
+
+        upgraded_at = await asyncio.gather(*(upgrade(server_id) for server_id in server_ids))
+        pending = {
+            server_id: at for server_id, at in zip(server_ids, upgraded_at, strict=True) if at
+        }
+        failed = [server_id for server_id in server_ids if server_id not in pending]
+
+        missing = await self._await_heartbeats(session, rollout, lock, pending)
+        for server_id in missing:
+            await self._record_host(
+                session,
+                rollout,
+                lock,
+                server_id,
+                status=HOST_FAILED,
+                error=(
+                    f"No heartbeat with agent {rollout.target_version} within "
+                    f"{rollout.heartbeat_timeout_seconds}s of upgrade"
+                ),
+            )
+        return failed + missing
+
+    async def _upgrade_host(self, server_id: str) -> str | None:
+        """Upgrade one server in its own session.
+
+        Returns:
+            Error message, or None if the upgrade command succeeded.
+        """
+        settings = get_settings()
+        async with self._open_session() as session:
+            credential_service = (
+                CredentialService(session, settings.encryption_key)
+                if settings.encryption_key
+                else None
+            )
+            if self._ssh is None:
+                self._ssh = get_ssh_service()
+            service = get_deployment_service(session, credential_service, ssh=self._ssh)
+            # Keep pending writes (e.g. a new GUID) out of the database until the
+            # SSH command is done, so one upgrade doesn't hold SQLite's write lock
+            # while the rest of the wave waits on it
+            with session.no_autoflush:
+                result = await service.upgrade_agent(server_id)
+            if not result.success:
+                return result.error or "Upgrade failed"
+            await session.commit()
+            return None
+
+    async def _await_heartbeats(
+        self,
+        session: AsyncSession,
+        rollout: AgentRollout,
+        lock: asyncio.Lock,
+        upgraded_at: dict[str, datetime],
+    ) -> list[str]:
+        """Wait for upgraded servers to heartbeat with the target version.
+
+        A server counts once it has been seen after its upgrade finished and
+        reports the target agent_version.
+
+        Returns:
+            Servers that did not heartbeat in time.
+        """
+        waiting = dict(upgraded_at)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + rollout.heartbeat_timeout_seconds
+
+        while waiting:
+            async with lock:
+                result = await session.execute(
+                    select(Server.id, Server.agent_version, Server.last_seen).where(
+                        Server.id.in_(list(waiting))
+                    )
+                )
+                rows = result.all()
+                # Don't keep a stale view of servers across polls
+                await session.commit()
+
+            for server_id, agent_version, last_seen in rows:
+                last_seen = _as_utc(last_seen)
+                if (
+                    agent_version == rollout.target_version
+                    and last_seen is not None
+                    and last_seen >= waiting[server_id]
+                ):
+                    del waiting[server_id]
+                    await self._record_host(
+                        session,
+                        rollout,
+                        lock,
+                        server_id,
+                        status=HOST_SUCCEEDED,
+                        verified_at=last_seen.isoformat(),
+                    )
+
+            if not waiting or loop.time() >= deadline:
+                break
+            await asyncio.sleep(
+                min(HEARTBEAT_POLL_INTERVAL_SECONDS, max(deadline - loop.time(), 0))
+            )
+
+        return list(waiting)
+
+    async def _record_host(
+        self,
+        session: AsyncSession,
+        rollout: AgentRollout,
+        lock: asyncio.Lock,
+        server_id: str,
+        **changes: Any,
+    ) -> None:
+        """Update one server's result in the rollout record and commit it."""
+        async with lock:
+            results = []
+            host: dict[str, Any] | None = None
+            for entry in rollout.results or []:
+                if entry["server_id"] == server_id:
+                    entry = {**entry, **changes}
+                    host = entry
+                results.append(entry)
+            rollout.results = results
+
+            if changes.get("status") == HOST_SUCCEEDED:
+                rollout.hosts_succeeded += 1
+            elif changes.get("status") == HOST_FAILED:
+                rollout.hosts_failed += 1
+            await session.commit()
+            _publish_rollout_progress(rollout, host)
+
+
+def get_rollout_service() -> AgentRolloutService:
+    """Get an agent rollout service instance."""
+    return AgentRolloutService()
@@ -9,6 +9,7 @@ Key features:
 - Immediate alerting for persistent metrics (Disk)
 - Notification cooldowns to prevent spam
 - Auto-resolve when conditions clear
+- Pending breaches kept up to date, so "about to alert" is a cheap read
 """
 
 import logging
@@ -26,9 +27,13 @@ from homelab_cmd.api.schemas.config import (
 )
 from homelab_cmd.db.models.alert import Alert, AlertStatus
 from homelab_cmd.db.models.alert_state import AlertSeverity, AlertState, MetricType
+from homelab_cmd.services.event_bus import EventTopic, publish
 
 logger = logging.getLogger(__name__)
 
+# Metrics whose breaches wait out a sustained duration before firing
+PENDING_METRICS = (MetricType.CPU, MetricType.MEMORY, MetricType.DISK)
+
 
 class AlertEvent(NamedTuple):
     """Represents an alert event to be notified."""
@@ -495,6 +500,7 @@ class AlertingService:
         )
         self.session.add(alert)
         await self.session.flush()
+        publish_alert_transition(alert, "opened")
 
         logger.info(
             "Created Alert record for service %s on server %s: %s",
@@ -543,6 +549,7 @@ class AlertingService:
             return None
 
         alert.resolve(auto=True)
+        publish_alert_transition(alert, "resolved")
 
         logger.info(
             "Resolved service Alert record for server %s: %s",
@@ -593,6 +600,7 @@ class AlertingService:
                     state.consecutive_breaches = 0
                     state.first_breach_at = None
                     state.current_value = current_value
+                    clear_pending(state)
                     logger.debug(
                         "Server %s metric %s dropped below threshold, resetting breach timer",
                         server_id,
@@ -627,6 +635,7 @@ class AlertingService:
             elapsed_seconds = (now - first_breach).total_seconds()
             if elapsed_seconds < required_seconds:
                 # Not yet sustained, don't alert
+                mark_pending(state, threshold)
                 logger.debug(
                     "Server %s metric %s: breach for %.0fs/%ds, not yet sustained",
                     server_id,
@@ -637,6 +646,7 @@ class AlertingService:
                 return None
 
         # Sustained threshold met - check if we should alert/escalate/re-notify
+        clear_pending(state)
         if state.current_severity is None:
             # New alert
             state.current_severity = target_severity.value
@@ -978,6 +988,7 @@ class AlertingService:
         )
         self.session.add(alert)
         await self.session.flush()
+        publish_alert_transition(alert, "opened")
 
         logger.info(
             "Created Alert record for server %s: %s (%s)",
@@ -1025,6 +1036,7 @@ class AlertingService:
             return None
 
         alert.resolve(auto=True)
+        publish_alert_transition(alert, "resolved")
 
         logger.info(
             "Resolved Alert record for server %s: %s",
@@ -1083,6 +1095,7 @@ class AlertingService:
             f"{metric_label} usage escalated to {new_severity} at {current_value:.1f}%, "
             f"exceeding the {new_severity} threshold of {threshold_value:.0f}%."
         )
+        publish_alert_transition(alert, "escalated")
 
         logger.info(
             "Escalated Alert record for server %s: %s -> %s",
@@ -1094,6 +1107,82 @@ class AlertingService:
         return alert
 
 
+def mark_pending(state: AlertState, threshold: MetricThreshold) -> None:
+    """Record when a breach that has not fired yet will fire.
+
+    The severity and threshold are the ones the alert would fire at if the
+    current value persisted.
+
+    Args:
+        state: Alert state with a breach in progress (first_breach_at set)
+        threshold: Threshold configuration for the state's metric
+    """
+    first_breach = state.first_breach_at
+    # Handle timezone-naive datetimes from SQLite
+    if first_breach.tzinfo is None:
+        first_breach = first_breach.replace(tzinfo=UTC)
+
+    if (state.current_value or 0) >= threshold.critical_percent:
+        state.pending_severity = AlertSeverity.CRITICAL.value
+        state.pending_threshold = threshold.critical_percent
+    else:
+        state.pending_severity = AlertSeverity.HIGH.value
+        state.pending_threshold = threshold.high_percent
+    state.fires_at = first_breach + timedelta(seconds=threshold.sustained_seconds)
+
+
+def clear_pending(state: AlertState) -> None:
+    """Mark an alert state as having no pending breach."""
+    state.fires_at = None
+    state.pending_severity = None
+    state.pending_threshold = None
+
+
+async def refresh_pending_breaches(session: AsyncSession, thresholds: ThresholdsConfig) -> int:
+    """Recompute every pending breach against the given thresholds.
+
+    Run when thresholds change, and at startup to fill in breaches recorded
+    before pending breaches were maintained.
+
+    Args:
+        session: Database session (not committed)
+        thresholds: Current threshold settings
+
+    Returns:
+        Number of pending breaches
+    """
+    result = await session.execute(
+        select(AlertState)
+        .where(AlertState.first_breach_at.isnot(None))
+        .where(AlertState.current_severity.is_(None))
+        .where(AlertState.metric_type.in_([metric.value for metric in PENDING_METRICS]))
+    )
+    states = result.scalars().all()
+    for state in states:
+        mark_pending(state, getattr(thresholds, state.metric_type))
+    return len(states)
+
+
+def publish_alert_transition(alert: Alert, transition: str) -> None:
+    """Publish an alert state change on the live update bus.
+
+    Args:
+        alert: The alert that changed (must have been flushed so it has an ID).
+        transition: What happened (opened, escalated, acknowledged, resolved).
+    """
+    publish(
+        EventTopic.ALERT,
+        {
+            "alert_id": alert.id,
+            "server_id": alert.server_id,
+            "alert_type": alert.alert_type,
+            "severity": alert.severity,
+            "status": alert.status,
+            "transition": transition,
+        },
+    )
+
+
 async def get_active_alerts_count(session: AsyncSession, server_id: str) -> int:
     """Get count of active alerts for a server.
 
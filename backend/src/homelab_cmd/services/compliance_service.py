@@ -4,8 +4,10 @@ Part of EP0010: Configuration Management - US0117 Configuration Compliance Check
 """
 
 import asyncio
+import hashlib
 import logging
 import re
+import shlex
 from datetime import UTC, datetime
 
 from packaging import version
@@ -29,6 +31,10 @@ from homelab_cmd.services.ssh_executor import (
 
 logger = logging.getLogger(__name__)
 
+# Markers in manifest check output
+MANIFEST_DIGEST_PREFIX = "@@digest "
+MANIFEST_SECTION_PREFIX = "@@section "
+
 
 class ComplianceCheckError(Exception):
     """Error raised for compliance check issues."""
@@ -51,6 +57,13 @@ class SSHUnavailableError(ComplianceCheckError):
         super().__init__(message)
 
 
+class ManifestCheckError(ComplianceCheckError):
+    """Raised when a manifest check cannot read the host's state."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
 class ComplianceCheckService:
     """Service for checking configuration compliance via SSH.
 
@@ -77,6 +90,7 @@ class ComplianceCheckService:
         session: AsyncSession,
         server: Server,
         pack_name: str,
+        use_manifest: bool = False,
     ) -> ConfigCheckResponse:
         """Check a server's compliance against a configuration pack.
 
@@ -84,6 +98,8 @@ class ComplianceCheckService:
             session: Database session for storing results.
             server: Server to check.
             pack_name: Name of the configuration pack.
+            use_manifest: Check everything in one SSH command and reuse the
+                previous result when the host's manifest digest is unchanged.
 
         Returns:
             ConfigCheckResponse with compliance status and mismatches.
@@ -91,6 +107,7 @@ class ComplianceCheckService:
         Raises:
             ConfigPackError: If pack cannot be loaded.
             SSHUnavailableError: If SSH connection fails.
+            ManifestCheckError: If the manifest check fails (nothing is stored).
         """
         start_time = datetime.now(UTC)
 
@@ -139,25 +156,31 @@ class ComplianceCheckService:
             raise SSHUnavailableError(f"SSH connection failed: {e}") from e
 
         mismatches: list[MismatchItem] = []
+        manifest_digest: str | None = None
+        use_sudo = config_user != username
 
-        # Check files (use config_user for home directory expansion)
-        # Use sudo when SSH user differs from config user
-        if pack.items.files:
-            use_sudo = config_user != username
-            file_mismatches = await self._check_files(
-                client, config_user, pack.items.files, use_sudo=use_sudo
+        if use_manifest:
+            mismatches, manifest_digest = await self._check_manifest(
+                session, client, server.id, pack_name, pack, config_user, use_sudo
             )
-            mismatches.extend(file_mismatches)
+        else:
+            # Check files (use config_user for home directory expansion)
+            # Use sudo when SSH user differs from config user
+            if pack.items.files:
+                file_mismatches = await self._check_files(
+                    client, config_user, pack.items.files, use_sudo=use_sudo
+                )
+                mismatches.extend(file_mismatches)
 
-        # Check packages
-        if pack.items.packages:
-            package_mismatches = await self._check_packages(client, pack.items.packages)
-            mismatches.extend(package_mismatches)
+            # Check packages
+            if pack.items.packages:
+                package_mismatches = await self._check_packages(client, pack.items.packages)
+                mismatches.extend(package_mismatches)
 
-        # Check settings
-        if pack.items.settings:
-            setting_mismatches = await self._check_settings(client, pack.items.settings)
-            mismatches.extend(setting_mismatches)
+            # Check settings
+            if pack.items.settings:
+                setting_mismatches = await self._check_settings(client, pack.items.settings)
+                mismatches.extend(setting_mismatches)
 
         # Calculate duration
         end_time = datetime.now(UTC)
@@ -175,7 +198,7 @@ class ComplianceCheckService:
         )
 
         # Store result in database
-        await self._store_result(session, response)
+        await self._store_result(session, response, manifest_digest)
 
         return response
 
@@ -201,8 +224,29 @@ class ComplianceCheckService:
         if not files:
             return []
 
-        mismatches = []
+        batch_command = self._file_check_command(username, files, use_sudo)
+
+        try:
+            result = await asyncio.to_thread(
+                self._execute_command, client, batch_command
+            )
+        except Exception as e:
+            logger.warning("Failed to check files via SSH: %s", e)
+            return []
+
+        return self._parse_file_check(result, files)
+
+    def _file_check_command(self, username: str, files: list, use_sudo: bool) -> str:
+        """Build the command reporting existence, mode and hash of each file.
+
+        Args:
+            username: Config user for home directory expansion.
+            files: List of FileItem objects to check.
+            use_sudo: Whether to use sudo for file access.
 
+        Returns:
+            Shell command printing one PATH|EXISTS|MODE|HASH line per file.
+        """
         # Build batch command for all files
         # Expand ~ to actual home directory
         home_dir = f"/home/{username}" if username != "root" else "/root"
@@ -233,15 +277,19 @@ class ComplianceCheckService:
             )
             commands.append(cmd)
 
-        batch_command = " && ".join(commands)
+        return " && ".join(commands)
 
-        try:
-            result = await asyncio.to_thread(
-                self._execute_command, client, batch_command
-            )
-        except Exception as e:
-            logger.warning("Failed to check files via SSH: %s", e)
-            return mismatches
+    def _parse_file_check(self, result: str, files: list) -> list[MismatchItem]:
+        """Compare file check output against the expected files.
+
+        Args:
+            result: Output of the file check command.
+            files: List of FileItem objects checked.
+
+        Returns:
+            List of mismatches found.
+        """
+        mismatches = []
 
         # Parse results
         lines = result.strip().split("\n") if result.strip() else []
@@ -329,23 +377,46 @@ class ComplianceCheckService:
         if not packages:
             return []
 
-        mismatches = []
+        command = self._package_check_command(packages)
+
+        try:
+            result = await asyncio.to_thread(self._execute_command, client, command)
+        except Exception as e:
+            logger.warning("Failed to check packages via SSH: %s", e)
+            return []
+
+        return self._parse_package_check(result, packages)
 
+    def _package_check_command(self, packages: list) -> str:
+        """Build the dpkg query reporting the status of each package.
+
+        Args:
+            packages: List of PackageItem objects to check.
+
+        Returns:
+            Shell command printing package<tab>version<tab>status lines.
+        """
         # Get all package names
         package_names = [p.name for p in packages]
 
         # Query dpkg for package status
         # Format: package<tab>version<tab>status
-        command = (
+        return (
             f"dpkg-query -W -f='${{Package}}\\t${{Version}}\\t${{Status}}\\n' "
             f"{' '.join(package_names)} 2>/dev/null || true"
         )
 
-        try:
-            result = await asyncio.to_thread(self._execute_command, client, command)
-        except Exception as e:
-            logger.warning("Failed to check packages via SSH: %s", e)
-            return mismatches
+    def _parse_package_check(self, result: str, packages: list) -> list[MismatchItem]:
+        """Compare dpkg query output against the expected packages.
+
+        Args:
+            result: Output of the package check command.
+            packages: List of PackageItem objects checked.
+
+        Returns:
+            List of mismatches found.
+        """
+        mismatches = []
 
         # Parse results into dict
         installed_packages: dict[str, str] = {}
@@ -426,9 +497,7 @@ class ComplianceCheckService:
         if not env_settings:
             return mismatches
 
-        # Build command to echo all env vars
-        echo_commands = [f'echo "{s.key}=${{{s.key}}}"' for s in env_settings]
-        command = " && ".join(echo_commands)
+        command = self._settings_check_command(env_settings)
 
         try:
             result = await asyncio.to_thread(self._execute_command, client, command)
@@ -436,6 +505,33 @@ class ComplianceCheckService:
             logger.warning("Failed to check settings via SSH: %s", e)
             return mismatches
 
+        return self._parse_settings_check(result, env_settings)
+
+    def _settings_check_command(self, env_settings: list) -> str:
+        """Build the command echoing each environment variable setting.
+
+        Args:
+            env_settings: List of env_var SettingItem objects to check.
+
+        Returns:
+            Shell command printing one KEY=value line per setting.
+        """
+        # Build command to echo all env vars
+        echo_commands = [f'echo "{s.key}=${{{s.key}}}"' for s in env_settings]
+        return " && ".join(echo_commands)
+
+    def _parse_settings_check(self, result: str, env_settings: list) -> list[MismatchItem]:
+        """Compare echoed environment variables against the expected settings.
+
+        Args:
+            result: Output of the settings check command.
+            env_settings: List of env_var SettingItem objects checked.
+
+        Returns:
+            List of mismatches found.
+        """
+        mismatches = []
+
         # Parse results
         env_values: dict[str, str] = {}
         for line in result.strip().split("\n"):
@@ -458,6 +554,119 @@ class ComplianceCheckService:
 
         return mismatches
 
+    async def _check_manifest(
+        self,
+        session: AsyncSession,
+        client,
+        server_id: str,
+        pack_name: str,
+        pack,
+        username: str,
+        use_sudo: bool,
+    ) -> tuple[list[MismatchItem], str | None]:
+        """Check all pack items with one SSH command.
+
+        The remote side gathers file hashes, package versions and settings
+        into a manifest and prints its sha256 digest. The digest also covers
+        the pack definition, so it only repeats when neither the host nor the
+        pack has changed. The full manifest is only sent back when the digest
+        differs from the one stored with the last check; otherwise that
+        check's mismatches still apply.
+
+        Args:
+            session: Database session for reading the last manifest digest.
+            client: SSH client connection.
+            server_id: Server identifier.
+            pack_name: Name of the configuration pack.
+            pack: Configuration pack to check.
+            username: Config user for home directory expansion.
+            use_sudo: Whether to use sudo for file access.
+
+        Returns:
+            Tuple of mismatches and the host's manifest digest.
+
+        Raises:
+            ManifestCheckError: If the command fails or its output cannot
+                be parsed.
+        """
+        env_settings = [s for s in pack.items.settings if s.type == "env_var"]
+        sections = []
+        if pack.items.files:
+            sections.append(
+                ("files", self._file_check_command(username, pack.items.files, use_sudo))
+            )
+        if pack.items.packages:
+            sections.append(("packages", self._package_check_command(pack.items.packages)))
+        if env_settings:
+            sections.append(("settings", self._settings_check_command(env_settings)))
+
+        if not sections:
+            return [], None
+
+        body = "; ".join(
+            f"echo '{MANIFEST_SECTION_PREFIX}{name}'; {command}" for name, command in sections
+        )
+        pack_digest = hashlib.sha256(
+            f"{pack.items.model_dump_json()}\n{body}".encode()
+        ).hexdigest()
+
+        previous = await session.execute(
+            select(ConfigCheck.manifest_digest, ConfigCheck.mismatches)
+            .where(ConfigCheck.server_id == server_id)
+            .where(ConfigCheck.pack_name == pack_name)
+            .order_by(ConfigCheck.checked_at.desc())
+            .limit(1)
+        )
+        last_digest, last_mismatches = previous.one_or_none() or (None, None)
+
+        command = (
+            f"m=$({{ {body}; }} 2>/dev/null); "
+            f"d=$(printf '%s\\n%s' {pack_digest} \"$m\" | sha256sum | cut -d' ' -f1); "
+            f'echo "{MANIFEST_DIGEST_PREFIX}$d"; '
+            f"[ \"$d\" = {shlex.quote(last_digest or '')} ] || printf '%s\\n' \"$m\""
+        )
+
+        try:
+            result = await asyncio.to_thread(self._execute_command, client, command)
+        except Exception as e:
+            raise ManifestCheckError(f"Failed to check manifest via SSH: {e}") from e
+
+        lines = result.strip().split("\n")
+        if not lines[0].startswith(MANIFEST_DIGEST_PREFIX):
+            raise ManifestCheckError(f"Unexpected manifest output from server {server_id}")
+        digest = lines[0][len(MANIFEST_DIGEST_PREFIX) :]
+
+        if digest == last_digest and len(lines) == 1:
+            logger.debug("Manifest unchanged for server %s pack %s", server_id, pack_name)
+            return [MismatchItem.model_validate(m) for m in last_mismatches or []], digest
+
+        outputs: dict[str, list[str]] = {}
+        current: list[str] = []
+        for line in lines[1:]:
+            if line.startswith(MANIFEST_SECTION_PREFIX):
+                current = outputs.setdefault(line[len(MANIFEST_SECTION_PREFIX) :], [])
+            else:
+                current.append(line)
+
+        mismatches: list[MismatchItem] = []
+        if pack.items.files:
+            mismatches.extend(
+                self._parse_file_check("\n".join(outputs.get("files", [])), pack.items.files)
+            )
+        if pack.items.packages:
+            mismatches.extend(
+                self._parse_package_check(
+                    "\n".join(outputs.get("packages", [])), pack.items.packages
+                )
+            )
+        if env_settings:
+            mismatches.extend(
+                self._parse_settings_check(
+                    "\n".join(outputs.get("settings", [])), env_settings
+                )
+            )
+        return mismatches, digest
+
     def _execute_command(self, client, command: str) -> str:
         """Execute SSH command and return stdout.
 
@@ -513,12 +722,14 @@ class ComplianceCheckService:
         self,
         session: AsyncSession,
         response: ConfigCheckResponse,
+        manifest_digest: str | None = None,
     ) -> None:
         """Store compliance check result in database.
 
         Args:
             session: Database session.
             response: Compliance check response to store.
+            manifest_digest: Host manifest digest from a manifest check.
         """
         check = ConfigCheck(
             server_id=response.server_id,
@@ -527,6 +738,7 @@ class ComplianceCheckService:
             mismatches=[m.model_dump() for m in response.mismatches],
             checked_at=response.checked_at,
             check_duration_ms=response.check_duration_ms,
+            manifest_digest=manifest_digest,
         )
         session.add(check)
         await session.commit()
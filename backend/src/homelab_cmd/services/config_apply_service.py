@@ -6,7 +6,14 @@ Part of EP0010: Configuration Management:
 """
 
 import asyncio
+import io
 import logging
+import posixpath
+import shlex
+import tarfile
+import threading
+import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 
 from sqlalchemy import select
@@ -27,6 +34,7 @@ from homelab_cmd.api.schemas.config_apply import (
 )
 from homelab_cmd.db.models import ConfigApply, ConfigApplyStatus, Server
 from homelab_cmd.services.config_pack_service import ConfigPackError, ConfigPackService
+from homelab_cmd.services.event_bus import EventTopic, publish
 from homelab_cmd.services.ssh_executor import (
     SSHAuthenticationError,
     SSHConnectionError,
@@ -36,6 +44,26 @@ from homelab_cmd.services.ssh_executor import (
 
 logger = logging.getLogger(__name__)
 
+# Minimum interval between progress commits during a batched apply
+PROGRESS_COMMIT_INTERVAL_SECONDS = 1.0
+
+# Channel timeout for a batched apply, plus an allowance per package
+BATCH_TIMEOUT_SECONDS = 60
+PACKAGE_INSTALL_TIMEOUT_SECONDS = 120
+
+# Prefix of the per-item result lines printed by the batch script
+BATCH_RESULT_MARKER = "HOMELABCMD_RESULT"
+
+# Unpacks the file archive from stdin and defines report(), which prints
+# "<marker>\t<index>\t<exit code>\t<last lines of output>" for an item
+BATCH_SCRIPT_PREAMBLE = f"""tmp=$(mktemp -d) || exit 1
+trap 'rm -rf "$tmp"' EXIT
+tar -xf - -C "$tmp" || exit 1
+report() {{
+    printf '{BATCH_RESULT_MARKER}\\t%s\\t%s\\t%s\\n' "$1" "$2" \\
+        "$(printf '%s' "$3" | tail -n 5 | tr '\\t\\n' '  ')"
+}}"""
+
 
 class ConfigApplyError(Exception):
     """Error raised for config apply issues."""
@@ -66,6 +94,34 @@ class ApplyAlreadyRunningError(ConfigApplyError):
         super().__init__(f"An apply operation is already running for server: {server_id}")
 
 
+def _parse_batch_result(line: str) -> tuple[int, int, str] | None:
+    """Parse a batch script result line into (index, exit code, message)."""
+    parts = line.rstrip("\n").split("\t", 3)
+    if len(parts) != 4 or parts[0] != BATCH_RESULT_MARKER:
+        return None
+    try:
+        return int(parts[1]), int(parts[2]), parts[3].strip()
+    except ValueError:
+        return None
+
+
+def _publish_apply_progress(apply_record: ConfigApply) -> None:
+    """Publish a config apply's progress on the live update bus."""
+    publish(
+        EventTopic.APPLY_PROGRESS,
+        {
+            "apply_id": apply_record.id,
+            "server_id": apply_record.server_id,
+            "pack_name": apply_record.pack_name,
+            "status": apply_record.status,
+            "progress": apply_record.progress,
+            "current_item": apply_record.current_item,
+            "items_completed": apply_record.items_completed,
+            "items_failed": apply_record.items_failed,
+        },
+    )
+
+
 class ConfigApplyService:
     """Service for applying configuration packs via SSH.
 
@@ -268,6 +324,7 @@ class ConfigApplyService:
         self,
         apply_record: ConfigApply,
         session: AsyncSession,
+        batched: bool = True,
     ) -> None:
         """Execute the apply operation.
 
@@ -276,6 +333,8 @@ class ConfigApplyService:
         Args:
             apply_record: Apply record to execute.
             session: Database session.
+            batched: Apply every item in one SSH session (default) rather
+                than running separate commands per item.
         """
         start_time = datetime.now(UTC)
 
@@ -329,60 +388,16 @@ class ConfigApplyService:
                 return
 
             # Execute apply items
-            results: list[ApplyItemResult] = []
-            items_completed = 0
-            items_failed = 0
-
-            # Apply files
-            for file_item in pack.items.files:
-                apply_record.current_item = file_item.path
-                await session.commit()
-
-                item_result = await self._apply_file(client, username, file_item)
-                results.append(item_result)
-
-                if item_result.success:
-                    items_completed += 1
-                else:
-                    items_failed += 1
-
-                await self._update_progress(
-                    apply_record, session, results, items_completed, items_failed
+            if batched:
+                results = await self._apply_batched(
+                    client, username, pack, apply_record, session
                 )
-
-            # Apply packages
-            for pkg_item in pack.items.packages:
-                apply_record.current_item = f"package:{pkg_item.name}"
-                await session.commit()
-
-                item_result = await self._apply_package(client, pkg_item)
-                results.append(item_result)
-
-                if item_result.success:
-                    items_completed += 1
-                else:
-                    items_failed += 1
-
-                await self._update_progress(
-                    apply_record, session, results, items_completed, items_failed
-                )
-
-            # Apply settings
-            for setting_item in pack.items.settings:
-                apply_record.current_item = f"setting:{setting_item.key}"
-                await session.commit()
-
-                item_result = await self._apply_setting(client, username, setting_item)
-                results.append(item_result)
-
-                if item_result.success:
-                    items_completed += 1
-                else:
-                    items_failed += 1
-
-                await self._update_progress(
-                    apply_record, session, results, items_completed, items_failed
+            else:
+                results = await self._apply_items(
+                    client, username, pack, apply_record, session
                 )
+            items_completed = sum(1 for r in results if r.success)
+            items_failed = len(results) - items_completed
 
             # Complete the apply
             end_time = datetime.now(UTC)
@@ -390,8 +405,11 @@ class ConfigApplyService:
             apply_record.completed_at = end_time
             apply_record.current_item = None
             apply_record.progress = 100
+            apply_record.items_completed = items_completed
+            apply_record.items_failed = items_failed
             apply_record.results = [r.model_dump() for r in results]
             await session.commit()
+            _publish_apply_progress(apply_record)
 
             logger.info(
                 "Config apply %d completed: %d/%d succeeded for server %s",
@@ -412,6 +430,234 @@ class ConfigApplyService:
             logger.exception("Apply operation %d failed: %s", apply_record.id, e)
             await self._fail_apply(apply_record, session, str(e))
 
+    async def _apply_items(
+        self,
+        client,
+        username: str,
+        pack,
+        apply_record: ConfigApply,
+        session: AsyncSession,
+    ) -> list[ApplyItemResult]:
+        """Apply pack items one at a time, committing progress after each.
+
+        Args:
+            client: SSH client connection.
+            username: SSH username for home directory expansion.
+            pack: Configuration pack to apply.
+            apply_record: Apply record to update with progress.
+            session: Database session.
+
+        Returns:
+            Per-item results in pack order.
+        """
+        results: list[ApplyItemResult] = []
+        items_completed = 0
+        items_failed = 0
+
+        # Apply files
+        for file_item in pack.items.files:
+            apply_record.current_item = file_item.path
+            await session.commit()
+
+            item_result = await self._apply_file(client, username, file_item)
+            results.append(item_result)
+
+            if item_result.success:
+                items_completed += 1
+            else:
+                items_failed += 1
+
+            await self._update_progress(
+                apply_record, session, results, items_completed, items_failed
+            )
+
+        # Apply packages
+        for pkg_item in pack.items.packages:
+            apply_record.current_item = f"package:{pkg_item.name}"
+            await session.commit()
+
+            item_result = await self._apply_package(client, pkg_item)
+            results.append(item_result)
+
+            if item_result.success:
+                items_completed += 1
+            else:
+                items_failed += 1
+
+            await self._update_progress(
+                apply_record, session, results, items_completed, items_failed
+            )
+
+        # Apply settings
+        for setting_item in pack.items.settings:
+            apply_record.current_item = f"setting:{setting_item.key}"
+            await session.commit()
+
+            item_result = await self._apply_setting(client, username, setting_item)
+            results.append(item_result)
+
+            if item_result.success:
+                items_completed += 1
+            else:
+                items_failed += 1
+
+            await self._update_progress(
+                apply_record, session, results, items_completed, items_failed
+            )
+
+        return results
+
+    async def _apply_batched(
+        self,
+        client,
+        username: str,
+        pack,
+        apply_record: ConfigApply,
+        session: AsyncSession,
+    ) -> list[ApplyItemResult]:
+        """Apply all pack items in a single SSH command.
+
+        File contents are sent as a tar archive on stdin. One script unpacks
+        them, installs every package in one apt-get transaction and writes
+        every setting, printing a result line per item as it goes. Progress
+        is committed at most once per PROGRESS_COMMIT_INTERVAL_SECONDS.
+
+        Args:
+            client: SSH client connection.
+            username: SSH username for home directory expansion.
+            pack: Configuration pack to apply.
+            apply_record: Apply record to update with progress.
+            session: Database session.
+
+        Returns:
+            Per-item results in pack order.
+        """
+        home_dir = f"/home/{username}" if username != "root" else "/root"
+        labels: list[tuple[str, str, str]] = []
+        results: dict[int, ApplyItemResult] = {}
+        script = [BATCH_SCRIPT_PREAMBLE]
+        archive = io.BytesIO()
+
+        with tarfile.open(fileobj=archive, mode="w") as tar:
+            for file_item in pack.items.files:
+                index = len(labels)
+                labels.append((file_item.path, "created", file_item.path))
+                path = file_item.path.replace("~", home_dir)
+                try:
+                    content = (
+                        self._pack_service.get_template_content(file_item.template)
+                        if file_item.template
+                        else ""
+                    )
+                except Exception as e:
+                    results[index] = ApplyItemResult(
+                        item=file_item.path, action="created", success=False, error=str(e)
+                    )
+                    continue
+
+                # Trailing newline matches the heredoc used by per-item apply
+                data = f"{content}\n".encode()
+                member = tarfile.TarInfo(name=str(index))
+                member.size = len(data)
+                tar.addfile(member, io.BytesIO(data))
+
+                steps = []
+                parent_dir = posixpath.dirname(path)
+                if parent_dir:
+                    steps.append(f"mkdir -p {shlex.quote(parent_dir)}")
+                steps.append(f'cat "$tmp/{index}" > {shlex.quote(path)}')
+                steps.append(f"chmod {shlex.quote(file_item.mode)} {shlex.quote(path)}")
+                script.append(
+                    f'out=$( {{ {" && ".join(steps)}; }} 2>&1 ); report {index} $? "$out"'
+                )
+
+        if pack.items.packages:
+            names = " ".join(shlex.quote(p.name) for p in pack.items.packages)
+            script.append(f"out=$(sudo apt-get install -y {names} 2>&1); rc=$?")
+            for pkg_item in pack.items.packages:
+                index = len(labels)
+                labels.append((pkg_item.name, "installed", f"package:{pkg_item.name}"))
+                name = shlex.quote(pkg_item.name)
+                script.append(
+                    f'if [ $rc -eq 0 ] || dpkg-query -W -f=\'${{Status}}\' {name} 2>/dev/null'
+                    f" | grep -q 'ok installed'; then report {index} 0 \"\";"
+                    f' else report {index} $rc "$out"; fi'
+                )
+
+        bashrc_d = f"{home_dir}/.bashrc.d"
+        env_file = f"{bashrc_d}/env.sh"
+        for setting_item in pack.items.settings:
+            index = len(labels)
+            if setting_item.type != "env_var":
+                labels.append((setting_item.key, "set", f"setting:{setting_item.key}"))
+                results[index] = ApplyItemResult(
+                    item=setting_item.key,
+                    action="set",
+                    success=False,
+                    error=f"Unsupported setting type: {setting_item.type}",
+                )
+                continue
+
+            labels.append((f"env:{setting_item.key}", "set", f"setting:{setting_item.key}"))
+            escaped_value = setting_item.expected.replace('"', '\\"')
+            line = f'export {setting_item.key}="{escaped_value}"'
+            script.append(
+                f"out=$( {{ mkdir -p {shlex.quote(bashrc_d)}"
+                f" && printf '%s\\n' {shlex.quote(line)} >> {shlex.quote(env_file)}; }} 2>&1 );"
+                f' report {index} $? "$out"'
+            )
+
+        def ordered() -> list[ApplyItemResult]:
+            return [results[i] for i in sorted(results)]
+
+        last_commit = time.monotonic()
+
+        async def on_line(line: str) -> None:
+            nonlocal last_commit
+            parsed = _parse_batch_result(line)
+            if parsed is None or not 0 <= parsed[0] < len(labels):
+                return
+            index, exit_code, message = parsed
+            item, action, current_item = labels[index]
+            results[index] = ApplyItemResult(
+                item=item,
+                action=action,
+                success=exit_code == 0,
+                error=None if exit_code == 0 else message or f"Exit code {exit_code}",
+            )
+            apply_record.current_item = current_item
+
+            if time.monotonic() - last_commit >= PROGRESS_COMMIT_INTERVAL_SECONDS:
+                completed = sum(1 for r in results.values() if r.success)
+                await self._update_progress(
+                    apply_record, session, ordered(), completed, len(results) - completed
+                )
+                last_commit = time.monotonic()
+
+        # Local failures only: nothing to send
+        if len(script) > 1:
+            timeout = BATCH_TIMEOUT_SECONDS + PACKAGE_INSTALL_TIMEOUT_SECONDS * len(
+                pack.items.packages
+            )
+            try:
+                outcome = await self._stream_command(
+                    client, "\n".join(script), archive.getvalue(), on_line, timeout
+                )
+                missing_error = (
+                    f"No result reported (exit code {outcome['exit_code']}):"
+                    f" {outcome['stderr'].strip()}"
+                )
+            except Exception as e:
+                missing_error = str(e)
+
+            for index, (item, action, _current) in enumerate(labels):
+                if index not in results:
+                    results[index] = ApplyItemResult(
+                        item=item, action=action, success=False, error=missing_error
+                    )
+
+        return ordered()
+
     async def _apply_file(
         self,
         client,
@@ -619,6 +865,59 @@ class ConfigApplyService:
 
         return await asyncio.to_thread(_exec_sync)
 
+    async def _stream_command(
+        self,
+        client,
+        command: str,
+        stdin_data: bytes,
+        on_line: Callable[[str], Awaitable[None]],
+        timeout: int,
+    ) -> dict:
+        """Execute SSH command with data on stdin, handling output as it arrives.
+
+        Args:
+            client: SSH client connection.
+            command: Command to execute.
+            stdin_data: Bytes written to the command's stdin before closing it.
+            on_line: Coroutine called with each stdout line.
+            timeout: Channel timeout in seconds.
+
+        Returns:
+            Dict with exit_code, stderr.
+        """
+        loop = asyncio.get_running_loop()
+        lines: asyncio.Queue[str | None] = asyncio.Queue()
+
+        def _exec_sync():
+            try:
+                stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+                # Drain stderr alongside stdout so a command writing a lot of
+                # it does not stall on a full channel window
+                stderr_chunks: list[bytes] = []
+                stderr_reader = threading.Thread(
+                    target=lambda: stderr_chunks.append(stderr.read()), daemon=True
+                )
+                stderr_reader.start()
+                stdin.write(stdin_data)
+                stdin.channel.shutdown_write()
+                for line in stdout:
+                    if isinstance(line, bytes):
+                        line = line.decode("utf-8", errors="replace")
+                    loop.call_soon_threadsafe(lines.put_nowait, line)
+                exit_code = stdout.channel.recv_exit_status()
+                stderr_reader.join()
+                return {
+                    "exit_code": exit_code,
+                    "stderr": b"".join(stderr_chunks).decode("utf-8", errors="replace"),
+                }
+            finally:
+                loop.call_soon_threadsafe(lines.put_nowait, None)
+
+        execution = asyncio.ensure_future(asyncio.to_thread(_exec_sync))
+        while (line := await lines.get()) is not None:
+            await on_line(line)
+        return await execution
+
     async def _update_progress(
         self,
         apply_record: ConfigApply,
@@ -648,6 +947,7 @@ class ConfigApplyService:
         apply_record.items_failed = items_failed
         apply_record.results = [r.model_dump() for r in results]
         await session.commit()
+        _publish_apply_progress(apply_record)
 
     async def _fail_apply(
         self,
@@ -667,6 +967,7 @@ class ConfigApplyService:
         apply_record.error = error_message
         apply_record.current_item = None
         await session.commit()
+        _publish_apply_progress(apply_record)
 
         logger.error(
             "Config apply %d failed for server %s: %s",
@@ -1,10 +1,12 @@
 """Service for loading and managing configuration packs."""
 
 import logging
+import os
+import threading
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
 from pydantic import ValidationError
 
 from homelab_cmd.api.schemas.config_pack import (
@@ -13,6 +15,13 @@ from homelab_cmd.api.schemas.config_pack import (
     PackItems,
 )
 from homelab_cmd.config import get_settings
+from homelab_cmd.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    import yaml
+else:
+    # Loaded on first use rather than at startup
+    yaml = lazy_import("yaml")
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +32,209 @@ class ConfigPackError(Exception):
     pass
 
 
+def _scan_files(directory: Path, suffix: str = "") -> dict[str, os.stat_result]:
+    """Stat the regular files in a directory, keyed by filename."""
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                entry.name: entry.stat()
+                for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()
+            }
+    except FileNotFoundError:
+        return {}
+
+
+def _scan_tree(directory: Path, prefix: str = "") -> dict[str, os.stat_result]:
+    """Stat the regular files under a directory, keyed by relative POSIX path."""
+    stats: dict[str, os.stat_result] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stats.update(_scan_tree(Path(entry.path), f"{prefix}{entry.name}/"))
+                elif entry.is_file():
+                    stats[f"{prefix}{entry.name}"] = entry.stat()
+    except FileNotFoundError:
+        return {}
+    return stats
+
+
+def _template_key(template_name: str) -> str:
+    """Normalise a template reference to its key in the template scan."""
+    return os.path.normpath(template_name).replace(os.sep, "/")
+
+
+def _signature(stat: os.stat_result | None) -> tuple[int, int] | None:
+    """Identify a file version by modification time and size."""
+    return (stat.st_mtime_ns, stat.st_size) if stat else None
+
+
+class PackRegistry:
+    """Parsed packs and templates for one packs directory, shared process-wide.
+
+    Every access re-stats the directory (no file reads or YAML parsing) and
+    only re-reads files whose mtime or size changed. Templates are scanned
+    recursively, keyed by their path under templates/, since packs may
+    reference them in subdirectories. Resolved packs are
+    dropped when the pack, or any pack it extends, changes; all of them are
+    dropped when templates are added or removed, as resolving validates
+    template references.
+    """
+
+    def __init__(self, packs_dir: Path) -> None:
+        """Initialise an empty registry.
+
+        Args:
+            packs_dir: Directory containing pack YAML files.
+        """
+        self.packs_dir = packs_dir
+        self.templates_dir = packs_dir / "templates"
+        self.resolved: dict[str, ConfigPack] = {}
+        self._lock = threading.Lock()
+        self._pack_stats: dict[str, os.stat_result] = {}
+        self._raw: dict[str, ConfigPack | ConfigPackError] = {}
+        self._dependents: dict[str, set[str]] = {}
+        self._template_stats: dict[str, os.stat_result] = {}
+        self._templates: dict[str, str] = {}
+
+    def refresh(self) -> None:
+        """Re-read any pack or template files changed since the last access."""
+        with self._lock:
+            pack_stats = {
+                name.removesuffix(".yaml"): stat
+                for name, stat in _scan_files(self.packs_dir, ".yaml").items()
+            }
+            changed = {
+                name
+                for name in pack_stats.keys() | self._pack_stats.keys()
+                if _signature(pack_stats.get(name)) != _signature(self._pack_stats.get(name))
+            }
+            self._pack_stats = pack_stats
+
+            if changed:
+                for name in changed:
+                    if name in pack_stats:
+                        self._raw[name] = self._parse(name)
+                    else:
+                        self._raw.pop(name, None)
+                self._invalidate(changed)
+
+            template_stats = _scan_tree(self.templates_dir)
+            for name in template_stats.keys() | self._template_stats.keys():
+                if _signature(template_stats.get(name)) != _signature(
+                    self._template_stats.get(name)
+                ):
+                    self._templates.pop(name, None)
+            if template_stats.keys() != self._template_stats.keys():
+                self.resolved.clear()
+            self._template_stats = template_stats
+
+    def clear(self) -> None:
+        """Forget everything so the next access re-reads every file."""
+        with self._lock:
+            self.resolved.clear()
+            self._pack_stats.clear()
+            self._raw.clear()
+            self._dependents.clear()
+            self._template_stats.clear()
+            self._templates.clear()
+
+    def _parse(self, pack_name: str) -> ConfigPack | ConfigPackError:
+        """Parse a pack file, returning the error if it is invalid."""
+        pack_path = self.packs_dir / f"{pack_name}.yaml"
+        try:
+            with open(pack_path) as f:
+                data = yaml.safe_load(f)
+            if data is None:
+                return ConfigPackError(f"Empty pack file: {pack_path}")
+            return ConfigPack.model_validate(data)
+        except OSError as e:
+            return ConfigPackError(f"Cannot read {pack_path}: {e}")
+        except yaml.YAMLError as e:
+            return ConfigPackError(f"Invalid YAML in {pack_path}: {e}")
+        except ValidationError as e:
+            return ConfigPackError(f"Invalid pack schema in {pack_path}: {e}")
+
+    def _invalidate(self, changed: set[str]) -> None:
+        """Rebuild the extends graph and drop resolved packs affected by a change."""
+        self._dependents = {}
+        for name, pack in self._raw.items():
+            if isinstance(pack, ConfigPack) and pack.extends:
+                self._dependents.setdefault(pack.extends, set()).add(name)
+
+        stale = set(changed)
+        pending = list(changed)
+        while pending:
+            for dependent in self._dependents.get(pending.pop(), ()):
+                if dependent not in stale:
+                    stale.add(dependent)
+                    pending.append(dependent)
+        for name in stale:
+            self.resolved.pop(name, None)
+
+    def pack_names(self) -> list[str]:
+        """Names of all pack files, sorted."""
+        return sorted(self._pack_stats)
+
+    def raw_pack(self, pack_name: str) -> ConfigPack:
+        """Get a parsed pack without resolving extends.
+
+        Raises:
+            ConfigPackError: If the pack file is missing or invalid.
+        """
+        pack = self._raw.get(pack_name)
+        if pack is None:
+            raise ConfigPackError(f"Pack file not found: {self.packs_dir / f'{pack_name}.yaml'}")
+        if isinstance(pack, ConfigPackError):
+            raise pack
+        return pack
+
+    def last_updated(self, pack_name: str) -> datetime:
+        """Modification time of a pack file."""
+        return datetime.fromtimestamp(self._pack_stats[pack_name].st_mtime, tz=UTC)
+
+    def has_template(self, template_name: str) -> bool:
+        """Whether a template file exists."""
+        return _template_key(template_name) in self._template_stats
+
+    def template(self, template_name: str) -> str:
+        """Get a template's content, reading it from disk once per version.
+
+        Raises:
+            ConfigPackError: If the template does not exist.
+        """
+        key = _template_key(template_name)
+        content = self._templates.get(key)
+        if content is None:
+            template_path = self.templates_dir / template_name
+            if key not in self._template_stats:
+                raise ConfigPackError(f"Template not found: {template_path}")
+            content = template_path.read_text()
+            self._templates[key] = content
+        return content
+
+
+_registries: dict[Path, PackRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_pack_registry(packs_dir: Path) -> PackRegistry:
+    """Get the process-wide registry for a packs directory."""
+    with _registries_lock:
+        registry = _registries.get(packs_dir)
+        if registry is None:
+            registry = _registries[packs_dir] = PackRegistry(packs_dir)
+        return registry
+
+
 class ConfigPackService:
     """Service for loading and managing configuration packs.
 
     Loads pack definitions from YAML files in the data/config-packs/ directory.
-    Supports pack inheritance via the 'extends' field.
+    Supports pack inheritance via the 'extends' field. Parsed packs and
+    templates are held in a PackRegistry shared by every instance for the
+    same directory.
     """
 
     def __init__(self, packs_dir: Path | None = None) -> None:
@@ -43,7 +250,7 @@ class ConfigPackService:
 
         self.packs_dir = packs_dir
         self.templates_dir = packs_dir / "templates"
-        self._pack_cache: dict[str, ConfigPack] = {}
+        self._registry = get_pack_registry(packs_dir)
 
     def _get_pack_path(self, pack_name: str) -> Path:
         """Get the file path for a pack by name."""
@@ -61,24 +268,7 @@ class ConfigPackService:
         Raises:
             ConfigPackError: If pack cannot be loaded or parsed
         """
-        pack_path = self._get_pack_path(pack_name)
-
-        if not pack_path.exists():
-            raise ConfigPackError(f"Pack file not found: {pack_path}")
-
-        try:
-            with open(pack_path) as f:
-                data = yaml.safe_load(f)
-
-            if data is None:
-                raise ConfigPackError(f"Empty pack file: {pack_path}")
-
-            return ConfigPack.model_validate(data)
-
-        except yaml.YAMLError as e:
-            raise ConfigPackError(f"Invalid YAML in {pack_path}: {e}") from e
-        except ValidationError as e:
-            raise ConfigPackError(f"Invalid pack schema in {pack_path}: {e}") from e
+        return self._registry.raw_pack(pack_name)
 
     def _validate_templates(self, pack: ConfigPack) -> None:
         """Validate that all referenced template files exist.
@@ -90,13 +280,12 @@ class ConfigPackService:
             ConfigPackError: If any template file is missing
         """
         for file_item in pack.items.files:
-            if file_item.template:
+            if file_item.template and not self._registry.has_template(file_item.template):
                 template_path = self.templates_dir / file_item.template
-                if not template_path.exists():
-                    raise ConfigPackError(
-                        f"Template file not found: {template_path} "
-                        f"(referenced by {file_item.path})"
-                    )
+                raise ConfigPackError(
+                    f"Template file not found: {template_path} "
+                    f"(referenced by {file_item.path})"
+                )
 
     def _resolve_extends(
         self, pack: ConfigPack, pack_name: str, visited: set[str] | None = None
@@ -167,16 +356,20 @@ class ConfigPackService:
         Raises:
             ConfigPackError: If pack cannot be loaded or has errors
         """
+        # Parents are loaded within the top-level call; one rescan covers them
+        if _visited is None:
+            self._registry.refresh()
+
         # Check cache first (only for fully resolved packs)
-        if resolve_extends and pack_name in self._pack_cache:
-            return self._pack_cache[pack_name]
+        if resolve_extends and pack_name in self._registry.resolved:
+            return self._registry.resolved[pack_name]
 
         pack = self._load_pack_raw(pack_name)
         self._validate_templates(pack)
 
         if resolve_extends:
             pack = self._resolve_extends(pack, pack_name, _visited)
-            self._pack_cache[pack_name] = pack
+            self._registry.resolved[pack_name] = pack
 
         return pack
 
@@ -192,15 +385,14 @@ class ConfigPackService:
             logger.warning("Config packs directory does not exist: %s", self.packs_dir)
             return packs
 
-        for pack_path in sorted(self.packs_dir.glob("*.yaml")):
-            pack_name = pack_path.stem
-
+        self._registry.refresh()
+        for pack_name in self._registry.pack_names():
             try:
                 # Load raw pack (without resolving extends) for metadata
                 raw_pack = self._load_pack_raw(pack_name)
 
                 # Get file modification time
-                mtime = datetime.fromtimestamp(pack_path.stat().st_mtime, tz=UTC)
+                mtime = self._registry.last_updated(pack_name)
 
                 # Count items (raw, not resolved - to show pack's own items)
                 item_count = (
@@ -238,13 +430,9 @@ class ConfigPackService:
         Raises:
             ConfigPackError: If template not found
         """
-        template_path = self.templates_dir / template_name
-
-        if not template_path.exists():
-            raise ConfigPackError(f"Template not found: {template_path}")
-
-        return template_path.read_text()
+        self._registry.refresh()
+        return self._registry.template(template_name)
 
     def clear_cache(self) -> None:
-        """Clear the pack cache."""
-        self._pack_cache.clear()
+        """Clear the pack cache, forcing every file to be re-read."""
+        self._registry.clear()
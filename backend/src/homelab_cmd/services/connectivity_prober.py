@@ -0,0 +1,216 @@
+"""Background connectivity prober for US0080.
+
+The dashboard status bar polls connectivity status every 60 seconds from
+every open tab. Working that out live means a Tailscale API round trip (or
+three) per poll, so a scheduled job probes connectivity instead and keeps
+the result in memory:
+
+- The status bar is answered from the latest snapshot without touching the
+  Tailscale API.
+- The settings page takes its Tailscale details from the same snapshot.
+- Each probe is recorded with its duration and outcome, and the last
+  PROBE_HISTORY_SIZE are kept for diagnostics.
+
+Every worker runs its own prober, since each serves from its own memory.
+Changing the connectivity mode or the Tailscale token invalidates the
+snapshot on every worker (via the coordinator), and the next read probes
+afresh.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from homelab_cmd.api.schemas.connectivity import (
+    ConnectivityMode,
+    ConnectivityStatusBarResponse,
+    ConnectivityStatusResponse,
+)
+from homelab_cmd.config import get_settings
+from homelab_cmd.db.session import get_session_factory
+from homelab_cmd.services.connectivity_service import ConnectivityService, status_bar_display
+from homelab_cmd.services.credential_service import CredentialService
+
+logger = logging.getLogger(__name__)
+
+# How often each worker probes connectivity
+CONNECTIVITY_PROBE_INTERVAL_SECONDS = 60
+
+# Snapshots older than this are re-probed on read (e.g. scheduler not running)
+SNAPSHOT_MAX_AGE_SECONDS = 5 * CONNECTIVITY_PROBE_INTERVAL_SECONDS
+
+# Number of probe results kept for diagnostics
+PROBE_HISTORY_SIZE = 60
+
+
+@dataclass
+class ConnectivitySnapshot:
+    """Connectivity status as of the last successful probe."""
+
+    status: ConnectivityStatusResponse
+    probed_at: datetime
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the probe ran."""
+        return (datetime.now(UTC) - self.probed_at).total_seconds()
+
+
+@dataclass
+class ProbeRecord:
+    """Outcome of one connectivity probe."""
+
+    probed_at: datetime
+    duration_ms: float
+    mode: ConnectivityMode | None
+    tailscale_connected: bool
+    device_count: int
+    error: str | None = None
+
+
+class ConnectivityProber:
+    """Probes connectivity on a schedule and serves the latest snapshot."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ) -> None:
+        """Initialise the prober.
+
+        Args:
+            session_factory: Factory for database sessions (default: the
+                application's session factory, resolved on first probe).
+        """
+        self._session_factory = session_factory
+        self._snapshot: ConnectivitySnapshot | None = None
+        self._history: deque[ProbeRecord] = deque(maxlen=PROBE_HISTORY_SIZE)
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def history(self) -> list[ProbeRecord]:
+        """Recent probe results, newest first."""
+        return list(reversed(self._history))
+
+    @property
+    def snapshot(self) -> ConnectivitySnapshot | None:
+        """The latest snapshot, or None if there is none or it is too old."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.age_seconds >= SNAPSHOT_MAX_AGE_SECONDS:
+            return None
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Discard the snapshot so the next read probes afresh."""
+        self._snapshot = None
+        # Drop the result of any probe already in flight
+        self._generation += 1
+
+    async def probe(self) -> ConnectivitySnapshot:
+        """Probe connectivity now and store the result.
+
+        Probes are serialised; a caller that waited on another probe gets
+        that probe's result rather than starting a second one.
+
+        Returns:
+            The new snapshot.
+
+        Raises:
+            Exception: Whatever the probe raised (the previous snapshot is kept).
+        """
+        requested_at = datetime.now(UTC)
+        async with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.probed_at >= requested_at:
+                return snapshot
+            return await self._probe()
+
+    async def _probe(self) -> ConnectivitySnapshot:
+        generation = self._generation
+        probed_at = datetime.now(UTC)
+        started = time.perf_counter()
+        try:
+            factory = self._session_factory or get_session_factory()
+            async with factory() as session:
+                credential_service = CredentialService(session, get_settings().encryption_key or "")
+                service = ConnectivityService(session, credential_service)
+                status = await service.get_connectivity_status()
+        except Exception as e:
+            self._history.append(
+                ProbeRecord(
+                    probed_at=probed_at,
+                    duration_ms=(time.perf_counter() - started) * 1000,
+                    mode=None,
+                    tailscale_connected=False,
+                    device_count=0,
+                    error=str(e) or type(e).__name__,
+                )
+            )
+            logger.warning("Connectivity probe failed: %s", e)
+            raise
+
+        self._history.append(
+            ProbeRecord(
+                probed_at=probed_at,
+                duration_ms=(time.perf_counter() - started) * 1000,
+                mode=status.mode,
+                tailscale_connected=status.tailscale.connected,
+                device_count=status.tailscale.device_count,
+            )
+        )
+        snapshot = ConnectivitySnapshot(status=status, probed_at=probed_at)
+        if generation == self._generation:
+            self._snapshot = snapshot
+        return snapshot
+
+    async def get_snapshot(self) -> ConnectivitySnapshot:
+        """Get the latest snapshot, probing first if there is none.
+
+        Returns:
+            The current snapshot.
+        """
+        snapshot = self.snapshot
+        if snapshot is None:
+            snapshot = await self.probe()
+        return snapshot
+
+    async def get_status_bar(self) -> ConnectivityStatusBarResponse:
+        """Get dashboard status bar info from the latest snapshot.
+
+        Returns:
+            ConnectivityStatusBarResponse with mode, display, healthy.
+        """
+        snapshot = await self.get_snapshot()
+        status = snapshot.status
+        display, healthy = status_bar_display(
+            status.mode, status.tailscale.device_count, status.tailscale.configured
+        )
+        return ConnectivityStatusBarResponse(
+            mode=status.mode,
+            display=display,
+            healthy=healthy,
+            checked_at=snapshot.probed_at,
+        )
+
+
+_prober = ConnectivityProber()
+
+
+def get_connectivity_prober() -> ConnectivityProber:
+    """Get the connectivity prober for this worker process."""
+    return _prober
+
+
+async def probe_connectivity() -> None:
+    """Scheduled job: refresh this worker's connectivity snapshot."""
+    try:
+        await _prober.probe()
+    except Exception:
+        # Already logged and recorded; keep serving the previous snapshot
+        pass
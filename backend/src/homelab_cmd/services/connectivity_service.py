@@ -29,6 +29,24 @@ class TailscaleTokenRequiredError(Exception):
     pass
 
 
+def status_bar_display(
+    mode: ConnectivityMode, device_count: int, token_configured: bool
+) -> tuple[str, bool]:
+    """Work out the status bar text and health for a connectivity mode.
+
+    Args:
+        mode: Current connectivity mode.
+        device_count: Number of devices in the tailnet.
+        token_configured: Whether a Tailscale API token is stored.
+
+    Returns:
+        Tuple of (display, healthy).
+    """
+    if mode == "tailscale":
+        return f"Tailscale ({device_count} devices)", token_configured
+    return "Direct SSH", True
+
+
 class ConnectivityService:
     """Service for managing connectivity mode settings."""
 
@@ -198,9 +216,15 @@ class ConnectivityService:
             key_uploaded_at=key_uploaded_at,
         )
 
-    async def get_connectivity_status(self) -> ConnectivityStatusResponse:
+    async def get_connectivity_status(
+        self, tailscale: TailscaleInfo | None = None
+    ) -> ConnectivityStatusResponse:
         """Get full connectivity configuration status.
 
+        Args:
+            tailscale: Tailscale info from a recent probe. When given, the
+                Tailscale API is not called.
+
         Returns:
             ConnectivityStatusResponse with mode and all settings.
         """
@@ -214,12 +238,16 @@ class ConnectivityService:
             else:
                 mode = "direct_ssh"
             mode_auto_detected = False
+        elif tailscale is not None:
+            mode = "tailscale" if tailscale.connected else "direct_ssh"
+            mode_auto_detected = True
         else:
             mode = await self.detect_connectivity_mode()
             mode_auto_detected = True
 
         # Get Tailscale info
-        tailscale_info = await self._get_tailscale_info()
+        if tailscale is None:
+            tailscale = TailscaleInfo(**await self._get_tailscale_info())
 
         # Get SSH info
         ssh_info = await self._get_ssh_info()
@@ -227,7 +255,7 @@ class ConnectivityService:
         return ConnectivityStatusResponse(
             mode=mode,
             mode_auto_detected=mode_auto_detected,
-            tailscale=TailscaleInfo(**tailscale_info),
+            tailscale=tailscale,
             ssh=ssh_info,
         )
 
@@ -301,13 +329,11 @@ class ConnectivityService:
         # Generate display text
         if mode == "tailscale":
             device_count = await self._get_tailscale_device_count()
-            display = f"Tailscale ({device_count} devices)"
             # Check if actually connected
             token_exists = await self._credential_service.credential_exists("tailscale_token")
-            healthy = token_exists
+            display, healthy = status_bar_display(mode, device_count, token_exists)
         else:
-            display = "Direct SSH"
-            healthy = True
+            display, healthy = status_bar_display(mode, 0, False)
 
         return ConnectivityStatusBarResponse(
             mode=mode,
@@ -0,0 +1,310 @@
+"""Coordination between hub workers sharing one database.
+
+Running the hub with several uvicorn workers (or several containers against
+the same database) needs two things a single process gets for free:
+
+- Scheduled jobs must run once per deployment, not once per worker. Workers
+  compete for a DB-backed lease and only the holder runs jobs wrapped with
+  leader_only. The holder renews the lease while it is alive; if it dies,
+  another worker takes over once the lease lapses.
+- In-memory caches must not serve stale data after another worker changes
+  what they hold. invalidate_cache() clears the local copy and bumps a shared
+  generation counter; every worker polls the counters and clears its own copy
+  when one moves.
+
+The database is the only shared component, so no broker is required.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import ParamSpec, TypeVar
+
+from sqlalchemy import case, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from homelab_cmd.db.models.coordination import CacheGeneration, LeaderLease
+from homelab_cmd.db.session import get_session_factory
+from homelab_cmd.services import telemetry
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Lease guarding the scheduled jobs
+SCHEDULER_LEASE = "scheduler"
+
+# Lease lifetime; a crashed leader is replaced within this many seconds
+LEASE_SECONDS = 30
+
+# How often the leader renews its lease (well inside LEASE_SECONDS)
+LEASE_RENEW_INTERVAL_SECONDS = 10
+
+# How often each worker checks for cache invalidations from other workers
+CACHE_SYNC_INTERVAL_SECONDS = 5
+
+# Shared cache names
+TAILSCALE_DEVICES_CACHE = "tailscale_devices"
+CONFIG_PACKS_CACHE = "config_packs"
+CONNECTIVITY_STATUS_CACHE = "connectivity_status"
+
+
+def _default_worker_id() -> str:
+    """Identify this worker uniquely across hosts and processes."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class Coordinator:
+    """Leader election and cache invalidation for one worker process."""
+
+    def __init__(self, worker_id: str | None = None) -> None:
+        """Initialise the coordinator.
+
+        Args:
+            worker_id: Identifier recorded as lease holder (default host:pid).
+        """
+        self.worker_id = worker_id or _default_worker_id()
+        self._active = False
+        self._lease_expires_at: datetime | None = None
+        self._cache_clearers: dict[str, list[Callable[[], None]]] = {}
+        self._seen_generations: dict[str, int] = {}
+        self._synced = False
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this worker should run leader-only jobs.
+
+        Before start() (tests, CLI tools, one-off scripts) every caller is
+        treated as the leader so jobs behave as they do in a single process.
+        """
+        if not self._active:
+            return True
+        return self._lease_expires_at is not None and datetime.now(UTC) < self._lease_expires_at
+
+    # =========================================================================
+    # Leader election
+    # =========================================================================
+
+    async def renew_lease(self, session: AsyncSession) -> bool:
+        """Acquire or renew the scheduler lease.
+
+        The lease is taken if this worker already holds it or the current
+        holder has let it expire.
+
+        Args:
+            session: Database session (committed by this method).
+
+        Returns:
+            True if this worker holds the lease.
+        """
+        now = datetime.now(UTC)
+        expires_at = now + timedelta(seconds=LEASE_SECONDS)
+
+        result = await session.execute(
+            update(LeaderLease)
+            .where(
+                LeaderLease.name == SCHEDULER_LEASE,
+                or_(LeaderLease.holder == self.worker_id, LeaderLease.expires_at < now),
+            )
+            .values(
+                holder=self.worker_id,
+                expires_at=expires_at,
+                acquired_at=case(
+                    (LeaderLease.holder == self.worker_id, LeaderLease.acquired_at),
+                    else_=now,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        held = result.rowcount > 0
+
+        if not held:
+            # First worker ever: create the lease row (losing a race is fine)
+            try:
+                async with session.begin_nested():
+                    session.add(
+                        LeaderLease(
+                            name=SCHEDULER_LEASE,
+                            holder=self.worker_id,
+                            expires_at=expires_at,
+                            acquired_at=now,
+                        )
+                    )
+                held = True
+            except IntegrityError:
+                held = False
+
+        await session.commit()
+
+        was_leader = self._lease_expires_at is not None
+        self._lease_expires_at = expires_at if held else None
+        if held and not was_leader:
+            logger.info("Worker %s is now the scheduler leader", self.worker_id)
+        elif was_leader and not held:
+            logger.warning("Worker %s lost the scheduler lease", self.worker_id)
+        return held
+
+    async def release_lease(self, session: AsyncSession) -> None:
+        """Give up the scheduler lease so another worker can take over at once.
+
+        Args:
+            session: Database session (committed by this method).
+        """
+        if self._lease_expires_at is None:
+            return
+        await session.execute(
+            update(LeaderLease)
+            .where(LeaderLease.name == SCHEDULER_LEASE, LeaderLease.holder == self.worker_id)
+            .values(expires_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        self._lease_expires_at = None
+        logger.info("Worker %s released the scheduler lease", self.worker_id)
+
+    # =========================================================================
+    # Cache invalidation
+    # =========================================================================
+
+    def register_cache(self, name: str, clear: Callable[[], None]) -> None:
+        """Register a function that clears this worker's copy of a cache.
+
+        Args:
+            name: Shared cache name.
+            clear: Callable that empties the local cache.
+        """
+        self._cache_clearers.setdefault(name, []).append(clear)
+
+    def _clear_local(self, name: str) -> None:
+        for clear in self._cache_clearers.get(name, []):
+            clear()
+
+    async def invalidate_cache(self, session: AsyncSession, name: str) -> None:
+        """Clear a cache on this worker and tell the other workers to clear theirs.
+
+        The broadcast takes effect when the session commits.
+
+        Args:
+            session: Database session used to bump the generation counter.
+            name: Shared cache name.
+        """
+        self._clear_local(name)
+
+        bump = (
+            update(CacheGeneration)
+            .where(CacheGeneration.name == name)
+            .values(generation=CacheGeneration.generation + 1)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(bump)
+        if result.rowcount == 0:
+            try:
+                async with session.begin_nested():
+                    session.add(CacheGeneration(name=name, generation=1))
+            except IntegrityError:
+                await session.execute(bump)
+
+        generation = await session.scalar(
+            select(CacheGeneration.generation).where(CacheGeneration.name == name)
+        )
+        # Already cleared locally, so don't clear again when polling sees it
+        self._seen_generations[name] = generation
+
+    async def sync_caches(self, session: AsyncSession) -> None:
+        """Clear local caches whose generation another worker has bumped.
+
+        Args:
+            session: Database session.
+        """
+        if not self._cache_clearers:
+            return
+        result = await session.execute(select(CacheGeneration.name, CacheGeneration.generation))
+        for name, generation in result.all():
+            # After the first sync, a counter we have never seen is new (was 0)
+            seen = self._seen_generations.get(name, 0 if self._synced else None)
+            if seen is not None and generation != seen:
+                logger.debug("Cache %s invalidated by another worker", name)
+                self._clear_local(name)
+            self._seen_generations[name] = generation
+        self._synced = True
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Join the election and start polling for cache invalidations."""
+        self._active = True
+        async with get_session_factory()() as session:
+            await self.renew_lease(session)
+            await self.sync_caches(session)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling and hand the lease to another worker."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            async with get_session_factory()() as session:
+                await self.release_lease(session)
+        except Exception as e:
+            logger.warning("Failed to release scheduler lease: %s", e)
+        self._active = False
+
+    async def _run(self) -> None:
+        last_renewed = time.monotonic()
+        while True:
+            await asyncio.sleep(CACHE_SYNC_INTERVAL_SECONDS)
+            try:
+                async with get_session_factory()() as session:
+                    if time.monotonic() - last_renewed >= LEASE_RENEW_INTERVAL_SECONDS:
+                        await self.renew_lease(session)
+                        last_renewed = time.monotonic()
+                    await self.sync_caches(session)
+            except Exception as e:
+                # Keep the last lease until it lapses; jobs stop if the DB stays down
+                logger.warning("Worker coordination failed: %s", e)
+
+
+_coordinator = Coordinator()
+
+
+def get_coordinator() -> Coordinator:
+    """Get the coordinator for this worker process."""
+    return _coordinator
+
+
+def leader_only(job: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R | None]]:
+    """Run a scheduled job only on the worker holding the scheduler lease.
+
+    Other workers skip the run and return None. Runs on the leader are timed
+    for the hub's /metrics endpoint.
+    """
+
+    @functools.wraps(job)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R | None:
+        if not _coordinator.is_leader:
+            logger.debug("Skipping %s: another worker is the scheduler leader", job.__name__)
+            return None
+        try:
+            with telemetry.JOB_DURATION.time(job=job.__name__):
+                return await job(*args, **kwargs)
+        except Exception:
+            telemetry.JOB_FAILURES.inc(job=job.__name__)
+            raise
+
+    return wrapper
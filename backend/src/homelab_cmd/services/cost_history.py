@@ -4,23 +4,30 @@ US0183: Historical Cost Tracking (EP0005)
 
 Provides methods for:
 - Capturing daily cost snapshots for servers
+- Maintaining weekly and monthly aggregates as snapshots are captured
 - Retrieving cost history with aggregation (daily/weekly/monthly)
 - Monthly summary with year-to-date totals
 - Per-server cost history
-- Rolling up old daily data to monthly aggregates
+- Pruning daily data older than the retention period
 """
 
 import logging
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from homelab_cmd.api.routes.config import DEFAULT_COST, get_config_value
 from homelab_cmd.api.schemas.config import CostConfig
-from homelab_cmd.db.models.cost_snapshot import CostSnapshot, CostSnapshotMonthly
+from homelab_cmd.db.models.cost_snapshot import (
+    CostSnapshot,
+    CostSnapshotMonthly,
+    CostSnapshotWeekly,
+)
+from homelab_cmd.db.models.metrics import Metrics
 from homelab_cmd.db.models.server import Server, ServerStatus
 from homelab_cmd.db.models.uptime import ServerUptimeDaily
 from homelab_cmd.services.power import (
@@ -38,6 +45,49 @@ DAILY_RETENTION_DAYS = 730
 # Default CPU percentage when no metrics available
 DEFAULT_CPU_PERCENT = 50.0
 
+# Period label formats; weeks start on Monday and never span two years
+WEEK_LABEL_FORMAT = "%Y-W%W"
+MONTH_LABEL_FORMAT = "%Y-%m"
+
+
+def _week_bounds(day: date) -> tuple[date, date]:
+    """Get the first and last day of the "%Y-W%W" week containing a date."""
+    start = max(day - timedelta(days=day.weekday()), date(day.year, 1, 1))
+    end = min(day + timedelta(days=6 - day.weekday()), date(day.year, 12, 31))
+    return start, end
+
+
+def _month_bounds(day: date) -> tuple[date, date]:
+    """Get the first and last day of the month containing a date."""
+    start = day.replace(day=1)
+    end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return start, end
+
+
+async def get_avg_cpu_24h_by_server(session: AsyncSession) -> dict[str, float]:
+    """Get average CPU usage over the last 24 hours for every server.
+
+    One grouped query for the whole fleet instead of one scan per server.
+    The hourly rollup tier only holds data older than the raw retention
+    window, so the last 24 hours always come from raw metrics.
+
+    Args:
+        session: Database session.
+
+    Returns:
+        Mapping of server ID to average CPU percentage. Servers without
+        metrics in the window are absent.
+    """
+    since = datetime.now(UTC) - timedelta(hours=24)
+
+    result = await session.execute(
+        select(Metrics.server_id, func.avg(Metrics.cpu_percent))
+        .where(Metrics.timestamp >= since)
+        .where(Metrics.cpu_percent.isnot(None))
+        .group_by(Metrics.server_id)
+    )
+    return {server_id: round(avg, 1) for server_id, avg in result.all() if avg is not None}
+
 
 @dataclass
 class CostHistoryItem:
@@ -79,6 +129,7 @@ class ServerCostHistoryResult:
     hostname: str
     period: str
     items: list[CostHistoryItem]
+    aggregation: str = "daily"
 
 
 class CostHistoryService:
@@ -102,8 +153,6 @@ class CostHistoryService:
 
     async def _get_avg_cpu_24h(self, server_id: str) -> float | None:
         """Get average CPU usage for a server over the last 24 hours."""
-        from homelab_cmd.db.models.metrics import Metrics
-
         since = datetime.now(UTC) - timedelta(hours=24)
 
         result = await self.session.execute(
@@ -149,6 +198,46 @@ class CostHistoryService:
         # Get electricity rate
         rate = await self._get_electricity_rate()
 
+        is_workstation = server.machine_type == "workstation"
+        avg_cpu = None
+        hours_used = None
+        if server.status != ServerStatus.OFFLINE.value:
+            if is_workstation:
+                hours_used = await self._get_uptime_hours_yesterday(server_id)
+            else:
+                avg_cpu = await self._get_avg_cpu_24h(server_id)
+
+        values = self._calculate_snapshot(server, rate, avg_cpu, hours_used)
+        await self._upsert_snapshots([values])
+        await self._refresh_period_totals([server_id], values["date"])
+        await self.session.commit()
+
+        # Fetch and return the snapshot
+        result = await self.session.execute(
+            select(CostSnapshot)
+            .where(CostSnapshot.server_id == server_id)
+            .where(CostSnapshot.date == values["date"])
+        )
+        return result.scalar_one_or_none()
+
+    def _calculate_snapshot(
+        self,
+        server: Server,
+        rate: float,
+        avg_cpu_24h: float | None,
+        uptime_hours_yesterday: float | None,
+    ) -> dict:
+        """Calculate today's cost snapshot values for a server.
+
+        Args:
+            server: Server to calculate for.
+            rate: Electricity rate per kWh.
+            avg_cpu_24h: Average CPU over the last 24 hours (servers only).
+            uptime_hours_yesterday: Hours up yesterday (workstations only).
+
+        Returns:
+            Column values for the CostSnapshot row.
+        """
         # Determine machine type
         is_workstation = server.machine_type == "workstation"
         machine_type = "workstation" if is_workstation else "server"
@@ -179,13 +268,15 @@ class CostHistoryService:
 
             if is_workstation:
                 # Workstation: use actual hours
-                hours_used = await self._get_uptime_hours_yesterday(server_id)
+                hours_used = uptime_hours_yesterday or 0.0
                 # Cost = (TDP * hours * rate) / 1000
                 estimated_kwh = (power_config.max_watts * hours_used) / 1000
-                estimated_cost = calculate_workstation_cost(power_config.max_watts, hours_used, rate)
+                estimated_cost = calculate_workstation_cost(
+                    power_config.max_watts, hours_used, rate
+                )
             else:
                 # Server: 24/7 operation with CPU-based power estimate
-                avg_cpu = await self._get_avg_cpu_24h(server_id)
+                avg_cpu = avg_cpu_24h
                 cpu_percent = avg_cpu if avg_cpu is not None else DEFAULT_CPU_PERCENT
 
                 estimated_watts = calculate_power_watts(
@@ -198,73 +289,221 @@ class CostHistoryService:
             tdp_watts = server.tdp_watts
 
             if is_workstation:
-                hours_used = await self._get_uptime_hours_yesterday(server_id)
+                hours_used = uptime_hours_yesterday or 0.0
                 estimated_kwh = (server.tdp_watts * hours_used) / 1000
                 estimated_cost = calculate_workstation_cost(server.tdp_watts, hours_used, rate)
             else:
                 estimated_kwh = calculate_daily_kwh(server.tdp_watts)
                 estimated_cost = round(estimated_kwh * rate, 2)
 
-        # Upsert snapshot (one per server per day)
-        today = date.today()
-        stmt = sqlite_insert(CostSnapshot).values(
-            server_id=server_id,
-            date=today,
-            estimated_kwh=estimated_kwh,
-            estimated_cost=estimated_cost,
-            electricity_rate=rate,
-            tdp_watts=tdp_watts,
-            idle_watts=idle_watts,
-            avg_cpu_percent=avg_cpu,
-            machine_type=machine_type,
-            hours_used=hours_used,
-        )
+        return {
+            "server_id": server.id,
+            "date": date.today(),
+            "estimated_kwh": estimated_kwh,
+            "estimated_cost": estimated_cost,
+            "electricity_rate": rate,
+            "tdp_watts": tdp_watts,
+            "idle_watts": idle_watts,
+            "avg_cpu_percent": avg_cpu,
+            "machine_type": machine_type,
+            "hours_used": hours_used,
+        }
+
+    async def _upsert_snapshots(self, rows: list[dict]) -> None:
+        """Insert or update snapshots (one per server per day) in one statement."""
+        stmt = sqlite_insert(CostSnapshot).values(rows)
 
         # On conflict, update the values
         stmt = stmt.on_conflict_do_update(
             index_elements=["server_id", "date"],
             set_={
-                "estimated_kwh": estimated_kwh,
-                "estimated_cost": estimated_cost,
-                "electricity_rate": rate,
-                "tdp_watts": tdp_watts,
-                "idle_watts": idle_watts,
-                "avg_cpu_percent": avg_cpu,
-                "machine_type": machine_type,
-                "hours_used": hours_used,
+                column: stmt.excluded[column]
+                for column in (
+                    "estimated_kwh",
+                    "estimated_cost",
+                    "electricity_rate",
+                    "tdp_watts",
+                    "idle_watts",
+                    "avg_cpu_percent",
+                    "machine_type",
+                    "hours_used",
+                )
             },
         )
-
         await self.session.execute(stmt)
-        await self.session.commit()
 
-        # Fetch and return the snapshot
-        result = await self.session.execute(
-            select(CostSnapshot)
-            .where(CostSnapshot.server_id == server_id)
-            .where(CostSnapshot.date == today)
+    async def _refresh_period_totals(self, server_ids: list[str], day: date) -> None:
+        """Recompute the weekly and monthly aggregates containing a day.
+
+        Only the current periods change when snapshots are captured, so the
+        aggregates are rebuilt from that period's daily snapshots rather than
+        adjusted by deltas (re-capturing a day must not count it twice).
+
+        Args:
+            server_ids: Servers whose snapshots changed.
+            day: Date of the changed snapshots.
+        """
+        periods = (
+            (CostSnapshotWeekly, "year_week", WEEK_LABEL_FORMAT, _week_bounds(day)),
+            (CostSnapshotMonthly, "year_month", MONTH_LABEL_FORMAT, _month_bounds(day)),
         )
-        return result.scalar_one_or_none()
+        for model, label_column, label_format, (start, end) in periods:
+            result = await self.session.execute(
+                select(
+                    CostSnapshot.server_id,
+                    func.sum(CostSnapshot.estimated_kwh).label("total_kwh"),
+                    func.sum(CostSnapshot.estimated_cost).label("total_cost"),
+                    func.avg(CostSnapshot.electricity_rate).label("avg_rate"),
+                    func.count().label("snapshot_count"),
+                )
+                .where(CostSnapshot.server_id.in_(server_ids))
+                .where(CostSnapshot.date >= start)
+                .where(CostSnapshot.date <= end)
+                .group_by(CostSnapshot.server_id)
+            )
+            rows = [
+                {
+                    "server_id": row.server_id,
+                    label_column: day.strftime(label_format),
+                    "total_kwh": row.total_kwh,
+                    "total_cost": row.total_cost,
+                    "avg_electricity_rate": row.avg_rate,
+                    "snapshot_count": row.snapshot_count,
+                }
+                for row in result.all()
+            ]
+            if not rows:
+                continue
+
+            stmt = sqlite_insert(model).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["server_id", label_column],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in (
+                        "total_kwh",
+                        "total_cost",
+                        "avg_electricity_rate",
+                        "snapshot_count",
+                    )
+                },
+            )
+            await self.session.execute(stmt)
+
+    async def backfill_period_totals(self) -> bool:
+        """Build the weekly and monthly aggregates from existing daily snapshots.
+
+        Databases created before the aggregates were maintained (and not
+        upgraded through the migration) have daily snapshots but no weekly
+        rows. This fills both tiers once; monthly rows rolled up from pruned
+        daily data are kept and added to. It is a no-op once any weekly
+        aggregate exists, and the guard is part of the insert so concurrent
+        workers cannot both run it.
+
+        Returns:
+            True if the aggregates were backfilled.
+        """
+        week_label = func.strftime(WEEK_LABEL_FORMAT, CostSnapshot.date)
+        weekly = insert(CostSnapshotWeekly).from_select(
+            [
+                "server_id",
+                "year_week",
+                "total_kwh",
+                "total_cost",
+                "avg_electricity_rate",
+                "snapshot_count",
+            ],
+            select(
+                CostSnapshot.server_id,
+                week_label,
+                func.sum(CostSnapshot.estimated_kwh),
+                func.sum(CostSnapshot.estimated_cost),
+                func.avg(CostSnapshot.electricity_rate),
+                func.count(),
+            )
+            .where(~select(CostSnapshotWeekly.id).exists())
+            .group_by(CostSnapshot.server_id, week_label),
+        )
+        result = await self.session.execute(weekly)
+        if not result.rowcount:
+            return False
+
+        month_label = func.strftime(MONTH_LABEL_FORMAT, CostSnapshot.date)
+        monthly = sqlite_insert(CostSnapshotMonthly).from_select(
+            [
+                "server_id",
+                "year_month",
+                "total_kwh",
+                "total_cost",
+                "avg_electricity_rate",
+                "snapshot_count",
+            ],
+            select(
+                CostSnapshot.server_id,
+                month_label,
+                func.sum(CostSnapshot.estimated_kwh),
+                func.sum(CostSnapshot.estimated_cost),
+                func.avg(CostSnapshot.electricity_rate),
+                func.count(),
+            ).group_by(CostSnapshot.server_id, month_label),
+        )
+        monthly = monthly.on_conflict_do_update(
+            index_elements=["server_id", "year_month"],
+            set_={
+                "total_kwh": CostSnapshotMonthly.total_kwh + monthly.excluded.total_kwh,
+                "total_cost": CostSnapshotMonthly.total_cost + monthly.excluded.total_cost,
+                "snapshot_count": (
+                    CostSnapshotMonthly.snapshot_count + monthly.excluded.snapshot_count
+                ),
+            },
+        )
+        await self.session.execute(monthly)
+        await self.session.commit()
+
+        logger.info("Backfilled weekly and monthly cost aggregates from daily snapshots")
+        return True
 
     async def capture_all_snapshots(self) -> int:
         """Capture daily cost snapshots for all servers.
 
         AC1: Capture snapshots for all servers at midnight UTC.
 
+        The rate, CPU averages and uptime are fetched once for the whole
+        fleet and all snapshots are written in a single upsert. The weekly
+        and monthly aggregates for today are refreshed in the same commit.
+
         Returns:
             Number of snapshots captured.
         """
-        result = await self.session.execute(select(Server.id))
-        server_ids = [row[0] for row in result.fetchall()]
+        result = await self.session.execute(select(Server))
+        servers = list(result.scalars().all())
+        if not servers:
+            logger.info("Captured 0 cost snapshots")
+            return 0
+
+        rate = await self._get_electricity_rate()
+        cpu_averages = await get_avg_cpu_24h_by_server(self.session)
+
+        yesterday = date.today() - timedelta(days=1)
+        result = await self.session.execute(
+            select(ServerUptimeDaily.server_id, ServerUptimeDaily.uptime_hours).where(
+                ServerUptimeDaily.date == yesterday
+            )
+        )
+        uptime_hours = {server_id: hours for server_id, hours in result.all()}
 
-        count = 0
-        for server_id in server_ids:
-            snapshot = await self.capture_daily_snapshot(server_id)
-            if snapshot:
-                count += 1
+        rows = [
+            self._calculate_snapshot(
+                server, rate, cpu_averages.get(server.id), uptime_hours.get(server.id)
+            )
+            for server in servers
+        ]
+        await self._upsert_snapshots(rows)
+        await self._refresh_period_totals([server.id for server in servers], date.today())
+        await self.session.commit()
 
-        logger.info("Captured %d cost snapshots", count)
-        return count
+        logger.info("Captured %d cost snapshots", len(rows))
+        return len(rows)
 
     async def get_history(
         self,
@@ -332,69 +571,71 @@ class CostHistoryService:
     async def _get_history_weekly(
         self, start_date: date, end_date: date, server_id: str | None
     ) -> list[CostHistoryItem]:
-        """Get weekly aggregated cost history."""
-        # SQLite: strftime to get ISO week
-        week_expr = func.strftime("%Y-W%W", CostSnapshot.date)
+        """Get weekly aggregated cost history.
 
-        query = (
-            select(
-                week_expr.label("week"),
-                func.sum(CostSnapshot.estimated_kwh).label("total_kwh"),
-                func.sum(CostSnapshot.estimated_cost).label("total_cost"),
-                func.avg(CostSnapshot.electricity_rate).label("avg_rate"),
-            )
-            .where(CostSnapshot.date >= start_date)
-            .where(CostSnapshot.date <= end_date)
+        Reads the materialised weekly aggregates; weeks overlapping the range
+        are returned whole.
+        """
+        return await self._get_period_totals(
+            CostSnapshotWeekly,
+            CostSnapshotWeekly.year_week,
+            start_date.strftime(WEEK_LABEL_FORMAT),
+            end_date.strftime(WEEK_LABEL_FORMAT),
+            server_id,
         )
 
-        if server_id:
-            query = query.where(CostSnapshot.server_id == server_id)
-
-        query = query.group_by(week_expr).order_by(week_expr)
-
-        result = await self.session.execute(query)
-        rows = result.fetchall()
-
-        return [
-            CostHistoryItem(
-                date=row.week,
-                estimated_kwh=round(row.total_kwh, 3),
-                estimated_cost=round(row.total_cost, 2),
-                electricity_rate=round(row.avg_rate, 4),
-                server_id=server_id,
-            )
-            for row in rows
-        ]
-
     async def _get_history_monthly(
         self, start_date: date, end_date: date, server_id: str | None
     ) -> list[CostHistoryItem]:
-        """Get monthly aggregated cost history."""
-        # SQLite: strftime to get year-month
-        month_expr = func.strftime("%Y-%m", CostSnapshot.date)
+        """Get monthly aggregated cost history.
+
+        Reads the materialised monthly aggregates; months overlapping the
+        range are returned whole.
+        """
+        return await self._get_period_totals(
+            CostSnapshotMonthly,
+            CostSnapshotMonthly.year_month,
+            start_date.strftime(MONTH_LABEL_FORMAT),
+            end_date.strftime(MONTH_LABEL_FORMAT),
+            server_id,
+        )
 
+    async def _get_period_totals(
+        self,
+        model: type[CostSnapshotWeekly] | type[CostSnapshotMonthly],
+        label_column: InstrumentedAttribute[str],
+        start_label: str,
+        end_label: str,
+        server_id: str | None,
+    ) -> list[CostHistoryItem]:
+        """Sum an aggregate table by period label over an indexed label range."""
         query = (
             select(
-                month_expr.label("month"),
-                func.sum(CostSnapshot.estimated_kwh).label("total_kwh"),
-                func.sum(CostSnapshot.estimated_cost).label("total_cost"),
-                func.avg(CostSnapshot.electricity_rate).label("avg_rate"),
+                label_column.label("period"),
+                func.sum(model.total_kwh).label("total_kwh"),
+                func.sum(model.total_cost).label("total_cost"),
+                # Weight each server's average by its days so the result
+                # matches averaging the daily rows
+                (
+                    func.sum(model.avg_electricity_rate * model.snapshot_count)
+                    / func.sum(model.snapshot_count)
+                ).label("avg_rate"),
             )
-            .where(CostSnapshot.date >= start_date)
-            .where(CostSnapshot.date <= end_date)
+            .where(label_column >= start_label)
+            .where(label_column <= end_label)
         )
 
         if server_id:
-            query = query.where(CostSnapshot.server_id == server_id)
+            query = query.where(model.server_id == server_id)
 
-        query = query.group_by(month_expr).order_by(month_expr)
+        query = query.group_by(label_column).order_by(label_column)
 
         result = await self.session.execute(query)
         rows = result.fetchall()
 
         return [
             CostHistoryItem(
-                date=row.month,
+                date=row.period,
                 estimated_kwh=round(row.total_kwh, 3),
                 estimated_cost=round(row.total_cost, 2),
                 electricity_rate=round(row.avg_rate, 4),
@@ -414,19 +655,17 @@ class CostHistoryService:
         Returns:
             Monthly summary with year-to-date total.
         """
-        # Query monthly totals for the year
-        month_expr = func.strftime("%Y-%m", CostSnapshot.date)
-        year_expr = func.strftime("%Y", CostSnapshot.date)
-
+        # Query monthly totals for the year from the monthly aggregates
         query = (
             select(
-                month_expr.label("month"),
-                func.sum(CostSnapshot.estimated_kwh).label("total_kwh"),
-                func.sum(CostSnapshot.estimated_cost).label("total_cost"),
+                CostSnapshotMonthly.year_month.label("month"),
+                func.sum(CostSnapshotMonthly.total_kwh).label("total_kwh"),
+                func.sum(CostSnapshotMonthly.total_cost).label("total_cost"),
             )
-            .where(year_expr == str(year))
-            .group_by(month_expr)
-            .order_by(month_expr)
+            .where(CostSnapshotMonthly.year_month >= f"{year:04d}-01")
+            .where(CostSnapshotMonthly.year_month <= f"{year:04d}-12")
+            .group_by(CostSnapshotMonthly.year_month)
+            .order_by(CostSnapshotMonthly.year_month)
         )
 
         result = await self.session.execute(query)
@@ -465,7 +704,7 @@ class CostHistoryService:
         )
 
     async def get_server_history(
-        self, server_id: str, period: str = "30d"
+        self, server_id: str, period: str = "30d", aggregation: str = "daily"
     ) -> ServerCostHistoryResult | None:
         """Get cost history for a specific server.
 
@@ -474,6 +713,8 @@ class CostHistoryService:
         Args:
             server_id: The server ID.
             period: '7d', '30d', '90d', or '12m'.
+            aggregation: 'daily', 'weekly', or 'monthly'. Weekly and monthly
+                items come from the materialised aggregates.
 
         Returns:
             Server cost history result, or None if server not found.
@@ -498,6 +739,18 @@ class CostHistoryService:
         else:
             raise ValueError(f"Invalid period: {period}")
 
+        if aggregation != "daily":
+            items = await self.get_history(start_date, today, server_id, aggregation)
+            for item in items:
+                item.server_hostname = server.hostname
+            return ServerCostHistoryResult(
+                server_id=server_id,
+                hostname=server.hostname,
+                period=period,
+                items=items,
+                aggregation=aggregation,
+            )
+
         # Query cost snapshots
         query = (
             select(CostSnapshot)
@@ -530,75 +783,28 @@ class CostHistoryService:
         )
 
     async def rollup_old_data(self) -> dict[str, int]:
-        """Roll up old daily data to monthly aggregates.
+        """Prune daily data that has passed the retention period.
 
         AC6: Data retention - daily data older than 2 years rolled up.
 
+        The weekly and monthly aggregates already include every daily
+        snapshot, so pruning the daily tier loses no history.
+
         Returns:
-            Dictionary with counts: {'daily_deleted': N, 'monthly_created': N}
+            Dictionary with counts: {'daily_deleted': N}
         """
         cutoff = date.today() - timedelta(days=DAILY_RETENTION_DAYS)
 
-        # Query daily snapshots older than cutoff, grouped by server and month
-        month_expr = func.strftime("%Y-%m", CostSnapshot.date)
-
-        query = (
-            select(
-                CostSnapshot.server_id,
-                month_expr.label("year_month"),
-                func.sum(CostSnapshot.estimated_kwh).label("total_kwh"),
-                func.sum(CostSnapshot.estimated_cost).label("total_cost"),
-                func.avg(CostSnapshot.electricity_rate).label("avg_rate"),
-                func.count().label("snapshot_count"),
-            )
-            .where(CostSnapshot.date < cutoff)
-            .group_by(CostSnapshot.server_id, month_expr)
-        )
-
-        result = await self.session.execute(query)
-        aggregates = result.fetchall()
-
-        if not aggregates:
-            logger.debug("No old cost snapshots to roll up")
-            return {"daily_deleted": 0, "monthly_created": 0}
-
-        monthly_created = 0
-        for row in aggregates:
-            # Upsert monthly aggregate
-            stmt = sqlite_insert(CostSnapshotMonthly).values(
-                server_id=row.server_id,
-                year_month=row.year_month,
-                total_kwh=row.total_kwh,
-                total_cost=row.total_cost,
-                avg_electricity_rate=row.avg_rate,
-                snapshot_count=row.snapshot_count,
-            )
-
-            # On conflict, add to existing values
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["server_id", "year_month"],
-                set_={
-                    "total_kwh": CostSnapshotMonthly.total_kwh + row.total_kwh,
-                    "total_cost": CostSnapshotMonthly.total_cost + row.total_cost,
-                    "snapshot_count": CostSnapshotMonthly.snapshot_count + row.snapshot_count,
-                },
-            )
-
-            await self.session.execute(stmt)
-            monthly_created += 1
-
-        # Delete old daily snapshots
         delete_result = await self.session.execute(
             delete(CostSnapshot).where(CostSnapshot.date < cutoff)
         )
-        daily_deleted = delete_result.rowcount
+        daily_deleted = delete_result.rowcount or 0
 
         await self.session.commit()
 
-        logger.info(
-            "Cost snapshot rollup: %d monthly aggregates created/updated, %d daily records deleted",
-            monthly_created,
-            daily_deleted,
-        )
+        if daily_deleted:
+            logger.info("Cost snapshot rollup: %d daily records deleted", daily_deleted)
+        else:
+            logger.debug("No old cost snapshots to prune")
 
-        return {"daily_deleted": daily_deleted, "monthly_created": monthly_created}
+        return {"daily_deleted": daily_deleted}
@@ -23,6 +23,7 @@ from homelab_cmd.config import get_settings
 from homelab_cmd.db.models.config import Config
 from homelab_cmd.db.models.discovery import Discovery, DiscoveryStatus
 from homelab_cmd.db.models.server import Server
+from homelab_cmd.services.event_bus import EventTopic, publish
 from homelab_cmd.services.ssh import get_ssh_service
 
 # UUID v4 validation pattern for GUID matching
@@ -411,6 +412,7 @@ class DiscoveryService:
             discovery.progress_scanned = scanned
             discovery.devices_found = len(discovered)
             await session.commit()
+            _publish_discovery_progress(discovery)
 
         return discovered
 
@@ -450,6 +452,7 @@ class DiscoveryService:
             discovery.status = DiscoveryStatus.COMPLETED.value
             discovery.completed_at = datetime.now(UTC)
             await session.commit()
+            _publish_discovery_progress(discovery)
 
             logger.info(
                 "Discovery %d completed: found %d devices on %s",
@@ -464,6 +467,21 @@ class DiscoveryService:
             discovery.error = str(e)
             discovery.completed_at = datetime.now(UTC)
             await session.commit()
+            _publish_discovery_progress(discovery)
+
+
+def _publish_discovery_progress(discovery: Discovery) -> None:
+    """Publish a discovery's progress on the live update bus."""
+    publish(
+        EventTopic.DISCOVERY_PROGRESS,
+        {
+            "discovery_id": discovery.id,
+            "status": discovery.status,
+            "progress_scanned": discovery.progress_scanned,
+            "progress_total": discovery.progress_total,
+            "devices_found": discovery.devices_found,
+        },
+    )
 
 
 # Module-level instance
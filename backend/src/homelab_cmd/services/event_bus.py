@@ -0,0 +1,175 @@
+"""In-process publish/subscribe bus for live dashboard updates.
+
+Services publish small change notifications (server status, new metric
+points, alert transitions, scan/discovery/apply progress, action completion)
+and the SSE endpoint fans them out to connected browser tabs, so the UI can
+react to changes instead of polling every endpoint on a timer.
+
+Publishing is synchronous and never blocks: each subscriber has a bounded
+queue and the oldest pending event is dropped if a slow client falls
+behind. A short replay buffer lets reconnecting clients catch up from their
+Last-Event-ID.
+"""
+
+import asyncio
+import itertools
+import logging
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Pending events per subscriber before the oldest is dropped
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# Recent events kept for Last-Event-ID replay
+REPLAY_BUFFER_SIZE = 500
+
+
+class EventTopic(str, Enum):
+    """Topics published on the event bus."""
+
+    SERVER_STATUS = "server_status"
+    METRICS = "metrics"
+    ALERT = "alert"
+    SCAN_PROGRESS = "scan_progress"
+    DISCOVERY_PROGRESS = "discovery_progress"
+    APPLY_PROGRESS = "apply_progress"
+    ROLLOUT_PROGRESS = "rollout_progress"
+    ACTION = "action"
+
+
+@dataclass(frozen=True)
+class BusEvent:
+    """A published event."""
+
+    id: int
+    topic: EventTopic
+    data: dict[str, Any]
+    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+class Subscription:
+    """A subscriber's queue of events for the topics it asked for."""
+
+    def __init__(self, topics: set[EventTopic] | None) -> None:
+        """Initialise the subscription.
+
+        Args:
+            topics: Topics to receive, or None for all topics.
+        """
+        self.topics = topics
+        self.queue: asyncio.Queue[BusEvent] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.dropped = 0
+
+    def wants(self, event: BusEvent) -> bool:
+        """Check whether this subscriber receives an event's topic."""
+        return self.topics is None or event.topic in self.topics
+
+    def offer(self, event: BusEvent) -> None:
+        """Queue an event, dropping the oldest if the subscriber is behind."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> BusEvent | None:
+        """Wait for the next event.
+
+        Returns:
+            The event, or None if nothing arrived within timeout.
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+
+class EventBus:
+    """Fan-out of published events to all matching subscribers."""
+
+    def __init__(self) -> None:
+        """Initialise an empty bus."""
+        self._subscribers: set[Subscription] = set()
+        self._recent: deque[BusEvent] = deque(maxlen=REPLAY_BUFFER_SIZE)
+        self._ids = itertools.count(1)
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+        return len(self._subscribers)
+
+    def publish(self, topic: EventTopic, data: dict[str, Any]) -> None:
+        """Publish an event to all subscribers of its topic.
+
+        Safe to call from worker threads; delivery is handed to the event loop.
+
+        Args:
+            topic: Event topic.
+            data: JSON-serialisable payload.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Called from a worker thread (e.g. asyncio.to_thread)
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self.publish, topic, data)
+            return
+
+        event = BusEvent(id=next(self._ids), topic=topic, data=data)
+        self._recent.append(event)
+        for subscription in self._subscribers:
+            if subscription.wants(event):
+                subscription.offer(event)
+
+    def replay_since(self, last_event_id: int, subscription: Subscription) -> None:
+        """Queue buffered events newer than last_event_id for a reconnecting client."""
+        for event in self._recent:
+            if event.id > last_event_id and subscription.wants(event):
+                subscription.offer(event)
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        topics: set[EventTopic] | None = None,
+        last_event_id: int | None = None,
+    ) -> AsyncIterator[Subscription]:
+        """Subscribe for the lifetime of the context.
+
+        Args:
+            topics: Topics to receive, or None for all.
+            last_event_id: Replay buffered events after this ID first.
+
+        Yields:
+            The subscription to read events from.
+        """
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(topics)
+        if last_event_id is not None:
+            self.replay_since(last_event_id, subscription)
+        self._subscribers.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscribers.discard(subscription)
+            if subscription.dropped:
+                logger.debug("Event stream subscriber dropped %d events", subscription.dropped)
+
+
+_event_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Get the process-wide event bus."""
+    return _event_bus
+
+
+def publish(topic: EventTopic, data: dict[str, Any]) -> None:
+    """Publish an event on the process-wide bus."""
+    _event_bus.publish(topic, data)
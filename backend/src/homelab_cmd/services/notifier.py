@@ -13,13 +13,18 @@ import asyncio
 import logging
 from collections import deque
 from datetime import UTC, datetime
-from typing import NamedTuple
-
-import httpx
+from typing import TYPE_CHECKING, NamedTuple
 
 from homelab_cmd.api.schemas.config import NotificationsConfig
+from homelab_cmd.lazy_imports import lazy_import
 from homelab_cmd.services.alerting import AlertEvent
 
+if TYPE_CHECKING:
+    import httpx
+else:
+    # Loaded on first outbound request rather than at startup
+    httpx = lazy_import("httpx")
+
 logger = logging.getLogger(__name__)
 
 # Slack colour codes matching brand guide
@@ -661,3 +666,8 @@ def get_notifier(webhook_url: str) -> SlackNotifier:
             asyncio.create_task(_notifier.close())
         _notifier = SlackNotifier(webhook_url)
     return _notifier
+
+
+def queued_notification_count() -> int:
+    """Number of notifications waiting in the retry queue (0 if no notifier)."""
+    return len(_notifier.retry_queue) if _notifier is not None else 0
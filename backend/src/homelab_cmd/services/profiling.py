@@ -0,0 +1,283 @@
+"""Request and SQL statement profiling for the hub.
+
+Answers "which route or query is making the dashboard slow?" without an
+external profiler:
+
+- Every HTTP request is timed per route template, along with how many SQL
+  statements it ran and how long they took (RequestTimingMiddleware).
+- Every SQL statement is timed and aggregated by statement text.
+- Statements slower than the configured threshold are logged, with
+  SQLite's EXPLAIN QUERY PLAN, and the most recent are kept for review.
+
+The aggregates are in memory and per worker. GET /api/v1/system/performance
+summarises the slowest routes and statements, and how long each phase of
+the worker's startup took.
+"""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Iterator, MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from homelab_cmd import STARTED_AT
+from homelab_cmd.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Recent slow statements kept for the performance summary
+SLOW_QUERY_LOG_SIZE = 100
+
+# Distinct statements aggregated; statements beyond this are timed but not tracked
+MAX_TRACKED_STATEMENTS = 500
+
+# Longest statement text kept in aggregates and the slow-query log
+MAX_STATEMENT_LENGTH = 2000
+
+# Route label for requests that matched no route
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass
+class RequestProfile:
+    """SQL activity of the request being handled."""
+
+    scope: MutableMapping[str, Any]
+    query_count: int = 0
+    query_ms: float = 0.0
+
+    @property
+    def path(self) -> str:
+        """Route template, known once the router has matched the request."""
+        template = getattr(self.scope.get("route"), "path", None)
+        if not template:
+            return UNMATCHED_ROUTE
+        # Routes in an included router may carry only their own part of the
+        # path; take the include prefix from the matching part of the request
+        segments = template.count("/")
+        request_path = self.scope.get("path", "")
+        if ":path}" in template or request_path.count("/") <= segments:
+            return template
+        return request_path.rsplit("/", segments)[0] + template
+
+    @property
+    def route(self) -> str:
+        """Method and route template, e.g. "GET /api/v1/servers/{server_id}"."""
+        return f"{self.scope.get('method', '')} {self.path}"
+
+
+@dataclass
+class TimingStats:
+    """Running count, total and maximum of a timed operation."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean duration in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def add(self, duration_ms: float) -> None:
+        """Record one duration."""
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+
+@dataclass
+class RouteStats(TimingStats):
+    """Latency and SQL activity of one route."""
+
+    query_count: int = 0
+    query_ms: float = 0.0
+
+
+@dataclass
+class SlowQuery:
+    """One statement that exceeded the slow-query threshold."""
+
+    occurred_at: datetime
+    duration_ms: float
+    statement: str
+    route: str | None
+    plan: list[str] = field(default_factory=list)
+
+
+# Profile of the request being handled in this context (None outside requests)
+_current_request: ContextVar[RequestProfile | None] = ContextVar("current_request", default=None)
+
+
+def _normalise(statement: str) -> str:
+    return " ".join(statement.split())[:MAX_STATEMENT_LENGTH]
+
+
+def _explain(connection: Any, statement: str, parameters: Any) -> list[str]:
+    """Capture SQLite's query plan for a statement, or [] if unavailable."""
+    try:
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            return [row[-1] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+    except Exception as e:
+        logger.debug("EXPLAIN QUERY PLAN failed: %s", e)
+        return []
+
+
+class Profiler:
+    """Aggregates request and statement timings for this worker."""
+
+    def __init__(self, slow_query_threshold_ms: float | None = None) -> None:
+        """Initialise an empty profiler.
+
+        Args:
+            slow_query_threshold_ms: Statements at least this slow are logged
+                (0 disables; default: the slow_query_threshold_ms setting).
+        """
+        self._slow_query_threshold_ms = slow_query_threshold_ms
+        self.routes: dict[str, RouteStats] = {}
+        self.statements: dict[str, TimingStats] = {}
+        self.slow_queries: deque[SlowQuery] = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+        self.since = datetime.now(UTC)
+
+    @property
+    def slow_query_threshold_ms(self) -> float:
+        """Threshold above which statements are logged as slow (0 = off)."""
+        if self._slow_query_threshold_ms is None:
+            self._slow_query_threshold_ms = get_settings().slow_query_threshold_ms
+        return self._slow_query_threshold_ms
+
+    @slow_query_threshold_ms.setter
+    def slow_query_threshold_ms(self, value: float) -> None:
+        self._slow_query_threshold_ms = value
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        self.routes.clear()
+        self.statements.clear()
+        self.slow_queries.clear()
+        self.since = datetime.now(UTC)
+
+    def record_statement(
+        self,
+        connection: Any,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        duration_ms: float,
+    ) -> None:
+        """Record one executed statement.
+
+        Args:
+            connection: SQLAlchemy connection that ran the statement.
+            statement: SQL text as sent to the driver.
+            parameters: Bound parameters.
+            executemany: Whether parameters is a sequence of parameter sets.
+            duration_ms: Execution time in milliseconds.
+        """
+        request = _current_request.get()
+        if request is not None:
+            request.query_count += 1
+            request.query_ms += duration_ms
+
+        text = _normalise(statement)
+        stats = self.statements.get(text)
+        if stats is None and len(self.statements) < MAX_TRACKED_STATEMENTS:
+            stats = self.statements[text] = TimingStats()
+        if stats is not None:
+            stats.add(duration_ms)
+
+        threshold = self.slow_query_threshold_ms
+        if threshold and duration_ms >= threshold:
+            plan = []
+            if not executemany and connection.dialect.name == "sqlite":
+                plan = _explain(connection, statement, parameters)
+            route = request.route if request else None
+            self.slow_queries.append(SlowQuery(datetime.now(UTC), duration_ms, text, route, plan))
+            logger.warning(
+                "Slow query (%.1f ms%s): %s%s",
+                duration_ms,
+                f", {route}" if route else "",
+                text,
+                "".join(f"\n  plan: {step}" for step in plan),
+            )
+
+    def record_request(self, profile: RequestProfile, duration_ms: float) -> None:
+        """Record one completed request.
+
+        Args:
+            profile: The request's route and SQL activity.
+            duration_ms: Time from receiving the request to the end of the response.
+        """
+        stats = self.routes.get(profile.route)
+        if stats is None:
+            stats = self.routes[profile.route] = RouteStats()
+        stats.add(duration_ms)
+        stats.query_count += profile.query_count
+        stats.query_ms += profile.query_ms
+
+
+@dataclass
+class StartupProfile:
+    """How long this worker took to start, phase by phase."""
+
+    phases: dict[str, float] = field(default_factory=dict)
+    ready_ms: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time one startup phase, including phases deferred until after startup."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = (time.perf_counter() - start) * 1000
+
+    def mark_ready(self) -> None:
+        """Record the time from the hub starting to load until it can serve requests."""
+        self.ready_ms = (time.perf_counter() - STARTED_AT) * 1000
+        logger.info(
+            "Ready to serve %.0f ms after starting to load (%s)",
+            self.ready_ms,
+            ", ".join(f"{name} {ms:.0f} ms" for name, ms in self.phases.items()),
+        )
+
+
+def start_request(scope: MutableMapping[str, Any]) -> tuple[RequestProfile, Token]:
+    """Begin profiling a request in the current context.
+
+    Args:
+        scope: ASGI scope of the request.
+
+    Returns:
+        The request profile and a token for end_request().
+    """
+    profile = RequestProfile(scope)
+    return profile, _current_request.set(profile)
+
+
+def end_request(token: Token) -> None:
+    """Stop attributing statements to the request started with this token."""
+    _current_request.reset(token)
+
+
+_profiler = Profiler()
+
+_startup_profile = StartupProfile()
+
+
+def get_profiler() -> Profiler:
+    """Get the profiler for this worker process."""
+    return _profiler
+
+
+def get_startup_profile() -> StartupProfile:
+    """Get the startup timings of this worker process."""
+    return _startup_profile
@@ -16,6 +16,7 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from homelab_cmd.db.models.scan import Scan, ScanStatus, ScanType
+from homelab_cmd.services.event_bus import EventTopic, publish
 from homelab_cmd.services.ssh import get_ssh_service
 
 logger = logging.getLogger(__name__)
@@ -391,6 +392,7 @@ class ScanService:
             scan.progress = percent
             scan.current_step = step
             await session.commit()
+            _publish_scan_progress(scan)
             if progress_callback:
                 progress_callback(percent, step)
 
@@ -414,6 +416,7 @@ class ScanService:
                 scan.error = os_result.error
                 scan.completed_at = datetime.now(UTC)
                 await session.commit()
+                _publish_scan_progress(scan)
                 return results
 
             os_info = self.parse_os_release(os_result.stdout)
@@ -553,6 +556,7 @@ class ScanService:
             scan.results = results.to_dict()
             scan.completed_at = datetime.now(UTC)
             await session.commit()
+            _publish_scan_progress(scan)
 
         except Exception as e:
             logger.exception("Scan failed for %s: %s", scan.hostname, e)
@@ -560,10 +564,24 @@ class ScanService:
             scan.error = str(e)
             scan.completed_at = datetime.now(UTC)
             await session.commit()
+            _publish_scan_progress(scan)
 
         return results
 
 
+def _publish_scan_progress(scan: Scan) -> None:
+    """Publish a scan's progress on the live update bus."""
+    publish(
+        EventTopic.SCAN_PROGRESS,
+        {
+            "scan_id": scan.id,
+            "status": scan.status,
+            "progress": scan.progress,
+            "current_step": scan.current_step,
+        },
+    )
+
+
 # Module-level instance for convenience
 _scan_service: ScanService | None = None
 
@@ -6,8 +6,12 @@ This module provides scheduled jobs for:
 - Pruning old metrics data beyond retention period (US0009)
 - Tiered data retention with rollup (US0046)
 - Configuration drift detection (US0122)
+
+Jobs are wrapped with leader_only so that with several hub workers only the
+one holding the scheduler lease runs them.
 """
 
+import asyncio
 import logging
 import time
 from datetime import UTC, datetime, timedelta
@@ -15,13 +19,20 @@ from datetime import UTC, datetime, timedelta
 from sqlalchemy import delete, func, select
 
 from homelab_cmd.api.schemas.config import NotificationsConfig
+from homelab_cmd.config import get_settings
 from homelab_cmd.db.models.alert import Alert, AlertStatus
 from homelab_cmd.db.models.config_check import ConfigCheck
 from homelab_cmd.db.models.metrics import Metrics, MetricsDaily, MetricsHourly
 from homelab_cmd.db.models.server import Server, ServerStatus
 from homelab_cmd.db.session import get_session_factory
 from homelab_cmd.services.alerting import AlertEvent, AlertingService
+from homelab_cmd.services.compliance_service import ComplianceCheckService
+from homelab_cmd.services.coordination import leader_only
+from homelab_cmd.services.credential_service import CredentialService
+from homelab_cmd.services.event_bus import EventTopic, publish
+from homelab_cmd.services.host_key_service import HostKeyService
 from homelab_cmd.services.notifier import get_notifier
+from homelab_cmd.services.ssh_executor import SSHPooledExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +49,11 @@ DAILY_RETENTION_DAYS = 365  # Keep daily aggregates for 12 months
 # Legacy constant for backward compatibility
 RETENTION_DAYS = RAW_RETENTION_DAYS
 
+# Compliance checks run at once during drift detection (each holds an SSH connection)
+DRIFT_CHECK_CONCURRENCY = 10
+
 
+@leader_only
 async def check_stale_servers(
     notifications_config: NotificationsConfig | None = None,
 ) -> int:
@@ -80,6 +95,14 @@ async def check_stale_servers(
         for server in stale_servers:
             server.status = ServerStatus.OFFLINE.value
             count += 1
+            publish(
+                EventTopic.SERVER_STATUS,
+                {
+                    "server_id": server.id,
+                    "status": ServerStatus.OFFLINE.value,
+                    "previous_status": ServerStatus.ONLINE.value,
+                },
+            )
 
             # Skip offline alerts for workstations (EP0009: US0089)
             if server.machine_type == "workstation":
@@ -172,6 +195,7 @@ async def check_offline_reminders(
     return reminders_sent
 
 
+@leader_only
 async def prune_old_metrics() -> int:
     """Delete metrics older than retention period.
 
@@ -448,6 +472,7 @@ async def prune_old_daily_metrics() -> int:
     return total_deleted
 
 
+@leader_only
 async def run_metrics_rollup() -> dict[str, int]:
     """Run all rollup operations in sequence.
 
@@ -500,14 +525,16 @@ async def run_metrics_rollup() -> dict[str, int]:
 # =============================================================================
 
 
+@leader_only
 async def check_config_drift(
     notifications_config: NotificationsConfig | None = None,
 ) -> dict[str, int]:
     """Check all eligible machines for configuration drift.
 
     Runs daily at 6am UTC. Queries servers with assigned packs and
-    drift_detection_enabled=True, checks compliance for each pack,
-    and creates/resolves alerts based on drift.
+    drift_detection_enabled=True, checks compliance for each pack
+    (concurrently, using manifest checks), and creates/resolves alerts
+    based on drift.
 
     Args:
         notifications_config: Optional notification settings for Slack alerts.
@@ -542,6 +569,7 @@ async def check_config_drift(
             return results
 
         results["servers_checked"] = len(servers)
+        results["errors"] += await _run_drift_compliance_checks(servers)
 
         # Get notifier if configured
         notifier = None
@@ -596,6 +624,63 @@ async def check_config_drift(
     return results
 
 
+async def _run_drift_compliance_checks(servers: list[Server]) -> int:
+    """Run a manifest compliance check for every pack assigned to the servers.
+
+    Checks run concurrently, up to DRIFT_CHECK_CONCURRENCY at a time, each
+    with its own session. They share one SSH executor, so checks of several
+    packs on a host reuse one connection. Hosts whose manifest has not
+    changed since the last check cost one short SSH command.
+
+    Args:
+        servers: Servers to check.
+
+    Returns:
+        Number of checks that failed.
+    """
+    # Deferred: the route module registers its pack cache with the coordinator
+    from homelab_cmd.api.routes.config_packs import get_config_pack_service
+
+    pack_service = get_config_pack_service()
+    encryption_key = get_settings().encryption_key or ""
+    session_factory = get_session_factory()
+    semaphore = asyncio.Semaphore(DRIFT_CHECK_CONCURRENCY)
+
+    async def check(ssh_executor: SSHPooledExecutor, server_id: str, pack_name: str) -> None:
+        async with semaphore, session_factory() as session:
+            server = await session.get(Server, server_id)
+            await ComplianceCheckService(pack_service, ssh_executor).check_compliance(
+                session, server, pack_name, use_manifest=True
+            )
+
+    checks = [
+        (server.id, pack_name) for server in servers for pack_name in server.assigned_packs or []
+    ]
+    # Credential and host key lookups use the executor's own session
+    async with session_factory() as executor_session:
+        ssh_executor = SSHPooledExecutor(
+            CredentialService(executor_session, encryption_key), HostKeyService(executor_session)
+        )
+        try:
+            outcomes = await asyncio.gather(
+                *(check(ssh_executor, server_id, pack_name) for server_id, pack_name in checks),
+                return_exceptions=True,
+            )
+        finally:
+            await ssh_executor.close()
+        # Host keys first seen during the run
+        await executor_session.commit()
+
+    failed = 0
+    for (server_id, pack_name), outcome in zip(checks, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            logger.warning(
+                "Compliance check failed for server %s pack %s: %s", server_id, pack_name, outcome
+            )
+            failed += 1
+    return failed
+
+
 async def _check_server_pack_drift(
     session,
     server: Server,
@@ -817,6 +902,7 @@ async def _resolve_drift_alert(
 # =============================================================================
 
 
+@leader_only
 async def capture_daily_costs() -> int:
     """Capture daily cost snapshots for all servers.
 
@@ -847,15 +933,18 @@ async def capture_daily_costs() -> int:
     return count
 
 
+@leader_only
 async def rollup_cost_snapshots() -> dict[str, int]:
-    """Roll up old daily cost data to monthly aggregates.
+    """Prune daily cost data older than the retention period.
 
-    AC6: Data retention - daily data older than 2 years rolled up.
+    AC6: Data retention - daily data older than 2 years rolled up. The
+    weekly and monthly aggregates are maintained at capture time, so only
+    the daily tier needs pruning.
 
     Schedule: 0 2 1 * * (1st of month, 2am UTC)
 
     Returns:
-        Dictionary with counts: {'daily_deleted': N, 'monthly_created': N}
+        Dictionary with counts: {'daily_deleted': N}
     """
     from homelab_cmd.services.cost_history import CostHistoryService
 
@@ -869,10 +958,8 @@ async def rollup_cost_snapshots() -> dict[str, int]:
 
     elapsed = time.monotonic() - start_time
     logger.info(
-        "Cost snapshot rollup completed in %.2f seconds: "
-        "monthly_created=%d, daily_deleted=%d",
+        "Cost snapshot rollup completed in %.2f seconds: daily_deleted=%d",
         elapsed,
-        result["monthly_created"],
         result["daily_deleted"],
     )
 
@@ -13,6 +13,8 @@ US0071: SSH Key Manager UI
 US0093: Unified SSH Key Management
 """
 
+from __future__ import annotations
+
 import asyncio
 import base64
 import hashlib
@@ -27,13 +29,15 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import paramiko
-from paramiko import AuthenticationException, SSHException
-
 from homelab_cmd.config import get_settings
+from homelab_cmd.lazy_imports import lazy_import
 
 if TYPE_CHECKING:
+    import paramiko
     from sqlalchemy.ext.asyncio import AsyncSession
+else:
+    # Loaded on first SSH use rather than at startup
+    paramiko = lazy_import("paramiko")
 
 logger = logging.getLogger(__name__)
 
@@ -616,7 +620,7 @@ class SSHConnectionService:
                     key_used=key_name,
                 )
 
-            except AuthenticationException as e:
+            except paramiko.AuthenticationException as e:
                 # Edge case 5: Key rejected, try next key
                 last_error = f"Authentication failed: {e}"
                 logger.debug("Key %s rejected for %s@%s: %s", key_name, username, hostname, e)
@@ -635,7 +639,7 @@ class SSHConnectionService:
                 last_error = str(e)
                 logger.debug("Connection error with %s: %s", key_name, e)
 
-            except SSHException as e:
+            except paramiko.SSHException as e:
                 # Other SSH errors
                 last_error = f"SSH error: {e}"
                 logger.debug("SSH error with %s: %s", key_name, e)
@@ -771,7 +775,7 @@ class SSHConnectionService:
                     exit_code=exit_code,
                 )
 
-            except AuthenticationException as e:
+            except paramiko.AuthenticationException as e:
                 last_error = f"Authentication failed: {e}"
                 logger.debug("Key %s rejected for %s@%s: %s", key_name, username, hostname, e)
 
@@ -789,7 +793,7 @@ class SSHConnectionService:
                 last_error = str(e)
                 logger.debug("Connection error with %s: %s", key_name, e)
 
-            except SSHException as e:
+            except paramiko.SSHException as e:
                 last_error = f"SSH error: {e}"
                 logger.debug("SSH error with %s: %s", key_name, e)
 
@@ -861,7 +865,7 @@ class SSHConnectionService:
                 stderr=stderr_text,
                 exit_code=exit_code,
             )
-        except AuthenticationException as err:
+        except paramiko.AuthenticationException as err:
             return CommandResult(
                 success=False,
                 stdout="",
@@ -885,7 +889,7 @@ class SSHConnectionService:
                 exit_code=-1,
                 error=str(err),
             )
-        except SSHException as err:
+        except paramiko.SSHException as err:
             return CommandResult(
                 success=False,
                 stdout="",
@@ -1046,7 +1050,7 @@ def get_ssh_service() -> SSHConnectionService:
     return _ssh_service
 
 
-async def migrate_tailscale_ssh_key(session: "AsyncSession") -> bool:
+async def migrate_tailscale_ssh_key(session: AsyncSession) -> bool:
     """Migrate SSH key from TailscaleSSHSettings (credential store) to unified SSHKeyManager.
 
     US0093: Unified SSH Key Management - AC4
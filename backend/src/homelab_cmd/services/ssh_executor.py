@@ -19,21 +19,28 @@ import hashlib
 import io
 import logging
 import time
+import weakref
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
-import paramiko
-from paramiko import AuthenticationException, SSHException
-
+from homelab_cmd.lazy_imports import lazy_import
 from homelab_cmd.services.credential_service import CredentialService
 from homelab_cmd.services.host_key_service import HostKeyService
 
 if TYPE_CHECKING:
+    import paramiko
+
     from homelab_cmd.db.models.server import Server
+else:
+    # Loaded on first SSH use rather than at startup
+    paramiko = lazy_import("paramiko")
 
 logger = logging.getLogger(__name__)
 
+# Live executors, for reporting pooled connections across all of them
+_executors: weakref.WeakSet[SSHPooledExecutor] = weakref.WeakSet()
+
 
 class SSHKeyNotConfiguredError(Exception):
     """Raised when SSH key is not configured."""
@@ -146,6 +153,9 @@ class SSHPooledExecutor:
     - AC4: Retry logic (3 attempts, 2s delay)
     - AC6: Host key verification (TOFU)
 
+    Safe to share between concurrent tasks: concurrent commands to one host
+    share its pooled connection.
+
     Args:
         credential_service: Service for retrieving SSH private key.
         host_key_service: Service for storing/verifying host keys.
@@ -164,6 +174,11 @@ class SSHPooledExecutor:
         self._credential_service = credential_service
         self._host_key_service = host_key_service
         self._pool: dict[str, tuple[paramiko.SSHClient, datetime]] = {}
+        # The services share one session, which cannot run concurrent queries
+        self._session_lock = asyncio.Lock()
+        # One connection attempt per host at a time, so concurrent callers share it
+        self._connect_locks: dict[str, asyncio.Lock] = {}
+        _executors.add(self)
 
     def _compute_fingerprint(self, key_bytes: bytes) -> str:
         """Compute SHA256 fingerprint of a host key."""
@@ -179,24 +194,24 @@ class SSHPooledExecutor:
         try:
             key_file.seek(0)
             return paramiko.Ed25519Key.from_private_key(key_file)
-        except SSHException:
+        except paramiko.SSHException:
             pass
 
         # Try RSA
         try:
             key_file.seek(0)
             return paramiko.RSAKey.from_private_key(key_file)
-        except SSHException:
+        except paramiko.SSHException:
             pass
 
         # Try ECDSA
         try:
             key_file.seek(0)
             return paramiko.ECDSAKey.from_private_key(key_file)
-        except SSHException:
+        except paramiko.SSHException:
             pass
 
-        raise SSHException("Unable to load SSH private key - unsupported format")
+        raise paramiko.SSHException("Unable to load SSH private key - unsupported format")
 
     def _load_file_based_key(self) -> paramiko.PKey | None:
         """Load SSH key from file-based storage (fallback for legacy configuration).
@@ -227,15 +242,15 @@ class SSHPooledExecutor:
                 try:
                     logger.debug("Trying file-based SSH key: %s", key_file)
                     return paramiko.RSAKey.from_private_key_file(str(key_file))
-                except SSHException:
+                except paramiko.SSHException:
                     pass
                 try:
                     return paramiko.Ed25519Key.from_private_key_file(str(key_file))
-                except SSHException:
+                except paramiko.SSHException:
                     pass
                 try:
                     return paramiko.ECDSAKey.from_private_key_file(str(key_file))
-                except SSHException:
+                except paramiko.SSHException:
                     pass
 
         # Also try any file that starts with id_
@@ -244,15 +259,15 @@ class SSHPooledExecutor:
                 try:
                     logger.debug("Trying file-based SSH key: %s", key_file)
                     return paramiko.Ed25519Key.from_private_key_file(str(key_file))
-                except SSHException:
+                except paramiko.SSHException:
                     pass
                 try:
                     return paramiko.RSAKey.from_private_key_file(str(key_file))
-                except SSHException:
+                except paramiko.SSHException:
                     pass
                 try:
                     return paramiko.ECDSAKey.from_private_key_file(str(key_file))
-                except SSHException:
+                except paramiko.SSHException:
                     pass
 
         logger.warning("No valid SSH key found in %s", key_path)
@@ -280,6 +295,16 @@ class SSHPooledExecutor:
             SSHAuthenticationError: If authentication fails.
             HostKeyChangedError: If host key has changed.
         """
+        async with self._connect_locks.setdefault(hostname, asyncio.Lock()):
+            return await self._get_connection(hostname, username, machine_id)
+
+    async def _get_connection(
+        self,
+        hostname: str,
+        username: str,
+        machine_id: str,
+    ) -> paramiko.SSHClient:
+        """Reuse the pooled connection to a host or open one (caller holds its lock)."""
         # Check pool for existing connection
         if hostname in self._pool:
             client, expires = self._pool[hostname]
@@ -297,7 +322,8 @@ class SSHPooledExecutor:
             del self._pool[hostname]
 
         # Get SSH private key from credential service or fall back to file-based keys
-        private_key = await self._credential_service.get_credential("ssh_private_key")
+        async with self._session_lock:
+            private_key = await self._credential_service.get_credential("ssh_private_key")
         pkey: paramiko.PKey | None = None
 
         if private_key:
@@ -312,7 +338,8 @@ class SSHPooledExecutor:
             raise SSHKeyNotConfiguredError()
 
         # Get stored host key for verification
-        stored_host_key = await self._host_key_service.get_host_key(machine_id)
+        async with self._session_lock:
+            stored_host_key = await self._host_key_service.get_host_key(machine_id)
 
         # Connect with retries
         logger.debug("Attempting SSH connection to %s@%s", username, hostname)
@@ -334,15 +361,17 @@ class SSHPooledExecutor:
                     if transport:
                         server_key = transport.get_remote_server_key()
                         fingerprint = self._compute_fingerprint(server_key.asbytes())
-                        await self._host_key_service.store_host_key(
-                            machine_id=machine_id,
-                            hostname=hostname,
-                            key_type=server_key.get_name(),
-                            public_key=server_key.get_base64(),
-                            fingerprint=fingerprint,
-                        )
+                        async with self._session_lock:
+                            await self._host_key_service.store_host_key(
+                                machine_id=machine_id,
+                                hostname=hostname,
+                                key_type=server_key.get_name(),
+                                public_key=server_key.get_base64(),
+                                fingerprint=fingerprint,
+                            )
                 else:
-                    await self._host_key_service.update_last_seen(machine_id)
+                    async with self._session_lock:
+                        await self._host_key_service.update_last_seen(machine_id)
 
                 # Add to pool
                 self._pool[hostname] = (client, datetime.now(UTC) + self.POOL_TTL)
@@ -352,11 +381,11 @@ class SSHPooledExecutor:
                 # Don't retry on host key change
                 raise
 
-            except AuthenticationException as e:
+            except paramiko.AuthenticationException as e:
                 # Don't retry on auth failure (not transient)
                 raise SSHAuthenticationError(hostname, username, str(e)) from e
 
-            except (SSHException, OSError, TimeoutError) as e:
+            except (paramiko.SSHException, OSError, TimeoutError) as e:
                 last_error = e
                 logger.warning(
                     "SSH connection attempt %d/%d to %s failed: %s",
@@ -438,12 +467,14 @@ class SSHPooledExecutor:
 
         try:
             # Get SSH private key
-            private_key = await self._credential_service.get_credential("ssh_private_key")
+            async with self._session_lock:
+                private_key = await self._credential_service.get_credential("ssh_private_key")
             if not private_key:
                 raise SSHKeyNotConfiguredError()
 
             pkey = await asyncio.to_thread(self._load_private_key, private_key)
-            stored_host_key = await self._host_key_service.get_host_key(machine_id)
+            async with self._session_lock:
+                stored_host_key = await self._host_key_service.get_host_key(machine_id)
 
             last_error: Exception | None = None
             for attempt in range(self.MAX_RETRIES):
@@ -467,15 +498,17 @@ class SSHPooledExecutor:
 
                         # Store host key if first connection
                         if not stored_host_key:
-                            await self._host_key_service.store_host_key(
-                                machine_id=machine_id,
-                                hostname=hostname,
-                                key_type=server_key.get_name(),
-                                public_key=server_key.get_base64(),
-                                fingerprint=fingerprint,
-                            )
+                            async with self._session_lock:
+                                await self._host_key_service.store_host_key(
+                                    machine_id=machine_id,
+                                    hostname=hostname,
+                                    key_type=server_key.get_name(),
+                                    public_key=server_key.get_base64(),
+                                    fingerprint=fingerprint,
+                                )
                         else:
-                            await self._host_key_service.update_last_seen(machine_id)
+                            async with self._session_lock:
+                                await self._host_key_service.update_last_seen(machine_id)
 
                     client.close()
 
@@ -493,10 +526,10 @@ class SSHPooledExecutor:
                 except HostKeyChangedError:
                     raise
 
-                except AuthenticationException as e:
+                except paramiko.AuthenticationException as e:
                     raise SSHAuthenticationError(hostname, username, str(e)) from e
 
-                except (SSHException, OSError, TimeoutError) as e:
+                except (paramiko.SSHException, OSError, TimeoutError) as e:
                     last_error = e
                     if attempt < self.MAX_RETRIES - 1:
                         await asyncio.sleep(self.RETRY_DELAY)
@@ -574,7 +607,8 @@ class SSHPooledExecutor:
             )
 
         # Get SSH username - per-server override or global default
-        ssh_username = await self._credential_service.get_credential("ssh_username")
+        async with self._session_lock:
+            ssh_username = await self._credential_service.get_credential("ssh_username")
         username = server.ssh_username or ssh_username or "homelabcmd"
 
         logger.info(
@@ -631,7 +665,7 @@ class SSHPooledExecutor:
                 timeout=timeout,
             ) from e
 
-        except (SSHException, OSError) as e:
+        except (paramiko.SSHException, OSError) as e:
             # Connection dropped mid-command - remove from pool and retry once
             logger.warning(
                 "Connection error during command on %s: %s. Retrying with new connection.",
@@ -716,3 +750,8 @@ class SSHPooledExecutor:
     async def close(self) -> None:
         """Close all connections and clean up."""
         await self.clear_pool()
+
+
+def pooled_connection_count() -> int:
+    """Number of SSH connections held open across all executor pools."""
+    return sum(len(executor._pool) for executor in list(_executors))
@@ -0,0 +1,264 @@
+"""Persisted SSH reachability for Tailscale devices.
+
+EP0016: Unified Discovery Experience (US0096, US0097).
+
+The discovery page shows whether each online Tailscale device accepts SSH.
+Testing every device on every page load is slow and floods the tailnet
+with connections, so results are stored per device:
+
+- Results younger than SSH_STATUS_TTL_SECONDS are served as they are.
+- Older results are served at once and re-tested in the background.
+- Devices never tested are tested inline, a bounded number at a time.
+
+Results live in the database, so they survive restarts and are shared by
+every hub worker.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from homelab_cmd.db.models.config import Config
+from homelab_cmd.db.models.ssh_reachability import DeviceSSHReachability
+from homelab_cmd.db.session import get_session_factory
+from homelab_cmd.services.ssh import get_ssh_service
+from homelab_cmd.services.tailscale_service import TailscaleDevice
+
+logger = logging.getLogger(__name__)
+
+# How long an SSH test result is current before it is re-tested
+SSH_STATUS_TTL_SECONDS = 900
+
+# Maximum SSH tests in flight at once
+SSH_TEST_CONCURRENCY = 10
+
+# Per-device SSH test timeout
+SSH_TEST_TIMEOUT_SECONDS = 10.0
+
+NO_SSH_KEY_ERROR = "No SSH key configured. Upload a key in Settings > Connectivity."
+
+# Devices with a background re-test in flight (per worker)
+_retesting: set[str] = set()
+_retest_tasks: set[asyncio.Task] = set()
+
+
+@dataclass
+class SSHReachability:
+    """SSH test result for one device."""
+
+    status: str
+    error: str | None
+    key_used: str | None
+    tested_at: datetime
+
+    @property
+    def is_current(self) -> bool:
+        """Whether the result is younger than SSH_STATUS_TTL_SECONDS."""
+        tested_at = self.tested_at
+        if tested_at.tzinfo is None:
+            tested_at = tested_at.replace(tzinfo=UTC)
+        return (datetime.now(UTC) - tested_at).total_seconds() < SSH_STATUS_TTL_SECONDS
+
+
+async def get_ssh_settings(session: AsyncSession) -> tuple[str, dict[str, str]]:
+    """Get the SSH username and per-key usernames from the database.
+
+    Returns:
+        Tuple of (username, key_usernames).
+    """
+    result = await session.execute(
+        select(Config.key, Config.value).where(Config.key.in_(["ssh_username", "ssh"]))
+    )
+    values = dict(result.all())
+    username = values.get("ssh_username") or "homelabcmd"
+    ssh_config = values.get("ssh") or {}
+    key_usernames = ssh_config.get("key_usernames", {}) if isinstance(ssh_config, dict) else {}
+    return username, key_usernames
+
+
+async def check_device_ssh(
+    device: TailscaleDevice,
+    username: str,
+    key_usernames: dict[str, str],
+) -> SSHReachability:
+    """Test SSH to one device now, without consulting stored results.
+
+    Uses the unified SSH key management (US0093) via SSHConnectionService.
+
+    Args:
+        device: Device to test (should be online).
+        username: Default SSH username.
+        key_usernames: Per-key usernames.
+
+    Returns:
+        The test result.
+    """
+    ssh_service = get_ssh_service()
+    if not ssh_service.list_keys_with_metadata():
+        return SSHReachability("unavailable", NO_SSH_KEY_ERROR, None, datetime.now(UTC))
+
+    # Use Tailscale IP for reliable connectivity (hostname may not resolve)
+    ssh_hostname = device.tailscale_ip or device.name or device.hostname
+    try:
+        result = await asyncio.wait_for(
+            ssh_service.test_connection(
+                hostname=ssh_hostname,
+                username=username,
+                key_usernames=key_usernames,
+            ),
+            timeout=SSH_TEST_TIMEOUT_SECONDS,
+        )
+    except TimeoutError:
+        return SSHReachability(
+            "unavailable",
+            f"SSH test timed out after {int(SSH_TEST_TIMEOUT_SECONDS)}s",
+            None,
+            datetime.now(UTC),
+        )
+    except Exception as e:
+        return SSHReachability(
+            "unavailable", str(e) or "SSH connection failed", None, datetime.now(UTC)
+        )
+
+    if result.success:
+        return SSHReachability("available", None, result.key_used, datetime.now(UTC))
+    return SSHReachability(
+        "unavailable", result.error or "SSH connection failed", None, datetime.now(UTC)
+    )
+
+
+async def _check_devices(
+    devices: list[TailscaleDevice], username: str, key_usernames: dict[str, str]
+) -> dict[str, SSHReachability]:
+    """Test SSH to several devices, SSH_TEST_CONCURRENCY at a time."""
+    semaphore = asyncio.Semaphore(SSH_TEST_CONCURRENCY)
+
+    async def check(device: TailscaleDevice) -> SSHReachability:
+        async with semaphore:
+            return await check_device_ssh(device, username, key_usernames)
+
+    results = await asyncio.gather(*(check(d) for d in devices))
+    return {d.id: r for d, r in zip(devices, results, strict=True)}
+
+
+async def load_reachability(
+    session: AsyncSession, device_ids: list[str]
+) -> dict[str, SSHReachability]:
+    """Load stored SSH results for devices.
+
+    Returns:
+        Results keyed by device ID (devices never tested are absent).
+    """
+    if not device_ids:
+        return {}
+    result = await session.execute(
+        select(DeviceSSHReachability).where(DeviceSSHReachability.device_id.in_(device_ids))
+    )
+    return {
+        row.device_id: SSHReachability(row.status, row.error, row.key_used, row.tested_at)
+        for row in result.scalars().all()
+    }
+
+
+async def store_reachability(session: AsyncSession, results: dict[str, SSHReachability]) -> None:
+    """Store SSH results, replacing each device's previous result."""
+    if not results:
+        return
+    stmt = sqlite_insert(DeviceSSHReachability).values(
+        [
+            {
+                "device_id": device_id,
+                "status": r.status,
+                "error": r.error,
+                "key_used": r.key_used,
+                "tested_at": r.tested_at,
+            }
+            for device_id, r in results.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["device_id"],
+        set_={
+            column: stmt.excluded[column] for column in ("status", "error", "key_used", "tested_at")
+        },
+    )
+    await session.execute(stmt)
+
+
+async def clear_reachability(session: AsyncSession) -> None:
+    """Forget every stored SSH result so devices are tested afresh."""
+    await session.execute(delete(DeviceSSHReachability))
+
+
+async def get_reachability(
+    session: AsyncSession, devices: list[TailscaleDevice]
+) -> dict[str, SSHReachability]:
+    """Get SSH reachability for online devices, testing only where needed.
+
+    Current results are returned as stored. Out-of-date results are returned
+    as stored and re-tested in the background. Devices never tested are
+    tested before returning.
+
+    Args:
+        session: Database session (new results are added, not committed).
+        devices: Online devices.
+
+    Returns:
+        Results keyed by device ID.
+    """
+    if not get_ssh_service().list_keys_with_metadata():
+        # Not worth storing: it changes as soon as a key is uploaded
+        now = datetime.now(UTC)
+        return {d.id: SSHReachability("unavailable", NO_SSH_KEY_ERROR, None, now) for d in devices}
+
+    stored = await load_reachability(session, [d.id for d in devices])
+    untested = [d for d in devices if d.id not in stored]
+    outdated = [d for d in devices if d.id in stored and not stored[d.id].is_current]
+
+    if not untested and not outdated:
+        return stored
+
+    username, key_usernames = await get_ssh_settings(session)
+
+    if outdated:
+        _retest_in_background(outdated, username, key_usernames)
+
+    if untested:
+        fresh = await _check_devices(untested, username, key_usernames)
+        await store_reachability(session, fresh)
+        stored.update(fresh)
+
+    return stored
+
+
+def _retest_in_background(
+    devices: list[TailscaleDevice], username: str, key_usernames: dict[str, str]
+) -> None:
+    """Re-test devices behind the caller, skipping any already being re-tested."""
+    devices = [d for d in devices if d.id not in _retesting]
+    if not devices:
+        return
+    _retesting.update(d.id for d in devices)
+    task = asyncio.create_task(_retest(devices, username, key_usernames))
+    _retest_tasks.add(task)
+    task.add_done_callback(_retest_tasks.discard)
+
+
+async def _retest(
+    devices: list[TailscaleDevice], username: str, key_usernames: dict[str, str]
+) -> None:
+    try:
+        results = await _check_devices(devices, username, key_usernames)
+        async with get_session_factory()() as session:
+            await store_reachability(session, results)
+            await session.commit()
+        logger.debug("Re-tested SSH for %d Tailscale devices", len(devices))
+    except Exception as e:
+        logger.warning("Background SSH re-test failed: %s", e)
+    finally:
+        _retesting.difference_update(d.id for d in devices)
@@ -6,14 +6,24 @@ Provides async HTTP client for Tailscale API with proper error handling,
 timeout configuration, rate limit respect, and device discovery with caching.
 """
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
-import httpx
-
+from homelab_cmd.config import get_settings
+from homelab_cmd.db.session import get_session_factory
+from homelab_cmd.lazy_imports import lazy_import
 from homelab_cmd.services.credential_service import CredentialService
 
+if TYPE_CHECKING:
+    import httpx
+else:
+    # Loaded on first outbound request rather than at startup
+    httpx = lazy_import("httpx")
+
 logger = logging.getLogger(__name__)
 
 
@@ -157,14 +167,23 @@ class TailscaleCache:
     """In-memory cache for Tailscale device list with 5-minute TTL.
 
     Part of US0077: Tailscale Device Discovery.
+
+    Past the TTL the device list is still served for up to STALE_TTL while a
+    single background refresh fetches a new one, so callers never wait on the
+    Tailscale API for data that is merely a few minutes old. The API's ETag is
+    kept so refreshes can be conditional.
     """
 
     TTL = timedelta(minutes=5)
+    STALE_TTL = timedelta(hours=1)
 
     def __init__(self) -> None:
         """Initialise empty cache."""
         self._devices: list[dict] | None = None
         self._cached_at: datetime | None = None
+        self.etag: str | None = None
+        self._generation = 0
+        self._refresh_task: asyncio.Task | None = None
 
     def get(self) -> tuple[list[dict] | None, datetime | None]:
         """Return cached devices if not expired.
@@ -177,23 +196,81 @@ class TailscaleCache:
                 return self._devices, self._cached_at
         return None, None
 
-    def set(self, devices: list[dict]) -> datetime:
+    def get_stale(self) -> tuple[list[dict] | None, datetime | None]:
+        """Return cached devices past the TTL but still within STALE_TTL.
+
+        Returns:
+            Tuple of (devices, cached_at) or (None, None) if too old or empty.
+        """
+        if self._devices is not None and self._cached_at is not None:
+            if datetime.now(UTC) - self._cached_at < self.STALE_TTL:
+                return self._devices, self._cached_at
+        return None, None
+
+    def set(self, devices: list[dict], etag: str | None = None) -> datetime:
         """Cache devices and return the cache timestamp.
 
         Args:
             devices: List of device dictionaries to cache.
+            etag: ETag the Tailscale API returned with the devices.
 
         Returns:
             The timestamp when the cache was set.
         """
         self._devices = devices
         self._cached_at = datetime.now(UTC)
+        self.etag = etag
         return self._cached_at
 
+    def touch(self) -> tuple[list[dict] | None, datetime]:
+        """Mark the cached devices fresh after the API reported no change.
+
+        Returns:
+            Tuple of (devices, cached_at).
+        """
+        self._cached_at = datetime.now(UTC)
+        return self._devices, self._cached_at
+
     def invalidate(self) -> None:
         """Clear the cache."""
         self._devices = None
         self._cached_at = None
+        self.etag = None
+        # Drop the result of any refresh already in flight
+        self._generation += 1
+
+    def refresh_in_background(
+        self,
+        fetch: Callable[[str | None], Awaitable[tuple[list[dict] | None, str | None]]],
+    ) -> None:
+        """Start a background refresh unless one is already running.
+
+        Args:
+            fetch: Coroutine function taking the cached ETag and returning
+                (devices, etag), with devices None if unchanged.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._refresh(fetch, self._generation))
+
+    async def _refresh(
+        self,
+        fetch: Callable[[str | None], Awaitable[tuple[list[dict] | None, str | None]]],
+        generation: int,
+    ) -> None:
+        try:
+            devices, etag = await fetch(self.etag)
+        except Exception as e:
+            # Keep serving the stale list; the next caller retries
+            logger.warning("Background Tailscale device refresh failed: %s", e)
+            return
+        if generation != self._generation:
+            return
+        if devices is None:
+            self.touch()
+        else:
+            self.set(devices, etag)
+        logger.debug("Refreshed Tailscale devices in background")
 
 
 # =============================================================================
@@ -343,6 +420,29 @@ class TailscaleService:
         Returns:
             List of device dictionaries from the Tailscale API.
 
+        Raises:
+            TailscaleNotConfiguredError: If no token is configured.
+            TailscaleAuthError: If token is invalid or lacks permissions.
+            TailscaleRateLimitError: If rate limited.
+            TailscaleConnectionError: If connection fails.
+        """
+        devices, _ = await self.get_devices_if_changed()
+        return devices or []
+
+    async def get_devices_if_changed(
+        self, etag: str | None = None
+    ) -> tuple[list[dict] | None, str | None]:
+        """Retrieve all devices unless they match a previously seen ETag.
+
+        Sends If-None-Match when an ETag is given; a 304 response means the
+        cached list is still current.
+
+        Args:
+            etag: ETag from the last successful fetch.
+
+        Returns:
+            Tuple of (devices, etag); devices is None if unchanged.
+
         Raises:
             TailscaleNotConfiguredError: If no token is configured.
             TailscaleAuthError: If token is invalid or lacks permissions.
@@ -350,13 +450,20 @@ class TailscaleService:
             TailscaleConnectionError: If connection fails.
         """
         token = await self._get_token()
+        headers = {"Authorization": f"Bearer {token}"}
+        if etag:
+            headers["If-None-Match"] = etag
 
         try:
             response = await self._client.get(
                 f"{self.BASE_URL}/tailnet/-/devices",
-                headers={"Authorization": f"Bearer {token}"},
+                headers=headers,
             )
 
+            if etag and response.status_code == 304:
+                logger.debug("Tailscale devices unchanged (ETag %s)", etag)
+                return None, etag
+
             # Handle HTTP errors
             if response.status_code == 401:
                 raise TailscaleAuthError("Invalid API token")
@@ -380,7 +487,7 @@ class TailscaleService:
             devices = data.get("devices", [])
 
             logger.info("Retrieved %d devices from Tailscale", len(devices))
-            return devices
+            return devices, response.headers.get("ETag")
 
         except httpx.ConnectTimeout:
             raise TailscaleConnectionError("Connection timed out after 10s") from None
@@ -423,21 +530,29 @@ class TailscaleService:
         """
         cache_hit = False
         cached_at = None
+        cached_devices = None
 
         if not refresh:
             cached_devices, cached_at = cache.get()
+            if cached_devices is None:
+                # Serve a stale list at once and refresh it behind the caller
+                cached_devices, cached_at = cache.get_stale()
+                if cached_devices is not None:
+                    cache.refresh_in_background(fetch_devices_in_background)
             if cached_devices is not None:
                 cache_hit = True
                 logger.debug("Cache hit for Tailscale devices")
-            else:
-                cached_devices = None
 
         if not cache_hit:
-            # Fetch fresh data from Tailscale API
-            raw_devices = await self.get_devices()
-            cached_at = cache.set(raw_devices)
-            cached_devices = raw_devices
-            logger.debug("Cache miss - fetched %d devices from Tailscale", len(raw_devices))
+            # Fetch from Tailscale API, conditionally if we still hold an old list
+            raw_devices, etag = await self.get_devices_if_changed(None if refresh else cache.etag)
+            if raw_devices is None:
+                cached_devices, cached_at = cache.touch()
+                logger.debug("Cache revalidated - Tailscale devices unchanged")
+            else:
+                cached_at = cache.set(raw_devices, etag)
+                cached_devices = raw_devices
+                logger.debug("Cache miss - fetched %d devices from Tailscale", len(raw_devices))
 
         # Transform to TailscaleDevice objects
         devices = [
@@ -454,3 +569,26 @@ class TailscaleService:
             cache_hit=cache_hit,
             cached_at=cached_at,
         )
+
+
+async def fetch_devices_in_background(
+    etag: str | None,
+) -> tuple[list[dict] | None, str | None]:
+    """Fetch devices outside any request, with a session of its own.
+
+    Used by TailscaleCache background refreshes, which outlive the request
+    (and its session and HTTP client) that triggered them.
+
+    Args:
+        etag: ETag from the last successful fetch.
+
+    Returns:
+        Tuple of (devices, etag); devices is None if unchanged.
+    """
+    settings = get_settings()
+    async with get_session_factory()() as session:
+        service = TailscaleService(CredentialService(session, settings.encryption_key or ""))
+        try:
+            return await service.get_devices_if_changed(etag)
+        finally:
+            await service.close()
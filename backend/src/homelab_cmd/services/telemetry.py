@@ -0,0 +1,528 @@
+"""Hub telemetry in OpenMetrics format for Prometheus scraping.
+
+Two kinds of series are exposed at /metrics:
+
+- Fleet gauges: the latest CPU, memory, disk, load and service states of
+  every server. Heartbeats handled by this worker update them in memory;
+  every FLEET_SYNC_INTERVAL_SECONDS (at most) a scrape reloads them from the
+  database so heartbeats handled by other workers and status changes made by
+  the scheduler are picked up. Scrapes in between read memory only.
+- Hub self-instrumentation: heartbeat count and ingest latency, HTTP
+  latency and statements per request by route, database query time,
+  scheduled job durations, SSH pool size and notifier queue depth. These
+  are per worker.
+
+The metric primitives here are deliberately small (no client library is
+needed): counters and histograms with fixed label names, and gauges read
+from callbacks at scrape time.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from homelab_cmd.db.models.metrics import Metrics
+from homelab_cmd.db.models.server import Server
+from homelab_cmd.db.models.service import CurrentServiceStatus
+from homelab_cmd.services.profiling import get_profiler
+
+logger = logging.getLogger(__name__)
+
+# Content type for the OpenMetrics text format
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Latency buckets in seconds (Prometheus client defaults)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Buckets for scheduled jobs, which run for seconds to minutes
+JOB_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+# Buckets for the number of statements a request runs
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+# Longest a scrape serves fleet gauges without reloading them from the database
+FLEET_SYNC_INTERVAL_SECONDS = 60
+
+# Heartbeat metrics exported as per-server gauges: (field, metric name, help)
+SERVER_GAUGES = (
+    ("cpu_percent", "homelab_server_cpu_percent", "CPU usage percentage."),
+    ("memory_percent", "homelab_server_memory_percent", "Memory usage percentage."),
+    ("disk_percent", "homelab_server_disk_percent", "Root disk usage percentage."),
+    ("load_1m", "homelab_server_load1", "1-minute load average."),
+    ("load_5m", "homelab_server_load5", "5-minute load average."),
+    ("load_15m", "homelab_server_load15", "15-minute load average."),
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+    return "{" + inner + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _sample(name: str, labels: dict[str, str], value: float) -> str:
+    return f"{name}{_format_labels(labels)} {_format_value(value)}"
+
+
+def _header(name: str, kind: str, help_text: str) -> list[str]:
+    return [f"# TYPE {name} {kind}", f"# HELP {name} {help_text}"]
+
+
+class Counter:
+    """Monotonic counter with fixed label names."""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        """Initialise the counter.
+
+        Args:
+            name: Family name (samples get a _total suffix).
+            help_text: Description shown by Prometheus.
+            labelnames: Names of the labels every sample carries.
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Add to the counter."""
+        key = tuple(labels[n] for n in self.labelnames)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value for a label set (0 if never incremented)."""
+        return self._values.get(tuple(labels[n] for n in self.labelnames), 0)
+
+    def render(self) -> list[str]:
+        """Render the family in OpenMetrics text format."""
+        lines = _header(self.name, "counter", self.help_text)
+        for key, value in sorted(self._values.items()):
+            lines.append(
+                _sample(f"{self.name}_total", dict(zip(self.labelnames, key, strict=True)), value)
+            )
+        return lines
+
+
+@dataclass
+class _HistogramSeries:
+    bucket_counts: list[int]
+    total: float = 0.0
+    count: int = 0
+
+
+class Histogram:
+    """Histogram with cumulative buckets and fixed label names."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialise the histogram.
+
+        Args:
+            name: Family name.
+            help_text: Description shown by Prometheus.
+            labelnames: Names of the labels every sample carries.
+            buckets: Upper bounds of the buckets, ascending (+Inf is added).
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self.buckets = (*buckets, float("inf"))
+        self._series: dict[tuple[str, ...], _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation."""
+        key = tuple(labels[n] for n in self.labelnames)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _HistogramSeries([0] * len(self.buckets))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series.bucket_counts[i] += 1
+                break
+        series.total += value
+        series.count += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the duration of the with-block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Number of observations for a label set."""
+        series = self._series.get(tuple(labels[n] for n in self.labelnames))
+        return series.count if series else 0
+
+    def render(self) -> list[str]:
+        """Render the family in OpenMetrics text format."""
+        lines = _header(self.name, "histogram", self.help_text)
+        for key, series in sorted(self._series.items()):
+            labels = dict(zip(self.labelnames, key, strict=True))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, series.bucket_counts, strict=True):
+                cumulative += bucket_count
+                lines.append(
+                    _sample(
+                        f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+                    )
+                )
+            lines.append(_sample(f"{self.name}_count", labels, series.count))
+            lines.append(_sample(f"{self.name}_sum", labels, series.total))
+        return lines
+
+
+class CallbackGauge:
+    """Gauge whose value is read from a callback at scrape time."""
+
+    def __init__(self, name: str, help_text: str, read: Callable[[], float]) -> None:
+        """Initialise the gauge.
+
+        Args:
+            name: Metric name.
+            help_text: Description shown by Prometheus.
+            read: Returns the current value.
+        """
+        self.name = name
+        self.help_text = help_text
+        self.read = read
+
+    def render(self) -> list[str]:
+        """Render the gauge in OpenMetrics text format."""
+        try:
+            value = self.read()
+        except Exception as e:
+            logger.debug("Gauge %s unavailable: %s", self.name, e)
+            return []
+        return [*_header(self.name, "gauge", self.help_text), _sample(self.name, {}, value)]
+
+
+# =============================================================================
+# Hub self-instrumentation
+# =============================================================================
+
+HEARTBEATS = Counter(
+    "homelab_heartbeats",
+    "Heartbeat samples received from agents.",
+    ("endpoint",),
+)
+HEARTBEAT_DURATION = Histogram(
+    "homelab_heartbeat_duration_seconds",
+    "Time to apply a heartbeat request, excluding the final commit.",
+    ("endpoint",),
+)
+DB_QUERY_DURATION = Histogram(
+    "homelab_db_query_duration_seconds",
+    "Database statement execution time.",
+    ("operation",),
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "homelab_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route"),
+)
+HTTP_REQUEST_QUERIES = Histogram(
+    "homelab_http_request_db_queries",
+    "Database statements run per HTTP request.",
+    ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+JOB_DURATION = Histogram(
+    "homelab_scheduler_job_duration_seconds",
+    "Scheduled job run time.",
+    ("job",),
+    buckets=JOB_BUCKETS,
+)
+JOB_FAILURES = Counter(
+    "homelab_scheduler_job_failures",
+    "Scheduled job runs that raised.",
+    ("job",),
+)
+
+
+def _ssh_pool_size() -> float:
+    from homelab_cmd.services.ssh_executor import pooled_connection_count
+
+    return pooled_connection_count()
+
+
+def _notifier_queue_depth() -> float:
+    from homelab_cmd.services.notifier import queued_notification_count
+
+    return queued_notification_count()
+
+
+HUB_GAUGES = (
+    CallbackGauge(
+        "homelab_ssh_pool_connections",
+        "SSH connections held open in executor pools.",
+        _ssh_pool_size,
+    ),
+    CallbackGauge(
+        "homelab_notifier_queue_depth",
+        "Slack notifications waiting for a retry.",
+        _notifier_queue_depth,
+    ),
+)
+
+HUB_METRICS: tuple[Counter | Histogram, ...] = (
+    HEARTBEATS,
+    HEARTBEAT_DURATION,
+    DB_QUERY_DURATION,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUEST_QUERIES,
+    JOB_DURATION,
+    JOB_FAILURES,
+)
+
+
+def _statement_operation(statement: str) -> str:
+    """Classify a SQL statement by its leading keyword."""
+    keyword = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else ""
+    if keyword in ("select", "insert", "update", "delete", "with"):
+        return "select" if keyword == "with" else keyword
+    return "other"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    DB_QUERY_DURATION.observe(elapsed, operation=_statement_operation(statement))
+    get_profiler().record_statement(conn, statement, parameters, executemany, elapsed * 1000)
+
+
+def _handle_error(context) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    started = context.connection.info.get("query_started") if context.connection else None
+    if started and context.statement is not None:
+        started.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement the engine executes.
+
+    Timings feed the query duration histogram and the request profiler
+    (per-request statement counts and the slow-query log).
+
+    Args:
+        engine: Synchronous engine (AsyncEngine.sync_engine for async engines).
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+# =============================================================================
+# Fleet gauges
+# =============================================================================
+
+
+@dataclass
+class ServerSnapshot:
+    """Latest known state of one server."""
+
+    hostname: str
+    status: str
+    last_seen: datetime | None = None
+    metrics: dict[str, float | None] = field(default_factory=dict)
+    services: dict[str, str] = field(default_factory=dict)
+
+
+class FleetGauges:
+    """In-memory latest snapshot of every server, for scraping."""
+
+    def __init__(self) -> None:
+        """Initialise an empty snapshot that needs loading."""
+        self._servers: dict[str, ServerSnapshot] = {}
+        self._synced_at: float | None = None
+
+    @property
+    def needs_sync(self) -> bool:
+        """Whether the snapshot is due a reload from the database."""
+        return (
+            self._synced_at is None
+            or time.monotonic() - self._synced_at >= FLEET_SYNC_INTERVAL_SECONDS
+        )
+
+    def invalidate(self) -> None:
+        """Reload from the database on the next scrape."""
+        self._synced_at = None
+
+    def record_heartbeat(
+        self,
+        server_id: str,
+        hostname: str,
+        metrics: dict[str, float | None] | None,
+        services: dict[str, str] | None,
+    ) -> None:
+        """Update a server from a heartbeat handled by this worker.
+
+        Args:
+            server_id: Server identifier.
+            hostname: Server hostname.
+            metrics: Heartbeat metric values keyed by SERVER_GAUGES field.
+            services: Service states keyed by service name.
+        """
+        snapshot = self._servers.get(server_id)
+        if snapshot is None:
+            snapshot = self._servers[server_id] = ServerSnapshot(hostname, "online")
+        snapshot.hostname = hostname
+        snapshot.status = "online"
+        snapshot.last_seen = datetime.now(UTC)
+        if metrics is not None:
+            snapshot.metrics = metrics
+        if services:
+            snapshot.services.update(services)
+
+    async def sync(self, session: AsyncSession) -> None:
+        """Reload every server's latest state from the database.
+
+        Args:
+            session: Database session.
+        """
+        servers: dict[str, ServerSnapshot] = {}
+        result = await session.execute(
+            select(Server.id, Server.hostname, Server.status, Server.last_seen)
+        )
+        for server_id, hostname, status, last_seen in result.all():
+            servers[server_id] = ServerSnapshot(hostname, status, last_seen)
+
+        # Latest metrics row per server
+        latest = (
+            select(Metrics.server_id, func.max(Metrics.timestamp).label("timestamp"))
+            .group_by(Metrics.server_id)
+            .subquery()
+        )
+        fields = [f for f, _, _ in SERVER_GAUGES]
+        result = await session.execute(
+            select(Metrics.server_id, *(getattr(Metrics, f) for f in fields)).join(
+                latest,
+                (Metrics.server_id == latest.c.server_id)
+                & (Metrics.timestamp == latest.c.timestamp),
+            )
+        )
+        for server_id, *values in result.all():
+            if server_id in servers:
+                servers[server_id].metrics = dict(zip(fields, values, strict=True))
+
+        result = await session.execute(
+            select(
+                CurrentServiceStatus.server_id,
+                CurrentServiceStatus.service_name,
+                CurrentServiceStatus.status,
+            )
+        )
+        for server_id, service_name, status in result.all():
+            if server_id in servers:
+                servers[server_id].services[service_name] = status
+
+        self._servers = servers
+        self._synced_at = time.monotonic()
+
+    def render(self) -> list[str]:
+        """Render fleet gauges in OpenMetrics text format."""
+        servers = sorted(self._servers.items())
+        lines = _header("homelab_server_info", "gauge", "Server metadata; value is always 1.")
+        lines += [
+            _sample(
+                "homelab_server_info",
+                {"server_id": sid, "hostname": s.hostname, "status": s.status},
+                1,
+            )
+            for sid, s in servers
+        ]
+
+        lines += _header("homelab_server_up", "gauge", "Whether the server is online.")
+        lines += [
+            _sample("homelab_server_up", {"server_id": sid}, int(s.status == "online"))
+            for sid, s in servers
+        ]
+
+        lines += _header(
+            "homelab_server_last_seen_timestamp_seconds",
+            "gauge",
+            "Unix time of the server's last heartbeat.",
+        )
+        for sid, s in servers:
+            if s.last_seen is not None:
+                last_seen = s.last_seen
+                if last_seen.tzinfo is None:
+                    last_seen = last_seen.replace(tzinfo=UTC)
+                lines.append(
+                    _sample(
+                        "homelab_server_last_seen_timestamp_seconds",
+                        {"server_id": sid},
+                        round(last_seen.timestamp(), 3),
+                    )
+                )
+
+        for field_name, metric_name, help_text in SERVER_GAUGES:
+            lines += _header(metric_name, "gauge", help_text)
+            for sid, s in servers:
+                value = s.metrics.get(field_name)
+                if value is not None:
+                    lines.append(_sample(metric_name, {"server_id": sid}, value))
+
+        lines += _header("homelab_service_up", "gauge", "Whether a monitored service is running.")
+        for sid, s in servers:
+            for service_name, status in sorted(s.services.items()):
+                lines.append(
+                    _sample(
+                        "homelab_service_up",
+                        {"server_id": sid, "service": service_name, "status": status},
+                        int(status == "running"),
+                    )
+                )
+        return lines
+
+
+_fleet = FleetGauges()
+
+
+def get_fleet_gauges() -> FleetGauges:
+    """Get the fleet gauges for this worker process."""
+    return _fleet
+
+
+def render_openmetrics() -> str:
+    """Render fleet gauges and hub metrics as an OpenMetrics exposition.
+
+    The caller is responsible for syncing the fleet gauges first if due.
+    """
+    lines = _fleet.render()
+    for metric in HUB_METRICS:
+        lines += metric.render()
+    for gauge in HUB_GAUGES:
+        lines += gauge.render()
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
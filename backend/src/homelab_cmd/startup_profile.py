@@ -0,0 +1,240 @@
+"""Startup profiling for the hub.
+
+Measures what a hub does before agents can reach it. Run it with
+`homelabcmd-cli startup-profile`:
+
+- Import time: imports the application in a fresh interpreter with
+  python -X importtime and totals each module's own import time by
+  top-level package, so a heavy library newly imported at startup stands
+  out.
+- Cold start: starts a hub on a spare local port against a scratch
+  database and times how long it takes to accept its first heartbeat.
+  The first start creates the schema; later starts reuse it, as a hub
+  restarting after an upgrade would. Each hub's own startup phase timings
+  are read back from GET /api/v1/system/performance.
+"""
+
+import os
+import re
+import secrets
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+from cryptography.fernet import Fernet
+
+from homelab_cmd.loadtest import SyntheticAgent
+
+# Module whose import brings up the whole hub
+APP_MODULE = "homelab_cmd.main"
+
+# Seconds a hub is given to accept its first heartbeat
+COLD_START_TIMEOUT_SECONDS = 60.0
+
+# Seconds between connection attempts while the hub starts
+POLL_INTERVAL_SECONDS = 0.02
+
+# Server ID prefix of the heartbeat sent to a starting hub
+SERVER_ID_PREFIX = "startup"
+
+# One line of -X importtime output: self and cumulative microseconds, then
+# the module name indented two spaces per nesting level
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ModuleImport:
+    """Import time of one module, from python -X importtime."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        """Top-level package the module belongs to."""
+        return self.module.split(".", 1)[0]
+
+
+@dataclass
+class ImportProfile:
+    """Import times of every module loaded by importing the application."""
+
+    modules: list[ModuleImport] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        """Time spent importing, in milliseconds."""
+        return sum(m.cumulative_us for m in self.modules if m.depth == 0) / 1000
+
+    def by_package(self) -> dict[str, float]:
+        """Own import time of each top-level package in milliseconds, slowest first."""
+        totals: dict[str, float] = defaultdict(float)
+        for module in self.modules:
+            totals[module.package] += module.self_us / 1000
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def slowest(self, limit: int) -> list[ModuleImport]:
+        """Modules with the longest own import time."""
+        return sorted(self.modules, key=lambda m: m.self_us, reverse=True)[:limit]
+
+
+@dataclass
+class ColdStart:
+    """One hub start, from launching the process to its first heartbeat."""
+
+    first_heartbeat_ms: float
+    startup: dict[str, Any] = field(default_factory=dict)
+
+
+def parse_importtime(output: str) -> ImportProfile:
+    """Read the report python -X importtime writes to stderr.
+
+    Args:
+        output: The interpreter's stderr; lines that are not part of the
+            report (such as log messages) are ignored.
+
+    Returns:
+        Import time of each module.
+    """
+    profile = ImportProfile()
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            profile.modules.append(
+                ModuleImport(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+            )
+    return profile
+
+
+def profile_imports(module: str = APP_MODULE) -> ImportProfile:
+    """Import a module in a fresh interpreter and report its import times.
+
+    Args:
+        module: Module to import.
+
+    Returns:
+        Import time of each module loaded.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_cold_start(database: Path, timeout: float = COLD_START_TIMEOUT_SECONDS) -> ColdStart:
+    """Start a hub and time how long it takes to accept a heartbeat.
+
+    The hub runs as `python -m homelab_cmd.main` with one worker, listening
+    on a spare local port, and is stopped once it has answered.
+
+    Args:
+        database: SQLite file for the hub; created if missing.
+        timeout: Seconds to wait for the first heartbeat.
+
+    Returns:
+        Time to the first accepted heartbeat and the hub's startup timings.
+
+    Raises:
+        RuntimeError: If the hub exits, rejects the heartbeat or does not
+            answer within the timeout.
+    """
+    port = _free_port()
+    api_key = secrets.token_urlsafe(24)
+    env = os.environ | {
+        "HOMELAB_CMD_HOST": "127.0.0.1",
+        "HOMELAB_CMD_PORT": str(port),
+        "HOMELAB_CMD_WORKERS": "1",
+        "HOMELAB_CMD_DEBUG": "false",
+        "HOMELAB_CMD_API_KEY": api_key,
+        "HOMELAB_CMD_DATABASE_URL": f"sqlite:///{database}",
+    }
+    env.setdefault("HOMELAB_CMD_ENCRYPTION_KEY", Fernet.generate_key().decode())
+    heartbeat = SyntheticAgent(0, seed=1, prefix=SERVER_ID_PREFIX).heartbeat(60.0)
+
+    with tempfile.TemporaryFile() as log:
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", APP_MODULE], env=env, stdout=log, stderr=subprocess.STDOUT
+        )
+        try:
+            with httpx.Client(
+                base_url=f"http://127.0.0.1:{port}", headers={"X-API-Key": api_key}
+            ) as client:
+                while True:
+                    if process.poll() is not None:
+                        log.seek(0)
+                        output = log.read().decode(errors="replace")
+                        raise RuntimeError(f"Hub exited during startup:\n{output[-2000:]}")
+                    if time.perf_counter() - started > timeout:
+                        raise RuntimeError(f"Hub did not accept a heartbeat within {timeout:.0f}s")
+                    try:
+                        response = client.post("/api/v1/agents/heartbeat", json=heartbeat)
+                    except httpx.TransportError:
+                        time.sleep(POLL_INTERVAL_SECONDS)
+                        continue
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    if response.status_code != 200:
+                        raise RuntimeError(
+                            f"Hub rejected the heartbeat: HTTP {response.status_code}"
+                        )
+                    break
+
+                summary = client.get("/api/v1/system/performance", params={"limit": 1})
+                startup = summary.json().get("startup", {}) if summary.is_success else {}
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    return ColdStart(first_heartbeat_ms=elapsed_ms, startup=startup)
+
+
+def format_startup_report(imports: ImportProfile, starts: list[ColdStart], limit: int) -> str:
+    """Render import and cold-start timings for the terminal."""
+    lines = [f"Import time: {imports.total_ms:.0f} ms", "  By package (own time):"]
+    lines.extend(
+        f"    {package:<24} {ms:8.1f} ms"
+        for package, ms in list(imports.by_package().items())[:limit]
+    )
+    lines.append("  Slowest modules (own time):")
+    lines.extend(f"    {m.module:<48} {m.self_us / 1000:8.1f} ms" for m in imports.slowest(limit))
+    for number, start in enumerate(starts, 1):
+        schema = "new database" if number == 1 else "existing database"
+        lines.append(
+            f"Cold start {number} ({schema}): first heartbeat after {start.first_heartbeat_ms:.0f} ms"
+        )
+        ready_ms = start.startup.get("ready_ms")
+        if ready_ms is not None:
+            lines.append(f"  Ready {ready_ms:.0f} ms after the hub started loading")
+        lines.extend(
+            f"    {phase['phase']:<24} {phase['duration_ms']:8.1f} ms"
+            for phase in start.startup.get("phases", [])
+        )
+    return "\n".join(lines)
@@ -0,0 +1 @@
+"""Microbenchmarks for HomelabCmd hub hot paths."""
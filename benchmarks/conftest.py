@@ -0,0 +1,270 @@
+"""Fixtures for the hub microbenchmarks.
+
+Database benchmarks run against seeded SQLite fleets: one file per fleet
+size, built once per session, holding 7 days of metrics for every server
+plus a sprinkling of open alerts. The same seed always builds the same
+fleet, so results are comparable between versions.
+
+Environment variables:
+    HOMELAB_BENCH_FLEET_SIZES: Comma-separated fleet sizes (default 10,100,1000).
+    HOMELAB_BENCH_SAMPLE_SECONDS: Seconds between seeded metrics rows
+        (default 300; agents report every 60, which makes a 1000-server
+        fleet take ten million rows).
+"""
+
+import asyncio
+import os
+import random
+import shutil
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from homelab_cmd.db.base import Base
+from homelab_cmd.db.models import (
+    Alert,
+    AlertSeverity,
+    AlertStatus,
+    AlertType,
+    Metrics,
+    Server,
+    ServerStatus,
+)
+from homelab_cmd.loadtest import OS_POOL
+
+pytest.importorskip("pytest_benchmark", reason="pip install -e '.[dev]' to run benchmarks")
+
+# Seed for every generated fleet and series
+SEED = 20240101
+
+# Days of metrics history in each fleet
+HISTORY_DAYS = 7
+
+# Metrics rows inserted per statement while seeding
+INSERT_CHUNK = 20_000
+
+# CPU models reported by seeded servers: (model, architecture)
+CPU_POOL = (
+    ("Intel(R) Core(TM) i5-8250U CPU @ 1.60GHz", "x86_64"),
+    ("Intel(R) Celeron(R) N5105 @ 2.00GHz", "x86_64"),
+    ("Intel(R) N100", "x86_64"),
+    ("AMD Ryzen 7 5800X 8-Core Processor", "x86_64"),
+    ("AMD Ryzen 5 5600G with Radeon Graphics", "x86_64"),
+    ("Intel(R) Xeon(R) CPU E5-2680 v4 @ 2.40GHz", "x86_64"),
+    ("AMD EPYC 7302P 16-Core Processor", "x86_64"),
+    ("Cortex-A72", "aarch64"),
+    ("Cortex-A76", "aarch64"),
+)
+
+FLEET_SIZES = [
+    int(size) for size in os.environ.get("HOMELAB_BENCH_FLEET_SIZES", "10,100,1000").split(",")
+]
+SAMPLE_SECONDS = int(os.environ.get("HOMELAB_BENCH_SAMPLE_SECONDS", "300"))
+
+
+@dataclass
+class Fleet:
+    """A seeded fleet database."""
+
+    size: int
+    path: Path
+    server_ids: list[str]
+    engine: AsyncEngine
+    sample_seconds: int
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        """Session factory configured like the hub's."""
+        return async_sessionmaker(self.engine, expire_on_commit=False)
+
+
+def async_url(path: Path) -> str:
+    """aiosqlite URL for a database file."""
+    return f"sqlite+aiosqlite:///{path}"
+
+
+def _drift(rng: random.Random, value: float, step: float) -> float:
+    return min(100.0, max(0.0, value + rng.uniform(-step, step)))
+
+
+def _server_rows(size: int, rng: random.Random, now: datetime) -> list[dict]:
+    rows = []
+    for index in range(size):
+        distribution, version, kernel = rng.choice(OS_POOL)
+        cpu_model, architecture = rng.choice(CPU_POOL)
+        rows.append(
+            {
+                "id": f"bench-{index:04d}",
+                "hostname": f"bench-{index:04d}.lab",
+                "ip_address": f"10.{index // 65536}.{index // 256 % 256}.{index % 256}",
+                "status": ServerStatus.ONLINE.value,
+                "os_distribution": distribution,
+                "os_version": version,
+                "kernel_version": kernel,
+                "architecture": architecture,
+                "cpu_model": cpu_model,
+                "cpu_cores": rng.choice((2, 4, 8, 16)),
+                "updates_available": rng.randint(0, 40),
+                "security_updates": rng.randint(0, 5),
+                "agent_version": "1.0.0",
+                "agent_mode": "readonly",
+                "filesystems": [
+                    {
+                        "mount_point": "/",
+                        "device": "/dev/sda1",
+                        "fs_type": "ext4",
+                        "total_bytes": 256 * 1024**3,
+                        "used_bytes": 100 * 1024**3,
+                        "available_bytes": 156 * 1024**3,
+                        "percent": 39.1,
+                    }
+                ],
+                "network_interfaces": [
+                    {
+                        "name": "eth0",
+                        "rx_bytes": rng.randint(10**8, 10**11),
+                        "tx_bytes": rng.randint(10**8, 10**11),
+                        "rx_packets": rng.randint(10**5, 10**8),
+                        "tx_packets": rng.randint(10**5, 10**8),
+                        "is_up": True,
+                    }
+                ],
+                "last_seen": now,
+                "created_at": now - timedelta(days=HISTORY_DAYS),
+                "updated_at": now,
+            }
+        )
+    return rows
+
+
+def _metrics_rows(server_id: str, rng: random.Random, now: datetime) -> Iterator[dict]:
+    samples = HISTORY_DAYS * 86400 // SAMPLE_SECONDS
+    cpu, memory, disk = rng.uniform(2, 40), rng.uniform(20, 70), rng.uniform(15, 80)
+    for sample in range(samples):
+        cpu = _drift(rng, cpu, 8)
+        memory = _drift(rng, memory, 2)
+        disk = _drift(rng, disk, 0.05)
+        yield {
+            "server_id": server_id,
+            "timestamp": now - timedelta(seconds=(samples - sample) * SAMPLE_SECONDS),
+            "cpu_percent": round(cpu, 1),
+            "memory_percent": round(memory, 1),
+            "memory_total_mb": 8192,
+            "memory_used_mb": int(8192 * memory / 100),
+            "disk_percent": round(disk, 1),
+            "disk_total_gb": 256.0,
+            "disk_used_gb": round(256 * disk / 100, 1),
+            "network_rx_bytes": sample * 10**6,
+            "network_tx_bytes": sample * 10**5,
+            "load_1m": round(cpu / 25, 2),
+            "load_5m": round(cpu / 25, 2),
+            "load_15m": round(cpu / 25, 2),
+            "uptime_seconds": sample * SAMPLE_SECONDS,
+        }
+
+
+def build_fleet(path: Path, size: int) -> list[str]:
+    """Create a fleet database file.
+
+    Args:
+        path: Database file to create.
+        size: Number of servers.
+
+    Returns:
+        IDs of the seeded servers.
+    """
+    rng = random.Random(SEED + size)
+    # Stored timestamps are naive UTC, as the hub writes them
+    now = datetime.now(UTC).replace(tzinfo=None, second=0, microsecond=0)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+
+    servers = _server_rows(size, rng, now)
+    with engine.begin() as conn:
+        conn.execute(insert(Server), servers)
+
+        chunk: list[dict] = []
+        for server in servers:
+            chunk.extend(_metrics_rows(server["id"], rng, now))
+            if len(chunk) >= INSERT_CHUNK:
+                conn.execute(insert(Metrics), chunk)
+                chunk = []
+        if chunk:
+            conn.execute(insert(Metrics), chunk)
+
+        alerts = [
+            {
+                "server_id": server["id"],
+                "alert_type": AlertType.DISK.value,
+                "severity": AlertSeverity.HIGH.value,
+                "status": AlertStatus.OPEN.value,
+                "title": f"Disk usage high on {server['hostname']}",
+                "threshold_value": 80.0,
+                "actual_value": 85.0,
+                "created_at": now - timedelta(hours=rng.randint(1, 48)),
+            }
+            for server in servers
+            if rng.random() < 0.1
+        ]
+        if alerts:
+            conn.execute(insert(Alert), alerts)
+    engine.dispose()
+
+    return [server["id"] for server in servers]
+
+
+@pytest.fixture(scope="session")
+def runner() -> Iterator[asyncio.Runner]:
+    """Event loop for running async code inside synchronous benchmarks.
+
+    pytest-benchmark times plain callables, so coroutines are driven by
+    runner.run() rather than by pytest-asyncio.
+    """
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture(scope="session", params=FLEET_SIZES, ids=lambda size: f"{size}-servers")
+def fleet(request, tmp_path_factory, runner) -> Iterator[Fleet]:
+    """A seeded fleet database, built once per fleet size."""
+    path = tmp_path_factory.mktemp("fleets") / f"fleet-{request.param}.db"
+    server_ids = build_fleet(path, request.param)
+    engine = create_async_engine(async_url(path))
+
+    yield Fleet(
+        size=request.param,
+        path=path,
+        server_ids=server_ids,
+        engine=engine,
+        sample_seconds=SAMPLE_SECONDS,
+    )
+
+    runner.run(engine.dispose())
+
+
+@pytest.fixture
+def fleet_copy(fleet, tmp_path, runner):
+    """Factory for throwaway copies of a fleet, for benchmarks that write.
+
+    Each call replaces the previous copy and returns a session factory
+    bound to the new one.
+    """
+    engines: list[AsyncEngine] = []
+    path = tmp_path / "fleet-copy.db"
+
+    def copy() -> async_sessionmaker:
+        while engines:
+            runner.run(engines.pop().dispose())
+        shutil.copyfile(fleet.path, path)
+        engines.append(create_async_engine(async_url(path)))
+        return async_sessionmaker(engines[0], expire_on_commit=False)
+
+    yield copy
+
+    while engines:
+        runner.run(engines.pop().dispose())
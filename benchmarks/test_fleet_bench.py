@@ -0,0 +1,53 @@
+"""Benchmarks for per-fleet request paths.
+
+Benchmarks cover:
+- list_servers building and serialising the dashboard's server list
+- AlertingService.evaluate_heartbeat for a quiet and a breaching heartbeat
+"""
+
+import json
+
+import pytest
+from fastapi import Response
+
+from homelab_cmd.api.routes.servers import list_servers
+from homelab_cmd.api.schemas.config import NotificationsConfig, ThresholdsConfig
+from homelab_cmd.services.alerting import AlertingService
+
+
+def test_list_servers(benchmark, fleet, runner) -> None:
+    """GET /api/v1/servers response building and serialisation."""
+
+    async def list_fleet():
+        async with fleet.session_factory() as session:
+            return await list_servers(response=Response(), session=session, _="benchmark")
+
+    response = benchmark(lambda: runner.run(list_fleet()))
+
+    assert json.loads(response.body)["total"] == fleet.size
+
+
+@pytest.mark.parametrize("cpu_percent", [35.0, 97.0], ids=["quiet", "breach"])
+def test_evaluate_heartbeat(benchmark, fleet, runner, cpu_percent) -> None:
+    """Alert evaluation for one heartbeat, rolled back after each round."""
+    server_id = fleet.server_ids[len(fleet.server_ids) // 2]
+    thresholds, notifications = ThresholdsConfig(), NotificationsConfig()
+
+    async def evaluate():
+        async with fleet.session_factory() as session:
+            service = AlertingService(session)
+            events = await service.evaluate_heartbeat(
+                server_id=server_id,
+                server_name=server_id,
+                cpu_percent=cpu_percent,
+                memory_percent=50.0,
+                disk_percent=45.0,
+                thresholds=thresholds,
+                notifications=notifications,
+            )
+            await session.rollback()
+            return events
+
+    events = benchmark(lambda: runner.run(evaluate()))
+
+    assert isinstance(events, list)
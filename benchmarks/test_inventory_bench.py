@@ -0,0 +1,94 @@
+"""Benchmarks for machine inventory parsing.
+
+Benchmarks cover:
+- infer_category_from_cpu across a fleet's worth of CPU models
+- ScanService.parse_* on command output from a busy host
+"""
+
+import pytest
+
+from homelab_cmd.services.power import infer_category_from_cpu
+from homelab_cmd.services.scan import ScanService
+
+from .conftest import CPU_POOL, FLEET_SIZES
+
+OS_RELEASE = """PRETTY_NAME="Ubuntu 24.04.1 LTS"
+NAME="Ubuntu"
+VERSION_ID="24.04"
+VERSION="24.04.1 LTS (Noble Numbat)"
+VERSION_CODENAME=noble
+ID=ubuntu
+ID_LIKE=debian
+HOME_URL="https://www.ubuntu.com/"
+SUPPORT_URL="https://help.ubuntu.com/"
+UBUNTU_CODENAME=noble
+"""
+
+FREE = """               total        used        free      shared  buff/cache   available
+Mem:     33554432000 12884901888  4294967296   536870912 16374562816 20669530112
+Swap:     2147483648           0  2147483648
+"""
+
+DF = "Filesystem     1024-blocks      Used Available Capacity Mounted on\n" + "".join(
+    f"/dev/sd{chr(97 + i)}1 512000000 {i * 20000000} {512000000 - i * 20000000} {i * 4}% /mnt/disk{i}\n"
+    for i in range(24)
+)
+
+DPKG = (
+    "Desired=Unknown/Install/Remove/Purge/Hold\n"
+    "| Status=Not/Inst/Conf-files/Unpacked/halF-conf/Half-inst/trig-aWait/Trig-pend\n"
+    "|/ Err?=(none)/Reinst-required (Status,Err: uppercase=bad)\n"
+    "||/ Name           Version      Architecture Description\n"
+    "+++-==============-============-============-=================================\n"
+    + "".join(f"ii  package-{i:04d}  1.{i}.0-1  amd64  Package number {i}\n" for i in range(1500))
+)
+
+PS = "USER         PID %CPU %MEM    VSZ   RSS TTY      STAT START   TIME COMMAND\n" + "".join(
+    f"user{i % 7}  {1000 + i}  {i % 50 / 10:.1f}  {i % 30 / 10:.1f} 168936 12288 ?  Ss  Jan20  0:05 /usr/bin/worker --id {i}\n"
+    for i in range(400)
+)
+
+IP_ADDR = "".join(
+    f"{i + 1}: eth{i}: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc fq_codel state UP group default qlen 1000\n"
+    f"    link/ether 00:11:22:33:44:{i:02x} brd ff:ff:ff:ff:ff:ff\n"
+    f"    inet 192.168.{i}.10/24 brd 192.168.{i}.255 scope global dynamic eth{i}\n"
+    "       valid_lft 86400sec preferred_lft 86400sec\n"
+    f"    inet6 fe80::{i}:5678:abcd:ef01/64 scope link\n"
+    "       valid_lft forever preferred_lft forever\n"
+    for i in range(16)
+)
+
+# Parser name and the output it parses
+PARSER_INPUTS = {
+    "os_release": OS_RELEASE,
+    "kernel_version": "6.8.0-45-generic\n",
+    "uptime": "345600.00 123456.78\n",
+    "disk_usage": DF,
+    "memory": FREE,
+    "package_count": "1505\n",
+    "package_list": DPKG,
+    "processes": PS,
+    "network_interfaces": IP_ADDR,
+}
+
+
+def test_infer_category_from_cpu(benchmark) -> None:
+    """Category inference for every server in the largest fleet."""
+    fleet = [CPU_POOL[i % len(CPU_POOL)] for i in range(max(FLEET_SIZES))]
+
+    def infer_all():
+        return [infer_category_from_cpu(model, architecture) for model, architecture in fleet]
+
+    categories = benchmark(infer_all)
+
+    assert len(categories) == len(fleet)
+
+
+@pytest.mark.parametrize("parser", list(PARSER_INPUTS))
+def test_scan_parser(benchmark, parser) -> None:
+    """One ScanService parser on realistic command output."""
+    parse = getattr(ScanService, f"parse_{parser}")
+
+    result = benchmark(parse, PARSER_INPUTS[parser])
+
+    assert result
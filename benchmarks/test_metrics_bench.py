@@ -0,0 +1,104 @@
+"""Benchmarks for metrics history, sparklines and the retention rollup.
+
+Benchmarks cover:
+- aggregate_metrics bucketing a week of one server's heartbeats by hour
+- downsample_metrics reducing sparkline series to their display size
+- rollup_raw_to_hourly rolling up a day of raw metrics for the whole fleet
+"""
+
+import random
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from homelab_cmd.api.routes.metrics import (
+    RANGE_CONFIG,
+    SPARKLINE_PERIODS,
+    TimeRange,
+    aggregate_metrics,
+    downsample_metrics,
+)
+from homelab_cmd.api.schemas.metrics import SparklinePoint
+from homelab_cmd.db.models import Metrics
+from homelab_cmd.services import scheduler
+
+from .conftest import HISTORY_DAYS, SEED
+
+# Seconds between an agent's heartbeats
+HEARTBEAT_SECONDS = 60
+
+
+def _series(samples: int) -> list[tuple[datetime, float]]:
+    """A random walk of CPU readings, one per heartbeat, oldest first."""
+    rng = random.Random(SEED)
+    end = datetime(2024, 1, 8, tzinfo=UTC)
+    value = 20.0
+    series = []
+    for sample in range(samples, 0, -1):
+        value = min(100.0, max(0.0, value + rng.uniform(-8, 8)))
+        series.append((end - timedelta(seconds=sample * HEARTBEAT_SECONDS), round(value, 1)))
+    return series
+
+
+def test_aggregate_metrics_week(benchmark) -> None:
+    """A week of heartbeats aggregated into hourly points for the 7d chart."""
+    metrics = [
+        Metrics(
+            server_id="bench-0000",
+            timestamp=timestamp,
+            cpu_percent=value,
+            memory_percent=value / 2,
+            disk_percent=40.0,
+        )
+        for timestamp, value in _series(7 * 86400 // HEARTBEAT_SECONDS)
+    ]
+    _, _, _, aggregation_seconds = RANGE_CONFIG[TimeRange.DAYS_7]
+
+    points = benchmark(aggregate_metrics, metrics, aggregation_seconds)
+
+    assert len(points) == 7 * 24
+
+
+@pytest.mark.parametrize("period", list(SPARKLINE_PERIODS))
+def test_downsample_sparkline(benchmark, period) -> None:
+    """Sparkline series downsampled with LTTB to their display size."""
+    minutes, target = SPARKLINE_PERIODS[period]
+    points = [
+        SparklinePoint(timestamp=timestamp, value=value)
+        for timestamp, value in _series(minutes * 60 // HEARTBEAT_SECONDS)
+    ]
+
+    result = benchmark(downsample_metrics, points, target)
+
+    assert len(result) <= target
+
+
+def test_rollup_raw_to_hourly(benchmark, fleet, fleet_copy, runner) -> None:
+    """The daily rollup of raw metrics that have aged past raw retention.
+
+    Retention is shortened by a day so the oldest day of the fleet's week
+    is rolled up, as the nightly job does. Each round runs on a fresh copy
+    of the fleet because the rollup deletes what it aggregates.
+    """
+
+    def setup():
+        factory = fleet_copy()
+        return (factory,), {}
+
+    def rollup(factory):
+        with patch.object(scheduler, "get_session_factory", return_value=factory):
+            return runner.run(scheduler.rollup_raw_to_hourly())
+
+    retention_days = scheduler.RAW_RETENTION_DAYS - 1
+    with patch.object(scheduler, "RAW_RETENTION_DAYS", retention_days):
+        created, deleted = benchmark.pedantic(rollup, setup=setup, rounds=3)
+
+    # Each server's rows from the oldest day; the hours at either end of it
+    # may be partial, so only those in between are sure to hold a row
+    samples = HISTORY_DAYS * 86400 // fleet.sample_seconds
+    aged = samples - retention_days * 86400 // fleet.sample_seconds
+    hours = aged if fleet.sample_seconds >= 3600 else 23
+    assert created >= fleet.size * hours
+    assert deleted >= fleet.size * aged
+    assert deleted >= created
@@ -0,0 +1,115 @@
+"""Benchmarks for encoding large API responses.
+
+Benchmarks cover:
+- A 1000-point metrics history, per-point and columnar
+- A 500-server list with latest metrics and per-server detail
+
+Each payload is encoded the way FastAPI releases before 0.130 encode a
+returned model (jsonable_encoder then json.dumps) and the way
+model_response encodes it, so comparing the two shows the saving.
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from homelab_cmd.api.routes.metrics import to_columns
+from homelab_cmd.api.schemas.metrics import (
+    MetricPoint,
+    MetricsColumnsResponse,
+    MetricsHistoryResponse,
+)
+from homelab_cmd.api.schemas.server import LatestMetrics, ServerListResponse, ServerResponse
+from homelab_cmd.api.serialisation import ModelResponse
+
+from .conftest import CPU_POOL
+
+# Data points in the history payload
+HISTORY_POINTS = 1000
+
+# Servers in the server list payload
+LIST_SERVERS = 500
+
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _history_points() -> list[MetricPoint]:
+    return [
+        MetricPoint(
+            timestamp=NOW - timedelta(minutes=HISTORY_POINTS - i),
+            cpu_percent=round(20 + (i % 37) * 1.7, 2),
+            memory_percent=round(40 + (i % 23) * 0.9, 2),
+            disk_percent=55.0,
+        )
+        for i in range(HISTORY_POINTS)
+    ]
+
+
+def _server(i: int) -> ServerResponse:
+    cpu_model, architecture = CPU_POOL[i % len(CPU_POOL)]
+    return ServerResponse(
+        id=f"server-{i:04d}",
+        hostname=f"server-{i:04d}.lan",
+        status="online",
+        cpu_model=cpu_model,
+        architecture=architecture,
+        os_distribution="Ubuntu",
+        os_version="24.04",
+        last_seen=NOW,
+        created_at=NOW,
+        updated_at=NOW,
+        latest_metrics=LatestMetrics(cpu_percent=12.5, memory_percent=48.2, disk_percent=61.0),
+        filesystems=[
+            {
+                "mount_point": f"/mnt/disk{d}",
+                "device": f"/dev/sd{chr(97 + d)}1",
+                "fs_type": "ext4",
+                "total_bytes": 512_000_000_000,
+                "used_bytes": d * 20_000_000_000,
+                "available_bytes": 512_000_000_000 - d * 20_000_000_000,
+                "percent": d * 4.0,
+            }
+            for d in range(4)
+        ],
+        active_alert_summaries=["Disk usage high"] if i % 10 == 0 else [],
+    )
+
+
+PAYLOADS = {
+    "history": lambda: MetricsHistoryResponse(
+        server_id="s",
+        range="24h",
+        resolution="1m",
+        data_points=_history_points(),
+        total_points=HISTORY_POINTS,
+    ),
+    "history-columns": lambda: MetricsColumnsResponse(
+        server_id="s",
+        range="24h",
+        resolution="1m",
+        columns=to_columns(_history_points()),
+        total_points=HISTORY_POINTS,
+    ),
+    "server-list": lambda: ServerListResponse(
+        servers=[_server(i) for i in range(LIST_SERVERS)], total=LIST_SERVERS
+    ),
+}
+
+# Encoder name and how it turns a response model into a body
+ENCODERS = {
+    "jsonable_encoder": lambda model: json.dumps(jsonable_encoder(model)).encode(),
+    "model_response": lambda model: ModelResponse(model).body,
+}
+
+
+@pytest.mark.parametrize("encoder", list(ENCODERS))
+@pytest.mark.parametrize("payload", list(PAYLOADS))
+def test_encode(benchmark, payload, encoder) -> None:
+    """Encode one large response body."""
+    model = PAYLOADS[payload]()
+
+    body = benchmark(ENCODERS[encoder], model)
+
+    assert json.loads(body) == json.loads(model.model_dump_json())
@@ -117,6 +117,7 @@ describe('Cost History API', () => {
         server_id: 'server-123',
         hostname: 'test-server',
         period: '30d',
+        aggregation: 'daily',
         items: [],
         currency_symbol: '£',
       };
@@ -150,5 +151,15 @@ describe('Cost History API', () => {
         '/servers/server-123/costs/history?period=90d'
       );
     });
+
+    it('fetches server cost history aggregated by month', async () => {
+      vi.mocked(client.fetchApi).mockResolvedValue({ items: [] });
+
+      await getServerCostHistory('server-123', '12m', 'monthly');
+
+      expect(client.fetchApi).toHaveBeenCalledWith(
+        '/servers/server-123/costs/history?period=12m&aggregation=monthly'
+      );
+    });
   });
 });
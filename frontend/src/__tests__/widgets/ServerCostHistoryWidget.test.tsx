@@ -51,6 +51,7 @@ describe('ServerCostHistoryWidget', () => {
     server_id: 'test-server-id',
     hostname: 'test-server',
     period: '30d',
+    aggregation: 'daily',
     items: mockItems,
     currency_symbol: '£',
   };
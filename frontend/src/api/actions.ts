@@ -10,6 +10,8 @@ export interface GetActionsParams {
   server_id?: string;
   limit?: number;
   offset?: number;
+  /** next_cursor of the previous page, instead of offset */
+  cursor?: string;
 }
 
 /**
@@ -21,6 +23,7 @@ export async function getActions(params?: GetActionsParams): Promise<ActionsResp
   if (params?.server_id) searchParams.set('server_id', params.server_id);
   if (params?.limit) searchParams.set('limit', params.limit.toString());
   if (params?.offset) searchParams.set('offset', params.offset.toString());
+  if (params?.cursor) searchParams.set('cursor', params.cursor);
 
   const query = searchParams.toString();
   const url = query ? `/api/v1/actions?${query}` : '/api/v1/actions';
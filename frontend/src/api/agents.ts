@@ -12,6 +12,9 @@ import type {
   AgentUpgradeResponse,
   AgentRemoveRequest,
   AgentRemoveResponse,
+  AgentRolloutListResponse,
+  AgentRolloutRequest,
+  AgentRolloutResponse,
   ServerActivateResponse,
 } from '../types/agent';
 
@@ -69,3 +72,48 @@ export async function removeAgent(
 export async function activateServer(serverId: string): Promise<ServerActivateResponse> {
   return api.put<ServerActivateResponse>(`/api/v1/agents/${serverId}/activate`, {});
 }
+
+/**
+ * Start a fleet agent rollout (canary wave first, then concurrent waves).
+ *
+ * @param request - Servers and wave settings
+ * @returns The pending rollout
+ */
+export async function createAgentRollout(
+  request: AgentRolloutRequest = {}
+): Promise<AgentRolloutResponse> {
+  return api.post<AgentRolloutResponse>('/api/v1/agents/rollouts', request);
+}
+
+/**
+ * List recent fleet agent rollouts, newest first.
+ *
+ * @returns Rollouts
+ */
+export async function listAgentRollouts(): Promise<AgentRolloutListResponse> {
+  return api.get<AgentRolloutListResponse>('/api/v1/agents/rollouts');
+}
+
+/**
+ * Get a fleet agent rollout's progress and per-server results.
+ *
+ * @param rolloutId - Rollout identifier
+ * @returns Rollout progress
+ */
+export async function getAgentRollout(rolloutId: number): Promise<AgentRolloutResponse> {
+  return api.get<AgentRolloutResponse>(`/api/v1/agents/rollouts/${rolloutId}`);
+}
+
+/**
+ * Pause, continue or cancel a fleet agent rollout.
+ *
+ * @param rolloutId - Rollout identifier
+ * @param action - Lifecycle action
+ * @returns Updated rollout
+ */
+export async function changeAgentRollout(
+  rolloutId: number,
+  action: 'pause' | 'unpause' | 'cancel'
+): Promise<AgentRolloutResponse> {
+  return api.post<AgentRolloutResponse>(`/api/v1/agents/rollouts/${rolloutId}/${action}`, {});
+}
@@ -6,6 +6,7 @@ import type {
   AlertResolveResponse,
   AlertFilters,
   PendingBreachesResponse,
+  PendingBreachFilters,
 } from '../types/alert';
 
 export async function getAlerts(filters?: AlertFilters): Promise<AlertsResponse> {
@@ -27,6 +28,9 @@ export async function getAlerts(filters?: AlertFilters): Promise<AlertsResponse>
     if (filters.offset !== undefined) {
       params.set('offset', filters.offset.toString());
     }
+    if (filters.cursor) {
+      params.set('cursor', filters.cursor);
+    }
   }
 
   const queryString = params.toString();
@@ -47,8 +51,30 @@ export async function resolveAlert(alertId: number): Promise<AlertResolveRespons
 }
 
 /**
- * Get pending breaches (conditions breached but sustained duration not yet met).
+ * Get pending breaches (conditions breached but sustained duration not yet met),
+ * soonest to fire first.
  */
-export async function getPendingBreaches(): Promise<PendingBreachesResponse> {
-  return api.get<PendingBreachesResponse>('/api/v1/alerts/pending');
+export async function getPendingBreaches(
+  filters?: PendingBreachFilters
+): Promise<PendingBreachesResponse> {
+  const params = new URLSearchParams();
+
+  if (filters) {
+    if (filters.server_id) {
+      params.set('server_id', filters.server_id);
+    }
+    if (filters.metric_type) {
+      params.set('metric_type', filters.metric_type);
+    }
+    if (filters.within !== undefined) {
+      params.set('within', filters.within.toString());
+    }
+    if (filters.limit !== undefined) {
+      params.set('limit', filters.limit.toString());
+    }
+  }
+
+  const queryString = params.toString();
+  const url = queryString ? `/api/v1/alerts/pending?${queryString}` : '/api/v1/alerts/pending';
+  return api.get<PendingBreachesResponse>(url);
 }
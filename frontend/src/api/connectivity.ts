@@ -8,6 +8,7 @@ import type {
   ConnectivityUpdateRequest,
   ConnectivityUpdateResponse,
   ConnectivityStatusBarResponse,
+  ConnectivityProbeListResponse,
 } from '../types/connectivity';
 
 /**
@@ -44,3 +45,14 @@ export async function getConnectivityStatusBar(): Promise<ConnectivityStatusBarR
     '/api/v1/settings/connectivity/status'
   );
 }
+
+/**
+ * List recent background connectivity probes for diagnostics.
+ *
+ * @returns Probe history, newest first, with the probe interval.
+ */
+export async function listConnectivityProbes(): Promise<ConnectivityProbeListResponse> {
+  return api.get<ConnectivityProbeListResponse>(
+    '/api/v1/settings/connectivity/probes'
+  );
+}
@@ -65,9 +65,16 @@ export async function getMonthlySummary(year?: number): Promise<MonthlySummaryRe
  */
 export async function getServerCostHistory(
   serverId: string,
-  period: CostHistoryPeriod = '30d'
+  period: CostHistoryPeriod = '30d',
+  aggregation: AggregationType = 'daily'
 ): Promise<ServerCostHistoryResponse> {
+  const searchParams = new URLSearchParams({ period });
+
+  if (aggregation !== 'daily') {
+    searchParams.set('aggregation', aggregation);
+  }
+
   return fetchApi<ServerCostHistoryResponse>(
-    `/servers/${serverId}/costs/history?period=${period}`
+    `/servers/${serverId}/costs/history?${searchParams.toString()}`
   );
 }
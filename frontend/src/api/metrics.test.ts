@@ -0,0 +1,85 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { getSparklineBatch, getSparklineData } from './metrics';
+import { api } from './client';
+import type { SparklineBatchResponse } from './metrics';
+
+vi.mock('./client', () => ({
+  api: {
+    get: vi.fn(),
+  },
+}));
+
+const mockGet = api.get as ReturnType<typeof vi.fn>;
+
+describe('Metrics API', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  describe('getSparklineBatch', () => {
+    it('sends repeated server_id and metric parameters', async () => {
+      mockGet.mockResolvedValue({ period: '1h', metrics: [], servers: [] });
+
+      await getSparklineBatch(['a', 'b'], ['cpu_percent', 'disk_percent'], '1h');
+
+      expect(mockGet).toHaveBeenCalledWith(
+        '/api/v1/servers/metrics/sparklines?period=1h&server_id=a&server_id=b&metric=cpu_percent&metric=disk_percent'
+      );
+    });
+  });
+
+  describe('getSparklineData', () => {
+    it('combines calls in the same tick into one batch request', async () => {
+      const response: SparklineBatchResponse = {
+        period: '30m',
+        metrics: ['cpu_percent', 'memory_percent'],
+        servers: [
+          {
+            server_id: 'server-1',
+            series: {
+              cpu_percent: { timestamps: [1767225600, 1767225660], values: [12.5, 14] },
+              memory_percent: { timestamps: [1767225600], values: [40] },
+            },
+          },
+        ],
+      };
+      mockGet.mockResolvedValue(response);
+
+      const [cpu, memory, missing] = await Promise.all([
+        getSparklineData('server-1', 'cpu_percent'),
+        getSparklineData('server-1', 'memory_percent'),
+        getSparklineData('server-2', 'cpu_percent'),
+      ]);
+
+      expect(mockGet).toHaveBeenCalledTimes(1);
+      expect(cpu.data).toEqual([
+        { timestamp: '2026-01-01T00:00:00.000Z', value: 12.5 },
+        { timestamp: '2026-01-01T00:01:00.000Z', value: 14 },
+      ]);
+      expect(memory.data).toHaveLength(1);
+      expect(missing.data).toEqual([]);
+    });
+
+    it('makes one request per period', async () => {
+      mockGet.mockResolvedValue({ period: '30m', metrics: [], servers: [] });
+
+      await Promise.all([
+        getSparklineData('server-1', 'cpu_percent', '30m'),
+        getSparklineData('server-1', 'cpu_percent', '6h'),
+      ]);
+
+      expect(mockGet).toHaveBeenCalledTimes(2);
+    });
+
+    it('rejects every waiting call when the batch request fails', async () => {
+      mockGet.mockRejectedValue(new Error('Network error'));
+
+      const results = await Promise.allSettled([
+        getSparklineData('server-1'),
+        getSparklineData('server-2'),
+      ]);
+
+      expect(results.map((r) => r.status)).toEqual(['rejected', 'rejected']);
+    });
+  });
+});
@@ -34,20 +34,125 @@ export type SparklineMetric = 'cpu_percent' | 'memory_percent' | 'disk_percent';
  */
 export type SparklinePeriod = '30m' | '1h' | '6h';
 
+/**
+ * One downsampled series from the batch endpoint, as parallel arrays.
+ */
+export interface SparklineSeries {
+  /** Unix timestamps in seconds, ascending */
+  timestamps: number[];
+  /** Metric values, parallel to timestamps */
+  values: number[];
+}
+
+/**
+ * Sparkline series for one server, keyed by metric type.
+ */
+export interface ServerSparklines {
+  server_id: string;
+  series: Partial<Record<SparklineMetric, SparklineSeries>>;
+}
+
+/**
+ * Response from the batch sparkline endpoint.
+ */
+export interface SparklineBatchResponse {
+  period: string;
+  metrics: SparklineMetric[];
+  servers: ServerSparklines[];
+}
+
+// Most servers requested in one batch call (keeps the URL short)
+const SPARKLINE_BATCH_SIZE = 100;
+
+/**
+ * Fetch sparkline data for many servers and metrics in one request.
+ *
+ * @param serverIds - Servers to include
+ * @param metrics - Metric types to include
+ * @param period - Time period (default: 30m)
+ * @returns Promise resolving to sparklines per server
+ */
+export async function getSparklineBatch(
+  serverIds: string[],
+  metrics: SparklineMetric[],
+  period: SparklinePeriod = '30m'
+): Promise<SparklineBatchResponse> {
+  const params = new URLSearchParams({ period });
+  serverIds.forEach((id) => params.append('server_id', id));
+  metrics.forEach((metric) => params.append('metric', metric));
+  return api.get<SparklineBatchResponse>(
+    `/api/v1/servers/metrics/sparklines?${params.toString()}`
+  );
+}
+
+interface PendingSparkline {
+  serverId: string;
+  metric: SparklineMetric;
+  resolve: (response: SparklineResponse) => void;
+  reject: (error: unknown) => void;
+}
+
+// Sparkline requests waiting for the next batch call, by period
+const pendingSparklines = new Map<SparklinePeriod, PendingSparkline[]>();
+
+function toSparklinePoints(series: SparklineSeries | undefined): SparklinePoint[] {
+  if (!series) return [];
+  return series.timestamps.map((t, i) => ({
+    timestamp: new Date(t * 1000).toISOString(),
+    value: series.values[i],
+  }));
+}
+
+async function flushSparklines(period: SparklinePeriod): Promise<void> {
+  const requests = pendingSparklines.get(period) ?? [];
+  pendingSparklines.delete(period);
+
+  const serverIds = [...new Set(requests.map((r) => r.serverId))];
+  const metrics = [...new Set(requests.map((r) => r.metric))];
+
+  for (let i = 0; i < serverIds.length; i += SPARKLINE_BATCH_SIZE) {
+    const chunk = new Set(serverIds.slice(i, i + SPARKLINE_BATCH_SIZE));
+    const chunkRequests = requests.filter((r) => chunk.has(r.serverId));
+    try {
+      const response = await getSparklineBatch([...chunk], metrics, period);
+      const byServer = new Map(response.servers.map((s) => [s.server_id, s]));
+      for (const r of chunkRequests) {
+        r.resolve({
+          server_id: r.serverId,
+          metric: r.metric,
+          period,
+          data: toSparklinePoints(byServer.get(r.serverId)?.series[r.metric]),
+        });
+      }
+    } catch (err) {
+      chunkRequests.forEach((r) => r.reject(err));
+    }
+  }
+}
+
 /**
  * Fetch sparkline data for a server metric.
  *
+ * Calls made in the same tick (e.g. every server card on the dashboard
+ * mounting at once) are combined into one batch request per period.
+ *
  * @param serverId - Server identifier
  * @param metric - Metric type (default: cpu_percent)
  * @param period - Time period (default: 30m)
  * @returns Promise resolving to sparkline data
  */
-export async function getSparklineData(
+export function getSparklineData(
   serverId: string,
   metric: SparklineMetric = 'cpu_percent',
   period: SparklinePeriod = '30m'
 ): Promise<SparklineResponse> {
-  return api.get<SparklineResponse>(
-    `/api/v1/servers/${serverId}/metrics/sparkline?metric=${metric}&period=${period}`
-  );
+  return new Promise((resolve, reject) => {
+    let pending = pendingSparklines.get(period);
+    if (!pending) {
+      pending = [];
+      pendingSparklines.set(period, pending);
+      setTimeout(() => void flushSparklines(period), 0);
+    }
+    pending.push({ serverId, metric, resolve, reject });
+  });
 }
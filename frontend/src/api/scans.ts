@@ -53,6 +53,9 @@ export async function getScans(filters?: ScanListFilters): Promise<ScanListRespo
   if (filters?.offset !== undefined) {
     params.append('offset', filters.offset.toString());
   }
+  if (filters?.cursor) {
+    params.append('cursor', filters.cursor);
+  }
 
   const queryString = params.toString();
   const url = queryString ? `/api/v1/scans?${queryString}` : '/api/v1/scans';
@@ -3,6 +3,7 @@ import type {
   ExpectedService,
   ExpectedServiceCreate,
   ExpectedServiceUpdate,
+  FleetServicesResponse,
   RestartActionResponse,
   ServiceDiscoveryRequest,
   ServiceDiscoveryResponse,
@@ -18,6 +19,14 @@ export function getServerServices(serverId: string): Promise<ServicesResponse> {
   return api.get<ServicesResponse>(`/api/v1/servers/${serverId}/services`);
 }
 
+/**
+ * Fetch expected services and their current status for every server.
+ * @returns Promise resolving to FleetServicesResponse
+ */
+export function getFleetServices(): Promise<FleetServicesResponse> {
+  return api.get<FleetServicesResponse>('/api/v1/services');
+}
+
 /**
  * Queue a service restart action.
  * @param serverId - The server ID
@@ -44,6 +44,8 @@ export interface ActionsResponse {
   total: number;
   limit: number;
   offset: number;
+  /** Pass as cursor to fetch the next page; null on the last page */
+  next_cursor?: string | null;
 }
 
 export interface RejectActionRequest {
@@ -60,3 +60,61 @@ export interface ServerActivateResponse {
   message: string;
   error: string | null;
 }
+
+export type AgentRolloutStatus =
+  | 'pending'
+  | 'running'
+  | 'paused'
+  | 'completed'
+  | 'failed'
+  | 'cancelled';
+
+export type AgentRolloutHostStatus =
+  | 'pending'
+  | 'upgrading'
+  | 'verifying'
+  | 'succeeded'
+  | 'failed';
+
+export interface AgentRolloutRequest {
+  /** Servers to upgrade in order (default: every agent not on the current version) */
+  server_ids?: string[];
+  canary_size?: number;
+  wave_size?: number;
+  heartbeat_timeout_seconds?: number;
+}
+
+export interface AgentRolloutHostResult {
+  server_id: string;
+  /** Wave index (0 is the canary wave) */
+  wave: number;
+  status: AgentRolloutHostStatus;
+  error: string | null;
+  upgraded_at: string | null;
+  verified_at: string | null;
+}
+
+export interface AgentRolloutResponse {
+  id: number;
+  target_version: string;
+  status: AgentRolloutStatus;
+  canary_size: number;
+  wave_size: number;
+  heartbeat_timeout_seconds: number;
+  waves_completed: number;
+  waves_total: number;
+  hosts_total: number;
+  hosts_succeeded: number;
+  hosts_failed: number;
+  hosts: AgentRolloutHostResult[];
+  error: string | null;
+  triggered_by: string;
+  created_at: string;
+  started_at: string | null;
+  completed_at: string | null;
+}
+
+export interface AgentRolloutListResponse {
+  rollouts: AgentRolloutResponse[];
+  total: number;
+}
@@ -26,6 +26,8 @@ export interface AlertsResponse {
   total: number;
   limit: number;
   offset: number;
+  /** Pass as cursor to fetch the next page; null on the last page */
+  next_cursor?: string | null;
 }
 
 export interface AlertAcknowledgeResponse {
@@ -47,6 +49,8 @@ export interface AlertFilters {
   server_id?: string;
   limit?: number;
   offset?: number;
+  /** next_cursor of the previous page, instead of offset */
+  cursor?: string;
 }
 
 /**
@@ -69,3 +73,14 @@ export interface PendingBreachesResponse {
   pending: PendingBreach[];
   total: number;
 }
+
+/**
+ * Filters for pending breaches, which are listed soonest to fire first.
+ */
+export interface PendingBreachFilters {
+  server_id?: string;
+  metric_type?: string;
+  /** Only breaches that fire within this many seconds */
+  within?: number;
+  limit?: number;
+}
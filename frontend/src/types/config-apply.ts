@@ -11,6 +11,7 @@
 export interface ApplyRequest {
   pack_name: string;
   dry_run: boolean;
+  batched?: boolean;
 }
 
 // Dry-run preview item types
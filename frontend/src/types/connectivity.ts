@@ -65,4 +65,30 @@ export interface ConnectivityStatusBarResponse {
   display: string;
   /** Whether connectivity is healthy */
   healthy: boolean;
+  /** When connectivity was last probed (ISO 8601) */
+  checked_at?: string | null;
+}
+
+/** Outcome of one background connectivity probe */
+export interface ConnectivityProbe {
+  /** When the probe ran (ISO 8601) */
+  probed_at: string;
+  /** How long the probe took in milliseconds */
+  duration_ms: number;
+  /** Connectivity mode seen (null if the probe failed) */
+  mode: ConnectivityMode | null;
+  /** Whether the Tailscale API answered */
+  tailscale_connected: boolean;
+  /** Number of devices in tailnet */
+  device_count: number;
+  /** Error if the probe failed */
+  error: string | null;
+}
+
+/** Response for GET /api/v1/settings/connectivity/probes */
+export interface ConnectivityProbeListResponse {
+  /** Recent probes, newest first */
+  probes: ConnectivityProbe[];
+  /** Seconds between scheduled probes */
+  interval_seconds: number;
 }
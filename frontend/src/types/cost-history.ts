@@ -74,6 +74,8 @@ export interface ServerCostHistoryResponse {
   hostname: string;
   /** Period used for the query */
   period: CostHistoryPeriod;
+  /** Aggregation level used */
+  aggregation: AggregationType;
   /** Cost history records */
   items: CostHistoryItem[];
   /** Currency symbol */
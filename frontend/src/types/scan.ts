@@ -105,6 +105,8 @@ export interface ScanListFilters {
   scan_type?: 'quick' | 'full';
   limit?: number;
   offset?: number;
+  /** next_cursor of the previous page, instead of offset */
+  cursor?: string;
 }
 
 /**
@@ -116,6 +118,8 @@ export interface ScanListResponse {
   total: number;
   limit: number;
   offset: number;
+  /** Pass as cursor to fetch the next page; null on the last page */
+  next_cursor?: string | null;
 }
 
 /**
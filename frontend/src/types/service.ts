@@ -30,6 +30,19 @@ export interface ServicesResponse {
   total: number;
 }
 
+/** Expected services for one server in the fleet-wide listing */
+export interface ServerServices {
+  server_id: string;
+  server_name: string;
+  services: ExpectedService[];
+}
+
+/** Response from GET /services */
+export interface FleetServicesResponse {
+  servers: ServerServices[];
+  total: number;
+}
+
 /** Response from POST /servers/{server_id}/services/{service_name}/restart */
 export interface RestartActionResponse {
   action_id: number;
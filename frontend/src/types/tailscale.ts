@@ -74,6 +74,8 @@ export interface TailscaleDevice {
   ssh_error?: string | null;
   /** SSH key that succeeded (EP0016) */
   ssh_key_used?: string | null;
+  /** When SSH was last tested; older results are re-tested in the background */
+  ssh_tested_at?: string | null;
 }
 
 /**
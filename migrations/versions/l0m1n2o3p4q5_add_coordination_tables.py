@@ -0,0 +1,50 @@
+"""Add leader_leases and cache_generations tables.
+
+Multi-worker hub deployment.
+
+Creates tables for:
+- leader_leases: Lease electing the worker that runs scheduled jobs
+- cache_generations: Counters used to broadcast cache invalidation
+
+Revision ID: l0m1n2o3p4q5
+Revises: k9l0m1n2o3p4
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "l0m1n2o3p4q5"
+down_revision: Union[str, None] = "k9l0m1n2o3p4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create leader_leases and cache_generations tables."""
+    op.create_table(
+        "leader_leases",
+        sa.Column("name", sa.String(50), nullable=False),
+        sa.Column("holder", sa.String(200), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("acquired_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+    op.create_table(
+        "cache_generations",
+        sa.Column("name", sa.String(50), nullable=False),
+        sa.Column("generation", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Drop leader_leases and cache_generations tables."""
+    op.drop_table("cache_generations")
+    op.drop_table("leader_leases")
@@ -0,0 +1,100 @@
+"""Add cost_snapshots_weekly table and backfill cost aggregates.
+
+EP0005: Cost Tracking - materialised weekly/monthly cost history.
+
+Creates tables for:
+- cost_snapshots_weekly: Weekly aggregates per server
+
+Weekly and monthly aggregates are now maintained as daily snapshots are
+captured, so both are backfilled from the existing daily snapshots. Monthly
+rows already rolled up from pruned daily data are kept and added to.
+
+Revision ID: m1n2o3p4q5r6
+Revises: l0m1n2o3p4q5
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "m1n2o3p4q5r6"
+down_revision: Union[str, None] = "l0m1n2o3p4q5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create cost_snapshots_weekly and backfill weekly/monthly aggregates."""
+    op.create_table(
+        "cost_snapshots_weekly",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("server_id", sa.String(100), nullable=True),
+        sa.Column("year_week", sa.String(8), nullable=False),
+        sa.Column("total_kwh", sa.Float(), nullable=False),
+        sa.Column("total_cost", sa.Float(), nullable=False),
+        sa.Column("avg_electricity_rate", sa.Float(), nullable=False),
+        sa.Column("snapshot_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(
+            ["server_id"],
+            ["servers.id"],
+            ondelete="SET NULL",
+        ),
+        sa.UniqueConstraint("server_id", "year_week", name="uq_weekly_cost_snapshot"),
+    )
+
+    op.create_index(
+        "idx_cost_snapshot_weekly_server",
+        "cost_snapshots_weekly",
+        ["server_id", "year_week"],
+    )
+    op.create_index("idx_cost_snapshot_weekly_yw", "cost_snapshots_weekly", ["year_week"])
+    op.create_index("ix_cost_snapshots_weekly_server_id", "cost_snapshots_weekly", ["server_id"])
+
+    # Backfill weekly aggregates from the daily snapshots
+    op.execute(
+        """
+        INSERT INTO cost_snapshots_weekly (
+            server_id, year_week, total_kwh, total_cost,
+            avg_electricity_rate, snapshot_count
+        )
+        SELECT server_id, strftime('%Y-W%W', date), SUM(estimated_kwh),
+               SUM(estimated_cost), AVG(electricity_rate), COUNT(*)
+        FROM cost_snapshots
+        GROUP BY server_id, strftime('%Y-W%W', date)
+        """
+    )
+
+    # Backfill monthly aggregates, adding to months already rolled up
+    op.execute(
+        """
+        INSERT INTO cost_snapshots_monthly (
+            server_id, year_month, total_kwh, total_cost,
+            avg_electricity_rate, snapshot_count
+        )
+        SELECT server_id, strftime('%Y-%m', date), SUM(estimated_kwh),
+               SUM(estimated_cost), AVG(electricity_rate), COUNT(*)
+        FROM cost_snapshots
+        GROUP BY server_id, strftime('%Y-%m', date)
+        ON CONFLICT (server_id, year_month) DO UPDATE SET
+            total_kwh = total_kwh + excluded.total_kwh,
+            total_cost = total_cost + excluded.total_cost,
+            snapshot_count = snapshot_count + excluded.snapshot_count
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop cost_snapshots_weekly table.
+
+    Monthly aggregates for months still covered by daily snapshots are left
+    in place; they are not distinguishable from rolled-up months.
+    """
+    op.drop_index("ix_cost_snapshots_weekly_server_id", table_name="cost_snapshots_weekly")
+    op.drop_index("idx_cost_snapshot_weekly_yw", table_name="cost_snapshots_weekly")
+    op.drop_index("idx_cost_snapshot_weekly_server", table_name="cost_snapshots_weekly")
+    op.drop_table("cost_snapshots_weekly")
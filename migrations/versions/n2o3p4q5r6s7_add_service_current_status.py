@@ -0,0 +1,72 @@
+"""Add service_current_status table.
+
+Latest reported status per server and service, maintained by the heartbeat
+and agent event paths so service listings need not search the history.
+
+Creates tables for:
+- service_current_status: Latest status of each reported service
+
+The table is backfilled with the newest service_status row per service.
+
+Revision ID: n2o3p4q5r6s7
+Revises: m1n2o3p4q5r6
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "n2o3p4q5r6s7"
+down_revision: Union[str, None] = "m1n2o3p4q5r6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create and backfill service_current_status table."""
+    op.create_table(
+        "service_current_status",
+        sa.Column("server_id", sa.String(100), nullable=False),
+        sa.Column("service_name", sa.String(255), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("status_reason", sa.String(255), nullable=True),
+        sa.Column("pid", sa.Integer(), nullable=True),
+        sa.Column("memory_mb", sa.Float(), nullable=True),
+        sa.Column("cpu_percent", sa.Float(), nullable=True),
+        sa.Column("timestamp", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("server_id", "service_name"),
+        sa.ForeignKeyConstraint(
+            ["server_id"],
+            ["servers.id"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    op.execute(
+        """
+        INSERT INTO service_current_status (
+            server_id, service_name, status, status_reason,
+            pid, memory_mb, cpu_percent, timestamp
+        )
+        SELECT s.server_id, s.service_name, s.status, s.status_reason,
+               s.pid, s.memory_mb, s.cpu_percent, s.timestamp
+        FROM service_status s
+        WHERE s.id = (
+            SELECT latest.id
+            FROM service_status latest
+            WHERE latest.server_id = s.server_id
+              AND latest.service_name = s.service_name
+            ORDER BY latest.timestamp DESC, latest.id DESC
+            LIMIT 1
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop service_current_status table."""
+    op.drop_table("service_current_status")
@@ -0,0 +1,36 @@
+"""Add manifest_digest to config_check.
+
+EP0010: Configuration Management - manifest-based compliance checks.
+
+Adds columns to:
+- config_check: manifest_digest, the host manifest digest recorded by drift
+  detection so unchanged hosts can reuse the previous result
+
+Revision ID: o3p4q5r6s7t8
+Revises: n2o3p4q5r6s7
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "o3p4q5r6s7t8"
+down_revision: Union[str, None] = "n2o3p4q5r6s7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add manifest_digest column to config_check."""
+    with op.batch_alter_table("config_check") as batch_op:
+        batch_op.add_column(sa.Column("manifest_digest", sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove manifest_digest column from config_check."""
+    with op.batch_alter_table("config_check") as batch_op:
+        batch_op.drop_column("manifest_digest")
@@ -0,0 +1,58 @@
+"""Add agent_rollout table.
+
+EP0007: Agent Management - fleet agent rollouts in canary-first waves.
+
+Creates tables for:
+- agent_rollout: Rollout plan, progress and per-server results
+
+Revision ID: p4q5r6s7t8u9
+Revises: o3p4q5r6s7t8
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "p4q5r6s7t8u9"
+down_revision: Union[str, None] = "o3p4q5r6s7t8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create agent_rollout table."""
+    op.create_table(
+        "agent_rollout",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("target_version", sa.String(20), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("server_ids", sa.JSON(), nullable=False),
+        sa.Column("canary_size", sa.Integer(), nullable=False),
+        sa.Column("wave_size", sa.Integer(), nullable=False),
+        sa.Column("heartbeat_timeout_seconds", sa.Integer(), nullable=False),
+        sa.Column("waves_completed", sa.Integer(), nullable=False),
+        sa.Column("waves_total", sa.Integer(), nullable=False),
+        sa.Column("hosts_succeeded", sa.Integer(), nullable=False),
+        sa.Column("hosts_failed", sa.Integer(), nullable=False),
+        sa.Column("results", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("triggered_by", sa.String(100), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_agent_rollout_status", "agent_rollout", ["status"])
+    op.create_index("idx_agent_rollout_created_at", "agent_rollout", ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop agent_rollout table."""
+    op.drop_index("idx_agent_rollout_created_at", table_name="agent_rollout")
+    op.drop_index("idx_agent_rollout_status", table_name="agent_rollout")
+    op.drop_table("agent_rollout")
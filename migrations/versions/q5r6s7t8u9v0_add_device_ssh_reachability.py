@@ -0,0 +1,41 @@
+"""Add device_ssh_reachability table.
+
+EP0016: Unified Discovery Experience - persisted SSH reachability.
+
+Creates tables for:
+- device_ssh_reachability: Last SSH test result per Tailscale device
+
+Revision ID: q5r6s7t8u9v0
+Revises: p4q5r6s7t8u9
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "q5r6s7t8u9v0"
+down_revision: Union[str, None] = "p4q5r6s7t8u9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create device_ssh_reachability table."""
+    op.create_table(
+        "device_ssh_reachability",
+        sa.Column("device_id", sa.String(100), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("key_used", sa.String(255), nullable=True),
+        sa.Column("tested_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("device_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop device_ssh_reachability table."""
+    op.drop_table("device_ssh_reachability")
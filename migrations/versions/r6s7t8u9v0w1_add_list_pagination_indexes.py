@@ -0,0 +1,55 @@
+"""Add keyset pagination indexes to alerts, remediation_actions and scans.
+
+Lists of alerts, actions and scans page newest first by (created_at, id).
+
+Creates indexes on:
+- alerts: (status|severity|server_id, created_at, id)
+- remediation_actions: (created_at, id) and (status|server_id, created_at, id)
+- scans: (hostname, created_at, id)
+
+Revision ID: r6s7t8u9v0w1
+Revises: q5r6s7t8u9v0
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "r6s7t8u9v0w1"
+down_revision: Union[str, None] = "q5r6s7t8u9v0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    ("idx_alerts_status_created", "alerts", ["status", "created_at", "id"]),
+    ("idx_alerts_severity_created", "alerts", ["severity", "created_at", "id"]),
+    ("idx_alerts_server_created", "alerts", ["server_id", "created_at", "id"]),
+    ("idx_remediation_actions_created", "remediation_actions", ["created_at", "id"]),
+    (
+        "idx_remediation_actions_status_created",
+        "remediation_actions",
+        ["status", "created_at", "id"],
+    ),
+    (
+        "idx_remediation_actions_server_created",
+        "remediation_actions",
+        ["server_id", "created_at", "id"],
+    ),
+    ("idx_scans_hostname_created", "scans", ["hostname", "created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    """Create list pagination indexes."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Drop list pagination indexes."""
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,47 @@
+"""Add pending breach columns to alert_states.
+
+Pending breaches (threshold exceeded, sustained duration not yet met) are
+maintained by the alerting service instead of being derived on each read.
+
+Adds columns to:
+- alert_states: fires_at, pending_severity, pending_threshold
+
+Creates indexes on:
+- alert_states: fires_at
+
+Existing pending breaches are filled in at hub startup.
+
+Revision ID: s7t8u9v0w1x2
+Revises: r6s7t8u9v0w1
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "s7t8u9v0w1x2"
+down_revision: Union[str, None] = "r6s7t8u9v0w1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add pending breach columns and index to alert_states."""
+    with op.batch_alter_table("alert_states") as batch_op:
+        batch_op.add_column(sa.Column("fires_at", sa.DateTime(timezone=True), nullable=True))
+        batch_op.add_column(sa.Column("pending_severity", sa.String(20), nullable=True))
+        batch_op.add_column(sa.Column("pending_threshold", sa.Float(), nullable=True))
+    op.create_index("idx_alert_states_fires_at", "alert_states", ["fires_at"])
+
+
+def downgrade() -> None:
+    """Remove pending breach columns and index from alert_states."""
+    op.drop_index("idx_alert_states_fires_at", table_name="alert_states")
+    with op.batch_alter_table("alert_states") as batch_op:
+        batch_op.drop_column("pending_threshold")
+        batch_op.drop_column("pending_severity")
+        batch_op.drop_column("fires_at")
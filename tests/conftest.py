@@ -46,6 +46,7 @@ def client() -> Generator[TestClient, None, None]:
     from fastapi import FastAPI
     from fastapi.middleware.cors import CORSMiddleware
 
+    from homelab_cmd.api.middleware import CompressionMiddleware, RequestTimingMiddleware
     from homelab_cmd.api.routes import (
         actions,
         agent_register,
@@ -61,9 +62,11 @@ def client() -> Generator[TestClient, None, None]:
         discovery,
         metrics,
         preferences,
+        prometheus,
         scan,
         servers,
         services,
+        stream,
         system,
         tailscale,
         widget_layout,
@@ -71,12 +74,18 @@ def client() -> Generator[TestClient, None, None]:
     from homelab_cmd.config import get_settings
     from homelab_cmd.db import dispose_engine, init_database
     from homelab_cmd.main import OPENAPI_TAGS
+    from homelab_cmd.services.connectivity_prober import get_connectivity_prober
+    from homelab_cmd.services.telemetry import get_fleet_gauges
 
     @asynccontextmanager
     async def test_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         """Test lifespan without scheduler to avoid async cleanup issues."""
         system.set_start_time(datetime.now(UTC))
         await init_database()
+        # Each test gets a fresh database, so drop results cached from the last one
+        costs.clear_cost_cache()
+        get_connectivity_prober().invalidate()
+        get_fleet_gauges().invalidate()
         yield
         await dispose_engine()
 
@@ -120,6 +129,8 @@ homelab infrastructure. Features include:
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        app.add_middleware(RequestTimingMiddleware)
+        app.add_middleware(CompressionMiddleware)
         app.include_router(system.router, prefix="/api/v1")
         app.include_router(servers.router, prefix="/api/v1")
         app.include_router(agents.router, prefix="/api/v1")
@@ -132,6 +143,7 @@ homelab infrastructure. Features include:
         app.include_router(config_apply.router, prefix="/api/v1")
         app.include_router(alerts.router, prefix="/api/v1")
         app.include_router(services.router, prefix="/api/v1")
+        app.include_router(services.fleet_router, prefix="/api/v1")
         app.include_router(actions.router, prefix="/api/v1")
         # EP0013: Synchronous Command Execution
         app.include_router(commands.router, prefix="/api/v1")
@@ -147,6 +159,8 @@ homelab infrastructure. Features include:
         app.include_router(preferences.router, prefix="/api/v1")
         # US0173: Widget Layout Persistence
         app.include_router(widget_layout.router, prefix="/api/v1")
+        app.include_router(stream.router, prefix="/api/v1")
+        app.include_router(prometheus.router)
         return app
 
     test_app = create_test_app()
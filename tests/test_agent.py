@@ -993,3 +993,304 @@ model name      : Intel Core i7-10700
 
         # Should return the first model found
         assert info["cpu_model"] == "Intel Core i7-10700"
+
+
+# =============================================================================
+# Batch Heartbeat Tests
+# =============================================================================
+
+
+class TestSendHeartbeatBatch:
+    """Tests for batched heartbeat delivery (high-frequency and backfill)."""
+
+    @pytest.fixture
+    def config(self) -> AgentConfig:
+        """Create test configuration."""
+        return AgentConfig(
+            hub_url="http://localhost:8080",
+            server_id="test-server",
+            api_key="test-key",
+            server_guid="a1b2c3d4-e5f6-4890-abcd-ef1234567890",
+            heartbeat_interval=60,
+            sample_interval=10,
+        )
+
+    @staticmethod
+    def _mock_client(mock_client_class: MagicMock, status_code: int, body: dict) -> MagicMock:
+        mock_response = MagicMock()
+        mock_response.status_code = status_code
+        mock_response.json.return_value = body
+
+        mock_client = MagicMock()
+        mock_client.post.return_value = mock_response
+        mock_client.__enter__ = MagicMock(return_value=mock_client)
+        mock_client.__exit__ = MagicMock(return_value=False)
+        mock_client_class.return_value = mock_client
+        return mock_client
+
+    @patch("agent.heartbeat.httpx.Client")
+    def test_posts_samples_to_batch_endpoint(
+        self, mock_client_class: MagicMock, config: AgentConfig
+    ) -> None:
+        """Samples are sent in one request to /agents/heartbeat/batch."""
+        from agent.heartbeat import build_sample_payload, send_heartbeat_batch
+
+        mock_client = self._mock_client(
+            mock_client_class,
+            200,
+            {"status": "ok", "accepted": 2, "servers": [{"server_registered": True}]},
+        )
+        samples = [
+            build_sample_payload(config, {"cpu_percent": 10.0}),
+            build_sample_payload(config, {"cpu_percent": 20.0}),
+        ]
+
+        result = send_heartbeat_batch(config, samples)
+
+        assert result.success is True
+        assert result.server_registered is True
+        url = mock_client.post.call_args.args[0]
+        assert url == "http://localhost:8080/api/v1/agents/heartbeat/batch"
+        assert mock_client.post.call_args.kwargs["json"] == {"heartbeats": samples}
+
+    @patch("agent.heartbeat.httpx.Client")
+    def test_auth_failure_returns_unsuccessful(
+        self, mock_client_class: MagicMock, config: AgentConfig
+    ) -> None:
+        """401 from the hub fails the batch without retrying."""
+        from agent.heartbeat import send_heartbeat_batch
+
+        mock_client = self._mock_client(mock_client_class, 401, {})
+
+        result = send_heartbeat_batch(config, [{"server_id": "test-server"}])
+
+        assert result.success is False
+        assert mock_client.post.call_count == 1
+
+    @patch("agent.heartbeat.httpx.Client")
+    def test_hub_without_batch_endpoint(
+        self, mock_client_class: MagicMock, config: AgentConfig
+    ) -> None:
+        """404 from an older hub reports batching unsupported without retrying."""
+        from agent.heartbeat import send_heartbeat_batch
+
+        mock_client = self._mock_client(mock_client_class, 404, {})
+
+        result = send_heartbeat_batch(config, [{"server_id": "test-server"}])
+
+        assert result.success is False
+        assert result.batch_supported is False
+        assert mock_client.post.call_count == 1
+
+    def test_sample_payload_is_metrics_only(self, config: AgentConfig) -> None:
+        """Sample payloads carry identity, timestamp and metrics only."""
+        from agent.heartbeat import build_sample_payload
+
+        payload = build_sample_payload(config, {"cpu_percent": 5.0})
+
+        assert set(payload) == {"server_guid", "server_id", "hostname", "timestamp", "metrics"}
+
+    def test_effective_sample_interval(self, config: AgentConfig) -> None:
+        """sample_interval only applies when shorter than heartbeat_interval."""
+        assert config.effective_sample_interval() == 10
+        config.sample_interval = 120
+        assert config.effective_sample_interval() == 60
+        config.sample_interval = None
+        assert config.effective_sample_interval() == 60
+
+
+class TestStateWatcher:
+    """Tests for state-change event push between heartbeats."""
+
+    @pytest.fixture
+    def config(self) -> AgentConfig:
+        """Create test configuration."""
+        return AgentConfig(
+            hub_url="http://localhost:8080",
+            server_id="test-server",
+            api_key="test-key",
+            server_guid="a1b2c3d4-e5f6-4890-abcd-ef1234567890",
+            monitored_services=["plex"],
+            filesystem_event_percent=90.0,
+        )
+
+    @staticmethod
+    def _fs(percent: float) -> list[dict[str, Any]]:
+        return [
+            {
+                "mount_point": "/",
+                "device": "/dev/sda1",
+                "fs_type": "ext4",
+                "total_bytes": 100,
+                "used_bytes": int(percent),
+                "available_bytes": 100 - int(percent),
+                "percent": percent,
+            }
+        ]
+
+    @patch("agent.events.get_filesystem_metrics")
+    @patch("agent.events.get_service_active_states")
+    def test_first_poll_is_baseline(
+        self, mock_states: MagicMock, mock_fs: MagicMock, config: AgentConfig
+    ) -> None:
+        """The first poll records state without emitting events."""
+        from agent.events import StateWatcher
+
+        mock_states.return_value = {"plex": "failed"}
+        mock_fs.return_value = self._fs(95.0)
+
+        assert StateWatcher(config).poll() == []
+
+    @patch("agent.events.get_service_status")
+    @patch("agent.events.get_filesystem_metrics")
+    @patch("agent.events.get_service_active_states")
+    def test_service_change_emits_event(
+        self,
+        mock_states: MagicMock,
+        mock_fs: MagicMock,
+        mock_status: MagicMock,
+        config: AgentConfig,
+    ) -> None:
+        """A service ActiveState change produces a service_state event."""
+        from agent.events import StateWatcher
+
+        mock_fs.return_value = self._fs(50.0)
+        mock_status.return_value = {"name": "plex", "status": "failed"}
+        watcher = StateWatcher(config)
+        mock_states.return_value = {"plex": "running"}
+        watcher.poll()
+
+        mock_states.return_value = {"plex": "failed"}
+        events = watcher.poll()
+
+        assert len(events) == 1
+        assert events[0]["event_type"] == "service_state"
+        assert events[0]["service"] == {"name": "plex", "status": "failed"}
+
+    @patch("agent.events.get_filesystem_metrics")
+    @patch("agent.events.get_service_active_states")
+    def test_filesystem_crossing_emits_event_once(
+        self, mock_states: MagicMock, mock_fs: MagicMock, config: AgentConfig
+    ) -> None:
+        """Crossing the threshold emits one event, not one per poll."""
+        from agent.events import StateWatcher
+
+        mock_states.return_value = {}
+        watcher = StateWatcher(config)
+        mock_fs.return_value = self._fs(80.0)
+        watcher.poll()
+
+        mock_fs.return_value = self._fs(93.0)
+        first = watcher.poll()
+        second = watcher.poll()
+
+        assert [e["event_type"] for e in first] == ["filesystem_threshold"]
+        assert second == []
+
+    @patch("agent.events.httpx.Client")
+    def test_send_events_posts_to_events_endpoint(
+        self, mock_client_class: MagicMock, config: AgentConfig
+    ) -> None:
+        """Events are posted once to /api/v1/agents/events."""
+        from agent.events import send_events
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_client = MagicMock()
+        mock_client.post.return_value = mock_response
+        mock_client.__enter__ = MagicMock(return_value=mock_client)
+        mock_client.__exit__ = MagicMock(return_value=False)
+        mock_client_class.return_value = mock_client
+        events = [{"event_type": "shutdown", "shutdown_reason": "agent_stop"}]
+
+        assert send_events(config, events) is True
+        url = mock_client.post.call_args.args[0]
+        assert url == "http://localhost:8080/api/v1/agents/events"
+        assert mock_client.post.call_args.kwargs["json"]["events"] == events
+
+
+class TestAgentChannel:
+    """Tests for the persistent hub channel client."""
+
+    @pytest.fixture
+    def config(self) -> AgentConfig:
+        """Create test configuration."""
+        return AgentConfig(
+            hub_url="https://hub.local:8080",
+            server_id="test-server",
+            api_key=None,
+            api_token="hlh_ag_test",
+            server_guid="a1b2c3d4-e5f6-4890-abcd-ef1234567890",
+            mode="readwrite",
+            channel_enabled=True,
+        )
+
+    def test_url_uses_websocket_scheme(self, config: AgentConfig) -> None:
+        """https hub URLs map to wss channel URLs."""
+        from agent.channel import AgentChannel
+
+        assert AgentChannel(config).url == "wss://hub.local:8080/api/v1/agents/channel"
+
+    def test_sync_config_updates_monitored_services(
+        self, config: AgentConfig, tmp_path: Path
+    ) -> None:
+        """sync_config applies in place and persists to the config file."""
+        from agent.channel import AgentChannel
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("hub_url: https://hub.local:8080\n")
+
+        success, result, _ = AgentChannel(config, config_file)._execute(
+            "sync_config", {"monitored_services": ["nginx", "plex"]}
+        )
+
+        assert success is True
+        assert result["persisted"] is True
+        assert config.monitored_services == ["nginx", "plex"]
+        assert "plex" in config_file.read_text()
+
+    def test_connect_wakes_main_loop(self, config: AgentConfig) -> None:
+        """Each connection wakes one wait so the agent heartbeats straight away."""
+        from agent.channel import AgentChannel
+
+        channel = AgentChannel(config)
+        ws = MagicMock()
+        # Close after the first connection and stop reconnecting
+        ws.__iter__.side_effect = lambda: (channel._stop.set(), iter([]))[1]
+
+        with patch("agent.channel.connect") as mock_connect:
+            mock_connect.return_value.__enter__.return_value = ws
+            assert channel.wait_connected(0) is False
+            channel._run()
+
+        assert channel.wait_connected(0) is True
+        assert channel.wait_connected(0) is False
+
+    def test_restart_service_refused_in_readonly_mode(self, config: AgentConfig) -> None:
+        """Readonly agents do not run hub restart commands."""
+        from agent.channel import AgentChannel
+
+        config.mode = "readonly"
+
+        with patch("agent.channel.subprocess.run") as mock_run:
+            success, _, error = AgentChannel(config)._execute(
+                "restart_service", {"service_name": "nginx"}
+            )
+
+        assert success is False
+        assert "readonly" in error
+        mock_run.assert_not_called()
+
+    def test_events_sent_over_connected_channel(self, config: AgentConfig) -> None:
+        """send_events prefers the channel and skips HTTP when it is acked."""
+        from agent.events import send_events
+
+        channel = MagicMock()
+        channel.connected = True
+        channel.send_events.return_value = True
+
+        with patch("agent.events.httpx.Client") as mock_client_class:
+            assert send_events(config, [{"event_type": "shutdown"}], channel) is True
+
+        channel.send_events.assert_called_once()
+        mock_client_class.assert_not_called()
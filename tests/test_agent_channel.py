@@ -0,0 +1,346 @@
+"""Tests for the persistent agent channel.
+
+WS /api/v1/agents/channel carries heartbeats and events from agents with a
+per-agent token, and hub commands (config sync, service restart, live
+metrics) back to them. A dropped channel marks the server offline quickly.
+"""
+
+import threading
+import time
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from starlette.websockets import WebSocketDisconnect
+
+from homelab_cmd.api.routes.actions import _execute_action_via_ssh
+from homelab_cmd.db.models.remediation import ActionStatus, RemediationAction
+from homelab_cmd.db.models.server import Server
+from homelab_cmd.services.agent_channel import AgentChannelManager, AgentChannelTimeoutError
+from homelab_cmd.services.ssh_executor import CommandResult
+
+CHANNEL_URL = "/api/v1/agents/channel"
+
+
+@pytest.fixture(autouse=True)
+def no_offline_grace(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Handle dropped channels immediately instead of after the grace period."""
+    monkeypatch.setattr("homelab_cmd.services.agent_channel.CHANNEL_OFFLINE_GRACE_SECONDS", 0)
+
+
+def _claim_agent(client: TestClient, auth_headers: dict[str, str], server_id: str) -> dict:
+    """Register a server with a per-agent token and return channel headers."""
+    token = client.post(
+        "/api/v1/agents/register/tokens",
+        json={"mode": "readwrite"},
+        headers=auth_headers,
+    ).json()["token"]
+    claim = client.post(
+        "/api/v1/agents/register/claim",
+        json={"token": token, "server_id": server_id, "hostname": f"{server_id}.local"},
+    ).json()
+    return {"X-Agent-Token": claim["api_token"], "X-Server-GUID": claim["server_guid"]}
+
+
+def _heartbeat_frame(server_id: str, server_guid: str, frame_id: str = "hb-1") -> dict:
+    return {
+        "type": "heartbeat",
+        "id": frame_id,
+        "payload": {
+            "server_guid": server_guid,
+            "server_id": server_id,
+            "hostname": f"{server_id}.local",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "metrics": {"cpu_percent": 12.5},
+        },
+    }
+
+
+def _wait_registered(ws, server_id: str, server_guid: str) -> None:
+    """Round-trip a heartbeat so the hub has registered the channel."""
+    ws.send_json(_heartbeat_frame(server_id, server_guid, frame_id="ready"))
+    assert ws.receive_json()["type"] == "ack"
+
+
+class TestChannelConnection:
+    """Authentication and agent-to-hub frames."""
+
+    def test_invalid_token_closed(self, client: TestClient) -> None:
+        """Connections with bad credentials are closed with 4401."""
+        headers = {
+            "X-Agent-Token": "hlh_ag_invalid",
+            "X-Server-GUID": "a1b2c3d4-e5f6-4890-abcd-ef1234567890",
+        }
+        with client.websocket_connect(CHANNEL_URL, headers=headers) as ws:
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                ws.receive_json()
+        assert exc_info.value.code == 4401
+
+    def test_heartbeat_over_channel_acknowledged(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """A heartbeat frame is processed like the HTTP endpoint and acked."""
+        headers = _claim_agent(client, auth_headers, "chan-hb")
+
+        with client.websocket_connect(CHANNEL_URL, headers=headers) as ws:
+            ws.send_json(_heartbeat_frame("chan-hb", headers["X-Server-GUID"]))
+            reply = ws.receive_json()
+
+            assert reply["type"] == "ack"
+            assert reply["id"] == "hb-1"
+            assert reply["payload"]["status"] == "ok"
+
+            server = client.get("/api/v1/servers/chan-hb", headers=auth_headers).json()
+            assert server["status"] == "online"
+            assert server["latest_metrics"]["cpu_percent"] == 12.5
+
+    def test_frame_for_other_server_rejected(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Heartbeats for a different GUID get an error frame."""
+        headers = _claim_agent(client, auth_headers, "chan-guid")
+
+        with client.websocket_connect(CHANNEL_URL, headers=headers) as ws:
+            ws.send_json(_heartbeat_frame("chan-guid", "b1b2c3d4-e5f6-4890-abcd-ef1234567890"))
+            reply = ws.receive_json()
+
+        assert reply["type"] == "error"
+        assert reply["code"] == "FORBIDDEN"
+
+    def test_connected_agents_listed(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Live channels appear in the channel list while connected."""
+        headers = _claim_agent(client, auth_headers, "chan-list")
+
+        with client.websocket_connect(CHANNEL_URL, headers=headers) as ws:
+            _wait_registered(ws, "chan-list", headers["X-Server-GUID"])
+            listed = client.get("/api/v1/agents/channels", headers=auth_headers).json()
+            assert [c["server_id"] for c in listed["channels"]] == ["chan-list"]
+
+        listed = client.get("/api/v1/agents/channels", headers=auth_headers).json()
+        assert listed["total"] == 0
+
+
+class TestChannelCommands:
+    """Hub-initiated commands are delivered over the channel."""
+
+    def test_live_metrics_pulled_from_agent(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """GET /agents/{id}/metrics/live returns the metrics the agent sends back."""
+        headers = _claim_agent(client, auth_headers, "chan-live")
+        responses: list = []
+
+        with client.websocket_connect(CHANNEL_URL, headers=headers) as ws:
+            _wait_registered(ws, "chan-live", headers["X-Server-GUID"])
+            request = threading.Thread(
+                target=lambda: responses.append(
+                    client.get("/api/v1/agents/chan-live/metrics/live", headers=auth_headers)
+                )
+            )
+            request.start()
+
+            command = ws.receive_json()
+            assert command["type"] == "command"
+            assert command["command"] == "collect_metrics"
+            ws.send_json(
+                {
+                    "type": "command_result",
+                    "id": command["id"],
+                    "success": True,
+                    "result": {"metrics": {"cpu_percent": 42.0}},
+                }
+            )
+            request.join(timeout=10)
+
+        assert responses[0].status_code == 200
+        assert responses[0].json()["metrics"]["cpu_percent"] == 42.0
+
+    def test_service_sync_uses_channel(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Adding an expected service sends sync_config to a connected agent."""
+        headers = _claim_agent(client, auth_headers, "chan-sync")
+
+        with client.websocket_connect(CHANNEL_URL, headers=headers) as ws:
+            _wait_registered(ws, "chan-sync", headers["X-Server-GUID"])
+            request = threading.Thread(
+                target=client.post,
+                args=("/api/v1/servers/chan-sync/services",),
+                kwargs={"json": {"service_name": "nginx"}, "headers": auth_headers},
+            )
+            request.start()
+
+            command = ws.receive_json()
+            ws.send_json(
+                {"type": "command_result", "id": command["id"], "success": True, "result": {}}
+            )
+            request.join(timeout=10)
+
+        assert command["command"] == "sync_config"
+        assert command["params"] == {"monitored_services": ["nginx"]}
+
+    def test_live_metrics_without_channel_returns_503(
+        self, client: TestClient, auth_headers: dict[str, str], send_heartbeat
+    ) -> None:
+        """Servers without a channel cannot serve live metrics."""
+        send_heartbeat(client, auth_headers, "chan-none")
+
+        response = client.get("/api/v1/agents/chan-none/metrics/live", headers=auth_headers)
+
+        assert response.status_code == 503
+        assert response.json()["detail"]["code"] == "AGENT_CHANNEL_UNAVAILABLE"
+
+
+class TestChannelLiveness:
+    """Dropped channels give fast offline detection."""
+
+    @staticmethod
+    def _wait_for_status(client: TestClient, auth_headers: dict, server_id: str) -> str:
+        status = ""
+        for _ in range(50):
+            status = client.get(f"/api/v1/servers/{server_id}", headers=auth_headers).json()[
+                "status"
+            ]
+            if status == "offline":
+                break
+            time.sleep(0.05)
+        return status
+
+    def test_dropped_channel_marks_offline(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Closing the channel without a shutdown event marks the server offline."""
+        headers = _claim_agent(client, auth_headers, "chan-drop")
+
+        with client.websocket_connect(CHANNEL_URL, headers=headers) as ws:
+            ws.send_json(_heartbeat_frame("chan-drop", headers["X-Server-GUID"]))
+            ws.receive_json()
+
+        assert self._wait_for_status(client, auth_headers, "chan-drop") == "offline"
+
+    def test_reconnect_to_other_worker_stays_online(
+        self, client: TestClient, auth_headers: dict[str, str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Reconnecting through another worker's manager keeps the server online."""
+        monkeypatch.setattr("homelab_cmd.services.agent_channel.CHANNEL_OFFLINE_GRACE_SECONDS", 0.5)
+        headers = _claim_agent(client, auth_headers, "chan-move")
+
+        with client.websocket_connect(CHANNEL_URL, headers=headers) as ws:
+            _wait_registered(ws, "chan-move", headers["X-Server-GUID"])
+
+        # The new connection registers with a manager this worker's check cannot see
+        with (
+            patch(
+                "homelab_cmd.api.routes.agents.get_agent_channel_manager",
+                return_value=AgentChannelManager(),
+            ),
+            client.websocket_connect(CHANNEL_URL, headers=headers) as ws,
+        ):
+            # Round-trip a frame that is not a heartbeat to finish the handshake
+            ws.send_text("not json")
+            assert ws.receive_json()["code"] == "INVALID_FRAME"
+            time.sleep(0.8)
+            server = client.get("/api/v1/servers/chan-move", headers=auth_headers).json()
+
+        assert server["status"] == "online"
+
+    def test_clean_agent_stop_stays_online(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """An agent_stop shutdown event before closing suppresses offline marking."""
+        headers = _claim_agent(client, auth_headers, "chan-stop")
+        guid = headers["X-Server-GUID"]
+
+        with client.websocket_connect(CHANNEL_URL, headers=headers) as ws:
+            ws.send_json(_heartbeat_frame("chan-stop", guid))
+            ws.receive_json()
+            ws.send_json(
+                {
+                    "type": "events",
+                    "id": "ev-1",
+                    "payload": {
+                        "server_guid": guid,
+                        "server_id": "chan-stop",
+                        "events": [
+                            {
+                                "event_type": "shutdown",
+                                "timestamp": datetime.now(UTC).isoformat(),
+                                "shutdown_reason": "agent_stop",
+                            }
+                        ],
+                    },
+                }
+            )
+            assert ws.receive_json()["type"] == "ack"
+
+        time.sleep(0.2)
+        server = client.get("/api/v1/servers/chan-stop", headers=auth_headers).json()
+        assert server["status"] == "online"
+
+
+class TestChannelActions:
+    """Service restart actions sent over the channel, or over SSH."""
+
+    @staticmethod
+    async def _run_restart(db_session, agent_mode: str | None, send_command: AsyncMock):
+        """Run an approved nginx restart with a connected channel; return (action, ssh)."""
+        db_session.add(Server(id="act-srv", hostname="act-srv.local", agent_mode=agent_mode))
+        action = RemediationAction(
+            server_id="act-srv",
+            action_type="restart_service",
+            service_name="nginx",
+            command="systemctl restart nginx",
+            status=ActionStatus.APPROVED.value,
+        )
+        db_session.add(action)
+        await db_session.commit()
+
+        manager = MagicMock()
+        manager.is_connected.return_value = True
+        manager.send_command = send_command
+        ssh = MagicMock()
+        ssh.return_value.execute = AsyncMock(
+            return_value=CommandResult(
+                exit_code=0, stdout="", stderr="", duration_ms=5, hostname="act-srv.local"
+            )
+        )
+        factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+        with (
+            patch("homelab_cmd.db.session.get_session_factory", return_value=factory),
+            patch("homelab_cmd.api.routes.actions.get_agent_channel_manager", return_value=manager),
+            patch("homelab_cmd.api.routes.actions.SSHPooledExecutor", ssh),
+        ):
+            await _execute_action_via_ssh(action.id)
+
+        await db_session.refresh(action)
+        return action, ssh.return_value.execute
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("agent_mode", ["readonly", None])
+    async def test_agent_without_command_execution_uses_ssh(
+        self, db_session, agent_mode: str | None
+    ) -> None:
+        """Agents that would refuse the restart are bypassed for SSH."""
+        send_command = AsyncMock()
+
+        action, ssh_execute = await self._run_restart(db_session, agent_mode, send_command)
+
+        send_command.assert_not_called()
+        ssh_execute.assert_awaited_once()
+        assert action.status == ActionStatus.COMPLETED.value
+
+    @pytest.mark.asyncio
+    async def test_timeout_after_send_is_not_rerun(self, db_session) -> None:
+        """An unanswered restart may have run, so it is not repeated over SSH."""
+        send_command = AsyncMock(side_effect=AgentChannelTimeoutError("no answer"))
+
+        action, ssh_execute = await self._run_restart(db_session, "readwrite", send_command)
+
+        send_command.assert_awaited_once()
+        ssh_execute.assert_not_called()
+        assert action.status == ActionStatus.FAILED.value
+        assert action.stderr.startswith("Outcome unknown")
@@ -3,6 +3,7 @@
 Tests verify the agent deployment functionality:
 - Agent version retrieval
 - Agent tarball building
+- Shipped agent files importing on every deploy path
 - Agent installation via SSH
 - Agent upgrade
 - Agent removal
@@ -10,6 +11,8 @@ Tests verify the agent deployment functionality:
 """
 
 import io
+import subprocess
+import sys
 import tarfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -18,10 +21,13 @@ import pytest
 import yaml
 
 from homelab_cmd.services.agent_deploy import (
+    AGENT_FILES,
     CONFIG_DIR,
+    INSTALL_DIR,
     AgentDeploymentService,
     DeploymentResult,
     build_agent_tarball,
+    get_agent_archive,
     get_agent_version,
     get_deployment_service,
 )
@@ -153,6 +159,45 @@ class TestBuildAgentTarball:
                     assert "monitored_services" in config_data
                     assert config_data["monitored_services"] == ["nginx", "postgresql"]
 
+    def test_agent_archive_cached_until_files_change(self, tmp_path: Path) -> None:
+        """Should reuse the built agent archive until an agent file changes."""
+        (tmp_path / "__init__.py").write_text("# placeholder")
+        with patch(
+            "homelab_cmd.services.agent_deploy._get_agent_source_path", return_value=tmp_path
+        ):
+            first = get_agent_archive()
+            assert get_agent_archive() is first
+
+            (tmp_path / "__init__.py").write_text("# changed placeholder")
+            second = get_agent_archive()
+
+        assert second is not first
+        assert second.etag != first.etag
+        with tarfile.open(fileobj=io.BytesIO(second.download), mode="r:gz") as tar:
+            assert tar.getnames() == [f"{INSTALL_DIR.lstrip('/')}/__init__.py"]
+
+    def test_build_tarball_appends_config_to_cached_archive(self, tmp_path: Path) -> None:
+        """Should reuse the cached agent files and append only config.yaml."""
+        (tmp_path / "__init__.py").write_text("# placeholder")
+        with patch(
+            "homelab_cmd.services.agent_deploy._get_agent_source_path", return_value=tmp_path
+        ):
+            archive = get_agent_archive()
+            tarball_bytes = build_agent_tarball(
+                hub_url="http://localhost:8080",
+                server_id="test-server",
+                server_guid="test-guid-7890",
+                api_token="hlh_ag_testkey3_abcdef",
+            )
+
+        assert tarball_bytes.startswith(archive.files)
+        with tarfile.open(fileobj=io.BytesIO(tarball_bytes), mode="r:gz") as tar:
+            assert tar.getnames() == [
+                f"{INSTALL_DIR.lstrip('/')}/__init__.py",
+                f"{CONFIG_DIR}/config.yaml",
+            ]
+            assert tar.getmember(f"{CONFIG_DIR}/config.yaml").mode == 0o600
+
     def test_build_tarball_with_command_execution(self) -> None:
         """Should include command_execution config when enabled."""
         with patch("homelab_cmd.services.agent_deploy._get_agent_source_path") as mock_get_path:
@@ -180,6 +225,57 @@ class TestBuildAgentTarball:
                     assert config_data["command_execution"]["use_sudo"] is True
 
 
+class TestShippedAgentFiles:
+    """Tests that every deploy path ships the modules the agent imports."""
+
+    def _extract_archive(self, tmp_path: Path) -> Path:
+        with tarfile.open(fileobj=io.BytesIO(get_agent_archive().download), mode="r:gz") as tar:
+            tar.extractall(tmp_path, filter="data")
+        return tmp_path / INSTALL_DIR.lstrip("/")
+
+    def test_archive_runs_as_script(self, tmp_path: Path) -> None:
+        """The deployed files start the agent as the systemd unit runs it."""
+        install_dir = self._extract_archive(tmp_path)
+
+        result = subprocess.run(
+            [sys.executable, str(install_dir / "__main__.py"), "--help"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_archive_imports_as_package(self, tmp_path: Path) -> None:
+        """The deployed files import as a package, as the Docker image runs them."""
+        package_dir = self._extract_archive(tmp_path).rename(tmp_path / "agent")
+
+        result = subprocess.run(
+            [sys.executable, "-m", "agent", "--help"],
+            cwd=package_dir.parent,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_install_script_and_dockerfile_copy_agent_modules(self) -> None:
+        """install.sh and the Dockerfile copy every module the archive ships."""
+        agent_dir = Path(__file__).parent.parent / "agent"
+        install_script = (agent_dir / "install.sh").read_text()
+        copy_line = next(
+            line
+            for line in (agent_dir / "Dockerfile").read_text().splitlines()
+            if line.startswith("COPY __init__.py")
+        )
+
+        for filename in (f for f in AGENT_FILES if f.endswith(".py")):
+            assert f'cp "$SCRIPT_DIR/{filename}"' in install_script
+            assert filename in copy_line.split()
+
+
 class TestAgentDeploymentServiceInstall:
     """Tests for AgentDeploymentService.install_agent method."""
 
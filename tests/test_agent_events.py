@@ -0,0 +1,218 @@
+"""Tests for the agent event push endpoint.
+
+POST /api/v1/agents/events lets agents report state changes (service
+ActiveState, filesystem threshold crossings, shutdown) between heartbeats so
+the hub can alert immediately.
+"""
+
+from datetime import UTC, datetime
+
+from fastapi.testclient import TestClient
+
+EVENTS_URL = "/api/v1/agents/events"
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _service_event(name: str, status: str) -> dict:
+    return {
+        "event_type": "service_state",
+        "timestamp": _now(),
+        "service": {"name": name, "status": status},
+    }
+
+
+def _filesystem_event(mount_point: str, percent: float) -> dict:
+    return {
+        "event_type": "filesystem_threshold",
+        "timestamp": _now(),
+        "filesystem": {
+            "mount_point": mount_point,
+            "device": "/dev/sda1",
+            "fs_type": "ext4",
+            "total_bytes": 1000,
+            "used_bytes": int(percent * 10),
+            "available_bytes": 1000 - int(percent * 10),
+            "percent": percent,
+        },
+    }
+
+
+class TestServiceStateEvents:
+    """service_state events are recorded and alerted on immediately."""
+
+    def test_failed_service_creates_alert(
+        self, client: TestClient, auth_headers: dict[str, str], send_heartbeat
+    ) -> None:
+        """A failed expected service raises an alert without waiting for a heartbeat."""
+        send_heartbeat(client, auth_headers, "event-svc")
+        client.post(
+            "/api/v1/servers/event-svc/services",
+            json={"service_name": "plex", "is_critical": True},
+            headers=auth_headers,
+        )
+
+        response = client.post(
+            EVENTS_URL,
+            json={"server_id": "event-svc", "events": [_service_event("plex", "failed")]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["processed"] == 1
+        assert response.json()["alerts_triggered"] == 1
+
+        alerts = client.get("/api/v1/alerts?server_id=event-svc", headers=auth_headers).json()
+        assert any(a["alert_type"] == "service" for a in alerts["alerts"])
+
+    def test_service_event_updates_current_status(
+        self, client: TestClient, auth_headers: dict[str, str], send_heartbeat
+    ) -> None:
+        """The pushed state becomes the service's current status."""
+        send_heartbeat(client, auth_headers, "event-status")
+        client.post(
+            "/api/v1/servers/event-status/services",
+            json={"service_name": "nginx"},
+            headers=auth_headers,
+        )
+
+        client.post(
+            EVENTS_URL,
+            json={"server_id": "event-status", "events": [_service_event("nginx", "stopped")]},
+            headers=auth_headers,
+        )
+
+        services = client.get("/api/v1/servers/event-status/services", headers=auth_headers)
+        assert services.json()["services"][0]["current_status"]["status"] == "stopped"
+
+
+class TestFilesystemThresholdEvents:
+    """filesystem_threshold events update the snapshot and disk alerting."""
+
+    def test_root_filesystem_crossing_creates_disk_alert(
+        self, client: TestClient, auth_headers: dict[str, str], send_heartbeat
+    ) -> None:
+        """Root filesystem above the disk threshold raises a disk alert."""
+        send_heartbeat(client, auth_headers, "event-disk")
+
+        response = client.post(
+            EVENTS_URL,
+            json={"server_id": "event-disk", "events": [_filesystem_event("/", 97.0)]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        alerts = client.get("/api/v1/alerts?server_id=event-disk", headers=auth_headers).json()
+        assert any(a["alert_type"] == "disk" for a in alerts["alerts"])
+
+    def test_filesystem_snapshot_updated(
+        self, client: TestClient, auth_headers: dict[str, str], send_heartbeat
+    ) -> None:
+        """The server's filesystem snapshot reflects the pushed usage."""
+        send_heartbeat(client, auth_headers, "event-fs")
+
+        client.post(
+            EVENTS_URL,
+            json={"server_id": "event-fs", "events": [_filesystem_event("/data", 92.5)]},
+            headers=auth_headers,
+        )
+
+        server = client.get("/api/v1/servers/event-fs", headers=auth_headers).json()
+        data_fs = [fs for fs in server["filesystems"] if fs["mount_point"] == "/data"]
+        assert data_fs[0]["percent"] == 92.5
+
+
+class TestShutdownEvents:
+    """shutdown events mark the server offline immediately."""
+
+    def test_system_shutdown_marks_offline(
+        self, client: TestClient, auth_headers: dict[str, str], send_heartbeat
+    ) -> None:
+        """A system shutdown sets status offline and raises an offline alert."""
+        send_heartbeat(client, auth_headers, "event-shutdown")
+        before = client.get("/api/v1/servers/event-shutdown", headers=auth_headers).json()
+
+        response = client.post(
+            EVENTS_URL,
+            json={
+                "server_id": "event-shutdown",
+                "events": [
+                    {
+                        "event_type": "shutdown",
+                        "timestamp": _now(),
+                        "shutdown_reason": "system_shutdown",
+                    }
+                ],
+            },
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        server = client.get("/api/v1/servers/event-shutdown", headers=auth_headers).json()
+        assert server["status"] == "offline"
+        assert server["last_seen"] == before["last_seen"]
+        alerts = client.get("/api/v1/alerts?server_id=event-shutdown", headers=auth_headers)
+        assert any(a["alert_type"] == "offline" for a in alerts.json()["alerts"])
+
+    def test_agent_stop_leaves_server_online(
+        self, client: TestClient, auth_headers: dict[str, str], send_heartbeat
+    ) -> None:
+        """Stopping only the agent (e.g. for upgrade) does not alert or refresh last_seen."""
+        send_heartbeat(client, auth_headers, "event-agent-stop")
+        before = client.get("/api/v1/servers/event-agent-stop", headers=auth_headers).json()
+
+        client.post(
+            EVENTS_URL,
+            json={
+                "server_id": "event-agent-stop",
+                "events": [
+                    {"event_type": "shutdown", "timestamp": _now(), "shutdown_reason": "agent_stop"}
+                ],
+            },
+            headers=auth_headers,
+        )
+
+        server = client.get("/api/v1/servers/event-agent-stop", headers=auth_headers).json()
+        assert server["status"] == "online"
+        assert server["last_seen"] == before["last_seen"]
+        alerts = client.get("/api/v1/alerts?server_id=event-agent-stop", headers=auth_headers)
+        assert alerts.json()["alerts"] == []
+
+
+class TestAgentEventValidation:
+    """Validation, authentication and unknown servers."""
+
+    def test_unknown_server_returns_404(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Events for an unregistered server are rejected."""
+        response = client.post(
+            EVENTS_URL,
+            json={"server_id": "never-seen", "events": [_service_event("plex", "failed")]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+
+    def test_missing_payload_for_event_type_rejected(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """A service_state event without a service payload returns 422."""
+        response = client.post(
+            EVENTS_URL,
+            json={
+                "server_id": "event-invalid",
+                "events": [{"event_type": "service_state", "timestamp": _now()}],
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+    def test_requires_authentication(self, client: TestClient) -> None:
+        """Event push requires agent authentication."""
+        response = client.post(
+            EVENTS_URL,
+            json={"server_id": "event-noauth", "events": [_service_event("plex", "failed")]},
+        )
+        assert response.status_code == 401
@@ -4,6 +4,9 @@ Tests cover the full registration flow: create token, claim token, heartbeat wit
 per-agent auth, token rotation, and token revocation.
 """
 
+import io
+import tarfile
+
 from fastapi.testclient import TestClient
 
 
@@ -505,3 +508,33 @@ class TestInstallScriptEndpoint:
         content = response.text
         assert "#!/bin/bash" in content
         assert "--token" in content
+
+
+class TestAgentDownloadEndpoint:
+    """Tests for GET /api/v1/agents/register/download."""
+
+    def test_download_agent_archive(self, client: TestClient) -> None:
+        """Should return the agent archive with an ETag (no auth required)."""
+        response = client.get("/api/v1/agents/register/download")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert response.headers["etag"]
+        with tarfile.open(fileobj=io.BytesIO(response.content), mode="r:gz") as tar:
+            assert "opt/homelab-agent/VERSION" in tar.getnames()
+
+    def test_download_not_modified(self, client: TestClient) -> None:
+        """Should return 304 when If-None-Match matches the current archive."""
+        etag = client.get("/api/v1/agents/register/download").headers["etag"]
+
+        response = client.get("/api/v1/agents/register/download", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_install_script_uses_download(self, client: TestClient) -> None:
+        """The install script fetches the agent from the download endpoint."""
+        response = client.get("/api/v1/agents/register/install.sh")
+
+        assert "/api/v1/agents/register/download" in response.text
@@ -0,0 +1,353 @@
+"""Tests for fleet agent rollouts (EP0007).
+
+Tests verify:
+- Wave planning (canary wave first, then fixed-size waves)
+- Concurrent upgrades per wave through one shared SSH service
+- Pausing when an upgrade fails or post-upgrade heartbeats don't arrive
+- Continuing and cancelling rollouts
+- Rollout API endpoints
+"""
+
+import asyncio
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from homelab_cmd.db.models.agent_rollout import AgentRollout, AgentRolloutStatus
+from homelab_cmd.db.models.server import Server
+from homelab_cmd.services.agent_deploy import get_agent_version
+from homelab_cmd.services.agent_rollout import (
+    AgentRolloutService,
+    RolloutConflictError,
+    RolloutError,
+    plan_waves,
+)
+from homelab_cmd.services.ssh import CommandResult
+
+
+class FakeFleet:
+    """Shared SSH stand-in that upgrades servers and sends their heartbeats."""
+
+    def __init__(self, session_factory, fail: set[str] = frozenset(), silent=frozenset()):
+        self.session_factory = session_factory
+        self.fail = set(fail)
+        self.silent = set(silent)
+        self.upgraded: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def execute_command(self, hostname: str, command: str = "", **kwargs) -> CommandResult:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        if hostname in self.fail:
+            return CommandResult(success=False, stdout="", stderr="", exit_code=1, error="boom")
+        self.upgraded.append(hostname)
+        return CommandResult(success=True, stdout="", stderr="", exit_code=0)
+
+    async def heartbeats(self) -> None:
+        """Heartbeat every upgraded, non-silent server with the new version."""
+        while True:
+            await asyncio.sleep(0.03)
+            hosts = [h for h in self.upgraded if h not in self.silent]
+            if not hosts:
+                continue
+            async with self.session_factory() as session:
+                await session.execute(
+                    update(Server)
+                    .where(Server.id.in_(hosts))
+                    .values(agent_version=get_agent_version(), last_seen=datetime.now(UTC))
+                )
+                await session.commit()
+
+
+@pytest.fixture
+async def session_factory(tmp_path: Path):
+    """Session factory for a file database shared by concurrent sessions."""
+    from homelab_cmd.db import models  # noqa: F401 - Import to register models
+    from homelab_cmd.db.base import Base
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'rollout.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _add_servers(session_factory, count: int) -> list[str]:
+    # Server IDs double as hostnames so the fake SSH service can map them back
+    server_ids = [f"srv-{i}" for i in range(count)]
+    async with session_factory() as session:
+        for server_id in server_ids:
+            session.add(Server(id=server_id, hostname=server_id, agent_version="0.0.1"))
+        await session.commit()
+    return server_ids
+
+
+async def _run(session_factory, fleet: FakeFleet, rollout_id: int) -> AgentRollout:
+    service = AgentRolloutService(session_factory=session_factory, ssh=fleet)
+    pump = asyncio.create_task(fleet.heartbeats())
+    try:
+        with patch("homelab_cmd.services.agent_rollout.HEARTBEAT_POLL_INTERVAL_SECONDS", 0.02):
+            await service.execute_rollout(rollout_id)
+    finally:
+        pump.cancel()
+    async with session_factory() as session:
+        return await session.get(AgentRollout, rollout_id)
+
+
+async def _create(session_factory, **kwargs) -> AgentRollout:
+    kwargs.setdefault("heartbeat_timeout_seconds", 2)
+    async with session_factory() as session:
+        rollout = await AgentRolloutService(session_factory=session_factory).create_rollout(
+            session, **kwargs
+        )
+        await session.commit()
+        return rollout
+
+
+class TestPlanWaves:
+    """Tests for plan_waves."""
+
+    def test_canary_then_fixed_size_waves(self) -> None:
+        """Should put canary_size servers first and split the rest by wave_size."""
+        ids = [f"s{i}" for i in range(8)]
+        assert plan_waves(ids, 1, 3) == [["s0"], ["s1", "s2", "s3"], ["s4", "s5", "s6"], ["s7"]]
+
+    def test_empty(self) -> None:
+        """Should plan no waves for no servers."""
+        assert plan_waves([], 1, 5) == []
+
+
+class TestCreateRollout:
+    """Tests for AgentRolloutService.create_rollout."""
+
+    async def test_defaults_to_servers_on_other_versions(self, session_factory) -> None:
+        """Should select active agent servers not on the current version."""
+        await _add_servers(session_factory, 3)
+        async with session_factory() as session:
+            session.add(Server(id="current", hostname="current", agent_version=get_agent_version()))
+            session.add(Server(id="no-agent", hostname="no-agent"))
+            session.add(Server(id="gone", hostname="gone", agent_version="0.0.1", is_inactive=True))
+            await session.commit()
+
+        rollout = await _create(session_factory, canary_size=1, wave_size=2)
+
+        assert rollout.server_ids == ["srv-0", "srv-1", "srv-2"]
+        assert rollout.waves_total == 2
+        assert [h["status"] for h in rollout.results] == ["pending"] * 3
+
+    async def test_unknown_server_rejected(self, session_factory) -> None:
+        """Should refuse servers that don't exist."""
+        with pytest.raises(RolloutError, match="not found"):
+            await _create(session_factory, server_ids=["missing"])
+
+    async def test_only_one_active_rollout(self, session_factory) -> None:
+        """Should refuse a second rollout while one is active."""
+        await _add_servers(session_factory, 1)
+        await _create(session_factory)
+        with pytest.raises(RolloutConflictError):
+            await _create(session_factory)
+
+
+class TestExecuteRollout:
+    """Tests for AgentRolloutService.execute_rollout."""
+
+    async def test_upgrades_all_waves_concurrently(self, session_factory) -> None:
+        """Should upgrade the canary alone, then wave_size servers at a time."""
+        server_ids = await _add_servers(session_factory, 5)
+        rollout = await _create(session_factory, canary_size=1, wave_size=2)
+        fleet = FakeFleet(session_factory)
+
+        rollout = await _run(session_factory, fleet, rollout.id)
+
+        assert rollout.status == AgentRolloutStatus.COMPLETED.value
+        assert rollout.waves_completed == 3
+        assert rollout.hosts_succeeded == 5
+        assert rollout.hosts_failed == 0
+        assert fleet.upgraded[0] == "srv-0"
+        assert sorted(fleet.upgraded) == server_ids
+        assert fleet.max_in_flight == 2
+        assert all(h["status"] == "succeeded" and h["verified_at"] for h in rollout.results)
+
+    async def test_missing_heartbeat_pauses_after_canary(self, session_factory) -> None:
+        """Should pause before the next wave when the canary never heartbeats."""
+        await _add_servers(session_factory, 3)
+        rollout = await _create(
+            session_factory, canary_size=1, wave_size=2, heartbeat_timeout_seconds=1
+        )
+        fleet = FakeFleet(session_factory, silent={"srv-0"})
+
+        rollout = await _run(session_factory, fleet, rollout.id)
+
+        assert rollout.status == AgentRolloutStatus.PAUSED.value
+        assert rollout.waves_completed == 1
+        assert "Canary wave failed on srv-0" in rollout.error
+        assert fleet.upgraded == ["srv-0"]
+        hosts = {h["server_id"]: h for h in rollout.results}
+        assert hosts["srv-0"]["status"] == "failed"
+        assert "No heartbeat" in hosts["srv-0"]["error"]
+        assert hosts["srv-1"]["status"] == "pending"
+
+    async def test_failed_upgrade_pauses_and_unpause_continues(self, session_factory) -> None:
+        """Should pause on a failed upgrade and continue with the next wave."""
+        await _add_servers(session_factory, 4)
+        rollout = await _create(session_factory, canary_size=2, wave_size=2)
+        fleet = FakeFleet(session_factory, fail={"srv-1"})
+
+        rollout = await _run(session_factory, fleet, rollout.id)
+
+        assert rollout.status == AgentRolloutStatus.PAUSED.value
+        assert rollout.hosts_succeeded == 1
+        assert rollout.hosts_failed == 1
+        assert {h["server_id"]: h["error"] for h in rollout.results}["srv-1"] == "boom"
+
+        async with session_factory() as session:
+            record = await session.get(AgentRollout, rollout.id)
+            await AgentRolloutService().unpause_rollout(session, record)
+            await session.commit()
+        rollout = await _run(session_factory, fleet, rollout.id)
+
+        assert rollout.status == AgentRolloutStatus.COMPLETED.value
+        assert rollout.hosts_succeeded == 3
+        assert rollout.hosts_failed == 1
+        assert "srv-1" not in fleet.upgraded
+
+    async def test_unpause_during_wave_does_not_rerun_it(self, session_factory) -> None:
+        """A second runner started mid-wave waits, then continues with the next wave."""
+        server_ids = await _add_servers(session_factory, 3)
+        rollout = await _create(session_factory, canary_size=1, wave_size=2)
+        fleet = FakeFleet(session_factory)
+        service = AgentRolloutService(session_factory=session_factory, ssh=fleet)
+
+        async def pause_and_unpause() -> None:
+            while not fleet.in_flight:
+                await asyncio.sleep(0.001)
+            async with session_factory() as session:
+                record = await session.get(AgentRollout, rollout.id)
+                await service.pause_rollout(session, record)
+                await service.unpause_rollout(session, record)
+                await session.commit()
+            await service.execute_rollout(rollout.id)
+
+        pump = asyncio.create_task(fleet.heartbeats())
+        try:
+            with patch("homelab_cmd.services.agent_rollout.HEARTBEAT_POLL_INTERVAL_SECONDS", 0.02):
+                await asyncio.gather(service.execute_rollout(rollout.id), pause_and_unpause())
+        finally:
+            pump.cancel()
+        async with session_factory() as session:
+            rollout = await session.get(AgentRollout, rollout.id)
+
+        assert rollout.status == AgentRolloutStatus.COMPLETED.value
+        assert sorted(fleet.upgraded) == server_ids
+        assert rollout.hosts_succeeded == 3
+
+    async def test_cancelled_rollout_not_run(self, session_factory) -> None:
+        """Should not upgrade anything once a rollout is cancelled."""
+        await _add_servers(session_factory, 2)
+        rollout = await _create(session_factory)
+        async with session_factory() as session:
+            record = await session.get(AgentRollout, rollout.id)
+            await AgentRolloutService().cancel_rollout(session, record)
+            await session.commit()
+        fleet = FakeFleet(session_factory)
+
+        rollout = await _run(session_factory, fleet, rollout.id)
+
+        assert rollout.status == AgentRolloutStatus.CANCELLED.value
+        assert fleet.upgraded == []
+
+
+class TestRolloutEndpoints:
+    """Tests for the /agents/rollouts endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def mount_router(self, client: TestClient) -> None:
+        # The shared test app doesn't mount the agent deployment routes
+        from homelab_cmd.api.routes import agent_deploy
+
+        client.app.include_router(agent_deploy.router, prefix="/api/v1")
+
+    @pytest.fixture(autouse=True)
+    def no_background_run(self):
+        with patch(
+            "homelab_cmd.api.routes.agent_deploy.run_rollout_background",
+            new_callable=AsyncMock,
+        ) as run:
+            yield run
+
+    def _create(self, client: TestClient, auth_headers: dict[str, str], create_server) -> dict:
+        create_server(client, auth_headers, "rollout-a")
+        create_server(client, auth_headers, "rollout-b")
+        response = client.post(
+            "/api/v1/agents/rollouts",
+            json={"server_ids": ["rollout-a", "rollout-b"], "wave_size": 2},
+            headers=auth_headers,
+        )
+        assert response.status_code == 202
+        return response.json()
+
+    def test_create_and_get(
+        self, client: TestClient, auth_headers: dict[str, str], create_server, no_background_run
+    ) -> None:
+        """Should create a pending rollout and start it in the background."""
+        rollout = self._create(client, auth_headers, create_server)
+
+        assert rollout["status"] == "pending"
+        assert rollout["hosts_total"] == 2
+        assert rollout["waves_total"] == 2
+        assert [h["server_id"] for h in rollout["hosts"]] == ["rollout-a", "rollout-b"]
+        no_background_run.assert_awaited_once_with(rollout["id"])
+
+        response = client.get(f"/api/v1/agents/rollouts/{rollout['id']}", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["id"] == rollout["id"]
+
+        response = client.get("/api/v1/agents/rollouts", headers=auth_headers)
+        assert response.json()["total"] == 1
+
+    def test_second_rollout_conflicts(
+        self, client: TestClient, auth_headers: dict[str, str], create_server
+    ) -> None:
+        """Should return 409 while another rollout is active."""
+        self._create(client, auth_headers, create_server)
+        response = client.post(
+            "/api/v1/agents/rollouts", json={"server_ids": ["rollout-a"]}, headers=auth_headers
+        )
+        assert response.status_code == 409
+
+    def test_unknown_server_is_bad_request(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Should return 400 for servers that don't exist."""
+        response = client.post(
+            "/api/v1/agents/rollouts", json={"server_ids": ["nope"]}, headers=auth_headers
+        )
+        assert response.status_code == 400
+
+    def test_pause_unpause_cancel(
+        self, client: TestClient, auth_headers: dict[str, str], create_server
+    ) -> None:
+        """Should move a rollout through pause, unpause and cancel."""
+        rollout_id = self._create(client, auth_headers, create_server)["id"]
+        base = f"/api/v1/agents/rollouts/{rollout_id}"
+
+        assert client.post(f"{base}/pause", headers=auth_headers).json()["status"] == "paused"
+        assert client.post(f"{base}/pause", headers=auth_headers).status_code == 409
+        response = client.post(f"{base}/unpause", headers=auth_headers)
+        assert response.status_code == 202
+        assert response.json()["status"] == "pending"
+        assert client.post(f"{base}/cancel", headers=auth_headers).json()["status"] == "cancelled"
+        assert client.post(f"{base}/cancel", headers=auth_headers).status_code == 409
+
+    def test_rollout_not_found(self, client: TestClient, auth_headers: dict[str, str]) -> None:
+        """Should return 404 for unknown rollouts."""
+        response = client.get("/api/v1/agents/rollouts/999", headers=auth_headers)
+        assert response.status_code == 404
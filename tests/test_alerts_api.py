@@ -9,8 +9,13 @@ These tests verify the alert CRUD-like endpoints:
 Story Reference: sdlc-studio/stories/US0014-alert-api.md
 """
 
+from datetime import UTC, datetime
+
 from fastapi.testclient import TestClient
 
+from homelab_cmd.db.models.service import ServiceStatus
+from homelab_cmd.db.session import get_session_factory
+
 
 def _create_alert_via_heartbeat(
     client: TestClient,
@@ -576,6 +581,36 @@ class TestServiceDownAlerts:
             # May be auto-resolved or we can acknowledge it
             assert ack_response.status_code in [200, 400]
 
+    def test_list_and_detail_agree_on_service_state(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """List, detail and acknowledge all judge a service by its current status."""
+        _create_service_down_alert(client, auth_headers, "agree-test", "radarr")
+
+        async def add_newer_history() -> None:
+            # History can disagree with the current status, e.g. after a replayed sample
+            async with get_session_factory()() as session:
+                session.add(
+                    ServiceStatus(
+                        server_id="agree-test",
+                        service_name="radarr",
+                        status="running",
+                        timestamp=datetime(2026, 1, 19, 10, 5, tzinfo=UTC),
+                    )
+                )
+                await session.commit()
+
+        client.portal.call(add_newer_history)
+
+        alerts = client.get("/api/v1/alerts?server_id=agree-test", headers=auth_headers).json()
+        listed = next(a for a in alerts["alerts"] if a["alert_type"] == "service")
+        detail = client.get(f"/api/v1/alerts/{listed['id']}", headers=auth_headers).json()
+        ack = client.post(f"/api/v1/alerts/{listed['id']}/acknowledge", headers=auth_headers)
+
+        assert listed["can_acknowledge"] is False
+        assert detail["can_acknowledge"] is False
+        assert ack.status_code == 400
+
 
 class TestListAlertsCanAcknowledge:
     """Tests for can_acknowledge flag in list response."""
@@ -3,16 +3,21 @@
 Part of EP0010: Configuration Management - US0117 Configuration Compliance Checker.
 """
 
+import hashlib
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import yaml
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from homelab_cmd.db.models import Server
+from homelab_cmd.db.models import ConfigCheck, Server
 from homelab_cmd.services.compliance_service import (
     ComplianceCheckService,
+    ManifestCheckError,
     SSHUnavailableError,
 )
 from homelab_cmd.services.config_pack_service import ConfigPackService
@@ -445,3 +450,145 @@ class TestFullCompliance:
         assert added_obj.server_id == "test-server"
         assert added_obj.pack_name == "test-pack"
         assert added_obj.is_compliant is True
+
+
+class LocalShellClient:
+    """SSH client stand-in that runs commands with the local shell."""
+
+    def __init__(self):
+        self.outputs: list[str] = []
+
+    def exec_command(self, command: str, timeout: int = 30):
+        """Run the command and expose its output like paramiko."""
+        output = subprocess.run(
+            ["sh", "-c", command], capture_output=True, text=True, timeout=timeout
+        ).stdout
+        self.outputs.append(output)
+        stdout = MagicMock()
+        stdout.read.return_value = output.encode()
+        return MagicMock(), stdout, MagicMock()
+
+
+class TestManifestCheck:
+    """Tests for single-command manifest checks with a cached digest."""
+
+    @pytest.fixture
+    def managed_file(self, tmp_path: Path) -> Path:
+        """File managed by the manifest pack."""
+        managed = tmp_path / "managed.conf"
+        managed.write_text("managed\n")
+        managed.chmod(0o644)
+        return managed
+
+    @pytest.fixture
+    def manifest_packs_dir(self, tmp_path: Path, managed_file: Path) -> Path:
+        """Pack directory with a pack checking one file and one setting."""
+        packs_dir = tmp_path / "packs"
+        packs_dir.mkdir()
+        pack = {
+            "name": "Manifest Pack",
+            "description": "Pack for manifest checks",
+            "items": {
+                "files": [
+                    {
+                        "path": str(managed_file),
+                        "mode": "0644",
+                        "content_hash": "sha256:"
+                        + hashlib.sha256(managed_file.read_bytes()).hexdigest(),
+                    },
+                    {"path": str(tmp_path / "absent.conf"), "mode": "0600"},
+                ],
+                "settings": [
+                    {"key": "HOMELABCMD_UNSET_VAR", "expected": "on", "type": "env_var"},
+                ],
+            },
+        }
+        (packs_dir / "manifest-pack.yaml").write_text(yaml.dump(pack))
+        return packs_dir
+
+    async def _check(self, db_session: AsyncSession, packs_dir: Path, client) -> list[str]:
+        server = await db_session.get(Server, "manifest-server")
+        if server is None:
+            server = Server(id="manifest-server", hostname="manifest.local", ssh_username="root")
+            db_session.add(server)
+            await db_session.commit()
+
+        executor = MagicMock(spec=SSHPooledExecutor)
+        executor.get_connection = AsyncMock(return_value=client)
+        service = ComplianceCheckService(ConfigPackService(packs_dir=packs_dir), executor)
+        result = await service.check_compliance(
+            session=db_session, server=server, pack_name="manifest-pack", use_manifest=True
+        )
+        return sorted(m.type for m in result.mismatches)
+
+    async def test_unchanged_host_reuses_previous_result(
+        self, db_session: AsyncSession, manifest_packs_dir: Path
+    ) -> None:
+        """A repeat check returns only the digest and reuses the stored mismatches."""
+        client = LocalShellClient()
+
+        first = await self._check(db_session, manifest_packs_dir, client)
+        second = await self._check(db_session, manifest_packs_dir, client)
+
+        assert first == ["missing_file", "wrong_setting"]
+        assert second == first
+        assert len(client.outputs) == 2
+        assert len(client.outputs[0].splitlines()) > 1
+        assert client.outputs[1].splitlines() == [client.outputs[0].splitlines()[0]]
+
+        result = await db_session.execute(
+            select(ConfigCheck).where(ConfigCheck.server_id == "manifest-server")
+        )
+        checks = result.scalars().all()
+        assert len(checks) == 2
+        assert checks[0].manifest_digest == checks[1].manifest_digest
+        assert len(checks[0].manifest_digest) == 64
+
+    async def test_changed_host_is_rechecked(
+        self, db_session: AsyncSession, manifest_packs_dir: Path, managed_file: Path
+    ) -> None:
+        """Changing a file on the host changes the digest and the result."""
+        client = LocalShellClient()
+        await self._check(db_session, manifest_packs_dir, client)
+
+        managed_file.write_text("edited\n")
+        managed_file.chmod(0o600)
+        mismatches = await self._check(db_session, manifest_packs_dir, client)
+
+        assert mismatches == [
+            "missing_file",
+            "wrong_content",
+            "wrong_permissions",
+            "wrong_setting",
+        ]
+        assert len(client.outputs[1].splitlines()) > 1
+
+    @pytest.mark.parametrize(
+        ("exec_error", "output"),
+        [
+            (OSError("channel closed"), b""),
+            (None, b"sh: 1: sha256sum: not found\n"),
+        ],
+        ids=["ssh-failure", "unparseable-output"],
+    )
+    async def test_failed_check_is_not_stored(
+        self,
+        db_session: AsyncSession,
+        manifest_packs_dir: Path,
+        exec_error: Exception | None,
+        output: bytes,
+    ) -> None:
+        """A failed manifest check raises instead of recording the host as compliant."""
+        client = MagicMock()
+        stdout = MagicMock()
+        stdout.read.return_value = output
+        client.exec_command.side_effect = exec_error
+        client.exec_command.return_value = (MagicMock(), stdout, MagicMock())
+
+        with pytest.raises(ManifestCheckError):
+            await self._check(db_session, manifest_packs_dir, client)
+
+        result = await db_session.execute(
+            select(ConfigCheck).where(ConfigCheck.server_id == "manifest-server")
+        )
+        assert result.scalars().all() == []
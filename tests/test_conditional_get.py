@@ -0,0 +1,175 @@
+"""Tests for table change versions, conditional GET and response compression.
+
+Tests cover:
+- Commits bump the versions of the tables they write; rollbacks do not
+- ORM UPDATE/DELETE statements count as writes
+- Polled endpoints return an ETag and answer If-None-Match with 304
+- A 304 is answered without running the endpoint's queries
+- Writes, query parameters and authentication are respected
+- Large responses are gzipped; the live update stream is not
+"""
+
+import gzip
+
+import pytest
+from sqlalchemy import delete
+from starlette.responses import PlainTextResponse
+
+from homelab_cmd.api.conditional import etag_matches
+from homelab_cmd.api.middleware import CompressionMiddleware
+from homelab_cmd.db.models import Config, Metrics, Server
+from homelab_cmd.db.versions import get_table_versions
+
+
+def _query_count(response) -> int:
+    """SQL statements run for a request, from its Server-Timing header."""
+    timing = response.headers["server-timing"]
+    return int(timing.split('desc="')[1].split(" queries")[0])
+
+
+class TestTableVersions:
+    """Tests for version bumps on commit."""
+
+    @pytest.mark.asyncio
+    async def test_commit_bumps_written_tables(self, db_session) -> None:
+        """Only tables written in the transaction are bumped."""
+        db_session.add(Config(key="k", value={"a": 1}))
+        await db_session.commit()
+        db_session.add(Config(key="k2", value={"a": 2}))
+        await db_session.commit()
+
+        versions = await get_table_versions(db_session, ["config", "servers"])
+
+        assert versions == {"config": 2, "servers": 0}
+
+    @pytest.mark.asyncio
+    async def test_rollback_and_unchanged_objects_do_not_bump(self, db_session) -> None:
+        """Discarded writes and no-op attribute sets leave versions alone."""
+        config = Config(key="k", value={"a": 1})
+        db_session.add(config)
+        await db_session.commit()
+
+        db_session.add(Config(key="k2", value={}))
+        await db_session.rollback()
+        await db_session.refresh(config)
+        config.value = {"a": 1}
+        await db_session.commit()
+
+        assert (await get_table_versions(db_session, ["config"]))["config"] == 1
+
+    @pytest.mark.asyncio
+    async def test_orm_statements_bump(self, db_session) -> None:
+        """Bulk ORM DELETE statements are writes too."""
+        db_session.add(Server(id="s1", hostname="s1"))
+        await db_session.commit()
+
+        await db_session.execute(delete(Metrics).where(Metrics.server_id == "s1"))
+        await db_session.commit()
+
+        versions = await get_table_versions(db_session, ["metrics", "servers"])
+        assert versions == {"metrics": 1, "servers": 1}
+
+
+class TestConditionalGet:
+    """Tests for ETag / If-None-Match on polled endpoints."""
+
+    def test_not_modified_without_running_queries(self, client, auth_headers, create_server):
+        """A matching If-None-Match gets an empty 304 after one query."""
+        create_server(client, auth_headers, "etag-1")
+        first = client.get("/api/v1/servers", headers=auth_headers)
+        etag = first.headers["etag"]
+
+        second = client.get("/api/v1/servers", headers={**auth_headers, "If-None-Match": etag})
+
+        assert etag.startswith('W/"')
+        assert first.headers["cache-control"] == "private, no-cache"
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+        assert _query_count(second) < _query_count(first)
+
+    def test_write_changes_etag(self, client, auth_headers, create_server, send_heartbeat):
+        """A heartbeat makes the server list stale."""
+        create_server(client, auth_headers, "etag-2")
+        etag = client.get("/api/v1/servers", headers=auth_headers).headers["etag"]
+
+        send_heartbeat(client, auth_headers, "etag-2")
+        response = client.get("/api/v1/servers", headers={**auth_headers, "If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_preferences_revalidate_after_save(self, client, auth_headers):
+        """Saving a preference changes the ETag of its GET."""
+        url = "/api/v1/preferences/card-order"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+        assert client.get(url, headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+
+        client.put(url, json={"order": ["a", "b"]}, headers=auth_headers)
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["order"] == ["a", "b"]
+
+    def test_query_parameters_change_etag(self, client, auth_headers):
+        """Differently filtered lists have different ETags."""
+        open_alerts = client.get("/api/v1/alerts?status=open", headers=auth_headers)
+        resolved = client.get("/api/v1/alerts?status=resolved", headers=auth_headers)
+
+        assert open_alerts.headers["etag"] != resolved.headers["etag"]
+
+    def test_authentication_checked_first(self, client):
+        """A 304 is never sent to an unauthenticated client."""
+        response = client.get("/api/v1/servers", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 401
+
+    def test_etag_matching(self):
+        """Weak comparison over a list of tags, plus the wildcard."""
+        assert etag_matches('"x", W/"abc"', 'W/"abc"')
+        assert etag_matches('"abc"', 'W/"abc"')
+        assert etag_matches("*", 'W/"abc"')
+        assert not etag_matches('W/"abd"', 'W/"abc"')
+        assert not etag_matches(None, 'W/"abc"')
+
+
+class TestCompression:
+    """Tests for CompressionMiddleware."""
+
+    def test_large_response_gzipped(self, client, auth_headers, create_server):
+        """The server list is compressed for clients accepting gzip."""
+        for i in range(10):
+            create_server(client, auth_headers, f"gzip-{i}")
+
+        response = client.get(
+            "/api/v1/servers", headers={**auth_headers, "Accept-Encoding": "gzip"}
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["total"] == 10
+
+    @pytest.mark.asyncio
+    async def test_stream_not_compressed(self):
+        """The live update stream passes through uncompressed."""
+        body = "data: x\n\n" * 500
+        middleware = CompressionMiddleware(PlainTextResponse(body))
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        async def send(message):
+            sent.append(message)
+
+        for path in ("/api/v1/stream", "/api/v1/servers"):
+            scope = {
+                "type": "http",
+                "method": "GET",
+                "path": path,
+                "headers": [(b"accept-encoding", b"gzip")],
+            }
+            await middleware(scope, receive, send)
+
+        stream_body, list_body = (m["body"] for m in sent if m["type"] == "http.response.body")
+        assert stream_body.decode() == body
+        assert gzip.decompress(list_body).decode() == body
@@ -5,13 +5,23 @@ Part of EP0010: Configuration Management:
 - US0123 Remove Configuration Pack
 """
 
+import subprocess
 import tempfile
+import threading
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import yaml
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from homelab_cmd.api.schemas.config_apply import ApplyItemResult
+from homelab_cmd.api.schemas.config_pack import FileItem, PackageItem, PackItems, SettingItem
+from homelab_cmd.db.models import ConfigApply, ConfigApplyStatus, Server
+from homelab_cmd.services.config_apply_service import ConfigApplyService
+from homelab_cmd.services.config_pack_service import ConfigPackError
 
 
 class TestConfigApplyAPIAuth:
@@ -478,6 +488,203 @@ class TestConfigApplyService:
         assert "-y" in expected_pattern
 
 
+class _LocalShellClient:
+    """Stands in for a paramiko client, running commands with the local shell."""
+
+    def __init__(self) -> None:
+        self.commands: list[str] = []
+
+    def exec_command(self, command: str, timeout: int | None = None):
+        self.commands.append(command)
+        process = subprocess.Popen(
+            ["sh", "-c", command],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        sent = bytearray()
+        outputs: dict[str, bytes] = {}
+        finished = threading.Event()
+
+        def shutdown_write() -> None:
+            outputs["stdout"], outputs["stderr"] = process.communicate(bytes(sent), timeout)
+            finished.set()
+
+        def read_stderr() -> bytes:
+            finished.wait()
+            return outputs["stderr"]
+
+        channel = SimpleNamespace(
+            shutdown_write=shutdown_write, recv_exit_status=lambda: process.returncode
+        )
+        stdin = SimpleNamespace(write=sent.extend, channel=channel)
+        stdout = _LinesFile(lambda: outputs["stdout"], channel)
+        stderr = SimpleNamespace(read=read_stderr)
+        return stdin, stdout, stderr
+
+
+class _LinesFile:
+    """Minimal paramiko ChannelFile: iterates decoded lines of deferred output."""
+
+    def __init__(self, output, channel) -> None:
+        self._output = output
+        self.channel = channel
+
+    def __iter__(self):
+        return iter(self._output().decode().splitlines(keepends=True))
+
+
+class TestBatchedApply:
+    """Batched apply sends the whole pack in one SSH command."""
+
+    @pytest.fixture
+    def pack(self, tmp_path: Path) -> SimpleNamespace:
+        """Pack with two files, one missing template and an unsupported setting."""
+        return SimpleNamespace(
+            items=PackItems(
+                files=[
+                    FileItem(path=str(tmp_path / "a.conf"), mode="600", template="a.txt"),
+                    FileItem(path=str(tmp_path / "nested/dir/b.conf"), mode="644"),
+                    FileItem(path=str(tmp_path / "c.conf"), mode="644", template="missing"),
+                ],
+                settings=[SettingItem(key="timezone", expected="UTC", type="config")],
+            )
+        )
+
+    @pytest.fixture
+    def pack_service(self, pack: SimpleNamespace) -> MagicMock:
+        """Pack service returning the pack and template content."""
+
+        def template_content(name: str) -> str:
+            if name == "missing":
+                raise ConfigPackError("Template not found: missing")
+            return "hello 'world'"
+
+        service = MagicMock()
+        service.load_pack.return_value = pack
+        service.get_template_content.side_effect = template_content
+        return service
+
+    async def test_execute_apply_uses_one_command(
+        self,
+        db_session: AsyncSession,
+        pack_service: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Files are written and results recorded from a single exec."""
+        db_session.add(Server(id="batch-srv", hostname="batch-srv"))
+        await db_session.commit()
+        apply_record = ConfigApply(
+            server_id="batch-srv",
+            pack_name="base",
+            status=ConfigApplyStatus.PENDING.value,
+            items_total=4,
+        )
+        db_session.add(apply_record)
+        await db_session.commit()
+
+        client = _LocalShellClient()
+        ssh_executor = MagicMock()
+        ssh_executor.get_connection = AsyncMock(return_value=client)
+        service = ConfigApplyService(pack_service, ssh_executor)
+
+        await service.execute_apply(apply_record, db_session)
+
+        assert len(client.commands) == 1
+        assert (tmp_path / "a.conf").read_text() == "hello 'world'\n"
+        assert (tmp_path / "a.conf").stat().st_mode & 0o777 == 0o600
+        assert (tmp_path / "nested/dir/b.conf").read_text() == "\n"
+        assert not (tmp_path / "c.conf").exists()
+
+        assert apply_record.status == ConfigApplyStatus.COMPLETED.value
+        assert apply_record.items_completed == 2
+        assert apply_record.items_failed == 2
+        assert [r["success"] for r in apply_record.results] == [True, True, False, False]
+        assert "Template not found" in apply_record.results[2]["error"]
+        assert "Unsupported setting type" in apply_record.results[3]["error"]
+
+    async def test_packages_installed_in_one_transaction(self) -> None:
+        """All packages go to one apt-get call; results come from result lines."""
+        pack = SimpleNamespace(
+            items=PackItems(packages=[PackageItem(name="curl"), PackageItem(name="nope")])
+        )
+        stdin = MagicMock()
+        stdout = MagicMock()
+        stdout.__iter__.return_value = iter(
+            [
+                "Reading package lists...\n",
+                "HOMELABCMD_RESULT\t0\t0\t\n",
+                "HOMELABCMD_RESULT\t1\t100\tE: Unable to locate package nope\n",
+            ]
+        )
+        stdout.channel.recv_exit_status.return_value = 0
+        stderr = MagicMock()
+        stderr.read.return_value = b""
+        client = MagicMock()
+        client.exec_command.return_value = (stdin, stdout, stderr)
+        service = ConfigApplyService(MagicMock(), MagicMock())
+
+        results = await service._apply_batched(
+            client, "root", pack, SimpleNamespace(current_item=None), MagicMock()
+        )
+
+        command = client.exec_command.call_args.args[0]
+        assert command.count("apt-get install") == 1
+        assert "sudo apt-get install -y curl nope" in command
+        stdin.channel.shutdown_write.assert_called_once()
+        assert results[0] == ApplyItemResult(item="curl", action="installed", success=True)
+        assert results[1].success is False
+        assert results[1].error == "E: Unable to locate package nope"
+
+    async def test_stderr_drained_while_stdout_streams(self) -> None:
+        """A command blocked on unread stderr still completes (no deadlock)."""
+        stderr_read = threading.Event()
+
+        def stdout_lines():
+            # The remote side stalls until its stderr has been consumed
+            assert stderr_read.wait(timeout=5)
+            yield "done\n"
+
+        def read_stderr() -> bytes:
+            stderr_read.set()
+            return b"warning\n" * 100_000
+
+        stdout = MagicMock()
+        stdout.__iter__.side_effect = lambda: stdout_lines()
+        stdout.channel.recv_exit_status.return_value = 0
+        client = MagicMock()
+        client.exec_command.return_value = (MagicMock(), stdout, MagicMock(read=read_stderr))
+        lines: list[str] = []
+
+        async def on_line(line: str) -> None:
+            lines.append(line)
+
+        outcome = await ConfigApplyService(MagicMock(), MagicMock())._stream_command(
+            client, "apply", b"", on_line, timeout=10
+        )
+
+        assert lines == ["done\n"]
+        assert outcome["exit_code"] == 0
+        assert outcome["stderr"].count("warning") == 100_000
+
+    async def test_transport_failure_fails_remaining_items(self) -> None:
+        """Items without a reported result fail with the transport error."""
+        pack = SimpleNamespace(items=PackItems(packages=[PackageItem(name="curl")]))
+        client = MagicMock()
+        client.exec_command.side_effect = OSError("Channel closed")
+        service = ConfigApplyService(MagicMock(), MagicMock())
+
+        results = await service._apply_batched(
+            client, "root", pack, SimpleNamespace(current_item=None), MagicMock()
+        )
+
+        assert results == [
+            ApplyItemResult(
+                item="curl", action="installed", success=False, error="Channel closed"
+            )
+        ]
+
+
 # =============================================================================
 # US0123: Remove Configuration Pack Tests
 # =============================================================================
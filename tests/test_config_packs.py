@@ -338,30 +338,102 @@ class TestConfigPackService:
             service.get_template_content("missing.conf")
 
     def test_pack_caching(self, tmp_path: Path) -> None:
-        """Test that loaded packs are cached."""
+        """Test that loaded packs are cached until their file changes."""
         pack_data = {"name": "Cached", "description": "Test caching"}
         (tmp_path / "cached.yaml").write_text(yaml.dump(pack_data))
 
         service = ConfigPackService(packs_dir=tmp_path)
 
-        # First load
-        service.load_pack("cached")
+        # Repeat loads return the same parsed pack
+        pack1 = service.load_pack("cached")
+        assert service.load_pack("cached") is pack1
 
         # Modify the file
         (tmp_path / "cached.yaml").write_text(
             yaml.dump({"name": "Modified", "description": "Changed"})
         )
 
-        # Second load should return cached version
+        # Second load picks up the change without clearing the cache
         pack2 = service.load_pack("cached")
-        assert pack2.name == "Cached"  # Still the cached version
+        assert pack2.name == "Modified"
 
-        # Clear cache
+        # Clearing the cache re-reads the same content
         service.clear_cache()
-
-        # Now should get the updated version
         pack3 = service.load_pack("cached")
         assert pack3.name == "Modified"
+        assert pack3 is not pack2
+
+    def test_cache_shared_between_instances(self, tmp_path: Path) -> None:
+        """Services for the same directory share parsed packs."""
+        (tmp_path / "shared.yaml").write_text(yaml.dump({"name": "Shared", "description": "x"}))
+
+        pack = ConfigPackService(packs_dir=tmp_path).load_pack("shared")
+
+        assert ConfigPackService(packs_dir=tmp_path).load_pack("shared") is pack
+
+    def test_parent_change_invalidates_child(self, tmp_path: Path) -> None:
+        """Changing a parent pack re-resolves the packs that extend it."""
+        (tmp_path / "parent.yaml").write_text(
+            yaml.dump(
+                {
+                    "name": "Parent",
+                    "description": "Parent",
+                    "items": {"packages": [{"name": "curl"}]},
+                }
+            )
+        )
+        (tmp_path / "child.yaml").write_text(
+            yaml.dump({"name": "Child", "description": "Child", "extends": "parent"})
+        )
+        (tmp_path / "other.yaml").write_text(yaml.dump({"name": "Other", "description": "x"}))
+        service = ConfigPackService(packs_dir=tmp_path)
+        other = service.load_pack("other")
+        assert [p.name for p in service.load_pack("child").items.packages] == ["curl"]
+
+        (tmp_path / "parent.yaml").write_text(
+            yaml.dump(
+                {
+                    "name": "Parent",
+                    "description": "Parent",
+                    "items": {"packages": [{"name": "curl"}, {"name": "git"}]},
+                }
+            )
+        )
+
+        assert [p.name for p in service.load_pack("child").items.packages] == ["curl", "git"]
+        assert service.load_pack("other") is other
+
+    def test_template_content_reloaded_on_change(self, tmp_path: Path) -> None:
+        """Templates are read once and re-read when the file changes."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        (templates_dir / "motd").write_text("hello")
+        service = ConfigPackService(packs_dir=tmp_path)
+
+        assert service.get_template_content("motd") == "hello"
+
+        (templates_dir / "motd").write_text("goodbye")
+
+        assert service.get_template_content("motd") == "goodbye"
+
+    def test_template_in_subdirectory_reloaded_on_change(self, tmp_path: Path) -> None:
+        """Templates referenced by relative path are tracked in subdirectories too."""
+        nested_dir = tmp_path / "templates" / "nginx" / "sites"
+        nested_dir.mkdir(parents=True)
+        (nested_dir / "default.conf").write_text("listen 80;")
+        service = ConfigPackService(packs_dir=tmp_path)
+
+        assert service.get_template_content("nginx/sites/default.conf") == "listen 80;"
+
+        (nested_dir / "default.conf").write_text("listen 443 ssl;")
+
+        assert service.get_template_content("nginx/sites/default.conf") == "listen 443 ssl;"
+        assert service.get_template_content("./nginx/sites/default.conf") == "listen 443 ssl;"
+
+        (nested_dir / "default.conf").unlink()
+
+        with pytest.raises(ConfigPackError, match="Template not found"):
+            service.get_template_content("nginx/sites/default.conf")
 
 
 class TestConfigPackAPI:
@@ -0,0 +1,187 @@
+"""Tests for the background connectivity prober (US0080).
+
+Tests cover:
+- A probe stores a snapshot and records its duration
+- The status bar is served from the snapshot without re-probing
+- Invalidation and snapshot age force a fresh probe
+- A failed probe keeps the previous snapshot and is recorded
+- API endpoints serve the snapshot and list probe history
+"""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homelab_cmd.api.schemas.connectivity import (
+    ConnectivityStatusResponse,
+    SSHInfo,
+    TailscaleInfo,
+)
+from homelab_cmd.services.connectivity_prober import (
+    SNAPSHOT_MAX_AGE_SECONDS,
+    ConnectivityProber,
+    get_connectivity_prober,
+)
+from homelab_cmd.services.connectivity_service import ConnectivityService
+
+
+def _status(mode: str = "tailscale", device_count: int = 4) -> ConnectivityStatusResponse:
+    return ConnectivityStatusResponse(
+        mode=mode,
+        mode_auto_detected=False,
+        tailscale=TailscaleInfo(
+            configured=True,
+            connected=mode == "tailscale",
+            tailnet="example.ts.net",
+            device_count=device_count,
+        ),
+        ssh=SSHInfo(),
+    )
+
+
+@pytest.fixture
+def prober(db_session) -> ConnectivityProber:
+    """Prober whose probes use the test database session."""
+
+    @asynccontextmanager
+    async def session_scope():
+        yield db_session
+
+    return ConnectivityProber(session_factory=session_scope)
+
+
+class TestConnectivityProber:
+    """Tests for ConnectivityProber."""
+
+    @pytest.mark.asyncio
+    async def test_probe_stores_snapshot_and_history(self, prober) -> None:
+        """A probe stores the status and records how long it took."""
+        with patch.object(
+            ConnectivityService, "get_connectivity_status", AsyncMock(return_value=_status())
+        ):
+            snapshot = await prober.probe()
+
+        assert prober.snapshot is snapshot
+        assert snapshot.status.tailscale.device_count == 4
+        [record] = prober.history
+        assert record.mode == "tailscale"
+        assert record.tailscale_connected is True
+        assert record.device_count == 4
+        assert record.duration_ms >= 0
+        assert record.error is None
+
+    @pytest.mark.asyncio
+    async def test_status_bar_served_from_snapshot(self, prober) -> None:
+        """Repeated status bar reads probe only once."""
+        probe = AsyncMock(return_value=_status(device_count=11))
+        with patch.object(ConnectivityService, "get_connectivity_status", probe):
+            first = await prober.get_status_bar()
+            second = await prober.get_status_bar()
+
+        assert probe.await_count == 1
+        assert first.display == "Tailscale (11 devices)"
+        assert first.healthy is True
+        assert first.checked_at is not None
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_fresh_probe(self, prober) -> None:
+        """After invalidate() the next read probes again."""
+        probe = AsyncMock(side_effect=[_status(), _status(mode="direct_ssh")])
+        with patch.object(ConnectivityService, "get_connectivity_status", probe):
+            await prober.get_status_bar()
+            prober.invalidate()
+            status_bar = await prober.get_status_bar()
+
+        assert probe.await_count == 2
+        assert status_bar.mode == "direct_ssh"
+        assert status_bar.display == "Direct SSH"
+
+    @pytest.mark.asyncio
+    async def test_old_snapshot_is_reprobed(self, prober) -> None:
+        """A snapshot past SNAPSHOT_MAX_AGE_SECONDS is not served."""
+        probe = AsyncMock(return_value=_status())
+        with patch.object(ConnectivityService, "get_connectivity_status", probe):
+            snapshot = await prober.get_snapshot()
+            snapshot.probed_at = datetime.now(UTC) - timedelta(seconds=SNAPSHOT_MAX_AGE_SECONDS)
+            assert prober.snapshot is None
+            await prober.get_snapshot()
+
+        assert probe.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_keeps_previous_snapshot(self, prober) -> None:
+        """A failed probe is recorded and the last good snapshot stays."""
+        probe = AsyncMock(side_effect=[_status(), RuntimeError("database is locked")])
+        with patch.object(ConnectivityService, "get_connectivity_status", probe):
+            good = await prober.probe()
+            with pytest.raises(RuntimeError):
+                await prober.probe()
+
+        assert prober.snapshot is good
+        latest = prober.history[0]
+        assert latest.error == "database is locked"
+        assert latest.mode is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_discards_probe_in_flight(self, prober) -> None:
+        """A probe that started before invalidate() does not become the snapshot."""
+
+        async def slow_status(self) -> ConnectivityStatusResponse:
+            prober.invalidate()
+            return _status()
+
+        with patch.object(ConnectivityService, "get_connectivity_status", slow_status):
+            await prober.probe()
+
+        assert prober.snapshot is None
+
+
+class TestConnectivityProberEndpoints:
+    """Tests for the connectivity endpoints backed by the prober."""
+
+    def test_status_bar_endpoint_reads_snapshot(self, client, auth_headers) -> None:
+        """The status bar endpoint probes once, then answers from memory."""
+        probe = AsyncMock(return_value=_status(device_count=7))
+        with patch.object(ConnectivityService, "get_connectivity_status", probe):
+            for _ in range(3):
+                response = client.get("/api/v1/settings/connectivity/status", headers=auth_headers)
+                assert response.status_code == 200
+
+        assert probe.await_count == 1
+        data = response.json()
+        assert data["display"] == "Tailscale (7 devices)"
+        assert data["checked_at"] is not None
+
+    def test_mode_change_invalidates_snapshot(self, client, auth_headers) -> None:
+        """Changing mode shows up in the status bar straight away."""
+        client.get("/api/v1/settings/connectivity/status", headers=auth_headers)
+        assert get_connectivity_prober().snapshot is not None
+
+        response = client.put(
+            "/api/v1/settings/connectivity",
+            headers=auth_headers,
+            json={"mode": "direct_ssh"},
+        )
+        assert response.status_code == 200
+        assert get_connectivity_prober().snapshot is None
+
+    def test_list_probes(self, client, auth_headers) -> None:
+        """Probe history is listed newest first with durations."""
+        client.get("/api/v1/settings/connectivity/status", headers=auth_headers)
+
+        response = client.get("/api/v1/settings/connectivity/probes", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["interval_seconds"] == 60
+        assert len(data["probes"]) >= 1
+        assert data["probes"][0]["duration_ms"] >= 0
+        assert data["probes"][0]["mode"] == "direct_ssh"
+
+    def test_list_probes_requires_auth(self, client) -> None:
+        """Probe history requires authentication."""
+        response = client.get("/api/v1/settings/connectivity/probes")
+        assert response.status_code == 401
@@ -0,0 +1,114 @@
+"""Tests for multi-worker coordination.
+
+Workers elect one scheduler leader through a DB lease and broadcast cache
+invalidations through shared generation counters.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from homelab_cmd.db.models.coordination import LeaderLease
+from homelab_cmd.services.coordination import SCHEDULER_LEASE, Coordinator, leader_only
+
+
+class TestLeaderElection:
+    """Scheduler lease acquisition and hand-over."""
+
+    async def test_first_worker_becomes_leader(self, db_session: AsyncSession) -> None:
+        """The first worker creates and holds the lease; others are refused."""
+        first = Coordinator("host-a:1")
+        second = Coordinator("host-b:2")
+
+        assert await first.renew_lease(db_session) is True
+        assert await second.renew_lease(db_session) is False
+        # The holder can keep renewing
+        assert await first.renew_lease(db_session) is True
+
+    async def test_expired_lease_taken_over(self, db_session: AsyncSession) -> None:
+        """Another worker takes the lease once the holder stops renewing."""
+        first = Coordinator("host-a:1")
+        second = Coordinator("host-b:2")
+        await first.renew_lease(db_session)
+
+        await db_session.execute(
+            update(LeaderLease)
+            .where(LeaderLease.name == SCHEDULER_LEASE)
+            .values(expires_at=datetime.now(UTC) - timedelta(seconds=1))
+        )
+        await db_session.commit()
+
+        assert await second.renew_lease(db_session) is True
+        assert await first.renew_lease(db_session) is False
+
+    async def test_released_lease_taken_immediately(self, db_session: AsyncSession) -> None:
+        """Releasing the lease on shutdown lets another worker lead at once."""
+        first = Coordinator("host-a:1")
+        second = Coordinator("host-b:2")
+        await first.renew_lease(db_session)
+
+        await first.release_lease(db_session)
+
+        assert await second.renew_lease(db_session) is True
+
+    async def test_leader_only_skips_followers(self, monkeypatch) -> None:
+        """Jobs run on the leader (or before election starts) and are skipped otherwise."""
+        coordinator = Coordinator("host-a:1")
+        monkeypatch.setattr("homelab_cmd.services.coordination._coordinator", coordinator)
+        calls: list[int] = []
+
+        @leader_only
+        async def job() -> int:
+            calls.append(1)
+            return 42
+
+        assert await job() == 42
+
+        coordinator._active = True
+        assert await job() is None
+
+        coordinator._lease_expires_at = datetime.now(UTC) + timedelta(seconds=30)
+        assert await job() == 42
+        assert len(calls) == 2
+
+
+class TestCacheInvalidation:
+    """Cache invalidation broadcast between workers."""
+
+    async def test_invalidation_reaches_other_workers(self, db_session: AsyncSession) -> None:
+        """Invalidating on one worker clears the cache on the others after a sync."""
+        local_cache = {"devices": ["a"]}
+        remote_cache = {"devices": ["a"]}
+        local = Coordinator("host-a:1")
+        remote = Coordinator("host-b:2")
+        local.register_cache("tailscale_devices", local_cache.clear)
+        remote.register_cache("tailscale_devices", remote_cache.clear)
+        await remote.sync_caches(db_session)
+
+        await local.invalidate_cache(db_session, "tailscale_devices")
+        await db_session.commit()
+
+        assert local_cache == {}
+        assert remote_cache == {"devices": ["a"]}
+
+        await remote.sync_caches(db_session)
+        assert remote_cache == {}
+
+    async def test_own_invalidation_not_cleared_twice(self, db_session: AsyncSession) -> None:
+        """A worker does not clear a cache again for its own invalidation."""
+        cleared: list[int] = []
+        coordinator = Coordinator("host-a:1")
+        coordinator.register_cache("config_packs", lambda: cleared.append(1))
+
+        await coordinator.invalidate_cache(db_session, "config_packs")
+        await coordinator.invalidate_cache(db_session, "config_packs")
+        await coordinator.sync_caches(db_session)
+
+        assert len(cleared) == 2
+
+    def test_pack_cache_endpoint(self, client: TestClient, auth_headers: dict[str, str]) -> None:
+        """DELETE /config/packs/cache clears the pack cache."""
+        response = client.delete("/api/v1/config/packs/cache", headers=auth_headers)
+        assert response.status_code == 204
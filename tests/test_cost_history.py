@@ -10,7 +10,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from homelab_cmd.db.models.cost_snapshot import CostSnapshot, CostSnapshotMonthly
+from homelab_cmd.db.models.cost_snapshot import (
+    CostSnapshot,
+    CostSnapshotMonthly,
+    CostSnapshotWeekly,
+)
 from homelab_cmd.db.models.server import Server, ServerStatus
 from homelab_cmd.services.cost_history import CostHistoryService
 
@@ -77,8 +81,10 @@ class TestCostHistoryService:
         mock_cpu_result = MagicMock()
         mock_cpu_result.scalar_one_or_none.return_value = 45.0
 
-        # Mock upsert and final fetch
+        # Mock upsert, period aggregate refresh and final fetch
         mock_upsert_result = MagicMock()
+        mock_period_result = MagicMock()
+        mock_period_result.all.return_value = []
         mock_snapshot_result = MagicMock()
         mock_snapshot_result.scalar_one_or_none.return_value = MagicMock(estimated_cost=0.26)
 
@@ -88,6 +94,8 @@ class TestCostHistoryService:
             mock_config_result,    # Config lookup
             mock_cpu_result,       # Avg CPU query
             mock_upsert_result,    # Upsert
+            mock_period_result,    # Weekly aggregate refresh
+            mock_period_result,    # Monthly aggregate refresh
             mock_snapshot_result,  # Final fetch
         ])
         mock_session.commit = AsyncMock()
@@ -180,8 +188,8 @@ class TestCostHistoryService:
         # Mock query result
         mock_result = MagicMock()
         mock_result.fetchall.return_value = [
-            MagicMock(week="2026-W01", total_kwh=8.4, total_cost=2.02, avg_rate=0.24),
-            MagicMock(week="2026-W02", total_kwh=8.2, total_cost=1.97, avg_rate=0.24),
+            MagicMock(period="2026-W01", total_kwh=8.4, total_cost=2.02, avg_rate=0.24),
+            MagicMock(period="2026-W02", total_kwh=8.2, total_cost=1.97, avg_rate=0.24),
         ]
         mock_session.execute = AsyncMock(return_value=mock_result)
 
@@ -205,8 +213,8 @@ class TestCostHistoryService:
         # Mock query result
         mock_result = MagicMock()
         mock_result.fetchall.return_value = [
-            MagicMock(month="2026-01", total_kwh=36.0, total_cost=8.64, avg_rate=0.24),
-            MagicMock(month="2025-12", total_kwh=37.2, total_cost=8.93, avg_rate=0.24),
+            MagicMock(period="2026-01", total_kwh=36.0, total_cost=8.64, avg_rate=0.24),
+            MagicMock(period="2025-12", total_kwh=37.2, total_cost=8.93, avg_rate=0.24),
         ]
         mock_session.execute = AsyncMock(return_value=mock_result)
 
@@ -284,37 +292,173 @@ class TestCostHistoryService:
         assert len(result.months) == 3
 
     @pytest.mark.asyncio
-    async def test_rollup_old_data(self, mock_session):
-        """AC6: Test rolling up daily data older than 2 years to monthly aggregates."""
-        service = CostHistoryService(mock_session)
-
-        # Mock the aggregate query
-        mock_agg_result = MagicMock()
-        mock_agg_result.fetchall.return_value = []  # No old data
-        mock_session.execute = AsyncMock(return_value=mock_agg_result)
+    async def test_rollup_old_data(self, db_session):
+        """AC6: Daily data older than 2 years is pruned; aggregates keep the history."""
+        db_session.add(Server(id="old-srv", hostname="old-srv"))
+        await db_session.commit()
+        old_day = date.today() - timedelta(days=800)
+        db_session.add_all(
+            [
+                CostSnapshot(
+                    server_id="old-srv",
+                    date=day,
+                    estimated_kwh=1.0,
+                    estimated_cost=0.25,
+                    electricity_rate=0.25,
+                )
+                for day in (old_day, date.today())
+            ]
+        )
+        await db_session.commit()
+        service = CostHistoryService(db_session)
+        await service.backfill_period_totals()
 
         result = await service.rollup_old_data()
 
-        assert mock_session.execute.called
-        assert result == {"daily_deleted": 0, "monthly_created": 0}
+        assert result == {"daily_deleted": 1}
+        history = await service.get_history(old_day, old_day, aggregation="monthly")
+        assert [item.estimated_cost for item in history] == [0.25]
 
     @pytest.mark.asyncio
-    async def test_capture_all_snapshots(self, mock_session, sample_server):
-        """Test capturing snapshots for all servers."""
-        service = CostHistoryService(mock_session)
+    async def test_capture_all_snapshots(self, db_session):
+        """Snapshots for the whole fleet are captured with shared lookups."""
+        from datetime import UTC, datetime
 
-        # Mock server query
-        mock_server_result = MagicMock()
-        mock_server_result.fetchall.return_value = [(sample_server.id,)]
-        mock_session.execute = AsyncMock(return_value=mock_server_result)
+        from sqlalchemy import select
 
-        with patch.object(service, 'capture_daily_snapshot', new_callable=AsyncMock) as mock_capture:
-            mock_capture.return_value = MagicMock()
+        from homelab_cmd.db.models.metrics import Metrics
 
-            await service.capture_all_snapshots()
+        db_session.add_all(
+            [
+                Server(id="snap-a", hostname="snap-a", tdp_watts=100, status="online"),
+                Server(id="snap-b", hostname="snap-b", tdp_watts=50, status="offline"),
+                Server(id="snap-c", hostname="snap-c", status="online"),
+            ]
+        )
+        db_session.add(
+            Metrics(server_id="snap-a", timestamp=datetime.now(UTC), cpu_percent=40.0)
+        )
+        await db_session.commit()
 
-            assert mock_session.execute.called
-            mock_capture.assert_called_once_with(sample_server.id)
+        service = CostHistoryService(db_session)
+        count = await service.capture_all_snapshots()
+
+        assert count == 3
+        result = await db_session.execute(select(CostSnapshot).order_by(CostSnapshot.server_id))
+        snapshots = {s.server_id: s for s in result.scalars().all()}
+        assert snapshots["snap-a"].estimated_kwh == 2.4  # 100W TDP-only, 24h
+        assert snapshots["snap-b"].estimated_cost == 0.0  # offline
+        assert snapshots["snap-c"].tdp_watts is None  # unconfigured
+
+        # Re-running the same day updates rather than duplicates
+        assert await service.capture_all_snapshots() == 3
+
+
+class TestCostPeriodAggregates:
+    """Weekly and monthly aggregates maintained alongside daily snapshots."""
+
+    @staticmethod
+    def _snapshot(server_id: str, day: date, cost: float, rate: float = 0.25) -> CostSnapshot:
+        return CostSnapshot(
+            server_id=server_id,
+            date=day,
+            estimated_kwh=cost / rate,
+            estimated_cost=cost,
+            electricity_rate=rate,
+        )
+
+    @pytest.mark.asyncio
+    async def test_capture_maintains_aggregates(self, db_session):
+        """Capturing refreshes the current week and month without double counting."""
+        from sqlalchemy import select
+
+        db_session.add(Server(id="agg-a", hostname="agg-a", tdp_watts=100, status="online"))
+        await db_session.commit()
+        service = CostHistoryService(db_session)
+
+        await service.capture_all_snapshots()
+        await service.capture_all_snapshots()
+
+        weekly = (await db_session.execute(select(CostSnapshotWeekly))).scalars().all()
+        monthly = (await db_session.execute(select(CostSnapshotMonthly))).scalars().all()
+        assert [(w.year_week, w.snapshot_count) for w in weekly] == [
+            (date.today().strftime("%Y-W%W"), 1)
+        ]
+        assert [(m.year_month, m.total_kwh) for m in monthly] == [
+            (date.today().strftime("%Y-%m"), 2.4)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_history_reads_aggregates(self, db_session):
+        """Weekly and monthly history match grouping the daily snapshots."""
+        db_session.add_all(
+            [Server(id="agg-a", hostname="agg-a"), Server(id="agg-b", hostname="agg-b")]
+        )
+        await db_session.commit()
+        # Thursday 1 Jan 2026 is week 00; Monday 5 Jan starts week 01
+        db_session.add_all(
+            [
+                self._snapshot("agg-a", date(2026, 1, 1), 1.0),
+                self._snapshot("agg-a", date(2026, 1, 5), 2.0),
+                self._snapshot("agg-b", date(2026, 1, 5), 3.0, rate=0.5),
+                self._snapshot("agg-a", date(2026, 2, 2), 4.0),
+            ]
+        )
+        await db_session.commit()
+        service = CostHistoryService(db_session)
+        assert await service.backfill_period_totals() is True
+
+        weekly = await service.get_history(
+            date(2026, 1, 1), date(2026, 1, 31), aggregation="weekly"
+        )
+        monthly = await service.get_history(
+            date(2026, 1, 1), date(2026, 2, 28), aggregation="monthly"
+        )
+        server_monthly = await service.get_history(
+            date(2026, 1, 1), date(2026, 2, 28), server_id="agg-a", aggregation="monthly"
+        )
+
+        assert [(i.date, i.estimated_cost) for i in weekly] == [
+            ("2026-W00", 1.0),
+            ("2026-W01", 5.0),
+        ]
+        assert weekly[1].electricity_rate == 0.375
+        assert [(i.date, i.estimated_cost) for i in monthly] == [("2026-01", 6.0), ("2026-02", 4.0)]
+        assert [(i.date, i.estimated_cost) for i in server_monthly] == [
+            ("2026-01", 3.0),
+            ("2026-02", 4.0),
+        ]
+
+        summary = await service.get_monthly_summary(2026)
+        assert summary.year_to_date_cost == 10.0
+
+    @pytest.mark.asyncio
+    async def test_backfill_keeps_rolled_up_months(self, db_session):
+        """Backfill adds to months already rolled up and only runs once."""
+        from sqlalchemy import select
+
+        db_session.add(Server(id="agg-a", hostname="agg-a"))
+        await db_session.commit()
+        db_session.add(
+            CostSnapshotMonthly(
+                server_id="agg-a",
+                year_month="2026-01",
+                total_kwh=4.0,
+                total_cost=1.0,
+                avg_electricity_rate=0.25,
+                snapshot_count=1,
+            )
+        )
+        db_session.add(self._snapshot("agg-a", date(2026, 1, 20), 2.0))
+        await db_session.commit()
+        service = CostHistoryService(db_session)
+
+        assert await service.backfill_period_totals() is True
+        assert await service.backfill_period_totals() is False
+
+        monthly = (await db_session.execute(select(CostSnapshotMonthly))).scalar_one()
+        assert monthly.total_cost == 3.0
+        assert monthly.snapshot_count == 2
 
 
 class TestCostSnapshotModel:
@@ -237,6 +237,30 @@ class TestServerCostHistoryEndpoint:
 
         assert response.status_code == 422
 
+    def test_get_server_cost_history_monthly(self, client: TestClient, auth_headers, test_server):
+        """Test per-server history aggregated by month."""
+        response = client.get(
+            f"/api/v1/servers/{test_server['id']}/costs/history?period=12m&aggregation=monthly",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["period"] == "12m"
+        assert data["aggregation"] == "monthly"
+
+    def test_get_server_cost_history_invalid_aggregation(
+        self, client: TestClient, auth_headers, test_server
+    ):
+        """Test that invalid aggregation returns error."""
+        response = client.get(
+            f"/api/v1/servers/{test_server['id']}/costs/history?aggregation=hourly",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"]["code"] == "INVALID_AGGREGATION"
+
     def test_get_server_cost_history_unauthorized(self, client: TestClient, test_server):
         """Test that unauthorized request returns 401."""
         response = client.get(
@@ -7,6 +7,7 @@ These tests verify the cost helper functions:
 """
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -16,6 +17,7 @@ from homelab_cmd.api.routes.costs import (
 )
 from homelab_cmd.db.models.metrics import Metrics
 from homelab_cmd.db.models.server import Server
+from homelab_cmd.services.cost_history import get_avg_cpu_24h_by_server
 
 
 class TestGetAvgCpu24h:
@@ -112,6 +114,33 @@ class TestGetAvgCpu24h:
         assert abs(avg - 60.0) < 0.1
 
 
+class TestGetAvgCpu24hByServer:
+    """Tests for the fleet-wide grouped CPU average."""
+
+    @pytest.mark.asyncio
+    async def test_matches_per_server_average(self, db_session) -> None:
+        """One grouped query gives the same averages as per-server queries."""
+        now = datetime.now(UTC)
+        for server_id, values in {"fleet-a": [10.0, 30.0], "fleet-b": [80.0]}.items():
+            db_session.add(Server(id=server_id, hostname=f"{server_id}.local"))
+            for i, cpu in enumerate(values):
+                db_session.add(
+                    Metrics(
+                        server_id=server_id, timestamp=now - timedelta(hours=i), cpu_percent=cpu
+                    )
+                )
+        db_session.add(Server(id="fleet-idle", hostname="fleet-idle.local"))
+        db_session.add(
+            Metrics(server_id="fleet-idle", timestamp=now - timedelta(hours=30), cpu_percent=99.0)
+        )
+        await db_session.commit()
+
+        averages = await get_avg_cpu_24h_by_server(db_session)
+
+        assert averages == {"fleet-a": 20.0, "fleet-b": 80.0}
+        assert averages["fleet-a"] == await get_avg_cpu_24h(db_session, "fleet-a")
+
+
 class TestGetCategoryLabel:
     """Tests for category label lookup."""
 
@@ -536,3 +565,69 @@ class TestCostTotals:
 
         assert totals["servers_configured"] == configured_count
         assert totals["servers_unconfigured"] == unconfigured_count
+
+
+class TestCostCache:
+    """Summary and breakdown are cached until power settings change."""
+
+    @staticmethod
+    def _get_counting(client, auth_headers, path: str) -> tuple[dict, AsyncMock]:
+        with patch(
+            "homelab_cmd.api.routes.costs.get_avg_cpu_24h_by_server",
+            new_callable=AsyncMock,
+            return_value={},
+        ) as mock_avg:
+            data = client.get(path, headers=auth_headers).json()
+        return data, mock_avg
+
+    def test_repeat_request_served_from_cache(self, client, auth_headers) -> None:
+        """A second request does not recompute the breakdown."""
+        client.post(
+            "/api/v1/servers",
+            json={"id": "cache-srv", "hostname": "cache.local", "tdp_watts": 100},
+            headers=auth_headers,
+        )
+        first, mock_first = self._get_counting(client, auth_headers, "/api/v1/costs/breakdown")
+        second, mock_second = self._get_counting(client, auth_headers, "/api/v1/costs/breakdown")
+
+        assert mock_first.await_count == 1
+        assert mock_second.await_count == 0
+        assert first == second
+
+    def test_server_power_change_invalidates(self, client, auth_headers) -> None:
+        """Changing a server's TDP recomputes the summary."""
+        client.post(
+            "/api/v1/servers",
+            json={"id": "cache-tdp", "hostname": "cache-tdp.local", "tdp_watts": 100},
+            headers=auth_headers,
+        )
+        before = client.get("/api/v1/costs/summary", headers=auth_headers).json()
+
+        client.put("/api/v1/servers/cache-tdp", json={"tdp_watts": 200}, headers=auth_headers)
+        after = client.get("/api/v1/costs/summary", headers=auth_headers).json()
+
+        assert after["total_estimated_watts"] == 2 * before["total_estimated_watts"]
+
+    def test_cost_config_change_invalidates(self, client, auth_headers) -> None:
+        """Changing the electricity rate recomputes the breakdown."""
+        client.post(
+            "/api/v1/servers",
+            json={"id": "cache-rate", "hostname": "cache-rate.local", "tdp_watts": 100},
+            headers=auth_headers,
+        )
+        client.get("/api/v1/costs/breakdown", headers=auth_headers)
+
+        client.put("/api/v1/config/cost", json={"electricity_rate": 0.5}, headers=auth_headers)
+        data = client.get("/api/v1/costs/breakdown", headers=auth_headers).json()
+
+        assert data["settings"]["electricity_rate"] == 0.5
+
+    def test_heartbeat_does_not_invalidate(self, client, auth_headers, send_heartbeat) -> None:
+        """Routine heartbeats leave the cached result in place."""
+        send_heartbeat(client, auth_headers, "cache-hb")
+        client.get("/api/v1/costs/summary", headers=auth_headers)
+
+        send_heartbeat(client, auth_headers, "cache-hb")
+        _, mock_avg = self._get_counting(client, auth_headers, "/api/v1/costs/summary")
+
+        assert mock_avg.await_count == 0
@@ -155,5 +155,8 @@ class TestApiVersioning:
                 continue
             if path == "/api/openapi.json":
                 continue
+            # Prometheus scrapes the conventional /metrics path
+            if path == "/metrics":
+                continue
 
             assert path.startswith("/api/v1"), f"Path {path} not under /api/v1"
@@ -0,0 +1,145 @@
+"""Tests for the live update event bus and SSE stream.
+
+Services publish change notifications on an in-process bus and
+GET /api/v1/stream fans them out to dashboard clients as Server-Sent Events.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from homelab_cmd.api.routes.stream import format_sse, sse_messages
+from homelab_cmd.services.event_bus import EventBus, EventTopic, Subscription
+
+
+class TestEventBus:
+    """Publishing and subscribing."""
+
+    async def test_subscriber_receives_matching_topics_only(self) -> None:
+        """Subscribers only see the topics they asked for."""
+        bus = EventBus()
+        async with bus.subscribe({EventTopic.ALERT}) as subscription:
+            bus.publish(EventTopic.METRICS, {"server_id": "a"})
+            bus.publish(EventTopic.ALERT, {"alert_id": 1})
+
+            event = await subscription.get(timeout=0.1)
+            assert event is not None
+            assert event.topic == EventTopic.ALERT
+            assert await subscription.get(timeout=0.01) is None
+
+    async def test_slow_subscriber_drops_oldest(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A full queue drops the oldest event rather than blocking publishers."""
+        monkeypatch.setattr("homelab_cmd.services.event_bus.SUBSCRIBER_QUEUE_SIZE", 2)
+        bus = EventBus()
+        async with bus.subscribe() as subscription:
+            for n in range(3):
+                bus.publish(EventTopic.METRICS, {"n": n})
+
+            received = [(await subscription.get(timeout=0.1)).data["n"] for _ in range(2)]
+
+        assert received == [1, 2]
+        assert subscription.dropped == 1
+
+    async def test_reconnect_replays_missed_events(self) -> None:
+        """Events after Last-Event-ID are replayed to a reconnecting client."""
+        bus = EventBus()
+        bus.publish(EventTopic.SERVER_STATUS, {"server_id": "a", "status": "online"})
+        bus.publish(EventTopic.SERVER_STATUS, {"server_id": "b", "status": "offline"})
+
+        async with bus.subscribe(last_event_id=1) as subscription:
+            event = await subscription.get(timeout=0.1)
+            assert event.id == 2
+            assert event.data["server_id"] == "b"
+            assert await subscription.get(timeout=0.01) is None
+
+    async def test_unsubscribed_on_exit(self) -> None:
+        """Leaving the context removes the subscriber."""
+        bus = EventBus()
+        async with bus.subscribe():
+            assert bus.subscriber_count == 1
+        assert bus.subscriber_count == 0
+
+
+class TestSseFormatting:
+    """SSE wire format and the message generator."""
+
+    async def test_format_sse(self) -> None:
+        """Messages carry the event ID, topic as event name and JSON data."""
+        bus = EventBus()
+        async with bus.subscribe() as subscription:
+            bus.publish(EventTopic.ALERT, {"alert_id": 7, "transition": "opened"})
+            message = format_sse(await subscription.get(timeout=0.1))
+
+        lines = message.split("\n")
+        assert lines[0] == "id: 1"
+        assert lines[1] == "event: alert"
+        data = json.loads(lines[2].removeprefix("data: "))
+        assert data["alert_id"] == 7
+        assert "timestamp" in data
+        assert message.endswith("\n\n")
+
+    async def test_keepalive_when_idle(self) -> None:
+        """Idle streams send the retry hint then keep-alive comments."""
+        calls = iter([False, False, True])
+
+        async def is_disconnected() -> bool:
+            return next(calls)
+
+        messages = [
+            m async for m in sse_messages(Subscription(None), is_disconnected, keepalive_seconds=0)
+        ]
+
+        assert messages == ["retry: 5000\n\n", ": keepalive\n\n", ": keepalive\n\n"]
+
+
+class TestStreamEndpoint:
+    """GET /api/v1/stream validation."""
+
+    def test_requires_auth(self, client: TestClient) -> None:
+        """The stream requires an API key."""
+        response = client.get("/api/v1/stream")
+        assert response.status_code == 401
+
+    def test_unknown_topic_rejected(self, client: TestClient, auth_headers: dict[str, str]) -> None:
+        """Unknown topics return 400 before the stream opens."""
+        response = client.get("/api/v1/stream?topics=metrics,bogus", headers=auth_headers)
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "INVALID_TOPIC"
+
+
+class TestPublishers:
+    """State changes publish events."""
+
+    def test_heartbeat_publishes_status_and_metrics(
+        self, client: TestClient, auth_headers: dict[str, str], send_heartbeat
+    ) -> None:
+        """A new server coming online publishes server_status and metrics."""
+        with patch("homelab_cmd.api.routes.agents.publish") as mock_publish:
+            send_heartbeat(client, auth_headers, "stream-hb", metrics={"cpu_percent": 10.0})
+
+        topics = [c.args[0] for c in mock_publish.call_args_list]
+        assert EventTopic.SERVER_STATUS in topics
+        assert EventTopic.METRICS in topics
+        status = next(
+            c.args[1] for c in mock_publish.call_args_list if c.args[0] == "server_status"
+        )
+        assert status == {"server_id": "stream-hb", "status": "online", "previous_status": None}
+
+    def test_alert_acknowledge_publishes_transition(
+        self, client: TestClient, auth_headers: dict[str, str], send_heartbeat
+    ) -> None:
+        """Acknowledging an alert publishes an alert transition."""
+        send_heartbeat(client, auth_headers, "stream-alert", metrics={"disk_percent": 95.0})
+        alert = client.get("/api/v1/alerts", headers=auth_headers).json()["alerts"][0]
+
+        with patch("homelab_cmd.services.alerting.publish") as mock_publish:
+            client.post(f"/api/v1/alerts/{alert['id']}/acknowledge", headers=auth_headers)
+
+        topic, data = mock_publish.call_args.args
+        assert topic == EventTopic.ALERT
+        assert data["alert_id"] == alert["id"]
+        assert data["transition"] == "acknowledged"
+        assert data["status"] == "acknowledged"
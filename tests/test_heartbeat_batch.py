@@ -0,0 +1,164 @@
+"""Tests for the batch heartbeat ingestion endpoint.
+
+POST /api/v1/agents/heartbeat/batch accepts many timestamped samples in one
+request. The latest sample per server drives server state and alerting;
+older samples are stored as history via bulk inserts.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+BATCH_URL = "/api/v1/agents/heartbeat/batch"
+
+
+def _samples(server_id: str, count: int, step_seconds: int = 10, **extra) -> list[dict]:
+    """Build `count` heartbeat samples spaced `step_seconds` apart, ending now."""
+    end = datetime.now(UTC)
+    return [
+        {
+            "server_id": server_id,
+            "hostname": f"{server_id}.local",
+            "timestamp": (end - timedelta(seconds=step_seconds * (count - 1 - i))).isoformat(),
+            "metrics": {
+                "cpu_percent": 10.0 + i,
+                "memory_percent": 40.0 + i,
+                "disk_percent": 50.0,
+            },
+            **extra,
+        }
+        for i in range(count)
+    ]
+
+
+class TestBatchHeartbeatIngestion:
+    """Batch endpoint stores all samples and updates server state."""
+
+    def test_batch_returns_accepted_count(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Response reports total and per-server sample counts."""
+        response = client.post(
+            BATCH_URL, json={"heartbeats": _samples("batch-count", 6)}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ok"
+        assert data["accepted"] == 6
+        assert data["servers"] == [
+            {"server_id": "batch-count", "samples_accepted": 6, "server_registered": True}
+        ]
+
+    def test_batch_stores_every_sample_as_history(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """All samples appear in the raw metrics history."""
+        client.post(
+            BATCH_URL, json={"heartbeats": _samples("batch-history", 6)}, headers=auth_headers
+        )
+
+        response = client.get(
+            "/api/v1/servers/batch-history/metrics?range=24h", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        cpu_values = sorted(p["cpu_percent"] for p in response.json()["data_points"])
+        assert cpu_values == [10.0, 11.0, 12.0, 13.0, 14.0, 15.0]
+
+    def test_latest_sample_drives_server_state(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Server latest_metrics reflects the newest sample, whatever the order sent."""
+        samples = _samples("batch-latest", 4)
+        samples.reverse()
+
+        client.post(BATCH_URL, json={"heartbeats": samples}, headers=auth_headers)
+
+        response = client.get("/api/v1/servers/batch-latest", headers=auth_headers)
+        data = response.json()
+        assert data["status"] == "online"
+        assert data["latest_metrics"]["cpu_percent"] == 13.0
+
+    def test_relay_batch_for_many_servers(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """A relay can submit samples for several servers in one request."""
+        samples = _samples("relay-a", 3) + _samples("relay-b", 2)
+
+        response = client.post(BATCH_URL, json={"heartbeats": samples}, headers=auth_headers)
+
+        assert response.status_code == 200
+        servers = {s["server_id"]: s["samples_accepted"] for s in response.json()["servers"]}
+        assert servers == {"relay-a": 3, "relay-b": 2}
+
+    def test_history_includes_filesystems_and_interfaces(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Per-filesystem and per-interface history is stored for older samples."""
+        samples = _samples(
+            "batch-detail",
+            3,
+            filesystems=[
+                {
+                    "mount_point": "/",
+                    "device": "/dev/sda1",
+                    "fs_type": "ext4",
+                    "total_bytes": 1000,
+                    "used_bytes": 500,
+                    "available_bytes": 500,
+                    "percent": 50.0,
+                }
+            ],
+            network_interfaces=[
+                {
+                    "name": "eth0",
+                    "rx_bytes": 1,
+                    "tx_bytes": 2,
+                    "rx_packets": 3,
+                    "tx_packets": 4,
+                    "is_up": True,
+                }
+            ],
+        )
+
+        response = client.post(BATCH_URL, json={"heartbeats": samples}, headers=auth_headers)
+
+        assert response.status_code == 200
+        server = client.get("/api/v1/servers/batch-detail", headers=auth_headers).json()
+        assert server["filesystems"][0]["mount_point"] == "/"
+        assert server["network_interfaces"][0]["name"] == "eth0"
+
+
+class TestBatchHeartbeatAlerting:
+    """Alert evaluation runs once per server on the latest sample."""
+
+    def test_alerts_evaluated_once_per_server(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """evaluate_heartbeat is called once with the newest sample's values."""
+        with patch(
+            "homelab_cmd.services.alerting.AlertingService.evaluate_heartbeat",
+            return_value=[],
+        ) as mock_evaluate:
+            client.post(
+                BATCH_URL, json={"heartbeats": _samples("batch-alert", 5)}, headers=auth_headers
+            )
+
+        assert mock_evaluate.call_count == 1
+        assert mock_evaluate.call_args.kwargs["cpu_percent"] == 14.0
+
+
+class TestBatchHeartbeatValidation:
+    """Request validation and authentication."""
+
+    def test_empty_batch_rejected(self, client: TestClient, auth_headers: dict[str, str]) -> None:
+        """An empty heartbeats array returns 422."""
+        response = client.post(BATCH_URL, json={"heartbeats": []}, headers=auth_headers)
+        assert response.status_code == 422
+
+    def test_requires_authentication(self, client: TestClient) -> None:
+        """Batch endpoint requires agent authentication."""
+        response = client.post(BATCH_URL, json={"heartbeats": _samples("batch-noauth", 1)})
+        assert response.status_code == 401
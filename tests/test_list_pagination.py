@@ -0,0 +1,189 @@
+"""Tests for keyset pagination of the alert, action and scan lists.
+
+Tests cover:
+- Following next_cursor visits every row once, newest first
+- Empty filter parameters do not filter
+- Malformed cursors, and cursors combined with offset, are rejected
+- Pages are read through an index in order, without sorting
+- Totals are cached until the table is written
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select, text
+
+from homelab_cmd.api.pagination import (
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    filter_criteria,
+    page_query,
+    split_page,
+)
+from homelab_cmd.db.models.alert import Alert
+from homelab_cmd.db.models.scan import Scan
+from homelab_cmd.db.models.server import Server
+
+
+def _create_alerts(client, auth_headers, count: int) -> None:
+    """One disk alert per server, via heartbeats."""
+    for i in range(count):
+        client.post(
+            "/api/v1/agents/heartbeat",
+            json={
+                "server_id": f"page-{i}",
+                "hostname": f"page-{i}.local",
+                "timestamp": datetime.now(UTC).isoformat(),
+                "metrics": {"cpu_percent": 10.0, "memory_percent": 30.0, "disk_percent": 96.0},
+            },
+            headers=auth_headers,
+        )
+
+
+class TestAlertListCursor:
+    """Tests for GET /api/v1/alerts?cursor=."""
+
+    def test_cursor_pages_visit_every_alert_once(self, client, auth_headers) -> None:
+        """Following next_cursor returns all alerts, newest first."""
+        _create_alerts(client, auth_headers, 5)
+        everything = client.get("/api/v1/alerts", headers=auth_headers).json()
+
+        ids, cursor, pages = [], None, 0
+        while True:
+            params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+            page = client.get("/api/v1/alerts", params=params, headers=auth_headers).json()
+            ids += [alert["id"] for alert in page["alerts"]]
+            pages += 1
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert ids == [alert["id"] for alert in everything["alerts"]]
+        assert everything["total"] == 5
+        assert everything["next_cursor"] is None
+        assert everything["alerts"][0]["server_name"].startswith("page-")
+
+    def test_cursor_respects_filters(self, client, auth_headers) -> None:
+        """Filters apply to every page."""
+        _create_alerts(client, auth_headers, 3)
+
+        first = client.get("/api/v1/alerts?server_id=page-1&limit=1", headers=auth_headers).json()
+
+        assert [a["server_id"] for a in first["alerts"]] == ["page-1"]
+        assert first["total"] == 1
+        assert first["next_cursor"] is None
+
+    def test_empty_filter_means_no_filter(self, client, auth_headers) -> None:
+        """An empty query parameter such as ?status= does not filter."""
+        _create_alerts(client, auth_headers, 2)
+
+        page = client.get("/api/v1/alerts?status=&server_id=", headers=auth_headers).json()
+
+        assert len(page["alerts"]) == 2
+        assert page["total"] == 2
+
+    def test_invalid_cursor_rejected(self, client, auth_headers) -> None:
+        """Malformed cursors and cursor with offset return 400."""
+        bad = client.get("/api/v1/alerts?cursor=not-a-cursor", headers=auth_headers)
+        cursor = encode_cursor(datetime.now(UTC), 1)
+        mixed = client.get(f"/api/v1/alerts?cursor={cursor}&offset=5", headers=auth_headers)
+
+        assert bad.status_code == 400
+        assert bad.json()["detail"]["code"] == "INVALID_CURSOR"
+        assert mixed.status_code == 400
+
+    def test_actions_and_scans_lists_return_cursor(self, client, auth_headers) -> None:
+        """The action and scan lists take and return cursors too."""
+        for url in ("/api/v1/actions", "/api/v1/scans"):
+            response = client.get(url, headers=auth_headers)
+
+            assert response.status_code == 200
+            assert response.json()["next_cursor"] is None
+            assert client.get(f"{url}?cursor=%%%", headers=auth_headers).status_code == 400
+
+
+class TestPaginationHelpers:
+    """Tests for the helpers in api/pagination.py."""
+
+    def test_cursor_round_trip(self) -> None:
+        """Aware timestamps are stored as naive UTC, like the database."""
+        created_at = datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=UTC)
+
+        assert decode_cursor(encode_cursor(created_at, 42)) == (
+            created_at.replace(tzinfo=None),
+            42,
+        )
+
+    @pytest.mark.asyncio
+    async def test_pages_split_on_equal_timestamps(self, db_session) -> None:
+        """Rows sharing a creation time are split by id without gaps."""
+        created_at = datetime(2026, 1, 1, tzinfo=UTC)
+        db_session.add_all(
+            Scan(
+                hostname="h",
+                username="root",
+                scan_type="quick",
+                status="completed",
+                created_at=created_at,
+            )
+            for _ in range(5)
+        )
+        await db_session.commit()
+
+        ids, cursor = [], None
+        while True:
+            query = page_query(select(Scan), Scan, limit=2, cursor=cursor)
+            page, cursor = split_page((await db_session.execute(query)).scalars().all(), 2)
+            ids += [scan.id for scan in page]
+            if cursor is None:
+                break
+
+        assert ids == [5, 4, 3, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_filtered_page_read_in_index_order(self, db_session) -> None:
+        """A filtered page scans an index in list order instead of sorting."""
+        cursor = encode_cursor(datetime.now(UTC), 100)
+        query = page_query(
+            select(Alert).where(*filter_criteria(Alert, {"status": "open"})),
+            Alert,
+            limit=50,
+            cursor=cursor,
+        )
+        compiled = query.compile(
+            dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+
+        plan = " ".join(
+            row[-1]
+            for row in (await db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))).all()
+        )
+
+        assert "idx_alerts_status_created" in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.asyncio
+    async def test_total_cached_until_table_written(self, db_session) -> None:
+        """Counts are reused while the table version is unchanged."""
+        db_session.add(Server(id="s1", hostname="s1"))
+        await db_session.commit()
+        filters = {"hostname": "s1"}
+
+        assert await count_rows(db_session, Server, filters) == 1
+        # Written behind the ORM's back, so the version does not change
+        await db_session.execute(text("DELETE FROM servers"))
+        assert await count_rows(db_session, Server, filters) == 1
+
+        db_session.add(Server(id="s2", hostname="s1"))
+        await db_session.commit()
+        assert await count_rows(db_session, Server, filters) == 1
+        assert await count_rows(db_session, Server, {"hostname": None}) == 1
+
+    def test_split_page_without_more_rows(self) -> None:
+        """The last page has no cursor."""
+        rows = [object()] * 3
+
+        assert split_page(rows, 3) == (rows, None)
+        assert split_page([], 3) == ([], None)
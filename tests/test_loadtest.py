@@ -0,0 +1,201 @@
+"""Tests for the synthetic agent fleet load-test harness.
+
+Tests cover:
+- Synthetic heartbeats are valid, realistic and repeatable for a seed
+- The hub accepts synthetic heartbeats
+- A run paces heartbeats, counts errors and reports latency percentiles
+- Reports compare against a baseline, and the CLI exits 1 on regression
+- Database growth is measured from the hub's SQLite file
+"""
+
+import json
+import sqlite3
+from unittest.mock import patch
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from homelab_cmd.api.schemas.heartbeat import HeartbeatRequest
+from homelab_cmd.cli import cli
+from homelab_cmd.loadtest import (
+    LoadTest,
+    LoadTestConfig,
+    SyntheticAgent,
+    compare_reports,
+    database_snapshot,
+    percentile,
+)
+
+
+def _hub(fail_server_ids: frozenset[str] = frozenset()) -> httpx.MockTransport:
+    """Fake hub that accepts heartbeats, failing those from some servers."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/system/health":
+            return httpx.Response(200, json={"version": "9.9.9"})
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        payload = json.loads(request.content)
+        HeartbeatRequest.model_validate(payload)
+        if payload["server_id"] in fail_server_ids:
+            return httpx.Response(500, json={"detail": "boom"})
+        return httpx.Response(200, json={"status": "ok"})
+
+    return httpx.MockTransport(handler)
+
+
+def _report(p95: float, error_rate: float = 0.0, throughput: float = 10.0) -> dict:
+    return {
+        "latency_ms": {"p50": p95 / 2, "p95": p95, "p99": p95 * 1.5},
+        "error_rate": error_rate,
+        "throughput": throughput,
+    }
+
+
+class TestSyntheticAgent:
+    """Tests for SyntheticAgent payloads."""
+
+    def test_heartbeat_is_valid_and_complete(self) -> None:
+        """Payloads pass hub validation and include every section."""
+        heartbeat = HeartbeatRequest.model_validate(SyntheticAgent(7, seed=1).heartbeat(60))
+
+        assert heartbeat.server_id == "loadtest-0007"
+        assert heartbeat.metrics is not None
+        assert len(heartbeat.services) >= 4
+        assert any(fs.mount_point == "/" for fs in heartbeat.filesystems)
+        assert any(i.name == "eth0" for i in heartbeat.network_interfaces)
+        assert heartbeat.packages is not None
+
+    def test_same_seed_gives_same_fleet(self) -> None:
+        """Profiles and metric series repeat for the same seed and index."""
+        a, b = SyntheticAgent(3, seed=42), SyntheticAgent(3, seed=42)
+        for _ in range(3):
+            first, second = a.heartbeat(60), b.heartbeat(60)
+            first.pop("timestamp"), second.pop("timestamp")
+            assert first == second
+
+        assert SyntheticAgent(3, seed=43).server_guid != a.server_guid
+
+    def test_hub_accepts_synthetic_heartbeat(self, client, auth_headers) -> None:
+        """A real hub stores a synthetic heartbeat and registers the server."""
+        response = client.post(
+            "/api/v1/agents/heartbeat",
+            json=SyntheticAgent(1, seed=1).heartbeat(60),
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["server_registered"] is True
+
+
+class TestLoadTest:
+    """Tests for LoadTest runs."""
+
+    @pytest.mark.asyncio
+    async def test_run_paces_heartbeats_and_reports(self) -> None:
+        """Each agent sends one heartbeat per interval within the duration."""
+        config = LoadTestConfig(agents=4, interval_seconds=0.1, duration_seconds=0.29)
+        async with httpx.AsyncClient(transport=_hub(), base_url="http://hub") as client:
+            result = await LoadTest(client, config).run()
+
+        assert result.requests == 12
+        assert result.succeeded == 12
+        assert result.hub_version == "9.9.9"
+        report = result.to_report()
+        assert report["error_rate"] == 0
+        assert set(report["latency_ms"]) == {"p50", "p90", "p95", "p99", "max"}
+        assert report["target_rate"] == 40.0
+
+    @pytest.mark.asyncio
+    async def test_errors_counted_by_status(self) -> None:
+        """Failed heartbeats are counted by status code."""
+        config = LoadTestConfig(agents=2, interval_seconds=0.2, duration_seconds=0.15)
+        transport = _hub(fail_server_ids=frozenset({"loadtest-0001"}))
+        async with httpx.AsyncClient(transport=transport, base_url="http://hub") as client:
+            test = LoadTest(client, config)
+            result = await test.run()
+            removed = await test.remove_servers()
+
+        assert result.errors == {"HTTP 500": 1}
+        assert result.error_rate == 0.5
+        assert removed == 2
+
+
+class TestReports:
+    """Tests for report helpers."""
+
+    def test_percentile_nearest_rank(self) -> None:
+        """Percentiles use the nearest-rank method."""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 95) == 0.0
+
+    def test_compare_flags_regressions(self) -> None:
+        """Latency, error rate and throughput regressions are reported."""
+        assert compare_reports(_report(100), _report(110), tolerance=0.2) == []
+
+        regressions = compare_reports(
+            _report(100), _report(150, error_rate=0.05, throughput=5.0), tolerance=0.2
+        )
+
+        assert any(r.startswith("p95 latency") for r in regressions)
+        assert any(r.startswith("error rate") for r in regressions)
+        assert any(r.startswith("throughput") for r in regressions)
+
+    def test_database_snapshot(self, tmp_path) -> None:
+        """Row counts of known tables and the file size are measured."""
+        path = tmp_path / "hub.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE metrics (id INTEGER)")
+        conn.executemany("INSERT INTO metrics VALUES (?)", [(1,), (2,)])
+        conn.commit()
+        conn.close()
+
+        snapshot = database_snapshot(path)
+
+        assert snapshot.rows == {"metrics": 2}
+        assert snapshot.size_bytes > 0
+
+
+class TestLoadTestCommand:
+    """Tests for `homelabcmd-cli load-test`."""
+
+    def _invoke(self, *args: str, transport: httpx.MockTransport):
+        real_client = httpx.AsyncClient
+
+        def client_factory(**kwargs):
+            return real_client(transport=transport, **kwargs)
+
+        with patch.object(httpx, "AsyncClient", client_factory):
+            return CliRunner().invoke(
+                cli,
+                ["load-test", "--agents", "2", "--interval", "0.1", "--duration", "0.19", *args],
+            )
+
+    def test_writes_report(self, tmp_path) -> None:
+        """A run prints a summary and writes a JSON report."""
+        output = tmp_path / "baseline.json"
+
+        result = self._invoke("--output", str(output), transport=_hub())
+
+        assert result.exit_code == 0, result.output
+        assert "Requests: 4" in result.output
+        assert "Removed 2 simulated servers" in result.output
+        assert json.loads(output.read_text())["succeeded"] == 4
+
+    def test_exits_on_regression(self, tmp_path) -> None:
+        """Comparing with a better baseline exits with status 1."""
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(_report(100)))
+
+        result = self._invoke(
+            "--baseline",
+            str(baseline),
+            transport=_hub(fail_server_ids=frozenset({"loadtest-0000"})),
+        )
+
+        assert result.exit_code == 1
+        assert "error rate" in result.output
@@ -7,10 +7,15 @@ Spec Reference: sdlc-studio/testing/specs/TSP0006-server-detail-charts.md
                 sdlc-studio/stories/US0113-inline-metric-sparklines.md
 """
 
+import math
+import time
 from datetime import UTC, datetime, timedelta
 
+import pytest
 from fastapi.testclient import TestClient
 
+from homelab_cmd.api.routes.metrics import lttb_indices
+
 
 class TestMetricsHistoryEndpoint:
     """TC077: Metrics API returns time-series data."""
@@ -527,3 +532,279 @@ class TestSparklineEndpoint:
         if len(data["data"]) > 1:
             timestamps = [point["timestamp"] for point in data["data"]]
             assert timestamps == sorted(timestamps)
+
+
+class TestLttbDownsampling:
+    """US0113: LTTB downsampling keeps the shape of the series."""
+
+    def test_short_series_unchanged(self) -> None:
+        """Series no longer than the target are kept whole."""
+        assert lttb_indices([0, 1, 2], [5.0, 6.0, 7.0], 30) == [0, 1, 2]
+
+    def test_keeps_target_points_including_ends(self) -> None:
+        """The result has target points, ascending, with both ends kept."""
+        xs = list(range(200))
+        ys = [math.sin(x / 10) for x in xs]
+
+        keep = lttb_indices(xs, ys, 30)
+
+        assert len(keep) == 30
+        assert keep == sorted(keep)
+        assert keep[0] == 0
+        assert keep[-1] == 199
+
+    def test_keeps_single_spike(self) -> None:
+        """A one-sample spike survives, where step sampling would drop it."""
+        xs = list(range(300))
+        ys = [10.0] * 300
+        ys[157] = 95.0
+        ys[211] = 1.0
+
+        keep = lttb_indices(xs, ys, 30)
+
+        assert 157 in keep
+        assert 211 in keep
+
+
+    def test_keeps_both_extremes_in_one_bucket(self) -> None:
+        """A minimum and maximum next to each other are both kept."""
+        xs = list(range(300))
+        ys = [10.0] * 300
+        ys[150] = 95.0
+        ys[151] = 1.0
+
+        keep = lttb_indices(xs, ys, 30)
+
+        assert {150, 151} <= set(keep)
+        assert len(keep) == 30
+        assert keep == sorted(keep)
+
+class TestSparklineBatchEndpoint:
+    """US0113: Batch sparklines for every server card in one request."""
+
+    def _send_metrics(
+        self,
+        client: TestClient,
+        auth_headers: dict[str, str],
+        server_id: str,
+        metrics_count: int = 10,
+    ) -> None:
+        """Helper to create a server with one heartbeat per minute."""
+        base_time = datetime.now(UTC) - timedelta(minutes=metrics_count)
+        for i in range(metrics_count):
+            response = client.post(
+                "/api/v1/agents/heartbeat",
+                json={
+                    "server_id": server_id,
+                    "hostname": f"{server_id}.local",
+                    "timestamp": (base_time + timedelta(minutes=i)).isoformat(),
+                    "metrics": {
+                        "cpu_percent": 20.0 + (i % 20) * 3,
+                        "memory_percent": 50.0 + (i % 20) * 2,
+                        "disk_percent": 45.0,
+                    },
+                },
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+
+    def test_returns_all_servers_and_metrics(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Without filters every server is returned with all three metrics."""
+        self._send_metrics(client, auth_headers, "batch-a", metrics_count=5)
+        self._send_metrics(client, auth_headers, "batch-b", metrics_count=5)
+
+        response = client.get("/api/v1/servers/metrics/sparklines", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["period"] == "30m"
+        assert data["metrics"] == ["cpu_percent", "memory_percent", "disk_percent"]
+        assert [s["server_id"] for s in data["servers"]] == ["batch-a", "batch-b"]
+        cpu = data["servers"][0]["series"]["cpu_percent"]
+        assert cpu["values"] == [20.0, 23.0, 26.0, 29.0, 32.0]
+        assert len(cpu["timestamps"]) == 5
+        assert cpu["timestamps"] == sorted(cpu["timestamps"])
+
+    def test_matches_per_server_endpoint(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Batch series carry the same points as the per-server endpoint."""
+        self._send_metrics(client, auth_headers, "batch-same", metrics_count=8)
+
+        single = client.get(
+            "/api/v1/servers/batch-same/metrics/sparkline?metric=memory_percent",
+            headers=auth_headers,
+        ).json()
+        batch = client.get(
+            "/api/v1/servers/metrics/sparklines?metric=memory_percent",
+            headers=auth_headers,
+        ).json()
+
+        series = batch["servers"][0]["series"]["memory_percent"]
+        assert series["values"] == [p["value"] for p in single["data"]]
+        assert series["timestamps"] == [
+            int(datetime.fromisoformat(p["timestamp"]).replace(tzinfo=UTC).timestamp())
+            for p in single["data"]
+        ]
+
+    def test_filters_servers_and_metrics(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Requested servers come back in request order with requested metrics only."""
+        self._send_metrics(client, auth_headers, "batch-x", metrics_count=3)
+        self._send_metrics(client, auth_headers, "batch-y", metrics_count=3)
+        self._send_metrics(client, auth_headers, "batch-z", metrics_count=3)
+
+        response = client.get(
+            "/api/v1/servers/metrics/sparklines"
+            "?server_id=batch-z&server_id=batch-x&server_id=missing&metric=disk_percent",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["metrics"] == ["disk_percent"]
+        assert [s["server_id"] for s in data["servers"]] == ["batch-z", "batch-x"]
+        assert set(data["servers"][0]["series"]) == {"disk_percent"}
+
+    def test_downsamples_to_period_target(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Series longer than the period's target are downsampled to it."""
+        self._send_metrics(client, auth_headers, "batch-long", metrics_count=45)
+
+        response = client.get(
+            "/api/v1/servers/metrics/sparklines?period=1h&metric=cpu_percent",
+            headers=auth_headers,
+        )
+
+        series = response.json()["servers"][0]["series"]["cpu_percent"]
+        assert len(series["values"]) == 30
+        assert series["values"][0] == 20.0
+        assert series["values"][-1] == 20.0 + (44 % 20) * 3
+        # Peaks of the sawtooth survive downsampling
+        assert series["values"].count(20.0 + 19 * 3) == 2
+
+    def test_server_without_metrics_has_empty_series(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Servers with no recent metrics are included with empty series."""
+        client.post(
+            "/api/v1/servers",
+            json={"id": "batch-empty", "hostname": "batch-empty.local"},
+            headers=auth_headers,
+        )
+
+        response = client.get(
+            "/api/v1/servers/metrics/sparklines?server_id=batch-empty", headers=auth_headers
+        )
+
+        series = response.json()["servers"][0]["series"]["cpu_percent"]
+        assert series == {"timestamps": [], "values": []}
+
+    def test_rejects_invalid_metric_and_period(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Unknown metrics and periods return 400."""
+        response = client.get(
+            "/api/v1/servers/metrics/sparklines?metric=invalid", headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "INVALID_METRIC"
+
+        response = client.get(
+            "/api/v1/servers/metrics/sparklines?period=5h", headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "INVALID_PERIOD"
+
+    def test_requires_auth(self, client: TestClient) -> None:
+        """Endpoint should require authentication."""
+        response = client.get("/api/v1/servers/metrics/sparklines")
+
+        assert response.status_code == 401
+
+
+class TestMetricsColumnsEndpoint:
+    """Columnar metrics history (parallel arrays)."""
+
+    @pytest.fixture
+    def hub_outside_utc(self, monkeypatch: pytest.MonkeyPatch):
+        """Run the hub in a timezone with a UTC offset."""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        yield
+        monkeypatch.undo()
+        time.tzset()
+
+    def test_matches_row_endpoint(
+        self, client: TestClient, auth_headers: dict[str, str], hub_outside_utc
+    ) -> None:
+        """Columns hold the same data as the per-point history, in UTC."""
+        base_time = datetime.now(UTC) - timedelta(hours=5)
+        for i in range(5):
+            client.post(
+                "/api/v1/agents/heartbeat",
+                json={
+                    "server_id": "columns-server",
+                    "hostname": "columns-server.local",
+                    "timestamp": (base_time + timedelta(hours=i)).isoformat(),
+                    "metrics": {
+                        "cpu_percent": 20.0 + i,
+                        "memory_percent": 50.0,
+                        "disk_percent": None,
+                    },
+                },
+                headers=auth_headers,
+            )
+
+        rows = client.get("/api/v1/servers/columns-server/metrics", headers=auth_headers).json()
+        response = client.get(
+            "/api/v1/servers/columns-server/metrics/columns", headers=auth_headers
+        )
+        data = response.json()
+
+        assert response.status_code == 200
+        assert data["total_points"] == rows["total_points"] == 5
+        assert (data["range"], data["resolution"]) == (rows["range"], rows["resolution"])
+        points = rows["data_points"]
+        columns = data["columns"]
+        assert columns["timestamps"] == [
+            # Stored timestamps are naive UTC
+            int(
+                datetime.fromisoformat(p["timestamp"].replace("Z", "+00:00"))
+                .replace(tzinfo=UTC)
+                .timestamp()
+            )
+            for p in points
+        ]
+        for metric in ("cpu_percent", "memory_percent", "disk_percent"):
+            assert columns[metric] == [p[metric] for p in points]
+
+    def test_empty_for_no_data(self, client: TestClient, auth_headers: dict[str, str]) -> None:
+        """A server without metrics has empty columns."""
+        client.post(
+            "/api/v1/servers",
+            json={"id": "columns-empty", "hostname": "columns-empty.local"},
+            headers=auth_headers,
+        )
+
+        response = client.get(
+            "/api/v1/servers/columns-empty/metrics/columns?range=30d", headers=auth_headers
+        )
+
+        assert response.json()["columns"] == {
+            "timestamps": [],
+            "cpu_percent": [],
+            "memory_percent": [],
+            "disk_percent": [],
+        }
+
+    def test_404_and_auth(self, client: TestClient, auth_headers: dict[str, str]) -> None:
+        """Unknown servers return 404; the endpoint requires authentication."""
+        url = "/api/v1/servers/nonexistent-server/metrics/columns"
+
+        assert client.get(url, headers=auth_headers).status_code == 404
+        assert client.get(url).status_code == 401
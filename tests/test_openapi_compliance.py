@@ -186,6 +186,7 @@ class TestResponseDocumentation:
             "/api/v1/system/health",
             "/api/v1/agents/register/claim",  # Token is the auth
             "/api/v1/agents/register/install.sh",  # Public install script
+            "/api/v1/agents/register/download",  # Public agent files for the install script
         ]
 
         missing_401 = []
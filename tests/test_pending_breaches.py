@@ -0,0 +1,142 @@
+"""Tests for pending breaches maintained during alert evaluation.
+
+Tests cover:
+- A breach short of its sustained duration is scheduled to fire
+- The schedule is cleared when the value recovers or the alert fires
+- GET /alerts/pending lists breaches soonest first, with within and limit
+- Changing thresholds reschedules breaches already pending
+- The fleet-wide query reads the fires_at index in order
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select, text
+
+from homelab_cmd.db.models.alert_state import AlertState
+
+
+def _heartbeat(client, auth_headers, server_id: str, cpu: float) -> None:
+    response = client.post(
+        "/api/v1/agents/heartbeat",
+        json={
+            "server_id": server_id,
+            "hostname": f"{server_id}.local",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "metrics": {"cpu_percent": cpu, "memory_percent": 30.0, "disk_percent": 40.0},
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+
+
+def _pending(client, auth_headers, **params) -> dict:
+    response = client.get("/api/v1/alerts/pending", params=params, headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestPendingBreachSchedule:
+    """Tests for breaches recorded as heartbeats are evaluated."""
+
+    def test_breach_scheduled_to_fire(self, client, auth_headers) -> None:
+        """A CPU breach fires after the default 180 second sustained duration."""
+        _heartbeat(client, auth_headers, "busy", 90.0)
+
+        data = _pending(client, auth_headers)
+
+        assert data["total"] == 1
+        breach = data["pending"][0]
+        assert breach["server_id"] == "busy"
+        assert breach["server_name"] == "busy.local"
+        assert breach["metric_type"] == "cpu"
+        assert breach["severity"] == "high"
+        assert breach["threshold_value"] == 85
+        assert breach["sustained_seconds"] == 180
+        assert 170 <= breach["time_until_alert"] <= 180
+
+    def test_critical_value_scheduled_as_critical(self, client, auth_headers) -> None:
+        """A value over the critical threshold would fire as critical."""
+        _heartbeat(client, auth_headers, "hot", 97.0)
+
+        breach = _pending(client, auth_headers)["pending"][0]
+
+        assert breach["severity"] == "critical"
+        assert breach["threshold_value"] == 95
+
+    def test_recovery_clears_breach(self, client, auth_headers) -> None:
+        """Dropping below the threshold removes the pending breach."""
+        _heartbeat(client, auth_headers, "busy", 90.0)
+        _heartbeat(client, auth_headers, "busy", 20.0)
+
+        assert _pending(client, auth_headers)["total"] == 0
+
+    def test_fired_alert_clears_breach(self, client, auth_headers) -> None:
+        """Once the sustained duration is met the breach is no longer pending."""
+        _heartbeat(client, auth_headers, "busy", 90.0)
+        client.put(
+            "/api/v1/config/thresholds",
+            json={"cpu": {"sustained_seconds": 0}},
+            headers=auth_headers,
+        )
+        _heartbeat(client, auth_headers, "busy", 90.0)
+
+        assert _pending(client, auth_headers)["total"] == 0
+        alerts = client.get("/api/v1/alerts", headers=auth_headers).json()["alerts"]
+        assert [alert["alert_type"] for alert in alerts] == ["cpu"]
+
+
+class TestPendingBreachList:
+    """Tests for GET /api/v1/alerts/pending filters and ordering."""
+
+    def test_soonest_first_with_within_and_limit(self, client, auth_headers) -> None:
+        """Breaches are ordered by time to fire; within and limit narrow them."""
+        for server_id in ("first", "second", "third"):
+            _heartbeat(client, auth_headers, server_id, 90.0)
+
+        everything = _pending(client, auth_headers)
+        soonest = _pending(client, auth_headers, limit=1)
+        imminent = _pending(client, auth_headers, within=60)
+        one_server = _pending(client, auth_headers, server_id="second")
+
+        assert [b["server_id"] for b in everything["pending"]] == ["first", "second", "third"]
+        assert [b["server_id"] for b in soonest["pending"]] == ["first"]
+        assert soonest["total"] == 3
+        assert imminent == {"pending": [], "total": 0}
+        assert [b["server_id"] for b in one_server["pending"]] == ["second"]
+
+    def test_threshold_change_reschedules(self, client, auth_headers) -> None:
+        """A shorter sustained duration brings pending breaches forward."""
+        _heartbeat(client, auth_headers, "busy", 90.0)
+
+        response = client.put(
+            "/api/v1/config/thresholds",
+            json={"cpu": {"sustained_seconds": 30}},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+        breach = _pending(client, auth_headers, within=60)["pending"][0]
+        assert breach["sustained_seconds"] == 30
+        assert breach["time_until_alert"] <= 30
+
+    @pytest.mark.asyncio
+    async def test_fleet_query_reads_index_in_order(self, db_session) -> None:
+        """Soonest-first reads walk the fires_at index instead of sorting."""
+        query = (
+            select(AlertState)
+            .where(AlertState.fires_at.isnot(None))
+            .order_by(AlertState.fires_at, AlertState.id)
+            .limit(10)
+        )
+        compiled = query.compile(
+            dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+
+        plan = " ".join(
+            row[-1]
+            for row in (await db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))).all()
+        )
+
+        assert "idx_alert_states_fires_at" in plan
+        assert "TEMP B-TREE" not in plan
@@ -0,0 +1,232 @@
+"""Tests for the Prometheus /metrics endpoint.
+
+Tests cover:
+- Counter and histogram rendering in OpenMetrics text format
+- Fleet gauges follow heartbeats without reloading from the database
+- Fleet gauges reload from the database once the sync interval passes
+- Hub self-instrumentation (heartbeats, query timing, scheduled jobs)
+- Authentication by X-API-Key or bearer token
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from homelab_cmd.db.models.metrics import Metrics
+from homelab_cmd.db.models.server import Server
+from homelab_cmd.services import telemetry
+from homelab_cmd.services.coordination import get_coordinator, leader_only
+from homelab_cmd.services.telemetry import (
+    OPENMETRICS_CONTENT_TYPE,
+    Counter,
+    FleetGauges,
+    Histogram,
+    instrument_engine,
+)
+
+
+def _samples(body: str) -> dict[str, float]:
+    """Parse sample lines into {name{labels}: value}."""
+    samples = {}
+    for line in body.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value.replace("+Inf", "inf"))
+    return samples
+
+
+class TestOpenMetricsRendering:
+    """Tests for the metric primitives."""
+
+    def test_counter_renders_total_samples(self) -> None:
+        """Counter families are typed without _total; samples carry it."""
+        counter = Counter("demo_requests", "Requests.", ("path",))
+        counter.inc(path="/a")
+        counter.inc(2, path='/"b"')
+
+        lines = counter.render()
+
+        assert lines[0] == "# TYPE demo_requests counter"
+        assert 'demo_requests_total{path="/a"} 1' in lines
+        assert 'demo_requests_total{path="/\\"b\\""} 2' in lines
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Bucket counts accumulate up to +Inf, with _count and _sum."""
+        histogram = Histogram("demo_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value)
+
+        samples = _samples("\n".join(histogram.render()))
+
+        assert samples['demo_seconds_bucket{le="0.1"}'] == 1
+        assert samples['demo_seconds_bucket{le="1"}'] == 3
+        assert samples['demo_seconds_bucket{le="+Inf"}'] == 4
+        assert samples["demo_seconds_count"] == 4
+        assert samples["demo_seconds_sum"] == pytest.approx(6.05)
+
+    def test_histogram_time_observes_duration(self) -> None:
+        """time() records one observation, even when the block raises."""
+        histogram = Histogram("demo_seconds", "Latency.", ("job",))
+        with histogram.time(job="a"):
+            pass
+        with pytest.raises(RuntimeError), histogram.time(job="a"):
+            raise RuntimeError
+
+        assert histogram.count(job="a") == 2
+
+
+class TestFleetGauges:
+    """Tests for per-server gauges."""
+
+    def test_heartbeat_updates_gauges(self) -> None:
+        """A recorded heartbeat shows up as server and service gauges."""
+        fleet = FleetGauges()
+        fleet.record_heartbeat(
+            "web-1",
+            "web-1.local",
+            {"cpu_percent": 12.5, "memory_percent": 40.0, "load_1m": None},
+            {"nginx": "running", "cron": "stopped"},
+        )
+
+        samples = _samples("\n".join(fleet.render()))
+
+        assert (
+            samples['homelab_server_info{server_id="web-1",hostname="web-1.local",status="online"}']
+            == 1
+        )
+        assert samples['homelab_server_up{server_id="web-1"}'] == 1
+        assert samples['homelab_server_cpu_percent{server_id="web-1"}'] == 12.5
+        assert 'homelab_server_load1{server_id="web-1"}' not in samples
+        assert (
+            samples['homelab_service_up{server_id="web-1",service="nginx",status="running"}'] == 1
+        )
+        assert samples['homelab_service_up{server_id="web-1",service="cron",status="stopped"}'] == 0
+
+    @pytest.mark.asyncio
+    async def test_sync_loads_latest_state(self, db_session) -> None:
+        """sync() reads the newest metrics row and current service states."""
+        now = datetime.now(UTC)
+        db_session.add(Server(id="db-1", hostname="db-1.local", status="offline"))
+        db_session.add_all(
+            Metrics(server_id="db-1", timestamp=now - timedelta(minutes=m), cpu_percent=cpu)
+            for m, cpu in ((2, 10.0), (1, 90.0))
+        )
+        await db_session.flush()
+        fleet = FleetGauges()
+
+        await fleet.sync(db_session)
+
+        samples = _samples("\n".join(fleet.render()))
+        assert samples['homelab_server_up{server_id="db-1"}'] == 0
+        assert samples['homelab_server_cpu_percent{server_id="db-1"}'] == 90.0
+        assert not fleet.needs_sync
+
+
+class TestHubInstrumentation:
+    """Tests for hub self-instrumentation."""
+
+    @pytest.mark.asyncio
+    async def test_database_queries_are_timed(self) -> None:
+        """Statements on an instrumented engine are observed by operation."""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        instrument_engine(engine.sync_engine)
+        before = telemetry.DB_QUERY_DURATION.count(operation="select")
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        await engine.dispose()
+
+        assert telemetry.DB_QUERY_DURATION.count(operation="select") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_failed_statement_does_not_skew_timings(self) -> None:
+        """A statement that raises leaves no start time behind on its connection."""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        instrument_engine(engine.sync_engine)
+
+        async with engine.connect() as conn:
+            with pytest.raises(DBAPIError):
+                await conn.execute(text("SELECT * FROM missing_table"))
+            started = conn.sync_connection.info["query_started"]
+        await engine.dispose()
+
+        assert started == []
+
+    @pytest.mark.asyncio
+    async def test_leader_jobs_are_timed(self) -> None:
+        """Scheduled jobs run by the leader are timed, and failures counted."""
+
+        @leader_only
+        async def demo_job() -> None:
+            raise RuntimeError("boom")
+
+        with patch.object(type(get_coordinator()), "is_leader", True):
+            with pytest.raises(RuntimeError):
+                await demo_job()
+
+        assert telemetry.JOB_DURATION.count(job="demo_job") == 1
+        assert telemetry.JOB_FAILURES.value(job="demo_job") == 1
+
+
+class TestPrometheusEndpoint:
+    """Tests for GET /metrics."""
+
+    def test_exposition_format(self, client, auth_headers) -> None:
+        """The endpoint serves OpenMetrics text ending in # EOF."""
+        response = client.get("/metrics", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == OPENMETRICS_CONTENT_TYPE
+        assert response.text.endswith("# EOF\n")
+        assert "# TYPE homelab_heartbeat_duration_seconds histogram" in response.text
+        assert "homelab_ssh_pool_connections 0" in response.text
+        assert "homelab_notifier_queue_depth" in response.text
+
+    def test_heartbeat_reflected_without_resync(self, client, auth_headers, send_heartbeat) -> None:
+        """After the first scrape, heartbeats reach the gauges from memory."""
+        client.get("/metrics", headers=auth_headers)
+        before = telemetry.HEARTBEATS.value(endpoint="rest")
+
+        send_heartbeat(
+            client,
+            auth_headers,
+            "prom-1",
+            metrics={"cpu_percent": 33.0, "memory_percent": 50.0, "disk_percent": 70.0},
+            services=[{"name": "plex", "status": "running"}],
+        )
+        with patch.object(FleetGauges, "sync") as sync:
+            response = client.get("/metrics", headers=auth_headers)
+
+        sync.assert_not_called()
+        samples = _samples(response.text)
+        assert samples['homelab_server_cpu_percent{server_id="prom-1"}'] == 33.0
+        assert (
+            samples['homelab_service_up{server_id="prom-1",service="plex",status="running"}'] == 1
+        )
+        assert samples['homelab_heartbeats_total{endpoint="rest"}'] == before + 1
+
+    def test_resyncs_after_interval(self, client, auth_headers, create_server) -> None:
+        """Servers changed outside this worker appear after the sync interval."""
+        client.get("/metrics", headers=auth_headers)
+        create_server(client, auth_headers, "prom-2")
+        assert "prom-2" not in client.get("/metrics", headers=auth_headers).text
+
+        with patch.object(telemetry, "FLEET_SYNC_INTERVAL_SECONDS", 0):
+            response = client.get("/metrics", headers=auth_headers)
+
+        assert 'homelab_server_up{server_id="prom-2"} 0' in response.text
+
+    def test_bearer_token_accepted(self, client, api_key) -> None:
+        """The API key may be sent as a bearer token."""
+        response = client.get("/metrics", headers={"Authorization": f"Bearer {api_key}"})
+        assert response.status_code == 200
+
+    def test_requires_auth(self, client) -> None:
+        """Scrapes without a valid key are rejected."""
+        assert client.get("/metrics").status_code == 401
+        response = client.get("/metrics", headers={"Authorization": "Bearer wrong"})
+        assert response.status_code == 401
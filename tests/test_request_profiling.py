@@ -0,0 +1,179 @@
+"""Tests for request and SQL statement profiling.
+
+Tests cover:
+- Requests are recorded per route template with their SQL statement count
+- Responses carry a Server-Timing header
+- Statements are aggregated by text; statements outside requests are unattributed
+- Slow statements are logged with their query plan
+- The performance summary endpoint ranks routes and statements, and resets
+"""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from homelab_cmd.services import telemetry
+from homelab_cmd.services.profiling import (
+    Profiler,
+    end_request,
+    get_profiler,
+    start_request,
+)
+from homelab_cmd.services.telemetry import instrument_engine
+
+
+@pytest.fixture
+def profiler():
+    """The worker profiler, emptied before and after the test."""
+    profiler = get_profiler()
+    profiler.reset()
+    threshold = profiler.slow_query_threshold_ms
+    yield profiler
+    profiler.slow_query_threshold_ms = threshold
+    profiler.reset()
+
+
+class TestRequestTiming:
+    """Tests for RequestTimingMiddleware."""
+
+    def test_request_recorded_by_route_template(
+        self, client, auth_headers, create_server, profiler
+    ) -> None:
+        """Requests are grouped by route template, not concrete path."""
+        create_server(client, auth_headers, "prof-1")
+        create_server(client, auth_headers, "prof-2")
+        profiler.reset()
+
+        client.get("/api/v1/servers/prof-1", headers=auth_headers)
+        client.get("/api/v1/servers/prof-2", headers=auth_headers)
+
+        stats = profiler.routes["GET /api/v1/servers/{server_id}"]
+        assert stats.count == 2
+        assert stats.query_count >= 2
+        assert stats.max_ms >= stats.mean_ms > 0
+        assert not any("prof-1" in route for route in profiler.routes)
+
+    def test_server_timing_header(self, client, auth_headers) -> None:
+        """Responses report app and database time."""
+        response = client.get("/api/v1/servers", headers=auth_headers)
+
+        timing = response.headers["server-timing"]
+        assert timing.startswith("app;dur=")
+        assert "db;dur=" in timing
+        assert "queries" in timing
+
+    def test_unmatched_routes_share_one_label(self, client, profiler) -> None:
+        """Unknown paths do not create a route per path."""
+        client.get("/no/such/path")
+        client.get("/another/missing/path")
+
+        assert profiler.routes["GET unmatched"].count == 2
+
+    def test_route_latency_exported(self, client, auth_headers) -> None:
+        """Route latency appears in the /metrics histograms."""
+        client.get("/api/v1/system/health")
+
+        response = client.get("/metrics", headers=auth_headers)
+
+        assert (
+            'homelab_http_request_duration_seconds_count{method="GET",'
+            'route="/api/v1/system/health"}' in response.text
+        )
+
+
+class TestStatementProfiling:
+    """Tests for statement aggregation and the slow-query log."""
+
+    @pytest.mark.asyncio
+    async def test_statements_attributed_to_request(self) -> None:
+        """Statements inside a request count towards it; others do not."""
+        profiler = Profiler(slow_query_threshold_ms=0)
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        instrument_engine(engine.sync_engine)
+        try:
+            with patch.object(telemetry, "get_profiler", return_value=profiler):
+                profile, token = start_request({"type": "http", "method": "GET"})
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                    await conn.execute(text("SELECT 1"))
+                end_request(token)
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 2"))
+        finally:
+            await engine.dispose()
+
+        assert profile.query_count == 2
+        assert profiler.statements["SELECT 1"].count == 2
+        assert profiler.statements["SELECT 2"].count == 1
+        assert not profiler.slow_queries
+
+    @pytest.mark.asyncio
+    async def test_slow_query_logged_with_plan(self, caplog) -> None:
+        """Statements over the threshold are logged with EXPLAIN QUERY PLAN."""
+        profiler = Profiler(slow_query_threshold_ms=0.000001)
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        instrument_engine(engine.sync_engine)
+        try:
+            with patch.object(telemetry, "get_profiler", return_value=profiler):
+                async with engine.connect() as conn:
+                    await conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)"))
+                    with caplog.at_level(logging.WARNING, logger="homelab_cmd.services.profiling"):
+                        await conn.execute(text("SELECT name FROM t WHERE name = :n"), {"n": "x"})
+        finally:
+            await engine.dispose()
+
+        [slow] = [q for q in profiler.slow_queries if q.statement.startswith("SELECT name")]
+        assert slow.route is None
+        assert any("SCAN" in step for step in slow.plan)
+        assert "Slow query" in caplog.text
+        assert "plan: SCAN" in caplog.text
+
+
+class TestPerformanceSummaryEndpoint:
+    """Tests for GET/DELETE /api/v1/system/performance."""
+
+    def test_summary_ranks_routes_and_statements(self, client, auth_headers, profiler) -> None:
+        """The summary lists routes and statements, slowest first."""
+        for _ in range(3):
+            client.get("/api/v1/servers", headers=auth_headers)
+
+        response = client.get(
+            "/api/v1/system/performance?limit=5&order_by=total", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["routes"]) <= 5
+        routes = {r["route"]: r for r in data["routes"]}
+        assert routes["GET /api/v1/servers"]["count"] == 3
+        assert routes["GET /api/v1/servers"]["mean_queries"] >= 1
+        totals = [s["total_ms"] for s in data["statements"]]
+        assert totals == sorted(totals, reverse=True)
+        assert data["slow_query_threshold_ms"] == profiler.slow_query_threshold_ms
+
+    def test_summary_includes_slow_queries(self, client, auth_headers, profiler) -> None:
+        """Slow statements are listed with the route that ran them."""
+        profiler.slow_query_threshold_ms = 0.000001
+        client.get("/api/v1/servers", headers=auth_headers)
+
+        data = client.get("/api/v1/system/performance", headers=auth_headers).json()
+
+        assert data["slow_queries"]
+        assert any(q["route"] == "GET /api/v1/servers" for q in data["slow_queries"])
+
+    def test_reset(self, client, auth_headers, profiler) -> None:
+        """DELETE discards recorded timings."""
+        client.get("/api/v1/servers", headers=auth_headers)
+
+        response = client.delete("/api/v1/system/performance", headers=auth_headers)
+
+        assert response.status_code == 204
+        assert "GET /api/v1/servers" not in profiler.routes
+
+    def test_requires_auth(self, client) -> None:
+        """The summary requires authentication."""
+        assert client.get("/api/v1/system/performance").status_code == 401
+        assert client.delete("/api/v1/system/performance").status_code == 401
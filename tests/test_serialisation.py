@@ -0,0 +1,74 @@
+"""Tests for direct pydantic-core serialisation of large responses.
+
+Tests cover:
+- ModelResponse renders the same JSON as the model's own serialiser
+- Headers set by dependencies survive; body headers are not copied
+- Endpoints using it still honour their response_model schema
+"""
+
+import json
+from datetime import UTC, datetime
+
+from fastapi import Response
+
+from homelab_cmd.api.schemas.metrics import MetricPoint, MetricsHistoryResponse
+from homelab_cmd.api.serialisation import ModelResponse, model_response
+
+
+def _history() -> MetricsHistoryResponse:
+    point = MetricPoint(
+        timestamp=datetime(2024, 1, 1, tzinfo=UTC), cpu_percent=12.5, disk_percent=None
+    )
+    return MetricsHistoryResponse(
+        server_id="s1", range="24h", resolution="1m", data_points=[point], total_points=1
+    )
+
+
+class TestModelResponse:
+    """Tests for ModelResponse and model_response."""
+
+    def test_renders_model_json(self) -> None:
+        """The body is the model's compact JSON."""
+        history = _history()
+
+        response = ModelResponse(history)
+
+        assert response.body == history.model_dump_json().encode()
+        assert response.media_type == "application/json"
+        assert json.loads(response.body)["data_points"][0]["disk_percent"] is None
+
+    def test_copies_dependency_headers(self) -> None:
+        """Headers from the injected response are kept, body headers are not."""
+        injected = Response()
+        injected.headers["ETag"] = 'W/"abc"'
+        injected.headers["content-length"] = "0"
+
+        response = model_response(_history(), injected)
+
+        assert response.headers["etag"] == 'W/"abc"'
+        assert response.headers["content-length"] == str(len(response.body))
+        assert response.headers.getlist("content-length") == [str(len(response.body))]
+
+
+class TestEndpoints:
+    """Endpoints returning model_response."""
+
+    def test_server_list_matches_schema(self, client, auth_headers, create_server) -> None:
+        """The server list has every ServerResponse field and an ETag."""
+        create_server(client, auth_headers, "ser-1")
+
+        response = client.get("/api/v1/servers", headers=auth_headers)
+
+        assert response.headers["content-type"] == "application/json"
+        assert "etag" in response.headers
+        server = response.json()["servers"][0]
+        assert server["id"] == "ser-1"
+        assert server["active_alert_count"] == 0
+        assert server["latest_metrics"] is None
+
+    def test_scan_list_counts_without_loading(self, client, auth_headers) -> None:
+        """An empty scan history reports a zero total."""
+        response = client.get("/api/v1/scans", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
@@ -1,11 +1,20 @@
 """Tests for Expected Services API endpoints (US0019).
 
-These tests verify the CRUD operations for expected services configuration.
+These tests verify the CRUD operations for expected services configuration,
+and the backfill of each service's current status from its history.
 
 Spec Reference: sdlc-studio/stories/US0019-expected-services-api.md
 """
 
+from datetime import UTC, datetime, timedelta
+
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from homelab_cmd.api.routes.agents import backfill_current_service_status
+from homelab_cmd.db.models.server import Server
+from homelab_cmd.db.models.service import CurrentServiceStatus, ServiceStatus
 
 
 class TestListServerServices:
@@ -74,6 +83,35 @@ class TestListServerServices:
         assert service["current_status"]["status"] == "running"
         assert service["current_status"]["pid"] == 1234
 
+    def test_list_services_ignores_older_status(
+        self, client: TestClient, auth_headers: dict[str, str], create_server, send_heartbeat
+    ) -> None:
+        """A late, older sample does not replace the current status."""
+        create_server(client, auth_headers, "test-status-order")
+        client.post(
+            "/api/v1/servers/test-status-order/services",
+            json={"service_name": "nginx"},
+            headers=auth_headers,
+        )
+        now = datetime.now(UTC)
+        send_heartbeat(
+            client,
+            auth_headers,
+            "test-status-order",
+            timestamp=now.isoformat(),
+            services=[{"name": "nginx", "status": "failed"}],
+        )
+        send_heartbeat(
+            client,
+            auth_headers,
+            "test-status-order",
+            timestamp=(now - timedelta(minutes=5)).isoformat(),
+            services=[{"name": "nginx", "status": "running"}],
+        )
+
+        response = client.get("/api/v1/servers/test-status-order/services", headers=auth_headers)
+        assert response.json()["services"][0]["current_status"]["status"] == "failed"
+
     def test_list_services_404_for_nonexistent_server(
         self, client: TestClient, auth_headers: dict[str, str]
     ) -> None:
@@ -88,6 +126,96 @@ class TestListServerServices:
         assert response.status_code == 401
 
 
+class TestCurrentStatusBackfill:
+    """Tests for filling service_current_status from the status history."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_adds_missing_services_once(self, db_session) -> None:
+        """Services without a current row get their newest history row; others are kept."""
+        now = datetime.now(UTC)
+        db_session.add(Server(id="backfill-srv", hostname="backfill-srv.local"))
+        await db_session.flush()
+        db_session.add_all(
+            [
+                ServiceStatus(
+                    server_id="backfill-srv",
+                    service_name="nginx",
+                    status="running",
+                    timestamp=now - timedelta(minutes=5),
+                ),
+                ServiceStatus(
+                    server_id="backfill-srv", service_name="nginx", status="failed", timestamp=now
+                ),
+                ServiceStatus(
+                    server_id="backfill-srv",
+                    service_name="sshd",
+                    status="stopped",
+                    timestamp=now - timedelta(minutes=5),
+                ),
+                CurrentServiceStatus(
+                    server_id="backfill-srv", service_name="sshd", status="running", timestamp=now
+                ),
+            ]
+        )
+        await db_session.commit()
+
+        added = await backfill_current_service_status(db_session)
+        added_again = await backfill_current_service_status(db_session)
+
+        result = await db_session.execute(
+            select(CurrentServiceStatus.service_name, CurrentServiceStatus.status).order_by(
+                CurrentServiceStatus.service_name
+            )
+        )
+        assert added == 1
+        assert added_again == 0
+        assert result.all() == [("nginx", "failed"), ("sshd", "running")]
+
+
+class TestListFleetServices:
+    """Tests for GET /api/v1/services."""
+
+    def test_fleet_services_grouped_by_server(
+        self, client: TestClient, auth_headers: dict[str, str], create_server, send_heartbeat
+    ) -> None:
+        """Returns every server's expected services and status in one call."""
+        create_server(client, auth_headers, "test-fleet-a")
+        create_server(client, auth_headers, "test-fleet-b")
+        create_server(client, auth_headers, "test-fleet-none")
+        for server_id, service_name in (
+            ("test-fleet-a", "nginx"),
+            ("test-fleet-a", "plex"),
+            ("test-fleet-b", "docker"),
+        ):
+            client.post(
+                f"/api/v1/servers/{server_id}/services",
+                json={"service_name": service_name},
+                headers=auth_headers,
+            )
+        send_heartbeat(
+            client,
+            auth_headers,
+            "test-fleet-a",
+            services=[{"name": "nginx", "status": "running"}],
+        )
+
+        response = client.get("/api/v1/services", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        servers = {s["server_id"]: s for s in data["servers"]}
+        assert set(servers) == {"test-fleet-a", "test-fleet-b"}
+        fleet_a = {svc["service_name"]: svc for svc in servers["test-fleet-a"]["services"]}
+        assert fleet_a["nginx"]["current_status"]["status"] == "running"
+        assert fleet_a["plex"]["current_status"] is None
+
+    def test_fleet_services_requires_auth(self, client: TestClient) -> None:
+        """Returns 401 without authentication."""
+        response = client.get("/api/v1/services")
+        assert response.status_code == 401
+
+
 class TestCreateExpectedService:
     """Tests for POST /api/v1/servers/{server_id}/services (AC2)."""
 
@@ -263,6 +263,43 @@ class TestExecuteConnectionReuse:
             # (connection reuse is handled within get_connection)
             assert mock_get_conn.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_concurrent_commands_share_one_connection(
+        self, executor, mock_server, mock_credential_service, mock_host_key_service
+    ):
+        """Concurrent commands to one host open a single connection between them."""
+        mock_host_key_service.get_host_key.return_value = MagicMock()
+        mock_client = MagicMock()
+        mock_client.get_transport.return_value.is_active.return_value = True
+        mock_stdout = MagicMock()
+        mock_stdout.read.return_value = b"output"
+        mock_stdout.channel.recv_exit_status.return_value = 0
+        mock_stderr = MagicMock()
+        mock_stderr.read.return_value = b""
+        mock_client.exec_command.return_value = (MagicMock(), mock_stdout, mock_stderr)
+
+        async def lookup(*_args):
+            # Overlapping queries on one AsyncSession would fail
+            assert not lookup.active
+            lookup.active = True
+            await asyncio.sleep(0.01)
+            lookup.active = False
+            return "mock-ssh-key-content"
+
+        lookup.active = False
+        mock_credential_service.get_credential = lookup
+
+        with (
+            patch.object(executor, "_load_private_key", return_value=MagicMock()),
+            patch.object(executor, "_connect_sync", return_value=mock_client) as connect,
+        ):
+            results = await asyncio.gather(
+                *(executor.execute(mock_server, f"command{i}") for i in range(5))
+            )
+
+        assert [r.exit_code for r in results] == [0] * 5
+        connect.assert_called_once()
+
 
 class TestExecuteErrorHandling:
     """Tests for error handling during execution."""
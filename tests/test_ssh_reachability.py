@@ -0,0 +1,130 @@
+"""Tests for persisted SSH reachability of Tailscale devices (US0096, US0097).
+
+Tests cover:
+- Untested devices are tested inline and stored
+- Current results are served without re-testing
+- Outdated results are served and re-tested in the background
+- No SSH key configured short-circuits without storing
+"""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homelab_cmd.services import ssh_reachability
+from homelab_cmd.services.ssh_reachability import (
+    NO_SSH_KEY_ERROR,
+    SSH_STATUS_TTL_SECONDS,
+    SSHReachability,
+    get_reachability,
+    load_reachability,
+    store_reachability,
+)
+from homelab_cmd.services.tailscale_service import TailscaleDevice
+
+
+def _device(device_id: str) -> TailscaleDevice:
+    return TailscaleDevice(
+        id=device_id,
+        name=f"host{device_id}.tailnet.ts.net",
+        hostname=f"host{device_id}",
+        tailscale_ip=f"100.64.0.{device_id}",
+        os="linux",
+        os_version=None,
+        last_seen=datetime.now(UTC),
+        online=True,
+        authorized=True,
+        already_imported=False,
+    )
+
+
+@pytest.fixture
+def ssh_service():
+    """Patch the SSH service with one that has a key and always connects."""
+    service = MagicMock()
+    service.list_keys_with_metadata.return_value = [{"id": "homelab"}]
+    service.test_connection = AsyncMock(
+        return_value=MagicMock(success=True, error=None, key_used="homelab")
+    )
+    with patch.object(ssh_reachability, "get_ssh_service", return_value=service):
+        yield service
+
+
+class TestGetReachability:
+    """Test get_reachability."""
+
+    @pytest.mark.asyncio
+    async def test_untested_devices_tested_and_stored(self, db_session, ssh_service) -> None:
+        """Devices with no stored result are tested before returning."""
+        results = await get_reachability(db_session, [_device("1"), _device("2")])
+
+        assert {r.status for r in results.values()} == {"available"}
+        assert ssh_service.test_connection.await_count == 2
+        stored = await load_reachability(db_session, ["1", "2"])
+        assert set(stored) == {"1", "2"}
+        assert stored["1"].key_used == "homelab"
+
+    @pytest.mark.asyncio
+    async def test_current_results_not_retested(self, db_session, ssh_service) -> None:
+        """Stored results younger than the TTL are served as they are."""
+        await store_reachability(
+            db_session,
+            {"1": SSHReachability("unavailable", "refused", None, datetime.now(UTC))},
+        )
+
+        results = await get_reachability(db_session, [_device("1")])
+
+        assert results["1"].status == "unavailable"
+        assert results["1"].error == "refused"
+        ssh_service.test_connection.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_outdated_results_served_and_retested_in_background(
+        self, db_session, ssh_service
+    ) -> None:
+        """Outdated results are returned at once and refreshed behind the caller."""
+        old = datetime.now(UTC) - timedelta(seconds=SSH_STATUS_TTL_SECONDS + 1)
+        await store_reachability(
+            db_session, {"1": SSHReachability("unavailable", "refused", None, old)}
+        )
+        await db_session.commit()
+
+        @asynccontextmanager
+        async def session_scope():
+            yield db_session
+
+        with patch.object(ssh_reachability, "get_session_factory", return_value=session_scope):
+            results = await get_reachability(db_session, [_device("1")])
+            assert results["1"].status == "unavailable"
+
+            tasks = list(ssh_reachability._retest_tasks)
+            assert len(tasks) == 1
+            await tasks[0]
+
+        stored = await load_reachability(db_session, ["1"])
+        assert stored["1"].status == "available"
+        assert stored["1"].is_current
+        assert not ssh_reachability._retesting
+
+    @pytest.mark.asyncio
+    async def test_no_ssh_key_short_circuits(self, db_session, ssh_service) -> None:
+        """Without SSH keys no device is tested and nothing is stored."""
+        ssh_service.list_keys_with_metadata.return_value = []
+
+        results = await get_reachability(db_session, [_device("1")])
+
+        assert results["1"].error == NO_SSH_KEY_ERROR
+        ssh_service.test_connection.assert_not_awaited()
+        assert await load_reachability(db_session, ["1"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_connection_recorded(self, db_session, ssh_service) -> None:
+        """A connection error is stored as unavailable with its message."""
+        ssh_service.test_connection.side_effect = OSError("No route to host")
+
+        results = await get_reachability(db_session, [_device("1")])
+
+        assert results["1"].status == "unavailable"
+        assert results["1"].error == "No route to host"
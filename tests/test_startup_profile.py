@@ -0,0 +1,174 @@
+"""Tests for hub startup profiling and deferred startup work.
+
+Tests cover:
+- Importing the application does not load paramiko, httpx or yaml
+- Lazy modules import on first use and patch the real module
+- Only missing tables are created; a current schema creates none
+- Startup phases are timed and reported in the performance summary
+- -X importtime output is parsed and totalled by package
+- `homelabcmd-cli startup-profile` reports imports and cold starts
+"""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+from click.testing import CliRunner
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from homelab_cmd.cli import cli
+from homelab_cmd.db import models  # noqa: F401
+from homelab_cmd.db.base import Base
+from homelab_cmd.db.session import _missing_tables
+from homelab_cmd.lazy_imports import LazyModule, lazy_import
+from homelab_cmd.services.profiling import StartupProfile, get_startup_profile
+from homelab_cmd.startup_profile import ColdStart, parse_importtime
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+2026-01-01 00:00:00,000 - homelab_cmd.config - WARNING - Using default development API key.
+import time:       500 |        500 |     pydantic.fields
+import time:      2000 |       2500 |   pydantic
+import time:      1000 |       1000 |     sqlalchemy.orm
+import time:      3000 |       4000 |   sqlalchemy
+import time:      4000 |      10500 | homelab_cmd.main
+"""
+
+
+class TestLazyImports:
+    """Tests for deferred imports of heavy libraries."""
+
+    def test_application_import_skips_heavy_libraries(self) -> None:
+        """SSH, HTTP client and YAML libraries load on first use, not at startup."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, homelab_cmd.main; "
+                "print(sorted({'paramiko', 'httpx', 'yaml'} & set(sys.modules)))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_module_imported_on_first_use(self, tmp_path, monkeypatch) -> None:
+        """Attributes are read from, and patched on, the real module."""
+        (tmp_path / "lazy_probe.py").write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "lazy_probe", raising=False)
+
+        probe = lazy_import("lazy_probe")
+        assert isinstance(probe, LazyModule)
+        assert "lazy_probe" not in sys.modules
+
+        assert probe.VALUE == 1
+        real = sys.modules["lazy_probe"]
+        with patch.object(probe, "VALUE", 2):
+            assert real.VALUE == 2
+        assert real.VALUE == 1
+        assert lazy_import("lazy_probe") is real
+
+
+class TestSchemaCheck:
+    """Tests for skipping create_all when the schema is current."""
+
+    async def test_only_missing_tables_created(self, tmp_path) -> None:
+        """A current schema needs no DDL; a dropped table is recreated alone."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'schema.db'}")
+        try:
+            async with engine.begin() as conn:
+                assert len(await conn.run_sync(_missing_tables)) == len(Base.metadata.tables)
+                await conn.run_sync(Base.metadata.create_all)
+                assert await conn.run_sync(_missing_tables) == []
+
+                await conn.execute(text("DROP TABLE scans"))
+                missing = await conn.run_sync(_missing_tables)
+        finally:
+            await engine.dispose()
+
+        assert [table.name for table in missing] == ["scans"]
+
+
+class TestStartupTimings:
+    """Tests for StartupProfile and its performance summary section."""
+
+    def test_phases_and_ready_time_recorded(self) -> None:
+        """Each phase is timed, and readiness is measured from package load."""
+        profile = StartupProfile()
+
+        with profile.phase("database"):
+            pass
+        profile.mark_ready()
+
+        assert list(profile.phases) == ["database"]
+        assert profile.phases["database"] >= 0
+        assert profile.ready_ms > 0
+
+    def test_summary_reports_startup(self, client, auth_headers) -> None:
+        """GET /system/performance includes the worker's startup phases."""
+        profile = get_startup_profile()
+        with patch.object(profile, "phases", {"database": 12.3456}):
+            response = client.get("/api/v1/system/performance", headers=auth_headers)
+
+        startup = response.json()["startup"]
+        assert startup["phases"] == [{"phase": "database", "duration_ms": 12.346}]
+
+
+class TestImportProfile:
+    """Tests for parsing python -X importtime output."""
+
+    def test_parse_and_total_by_package(self) -> None:
+        """Own times are summed per top-level package, slowest first."""
+        profile = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert [m.module for m in profile.modules][-1] == "homelab_cmd.main"
+        assert [m.depth for m in profile.modules] == [2, 1, 2, 1, 0]
+        assert profile.total_ms == 10.5
+        assert profile.by_package() == {"homelab_cmd": 4.0, "sqlalchemy": 4.0, "pydantic": 2.5}
+        assert profile.slowest(1)[0].module == "homelab_cmd.main"
+
+
+class TestStartupProfileCommand:
+    """Tests for `homelabcmd-cli startup-profile`."""
+
+    def test_reports_imports_and_cold_starts(self) -> None:
+        """Each start is timed against the same scratch database."""
+        start = ColdStart(
+            first_heartbeat_ms=1234.0,
+            startup={"ready_ms": 1100.0, "phases": [{"phase": "database", "duration_ms": 15.0}]},
+        )
+        with (
+            patch(
+                "homelab_cmd.cli.profile_imports",
+                return_value=parse_importtime(IMPORTTIME_OUTPUT),
+            ),
+            patch("homelab_cmd.cli.measure_cold_start", return_value=start) as measure,
+        ):
+            result = CliRunner().invoke(cli, ["startup-profile", "--starts", "2", "--top", "2"])
+
+        assert result.exit_code == 0, result.output
+        assert "Import time: 10 ms" in result.output
+        assert "pydantic" not in result.output.split("Slowest modules")[0]
+        assert "Cold start 2 (existing database): first heartbeat after 1234 ms" in result.output
+        assert "database" in result.output
+        databases = {call.args[0] for call in measure.call_args_list}
+        assert len(databases) == 1
+
+    def test_imports_only(self) -> None:
+        """--imports-only starts no hub."""
+        with (
+            patch(
+                "homelab_cmd.cli.profile_imports",
+                return_value=parse_importtime(IMPORTTIME_OUTPUT),
+            ),
+            patch("homelab_cmd.cli.measure_cold_start") as measure,
+        ):
+            result = CliRunner().invoke(cli, ["startup-profile", "--imports-only"])
+
+        assert result.exit_code == 0, result.output
+        measure.assert_not_called()
+        assert "Cold start" not in result.output
@@ -777,3 +777,203 @@ class TestTailscaleServiceGetDevicesCached:
         assert [d.name for d in result.devices] == ["alpha", "bravo", "charlie"]
 
         await service.close()
+
+
+def _device(device_id: str, name: str) -> dict:
+    """Build a Tailscale API device payload."""
+    return {
+        "id": device_id,
+        "name": f"{name}.tailnet.ts.net",
+        "hostname": name,
+        "addresses": [f"100.64.0.{device_id}"],
+        "os": "linux",
+        "online": True,
+        "authorized": True,
+        "lastSeen": "2025-01-26T10:00:00Z",
+    }
+
+
+class _TailnetServer:
+    """Local stand-in for the Tailscale devices endpoint with ETag support."""
+
+    def __init__(self, devices: list[dict]) -> None:
+        self.devices = devices
+        self.version = 1
+        self.requests: list[httpx.Request] = []
+
+    @property
+    def etag(self) -> str:
+        return f'"v{self.version}"'
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(200, json={"devices": self.devices}, headers={"ETag": self.etag})
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+async def _service_for(server: _TailnetServer, db_session, encryption_key) -> TailscaleService:
+    credential_service = CredentialService(db_session, encryption_key)
+    await credential_service.store_credential("tailscale_token", "tskey-test")
+    await db_session.commit()
+    service = TailscaleService(credential_service)
+    await service.close()
+    service._client = server.client()
+    return service
+
+
+class TestTailscaleConditionalRequests:
+    """Test ETag revalidation of the device list."""
+
+    @pytest.mark.asyncio
+    async def test_sends_if_none_match_and_handles_304(self, db_session, encryption_key) -> None:
+        """An unchanged device list comes back as None with the same ETag."""
+        server = _TailnetServer([_device("1", "alpha")])
+        service = await _service_for(server, db_session, encryption_key)
+
+        devices, etag = await service.get_devices_if_changed()
+        assert [d["hostname"] for d in devices] == ["alpha"]
+        assert etag == '"v1"'
+        assert "If-None-Match" not in server.requests[0].headers
+
+        devices, etag = await service.get_devices_if_changed(etag)
+        assert devices is None
+        assert etag == '"v1"'
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_revalidates_with_etag(self, db_session, encryption_key) -> None:
+        """An expired cache is revalidated rather than refetched."""
+        from datetime import datetime, timedelta
+
+        from homelab_cmd.services.tailscale_service import TailscaleCache
+
+        server = _TailnetServer([_device("1", "alpha")])
+        service = await _service_for(server, db_session, encryption_key)
+        cache = TailscaleCache()
+        cache.set([_device("1", "alpha")], etag='"v1"')
+        cache._cached_at = datetime.now(UTC) - TailscaleCache.STALE_TTL - timedelta(seconds=1)
+
+        result = await service.get_devices_cached(cache=cache, imported_hostnames=set())
+
+        assert result.cache_hit is False
+        assert [d.hostname for d in result.devices] == ["alpha"]
+        assert server.requests[0].headers["If-None-Match"] == '"v1"'
+        # Revalidation makes the cached list fresh again
+        assert cache.get()[0] is not None
+
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_refresh_ignores_etag(self, db_session, encryption_key) -> None:
+        """A forced refresh always fetches the full list."""
+        from homelab_cmd.services.tailscale_service import TailscaleCache
+
+        server = _TailnetServer([_device("1", "alpha")])
+        service = await _service_for(server, db_session, encryption_key)
+        cache = TailscaleCache()
+        cache.set([], etag='"v1"')
+
+        result = await service.get_devices_cached(
+            cache=cache, imported_hostnames=set(), refresh=True
+        )
+
+        assert result.count == 1
+        assert "If-None-Match" not in server.requests[0].headers
+
+        await service.close()
+
+
+class TestTailscaleCacheBackgroundRefresh:
+    """Test stale-while-revalidate behaviour of TailscaleCache."""
+
+    @staticmethod
+    def _age(cache, minutes: int) -> None:
+        from datetime import datetime, timedelta
+
+        cache._cached_at = datetime.now(UTC) - timedelta(minutes=minutes)
+
+    @pytest.mark.asyncio
+    async def test_stale_list_served_and_refreshed_in_background(
+        self, db_session, encryption_key
+    ) -> None:
+        """A stale hit returns at once and one background refresh replaces it."""
+        from unittest.mock import patch
+
+        from homelab_cmd.services.tailscale_service import TailscaleCache
+
+        server = _TailnetServer([_device("1", "alpha")])
+        service = await _service_for(server, db_session, encryption_key)
+        cache = TailscaleCache()
+        cache.set([_device("1", "alpha")], etag='"v1"')
+        self._age(cache, 10)
+
+        server.devices = [_device("1", "alpha"), _device("2", "bravo")]
+        server.version = 2
+        fetch = AsyncMock(side_effect=service.get_devices_if_changed)
+
+        with patch(
+            "homelab_cmd.services.tailscale_service.fetch_devices_in_background", fetch
+        ):
+            first = await service.get_devices_cached(cache=cache, imported_hostnames=set())
+            second = await service.get_devices_cached(cache=cache, imported_hostnames=set())
+            await cache._refresh_task
+
+        assert first.cache_hit is True
+        assert first.count == 1
+        assert second.count == 1
+        fetch.assert_awaited_once_with('"v1"')
+
+        devices, _ = cache.get()
+        assert [d["hostname"] for d in devices] == ["alpha", "bravo"]
+        assert cache.etag == '"v2"'
+
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_list(self) -> None:
+        """A failed background refresh leaves the stale list in place."""
+        from homelab_cmd.services.tailscale_service import TailscaleCache
+
+        cache = TailscaleCache()
+        cache.set([_device("1", "alpha")], etag='"v1"')
+        self._age(cache, 10)
+
+        cache.refresh_in_background(AsyncMock(side_effect=TailscaleConnectionError("down")))
+        await cache._refresh_task
+
+        devices, _ = cache.get_stale()
+        assert devices is not None
+        assert cache.get() == (None, None)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_discards_refresh_in_flight(self) -> None:
+        """A refresh started before invalidate() does not repopulate the cache."""
+        from homelab_cmd.services.tailscale_service import TailscaleCache
+
+        cache = TailscaleCache()
+        cache.set([_device("1", "alpha")])
+        self._age(cache, 10)
+
+        cache.refresh_in_background(AsyncMock(return_value=([_device("2", "bravo")], '"v2"')))
+        cache.invalidate()
+        await cache._refresh_task
+
+        assert cache.get_stale() == (None, None)
+        assert cache.etag is None
+
+    def test_list_past_stale_ttl_is_not_served(self) -> None:
+        """Lists older than STALE_TTL are neither fresh nor stale."""
+        from homelab_cmd.services.tailscale_service import TailscaleCache
+
+        cache = TailscaleCache()
+        cache.set([_device("1", "alpha")])
+        self._age(cache, 61)
+
+        assert cache.get() == (None, None)
+        assert cache.get_stale() == (None, None)